@@ -0,0 +1,90 @@
+''' Compare the disk footprint and the bytes read of a heap file stored by the BUFFER and COMPRESSED
+    backends, against the CPU time spent on compression. The records have a short string in a wide
+    VARCHAR column, which is zero padded in the heap pages like most real tables.
+    Run from the src directory: python -m benchmark.bench_compression
+'''
+import os
+import time
+import shutil
+import struct
+import tempfile
+import numpy as np
+
+import config as cf
+from paged_file.pf_manager import pf_manager
+from record_management.rm_manager import rm_manager
+from record_management.rm_file_scan import RM_FileScan
+
+
+def make_meta(str_size:int) -> dict:
+    ''' The meta of a table (id INT, price FLOAT, name VARCHAR(<str_size>)).
+    '''
+    columns = []
+    for column_type, column_size, column_name in ((cf.TYPE_INT, cf.SIZE_INT, 'id'),
+            (cf.TYPE_FLOAT, cf.SIZE_FLOAT, 'price'), (cf.TYPE_STR, str_size, 'name')):
+        columns.append({'column_type': column_type, 'column_size': column_size,
+            'column_name_length': len(column_name), 'column_name': column_name,
+            'column_default_en': False, 'column_default': np.zeros(column_size, dtype=np.uint8)})
+    return {'record_size': cf.SIZE_INT + cf.SIZE_FLOAT + str_size, 'column_number': len(columns),
+        'columns': columns, 'primary_key_size': 0, 'primary_keys': [], 'foreign_key_number': 0, 'foreign_keys': []}
+
+
+def run(backend:str, root:str, records:int, str_size:int) -> dict:
+    ''' Write and scan a table with <records> records by a backend.
+    return: dict, the measurements.
+    '''
+    pf_manager.set_file_backend(backend)
+    file_name = os.path.join(root, f'bench_{backend.lower()}')
+    data_name = file_name + cf.TABLE_DATA_SUFFIX
+    rm_manager.create_file(file_name)
+    handle = rm_manager.open_file(file_name)
+    handle.init_meta(make_meta(str_size))
+    rng = np.random.default_rng(0)
+    names = [f'customer#{i:09d}'.encode() for i in range(records)]
+    tic = time.perf_counter()
+    for i in range(records):
+        data = struct.pack(f'<id{str_size}s', i, float(rng.integers(0, 10000)) / 100, names[i])
+        handle.insert_record(np.frombuffer(data, dtype=np.uint8))
+    handle.sync_meta()
+    pf_manager.flush_file(handle.data_file_id)
+    write_time = time.perf_counter() - tic
+    compression = pf_manager.get_compression_stats().get(data_name, {})
+    compress_time = compression.get('compress_time', 0.0)
+    rm_manager.close_file(file_name)
+    file_size = os.path.getsize(data_name)
+    if os.path.exists(data_name + cf.PAGE_MAP_SUFFIX):
+        file_size += os.path.getsize(data_name + cf.PAGE_MAP_SUFFIX)
+    # scan from the disk, the buffer holds no page of the file after reopening it
+    handle = rm_manager.open_file(file_name)
+    handle.read_meta()
+    tic = time.perf_counter()
+    scan = RM_FileScan()
+    scan.open_scan(handle)
+    count = sum(1 for _ in scan.next())
+    scan_time = time.perf_counter() - tic
+    assert count == records
+    page_cnt = pf_manager.get_page_cnt(handle.data_file_id)
+    compression = pf_manager.get_compression_stats().get(data_name)
+    bytes_read = compression['bytes_read'] if compression else page_cnt * cf.PAGE_SIZE
+    decompress_time = compression['decompress_time'] if compression else 0.0
+    rm_manager.close_file(file_name)
+    rm_manager.remove_file(file_name)
+    return {'pages': page_cnt, 'file_size': file_size, 'bytes_read': bytes_read, 'write_time': write_time,
+        'scan_time': scan_time, 'compress_time': compress_time, 'decompress_time': decompress_time}
+
+
+if __name__ == '__main__':
+    records, str_size = 100000, 64
+    root = tempfile.mkdtemp()
+    try:
+        results = {backend: run(backend, root, records, str_size) for backend in ('BUFFER', 'COMPRESSED')}
+    finally: shutil.rmtree(root)
+    print(f'{records} records of {cf.SIZE_INT + cf.SIZE_FLOAT + str_size} bytes, '
+        f'{results["BUFFER"]["pages"]} pages, zlib level {cf.COMPRESSION_LEVEL}')
+    print(f'{"backend":<12}{"size (MB)":>10}{"read (MB)":>10}{"write (s)":>10}{"scan (s)":>10}'
+        f'{"compress (s)":>14}{"decompress (s)":>16}')
+    for backend, res in results.items():
+        print(f'{backend:<12}{res["file_size"] / 2**20:>10.2f}{res["bytes_read"] / 2**20:>10.2f}'
+            f'{res["write_time"]:>10.3f}{res["scan_time"]:>10.3f}{res["compress_time"]:>14.3f}{res["decompress_time"]:>16.3f}')
+    saved = 1 - results['COMPRESSED']['bytes_read'] / results['BUFFER']['bytes_read']
+    print(f'{saved:.1%} of the bytes read are saved')
@@ -0,0 +1,47 @@
+''' Compare the commit throughput and the fsync calls of the write-ahead log under several commit
+    delays and numbers of committing threads. Each commit is a statement waiting for its log
+    records to be durable, the commits waiting together are synced by one fsync call.
+    Run from the src directory: python -m benchmark.bench_group_commit
+'''
+import os
+import time
+import shutil
+import tempfile
+import threading
+
+import config as cf
+from log_management.lm_manager import LM_Manager
+
+
+def run(root:str, threads_cnt:int, commits_cnt:int, delay:float) -> dict:
+    ''' Commit <commits_cnt> times on each of <threads_cnt> threads.
+    return: dict, the measurements.
+    '''
+    cf.WAL_COMMIT_DELAY = delay
+    log_name = os.path.join(root, f'bench_{threads_cnt}_{delay}.log')
+    manager = LM_Manager()
+    manager.open(log_name)
+    def commit():
+        for _ in range(commits_cnt):
+            manager.commit()
+    threads = [threading.Thread(target=commit) for _ in range(threads_cnt)]
+    tic = time.perf_counter()
+    for thread in threads: thread.start()
+    for thread in threads: thread.join()
+    elapsed = time.perf_counter() - tic
+    stats = manager.get_stats()
+    manager.close()
+    return {'commits': stats['commits'], 'flushes': stats['flushes'], 'time': elapsed}
+
+
+if __name__ == '__main__':
+    commits_cnt = 200
+    root = tempfile.mkdtemp(dir='.')     # on the disk of the databases, not a tmpfs
+    try:
+        print(f'{"threads":<10}{"delay (ms)":>12}{"commits":>10}{"fsyncs":>10}{"commits/s":>12}')
+        for threads_cnt in (1, 4, 16):
+            for delay in (0.0, 0.001, 0.005):
+                res = run(root, threads_cnt, commits_cnt, delay)
+                print(f'{threads_cnt:<10}{delay * 1000:>12.1f}{res["commits"]:>10}{res["flushes"]:>10}'
+                    f'{res["commits"] / res["time"]:>12.0f}')
+    finally: shutil.rmtree(root)
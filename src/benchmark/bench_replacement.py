@@ -0,0 +1,58 @@
+''' Compare the hit rates of the buffer replacement policies.
+    The workload mixes point lookups on a small hot set (e.g. B+ tree nodes and
+    hot heap pages) with periodic full scans of a large table.
+    Run from the src directory: python -m benchmark.bench_replacement
+'''
+import time
+import numpy as np
+
+from utils.replacer import create_replacer
+
+
+def make_workload(seed:int=0, capacity:int=1024, hot_pages:int=512, table_pages:int=8192,
+        lookups:int=200000, scan_every:int=20000):
+    ''' Generate a page access sequence. Page ids >= table_pages belong to the hot set.
+    '''
+    rng = np.random.default_rng(seed)
+    # zipf-like skew over the hot set
+    weights = 1.0 / np.arange(1, hot_pages + 1)
+    hot = rng.choice(hot_pages, size=lookups, p=weights / weights.sum()) + table_pages
+    accesses = []
+    for start in range(0, lookups, scan_every):
+        accesses.extend(hot[start:start+scan_every].tolist())
+        accesses.extend(range(table_pages))
+    return accesses
+
+
+def simulate(policy:str, capacity:int, accesses) -> float:
+    ''' Replay the accesses on a replacer, return the hit rate.
+    '''
+    replacer = create_replacer(policy, capacity)
+    page_to_frame, frame_to_page = {}, [None] * capacity
+    hits = 0
+    for page in accesses:
+        frame = page_to_frame.get(page)
+        if frame is not None:
+            hits += 1
+            replacer.access(frame)
+            continue
+        frame = replacer.find()
+        if frame_to_page[frame] is not None:
+            page_to_frame.pop(frame_to_page[frame])
+            replacer.free(frame)
+        frame_to_page[frame] = page
+        page_to_frame[page] = frame
+        replacer.access(frame)
+    return hits / len(accesses)
+
+
+if __name__ == '__main__':
+    capacity = 1024
+    accesses = make_workload(capacity=capacity)
+    print(f'{len(accesses)} accesses, {capacity} buffer pages')
+    print(f'{"policy":<8}{"hit rate":>10}{"time (s)":>10}')
+    for policy in ('LRU', 'CLOCK', '2Q', 'LRU-K'):
+        tic = time.perf_counter()
+        hit_rate = simulate(policy, capacity, accesses)
+        toc = time.perf_counter()
+        print(f'{policy:<8}{hit_rate:>10.4f}{toc-tic:>10.3f}')
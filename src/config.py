@@ -4,8 +4,46 @@ import os
 # paged file system
 # BUFFER_CAPACITY = 4     # for test only
 # PAGE_SIZE = 64          # for test only
-BUFFER_CAPACITY = 16384 # 2**14
-PAGE_SIZE = 4096        # 2**12
+BUFFER_CAPACITY = 16384 # 2**14, the initial max number of buffer pages, allocated on demand
+PAGE_SIZE = 4096        # 2**12, the default page size, and the page size of the meta files
+MAX_PAGE_SIZE = 65536   # 2**16, a data file may use a page size of PAGE_SIZE * 2**k up to it, recorded in its meta
+TABLE_PAGE_SIZE = PAGE_SIZE     # the page size of the tables created, and of their indexes
+# buffer replacement policy, in {'LRU', 'CLOCK', '2Q', 'LRU-K'}
+REPLACEMENT_POLICY = 'LRU'
+DATABASE_REPLACEMENT_POLICY = {}    # database name -> policy, overrides REPLACEMENT_POLICY
+TWO_QUEUE_IN_RATIO = 0.25           # 2Q: the max ratio of pages accessed only once
+LRU_K = 2                           # LRU-K: the K
+PAGE_TABLE_PARTITIONS = 16          # partitions of the buffer page table, each has its own lock
+BUFFER_WAIT_TIMEOUT = 1.0           # seconds a read waits for other threads to unpin when all buffer pages are pinned
+SCAN_RING_SIZE = 32                 # buffer pages in the private ring of a sequential scan
+SCAN_RING_THRESHOLD = 0.25          # scan tables with more pages than this ratio of the buffer through a ring
+SCAN_BATCH_PAGES = 64               # data pages decoded together by a columnar batch scan
+READ_AHEAD_ENABLED = True           # read the following pages together with a sequential miss
+READ_AHEAD_MIN_WINDOW = 4           # pages read ahead when a sequential access is detected
+READ_AHEAD_MAX_WINDOW = 64          # the window doubles while the access keeps sequential
+READ_AHEAD_ASYNC = False            # read the next window on a background thread
+BG_WRITER_ENABLED = False           # write dirty pages back on a background thread before eviction
+BG_WRITER_INTERVAL = 0.2            # seconds between two rounds of the background writer
+BG_WRITER_MAX_PAGES = 64            # the max number of pages written in a round
+BG_WRITER_DIRTY_RATIO = 0.1         # keep writing while more buffer pages are dirty
+WARM_START = 'ALL'                  # in {'NONE', 'ALL', 'INDEX'}, reload the pages buffered when a database was closed
+                                    # on opening it in the background, INDEX for only the internal nodes of the indexes
+WARM_START_FILE_NAME = 'buffer.warm'    # the pages to reload, in the database directory
+WARM_START_BATCH_PAGES = 64         # pages reloaded at a time, continuous pages by one read
+TRACE_ENABLED = False               # trace the hot paths of the storage layers from the start, see utils.tracing
+ASYNC_IO_WORKERS = 8                # threads of the asyncio facade of PF_Manager doing the disk I/O
+ASYNC_QUERY_WORKERS = 4             # threads running the statements of parser_command_async()
+# buffer quotas, file name prefix -> (reserved, limit) pages, e.g. {'nation': (256, -1)} keeps 256 pages for
+# table nation and its indexes, {'orders.1': (1024, -1)} for index 1 of orders, a limit of -1 for no limit
+BUFFER_QUOTAS = {}
+DATABASE_BUFFER_QUOTAS = {}         # database name -> quotas, overrides BUFFER_QUOTAS
+# file backend, in {'BUFFER', 'MMAP', 'COMPRESSED'}, MMAP maps the files with a suffix in MMAP_FILE_SUFFIXES
+# into memory, COMPRESSED stores the new files with a suffix in COMPRESSED_FILE_SUFFIXES compressed by zlib
+FILE_BACKEND = 'BUFFER'
+DATABASE_FILE_BACKEND = {}          # database name -> backend, overrides FILE_BACKEND
+MMAP_SEGMENT_PAGES = 256            # pages mapped together, the file grows by segments
+COMPRESSION_LEVEL = 1               # zlib level of the compressed pages, 1 for the fastest
+COMPRESSION_ALIGN = 256             # compressed pages are stored in slots of a multiple of this size
 INVALID = -1
 try: FILE_OPEN_MODE = os.O_RDWR | os.O_BINARY
 except AttributeError as exception:
@@ -26,9 +64,22 @@ SIZE_FLOAT = 8      # size of float64, unchangable
 # index management
 INDEX_META_SUFFIX = '.ixmeta'
 INDEX_DATA_SUFFIX = '.ixdata'
+MMAP_FILE_SUFFIXES = (TABLE_DATA_SUFFIX, INDEX_DATA_SUFFIX)
+COMPRESSED_FILE_SUFFIXES = (TABLE_DATA_SUFFIX, INDEX_DATA_SUFFIX)
+PAGE_MAP_SUFFIX = '.pmap'           # the page map of a compressed file, <file_name>.pmap
 NODE_TYPE_INTER = 0
 NODE_TYPE_LEAF = 1
 INDEX_ROOT_PAGE = 0
 
+# log management
+WAL_ENABLED = False                 # log the page changes of the database opened, synced at the end of each modifying statement
+WAL_FILE_NAME = 'wal.log'           # the log file in the database directory
+WAL_COMMIT_DELAY = 0.0              # seconds a commit waits for other commits to join its fsync if others are running, for slow fsync
+WAL_MERGE_GAP = 16                  # changed byte ranges of a page closer than this are logged as one
+CHECKPOINT_INTERVAL = 30.0          # seconds between two checkpoints on a background thread, 0 for none, bounds the recovery
+CHECKPOINT_LOG_SIZE = 2**24         # bytes logged since the last checkpoint that start the next one earlier
+CHECKPOINT_BATCH_PAGES = 64         # dirty pages a checkpoint writes at a time, releasing the buffer lock between
+CHECKPOINT_BATCH_DELAY = 0.0        # seconds between two batches of a checkpoint, to spread its writes
+
 # unit test
 TEST_ROOT = f'./test_root'
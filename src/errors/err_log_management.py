@@ -0,0 +1,13 @@
+class OpenLogError(Exception):
+    ''' Raised when failed to open a log file.
+    '''
+
+
+class WriteLogError(Exception):
+    ''' Raised when failed to write the log to disk.
+    '''
+
+
+class ReadLogError(Exception):
+    ''' Raised when failed to read a log record.
+    '''
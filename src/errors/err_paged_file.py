@@ -47,4 +47,49 @@ class GetPageCntError(Exception):
     ''' Raised when failed to get the page cnt.
     '''
     
-    
\ No newline at end of file
+
+class AllocBufferError(Exception):
+    ''' Raised when failed to allocate a buffer page.
+    '''
+    
+
+class FlushFileError(Exception):
+    ''' Raised when failed to flush a file.
+    '''
+    
+
+class PinPageError(Exception):
+    ''' Raised when failed to pin a page.
+    '''
+    
+
+class UnpinPageError(Exception):
+    ''' Raised when failed to unpin a page.
+    '''
+    
+
+class MarkDirtyError(Exception):
+    ''' Raised when failed to mark a page as dirty.
+    '''
+    
+
+class ResizeBufferError(Exception):
+    ''' Raised when failed to resize the buffer.
+    '''
+    
+
+class ReleasePageError(Exception):
+    ''' Raised when failed to release a page.
+    '''
+    
+
+class BufferQuotaError(Exception):
+    ''' Raised when failed to set a buffer quota.
+    '''
+    
+
+
+class PageSizeError(Exception):
+    ''' Raised when failed to set the page size of a file.
+    '''
+    
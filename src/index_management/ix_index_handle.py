@@ -4,10 +4,13 @@ import numpy as np
 from typing import Tuple, List, Dict, Set, Union
 
 import config as cf
+from utils.tracing import traced
 from paged_file.pf_manager import pf_manager
+from log_management.lm_manager import lm_manager
 from record_management.rm_rid import RM_Rid
-from index_management.ix_tree_node import IX_TreeNodeHeader, IX_TreeNode, node_cache
+from index_management.ix_tree_node import IX_TreeNodeHeader, IX_TreeNode, load_node
 from errors.err_index_management import *
+from errors.err_paged_file import PageSizeError
 
 
 
@@ -28,6 +31,7 @@ class IX_IndexHandle:
         self.data_file_id = data_file_id
         self.meta = dict()
         self.meta_modified = False
+        self.logged_meta: np.ndarray = None    # the meta page logged last time
         self.is_opened = True
         
         
@@ -36,14 +40,16 @@ class IX_IndexHandle:
         ''' Serialize meta into np.ndarray[PAGE_SIZE, uint8].
         '''
         BYTE_ORDER = cf.BYTE_ORDER
-        data = np.ndarray(cf.PAGE_SIZE, dtype=np.uint8)
+        data = np.zeros(cf.PAGE_SIZE, dtype=np.uint8)
         field_number, fields, node_capacity = meta['field_number'], meta['fields'], meta['node_capacity']
         data[:4] = np.frombuffer(struct.pack(f'{BYTE_ORDER}i', field_number), dtype=np.uint8)
         off = 4
         for field_type, field_size in fields:
             data[off:off+8] = np.frombuffer(struct.pack(f'{BYTE_ORDER}ii',
                 field_type, field_size), dtype=np.uint8); off += 8
-        data[off:off+4] = np.frombuffer(struct.pack(f'{BYTE_ORDER}i', node_capacity), dtype=np.uint8)
+        data[off:off+16] = np.frombuffer(struct.pack(f'{BYTE_ORDER}iiii', node_capacity,
+            meta.get('free_page_number', 0), meta.get('free_page_head', cf.INVALID),
+            meta.get('page_size', cf.PAGE_SIZE)), dtype=np.uint8)
         return data
         
     
@@ -57,8 +63,11 @@ class IX_IndexHandle:
         for _ in range(field_number):
             fields.append(struct.unpack(f'{BYTE_ORDER}ii', data[off:off+8].tobytes()))
             off += 8
-        node_capacity, = struct.unpack(f'{BYTE_ORDER}i', data[off:off+4].tobytes())
-        meta = {'field_number': field_number, 'fields': fields, 'node_capacity': node_capacity}
+        node_capacity, free_page_number, free_page_head, page_size = struct.unpack(
+            f'{BYTE_ORDER}iiii', data[off:off+16].tobytes())
+        meta = {'field_number': field_number, 'fields': fields, 'node_capacity': node_capacity,
+            'free_page_number': free_page_number, 'free_page_head': free_page_head,
+            'page_size': page_size or cf.PAGE_SIZE}     # zeros in older files mean the default page size
         return meta
     
 
@@ -66,21 +75,27 @@ class IX_IndexHandle:
         ''' Search the min leaf node.
         return: IX_TreeNode, the min leaf node.
         '''
+        return self.search_min_leaf()[0]
+    
+    
+    def search_min_leaf(self) -> Tuple[IX_TreeNode, Tuple[int]]:
+        ''' Search the min leaf node.
+        return: Tuple[IX_TreeNode, Tuple[int]], the min leaf node and its ancestors' page numbers.
+        '''
         meta, current_page = self.meta, cf.INDEX_ROOT_PAGE
         fields = meta['fields']
         field_types = [field[0] for field in fields]
         field_sizes = [field[1] for field in fields]
+        ancestors = []
         while True:
-            current_node = node_cache[self.data_file_id].get(current_page)
-            if current_node is None:
-                current_node = IX_TreeNode.deserialize(self.data_file_id, field_types, field_sizes,
-                    meta['node_capacity'], pf_manager.read_page(self.data_file_id, current_page))
-                node_cache[self.data_file_id][current_page] = current_node
+            current_node = load_node(self.data_file_id, field_types, field_sizes,
+                meta['node_capacity'], current_page)
             if current_node.header.node_type != cf.NODE_TYPE_INTER: break
+            ancestors.append(current_page)
             current_page = current_node.header.first_child
         if current_node.header.node_type != cf.NODE_TYPE_LEAF:
             raise IndexSearchError(f'Failed to find the min leaf node.')
-        return current_node
+        return current_node, tuple(ancestors)
     
     
     def max_leaf(self) -> IX_TreeNode:
@@ -92,11 +107,8 @@ class IX_IndexHandle:
         field_types = [field[0] for field in fields]
         field_sizes = [field[1] for field in fields]
         while True:
-            current_node = node_cache[self.data_file_id].get(current_page)
-            if current_node is None:
-                current_node = IX_TreeNode.deserialize(self.data_file_id, field_types, field_sizes,
-                    meta['node_capacity'], pf_manager.read_page(self.data_file_id, current_page))
-                node_cache[self.data_file_id][current_page] = current_node
+            current_node = load_node(self.data_file_id, field_types, field_sizes,
+                meta['node_capacity'], current_page)
             if current_node.header.node_type != cf.NODE_TYPE_INTER: break
             entry_number = current_node.header.entry_number
             current_page = current_node.get_entry(entry_number-1).page_no
@@ -105,6 +117,7 @@ class IX_IndexHandle:
         return current_node
         
     
+    @traced('ix.search_leaf')
     def search_leaf(self, field_value:List[Union[int,float,str]]) -> Tuple[IX_TreeNode, Tuple[int]]:
         ''' Search the leaf node by a field value in this index.
         return: Tuple[IX_TreeNode, Tuple[int]], the leaf node and its ancestors' page numbers.
@@ -115,11 +128,8 @@ class IX_IndexHandle:
         field_sizes = [field[1] for field in fields]
         ancestors = []
         while True:
-            current_node = node_cache[self.data_file_id].get(current_page)
-            if current_node is None:
-                current_node = IX_TreeNode.deserialize(self.data_file_id, field_types, field_sizes,
-                    meta['node_capacity'], pf_manager.read_page(self.data_file_id, current_page))
-                node_cache[self.data_file_id][current_page] = current_node
+            current_node = load_node(self.data_file_id, field_types, field_sizes,
+                meta['node_capacity'], current_page)
             if current_node.header.node_type != cf.NODE_TYPE_INTER: break
             ancestors.append(current_page)
             child_idx = current_node.search_child_idx(field_value)
@@ -141,21 +151,31 @@ class IX_IndexHandle:
                                                           field_type must be in {TYPE_INT, TYPE_FLOAT, TYPE_STR},
                                                           field_size must be in {TYPE_INT, TYPE_FLOAT, TYPE_STR}.
                 'node_capacity': int,                   # OPTIONAL, will be calculated from fields.
+                'free_page_number': int,                # OPTIONAL, the number of released data pages, 0.
+                'free_page_head': int,                  # OPTIONAL, the last released data page, INVALID.
+                'page_size': int,                       # OPTIONAL, the data page size, PAGE_SIZE * 2**k, PAGE_SIZE.
             } TO BE CONTINUED ...
         '''
         if not self.is_opened:
             raise IndexNotOpenedError(f'Index {self.file_name}.{self.index_no} not opened.')
         field_number, fields = meta['field_number'], meta['fields']
-        if field_number > (cf.PAGE_SIZE - 8) // 8:
+        if field_number > (cf.PAGE_SIZE - 20) // 8:
             raise IndexInitMetaError(f'Index meta overflowed, must be in one page.')
+        page_size = meta.get('page_size', cf.PAGE_SIZE)
         total_field_size = np.sum([field[1] for field in fields[:field_number]])
-        node_capacity = (cf.PAGE_SIZE - IX_TreeNodeHeader.size()) // (total_field_size + 12)
+        node_capacity = (page_size - IX_TreeNodeHeader.size()) // (total_field_size + 12)
         if node_capacity < 2:
             raise IndexInitMetaError(f'Node capacity = {node_capacity} is too small.')
-        meta = {'field_number': field_number, 'fields': fields[:field_number], 'node_capacity': node_capacity}
+        try: pf_manager.set_page_size(self.data_file_id, page_size)
+        except PageSizeError as exception:
+            raise IndexInitMetaError(str(exception))
+        meta = {'field_number': field_number, 'fields': fields[:field_number], 'node_capacity': node_capacity,
+            'free_page_number': 0, 'free_page_head': cf.INVALID, 'page_size': page_size}
         self.meta = meta
         meta_page = IX_IndexHandle._serialize_meta(meta)
-        pf_manager.append_page(self.meta_file_id, meta_page)
+        pf_manager.append_page(self.meta_file_id)
+        self.logged_meta = None
+        self._write_meta_page(meta_page)
         self.meta_modified = False
         # create root node
         root_page = pf_manager.append_page(self.data_file_id)
@@ -176,7 +196,10 @@ class IX_IndexHandle:
         if not self.is_opened:
             raise IndexNotOpenedError(f'Index {self.file_name}.{self.index_no} not opened.')
         meta_page = pf_manager.read_page(self.meta_file_id, 0)
+        self.logged_meta = meta_page
         self.meta = IX_IndexHandle._desetialize_meta(meta_page)
+        pf_manager.set_page_size(self.data_file_id, self.meta['page_size'])
+        pf_manager.set_free_pages(self.data_file_id, self.meta['free_page_number'], self.meta['free_page_head'])
         self.meta_modified = False
         return self.meta
         
@@ -184,14 +207,27 @@ class IX_IndexHandle:
     def sync_meta(self) -> None:
         ''' Sync self.meta to the .ixmeta file. Use this interface since we do not
             want to write .ixmeta file each time we modify the index entries.
+            The free page list of the data file is synced as well.
         '''
         if not self.is_opened:
             raise IndexNotOpenedError(f'Index {self.file_name}.{self.index_no} not opened.')
+        free_pages = pf_manager.get_free_pages(self.data_file_id)
+        if free_pages != (self.meta['free_page_number'], self.meta['free_page_head']):
+            (self.meta['free_page_number'], self.meta['free_page_head']) = free_pages
+            self.meta_modified = True
         if not self.meta_modified: return
         meta_page = IX_IndexHandle._serialize_meta(self.meta)
-        pf_manager.write_page(self.meta_file_id, 0, meta_page)
+        self._write_meta_page(meta_page)
         self.meta_modified = False
         
+        
+    def _write_meta_page(self, meta_page:np.ndarray) -> None:
+        ''' Write the meta page to the .ixmeta file, and log its changes since logged last time.
+        '''
+        pf_manager.write_page(self.meta_file_id, 0, meta_page)
+        lm_manager.log_diff(self.meta_file_id, 0, self.logged_meta, meta_page)   # the LSN of the buffer page
+        self.logged_meta = meta_page
+        
     
     def insert_entry(self, field_values:List[Union[int,float,str]],
             rid:RM_Rid, verbose:int=0) -> None:
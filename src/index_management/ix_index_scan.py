@@ -3,10 +3,10 @@ from typing import Tuple, List, Dict, Union
 
 import config as cf
 from utils.enums import CompOp
-from paged_file.pf_manager import pf_manager
 from record_management.rm_rid import RM_Rid
 from index_management.ix_index_handle import IX_IndexHandle
-from index_management.ix_tree_node import IX_TreeNode, IX_TreeNodeEntry, node_cache
+from index_management.ix_tree_node import IX_TreeNode, IX_TreeNodeEntry, load_node, load_nodes
+from index_management.ix_rid_bucket import load_buckets
 from errors.err_index_management import *
 
 
@@ -36,6 +36,50 @@ class IX_IndexScan:
         self.comp_op, self.field_values = comp_op, field_values
     
     
+    @staticmethod
+    def _load_buckets(data_file_id:int, entries:List[IX_TreeNodeEntry]) -> None:
+        ''' Read the first rid buckets of some leaf entries together, before walking them.
+        '''
+        load_buckets(data_file_id, [entry.page_no for entry in entries
+            if entry.slot_no == cf.INVALID and entry.page_no != cf.INVALID])
+    
+    
+    @staticmethod
+    def _walk_leaves(index_handle:IX_IndexHandle, leaf:IX_TreeNode, ancestors:Tuple[int]) -> IX_TreeNode:
+        ''' Yield the leaf and the following leaves by their next_sib links. The following leaves
+            under the same parent are read together before walking them, then those of the next
+            parent by the next_sib links of the parents.
+        args:
+            ancestors: Tuple[int], the ancestors' page numbers of the leaf, the parent last.
+        '''
+        meta = index_handle.meta
+        (field_number, fields, node_capacity) = \
+            (meta['field_number'], meta['fields'], meta['node_capacity'])
+        field_types = [field[0] for field in fields[:field_number]]
+        field_sizes = [field[1] for field in fields[:field_number]]
+        data_file_id = index_handle.data_file_id
+        def children(parent_page:int) -> List[int]:
+            if parent_page == cf.INVALID: return []
+            parent = load_node(data_file_id, field_types, field_sizes, node_capacity, parent_page)
+            return [parent.header.first_child] + [entry.page_no for entry in parent.get_all_entries()]
+        parent_page = ancestors[-1] if ancestors else cf.INVALID
+        pending = set()     # the following leaves read together
+        while True:
+            yield leaf
+            current_page = leaf.header.next_sib
+            if current_page == cf.INVALID: break
+            if current_page not in pending and parent_page != cf.INVALID:
+                child_pages = children(parent_page)
+                if current_page not in child_pages:     # the first leaf under the next parent
+                    parent_page = load_node(data_file_id, field_types, field_sizes,
+                        node_capacity, parent_page).header.next_sib
+                    child_pages = children(parent_page)
+                if current_page in child_pages:
+                    pending = set(child_pages[child_pages.index(current_page):])
+                    load_nodes(data_file_id, field_types, field_sizes, node_capacity, sorted(pending))
+            leaf = load_node(data_file_id, field_types, field_sizes, node_capacity, current_page)
+    
+    
     def next(self) -> Tuple[RM_Rid,int]:
         ''' Yield the next scanned rid that satisfies the filtering condition.
         return:
@@ -43,27 +87,16 @@ class IX_IndexScan:
         '''
         if not self.is_opened: return None
         index_handle = self.index_handle
-        meta = index_handle.meta
-        (field_number, fields, node_capacity) = \
-            (meta['field_number'], meta['fields'], meta['node_capacity'])
-        field_types = [field[0] for field in fields[:field_number]]
-        field_sizes = [field[1] for field in fields[:field_number]]
         data_file_id = index_handle.data_file_id
         comp_op, field_values = self.comp_op, self.field_values
         if comp_op == CompOp.NO or comp_op == CompOp.NE:
-            current_node = index_handle.min_leaf()
-            while True:
-                for entry in current_node.get_all_entries():
+            for current_node in self._walk_leaves(index_handle, *index_handle.search_min_leaf()):
+                entries = current_node.get_all_entries()
+                self._load_buckets(data_file_id, entries)
+                for entry in entries:
                     if comp_op == CompOp.NE and IX_TreeNodeEntry.eq(entry.field_values, field_values):
                         continue
                     for item in entry.get_all_rids(data_file_id): yield item
-                current_page = current_node.header.next_sib
-                if current_page == cf.INVALID: break
-                current_node = node_cache[data_file_id].get(current_page)
-                if current_node is None:
-                    current_node = IX_TreeNode.deserialize(index_handle.data_file_id, field_types,
-                        field_sizes, node_capacity, pf_manager.read_page(data_file_id, current_page))
-                    node_cache[data_file_id][current_page] = current_node
         elif comp_op == CompOp.EQ:
             current_node, _ = index_handle.search_leaf(field_values)
             child_idx = current_node.search_child_idx(field_values)
@@ -72,35 +105,25 @@ class IX_IndexScan:
                 return None
             for item in current_node.get_entry(child_idx-1).get_all_rids(data_file_id): yield item
         elif comp_op == CompOp.LT or comp_op == CompOp.LE:
-            current_node = index_handle.min_leaf()
-            while True:
-                for entry in current_node.get_all_entries():
+            for current_node in self._walk_leaves(index_handle, *index_handle.search_min_leaf()):
+                entries = current_node.get_all_entries()
+                self._load_buckets(data_file_id, [entry for entry in entries
+                    if IX_TreeNodeEntry.le(entry.field_values, field_values)])
+                for entry in entries:
                     if not IX_TreeNodeEntry.le(entry.field_values, field_values): return None
                     if comp_op == CompOp.LT and IX_TreeNodeEntry.eq(
                         entry.field_values, field_values): return None
                     for item in entry.get_all_rids(data_file_id): yield item
-                current_page = current_node.header.next_sib
-                if current_page == cf.INVALID: break
-                current_node = node_cache[data_file_id].get(current_page)
-                if current_node is None:
-                    current_node = IX_TreeNode.deserialize(index_handle.data_file_id, field_types,
-                        field_sizes, node_capacity, pf_manager.read_page(data_file_id, current_page))
-                    node_cache[data_file_id][current_page] = current_node
         elif comp_op == CompOp.GT or comp_op == CompOp.GE:
-            current_node, _ = index_handle.search_leaf(field_values)
-            while True:
-                for entry in current_node.get_all_entries():
+            for current_node in self._walk_leaves(index_handle, *index_handle.search_leaf(field_values)):
+                entries = current_node.get_all_entries()
+                self._load_buckets(data_file_id, [entry for entry in entries
+                    if not IX_TreeNodeEntry.lt(entry.field_values, field_values)])
+                for entry in entries:
                     if IX_TreeNodeEntry.lt(entry.field_values, field_values): continue
                     if comp_op == CompOp.GT and IX_TreeNodeEntry.eq(
                         entry.field_values, field_values): continue
                     for item in entry.get_all_rids(data_file_id): yield item
-                current_page = current_node.header.next_sib
-                if current_page == cf.INVALID: break
-                current_node = node_cache[data_file_id].get(current_page)
-                if current_node is None:
-                    current_node = IX_TreeNode.deserialize(index_handle.data_file_id, field_types,
-                        field_sizes, node_capacity, pf_manager.read_page(data_file_id, current_page))
-                    node_cache[data_file_id][current_page] = current_node
         else: raise IndexScanNextError(f'Encountered wrong comp_op.')
 
     
@@ -1,14 +1,16 @@
 import os
 import re
+import threading
 import numpy as np
 from glob import glob
 from typing import List, Dict, Tuple, Union
 
 import config as cf
 from paged_file.pf_manager import pf_manager
+from log_management.lm_manager import lm_manager
 from index_management.ix_index_handle import IX_IndexHandle
-from index_management.ix_tree_node import node_cache, flush_node_cache
-from index_management.ix_rid_bucket import bucket_cache, flush_bucket_cache
+from index_management.ix_tree_node import node_cache, flush_node_cache, write_node_cache
+from index_management.ix_rid_bucket import bucket_cache, flush_bucket_cache, write_bucket_cache
 
 
 class IX_Manager:
@@ -16,6 +18,8 @@ class IX_Manager:
     
     def __init__(self) -> None:
         self.opened_indicies: Dict[str, IX_IndexHandle] = dict()
+        self.lock = threading.RLock()   # an index is not closed during a checkpoint
+        lm_manager.add_checkpoint_hook(self.checkpoint)
         
     
     def create_index(self, file_name:str, index_no:int) -> None:
@@ -55,13 +59,38 @@ class IX_Manager:
         ''' Close the index <file_name>.<index_no>
         '''
         index_name = f'{file_name}.{index_no}'
-        data_file_id = pf_manager.file_name_to_id[index_name + cf.INDEX_DATA_SUFFIX]
-        flush_node_cache(data_file_id)
-        flush_bucket_cache(data_file_id)
-        pf_manager.close_file(index_name + cf.INDEX_META_SUFFIX)
-        pf_manager.close_file(index_name + cf.INDEX_DATA_SUFFIX)
-        handle:IX_IndexHandle = self.opened_indicies.pop(index_name, None)
-        if handle: handle.is_opened = False
+        with self.lock:
+            data_file_id = pf_manager.file_name_to_id[index_name + cf.INDEX_DATA_SUFFIX]
+            flush_node_cache(data_file_id)
+            flush_bucket_cache(data_file_id)
+            handle:IX_IndexHandle = self.opened_indicies.pop(index_name, None)
+            if handle and handle.meta: handle.sync_meta()
+            pf_manager.close_file(index_name + cf.INDEX_META_SUFFIX)
+            pf_manager.close_file(index_name + cf.INDEX_DATA_SUFFIX)
+            if handle: handle.is_opened = False
+        
+    
+    def checkpoint(self) -> None:
+        ''' Write the nodes and rid buckets of the opened indexes logged since the last checkpoint
+            to pf_manager, called by the checkpoints of the log.
+        '''
+        with self.lock:
+            for handle in list(self.opened_indicies.values()):
+                write_node_cache(handle.data_file_id)
+                write_bucket_cache(handle.data_file_id)
+        
+    
+    def get_cached_pages(self, inter_only:bool=False) -> Dict[str, List[int]]:
+        ''' Get the pages of the tree nodes cached, of the opened indexes.
+        args:
+            inter_only: bool, only the internal nodes.
+        return: Dict[str, List[int]], index data file name -> sorted page ids.
+        '''
+        with self.lock:
+            return {index_name + cf.INDEX_DATA_SUFFIX: sorted(page_no for page_no, node
+                    in node_cache.get(handle.data_file_id, {}).items()
+                    if not inter_only or node.header.node_type == cf.NODE_TYPE_INTER)
+                for index_name, handle in self.opened_indicies.items()}
         
     
     @staticmethod
@@ -1,10 +1,12 @@
 import os
 import struct
+import threading
 import numpy as np
 from typing import Tuple, List
 
 import config as cf
 from paged_file.pf_manager import pf_manager
+from log_management.lm_manager import lm_manager
 from record_management.rm_rid import RM_Rid
 from utils.bitmap import Bitmap
 from errors.err_index_management import *
@@ -12,6 +14,8 @@ from errors.err_index_management import *
 
 # file_id -> Dict[Tuple[int,int], IX_RidBucket]
 bucket_cache = {}
+# guards filling bucket_cache, concurrent SELECTs missing the same page share the first bucket cached
+bucket_cache_lock = threading.Lock()
 
 
 class IX_RidBucketHeader:
@@ -46,18 +50,21 @@ class IX_RidBucketHeader:
 class IX_RidBucket:
     
     
-    def __init__(self) -> None:
-        ''' Init an empty rid bucket
+    def __init__(self, page_size:int=cf.PAGE_SIZE) -> None:
+        ''' Init an empty rid bucket in a page of <page_size> bytes.
         '''
         header_size = IX_RidBucketHeader.size()
-        capacity = (8*(cf.PAGE_SIZE-header_size)-7) // (8*12+1)
+        capacity = (8*(page_size-header_size)-7) // (8*12+1)
         self.header = IX_RidBucketHeader(rid_cnt=0, next_page=cf.INVALID)
         self.bitmap = Bitmap(capacity=capacity)
         bitmap_size = self.bitmap.size
-        self.data = np.zeros(cf.PAGE_SIZE, dtype=np.uint8)
+        self.data = np.zeros(page_size, dtype=np.uint8)
         self.data[:header_size] = self.header.serialize()
         self.data[header_size:header_size+bitmap_size] = self.bitmap.serialize()
         self.data_modified = True
+        self.logged: np.ndarray = None  # the page logged last time, None for a page just appended
+        self.lsn = 0                    # the LSN of the last logged change
+        self.written: np.ndarray = None # the page written to pf_manager by the last checkpoint
         
     
     def free_space(self):
@@ -112,70 +119,117 @@ class IX_RidBucket:
         self.data_modified = True
         
     
+    def _entries(self) -> Tuple[np.ndarray, np.ndarray]:
+        ''' Get the occupied slots and a view of all (page_no, slot_no, verbose) entries.
+        return: Tuple[np.ndarray, np.ndarray], np.ndarray[(N,), int64] and np.ndarray[(capacity, 3), int32].
+        '''
+        base_off = IX_RidBucketHeader.size() + self.bitmap.size
+        entries = self.data[base_off:base_off+self.bitmap.capacity*12].view(f'{cf.BYTE_ORDER}i4').reshape(-1, 3)
+        return self.bitmap.occupied_array(), entries
+        
+    
     def search_rid(self, page_no:int, slot_no:int) -> int:
         ''' Search the first slot position that contains the rid.
         return: int, the rid index, if not found, return INVALID.
         '''
-        BYTE_ORDER = cf.BYTE_ORDER
-        idx = cf.INVALID
-        base_off = IX_RidBucketHeader.size() + self.bitmap.size
-        data = self.data
-        for i in self.bitmap.occupied_slots():
-            off = base_off + (i * 12)
-            page, slot = struct.unpack(f'{BYTE_ORDER}ii', data[off:off+8].tobytes())
-            if page == page_no and slot == slot_no:
-                idx = i
-                break
-        return idx
+        slots, entries = self._entries()
+        entries = entries[slots]
+        found = np.flatnonzero((entries[:, 0] == page_no) & (entries[:, 1] == slot_no))
+        return int(slots[found[0]]) if len(found) > 0 else cf.INVALID
         
     
     def get_all_rids(self) -> List[Tuple[RM_Rid,int]]:
         ''' Return a list of all rids and verbose fields.
         '''
-        BYTE_ORDER = cf.BYTE_ORDER
-        bitmap = self.bitmap
-        data = self.data
-        base_off = IX_RidBucketHeader.size() + bitmap.size
-        res = []
-        for i in bitmap.occupied_slots():
-            off = base_off + (i * 12)
-            page_no, slot_no, verbose = struct.unpack(
-                f'{BYTE_ORDER}iii', data[off:off+12].tobytes())
-            res.append((RM_Rid(page_no, slot_no), verbose))
-        return res
+        slots, entries = self._entries()
+        return [(RM_Rid(page_no, slot_no), verbose) for page_no, slot_no, verbose in entries[slots].tolist()]
+        
+    
+    def add_verbose(self, delta:int) -> List[int]:
+        ''' Add delta to the verbose fields of all rids.
+        return: List[int], the modified verbose fields.
+        '''
+        slots, entries = self._entries()
+        entries[slots, 2] += delta
+        self.data_modified = True
+        return entries[slots, 2].tolist()
         
     
     @staticmethod
     def deserialize(data:np.ndarray):
-        bucket = IX_RidBucket()
+        bucket = IX_RidBucket(len(data))
         header_size = IX_RidBucketHeader.size()
-        capacity = (8*(cf.PAGE_SIZE-header_size)-7) // (8*12+1)
+        capacity = bucket.bitmap.capacity
         bitmap_size = bucket.bitmap.size
         bucket.header = IX_RidBucketHeader.deserialize(data[:header_size])
         bucket.bitmap = Bitmap.deserialize(capacity, data[header_size:header_size+bitmap_size])
-        bucket.data[:] = data[:cf.PAGE_SIZE]
+        bucket.data[:] = data
+        bucket.logged = bucket.written = bucket.data.copy()
         return bucket
         
     
     def serialize(self) -> np.ndarray:
-        ''' Serialize rid bucket into np.ndarray[PAGE_SIZE, uint8].
+        ''' Serialize rid bucket into np.ndarray[page_size, uint8].
         '''
         return self.data.copy()
     
 
     def sync(self, file_id:int, page_id:int) -> None:
-        ''' Sync data to disk.
+        ''' Sync data to disk, and log its changes since synced last time.
         '''
         if not self.data_modified: return
         self.data_modified = False
+        lsn = lm_manager.log_diff(file_id, page_id, self.logged, self.data, buffered=False)
+        self.lsn = max(self.lsn, lsn)
+        self.logged = self.data.copy()
         bucket_cache[file_id][page_id] = self
         
     
+def load_bucket(file_id:int, page_no:int) -> IX_RidBucket:
+    ''' Get a rid bucket from the bucket cache.
+        If not cached, deserialize it from the pinned page and cache it.
+    '''
+    bucket = bucket_cache[file_id].get(page_no)
+    if bucket is None:
+        page = pf_manager.pin_page(file_id, page_no)
+        try: bucket = IX_RidBucket.deserialize(page)
+        finally: pf_manager.unpin_page(file_id, page_no)
+        with bucket_cache_lock:
+            bucket = bucket_cache[file_id].setdefault(page_no, bucket)
+    return bucket
+    
+
+def load_buckets(file_id:int, page_nos:List[int]) -> None:
+    ''' Cache the rid buckets not cached yet, reading their pages together by pf_manager.read_pages().
+    '''
+    cache = bucket_cache[file_id]
+    missed = sorted(set(page_no for page_no in page_nos if page_no not in cache))
+    if not missed: return
+    buckets = [IX_RidBucket.deserialize(page) for page in pf_manager.read_pages(file_id, missed)]
+    with bucket_cache_lock:
+        for page_no, bucket in zip(missed, buckets):
+            cache.setdefault(page_no, bucket)
+
+
+def write_bucket_cache(file_id:int):
+    ''' Write the buckets logged since written last time to pf_manager, keeping them cached.
+        Called by the checkpoints.
+    '''
+    with bucket_cache_lock:
+        buckets = list(bucket_cache.get(file_id, {}).items())
+    for page_id, bucket in buckets:
+        logged = bucket.logged
+        lsn = bucket.lsn
+        if logged is None or logged is bucket.written: continue
+        pf_manager.write_page(file_id, page_id, logged, lsn)
+        bucket.written = logged
+
+
 def flush_bucket_cache(file_id:int):
     ''' Flush bucket pages to pf_manager.
     '''
     for page_id, bucket in bucket_cache[file_id].items():
-        pf_manager.write_page(file_id, page_id, bucket.serialize())
+        pf_manager.write_page(file_id, page_id, bucket.data, bucket.lsn)
     bucket_cache.pop(file_id, None)
     
 if __name__ == '__main__':
@@ -1,17 +1,22 @@
 import os
 import struct
+import threading
 import numpy as np
 from typing import Tuple, List, Dict, Union
 
 import config as cf
+from utils.tracing import traced
 from paged_file.pf_manager import pf_manager
+from log_management.lm_manager import lm_manager
 from record_management.rm_rid import RM_Rid
-from index_management.ix_rid_bucket import IX_RidBucket, bucket_cache
+from index_management.ix_rid_bucket import IX_RidBucket, bucket_cache, load_bucket
 from errors.err_index_management import *
 
 
 # file_id -> Dict[int, IX_TreeNode]
 node_cache:Dict[int, Dict] = {}
+# guards filling node_cache, concurrent SELECTs missing the same page share the first node cached
+node_cache_lock = threading.Lock()
 
 
 class IX_TreeNodeHeader:
@@ -163,10 +168,7 @@ class IX_TreeNodeEntry:
         bucket_page = self.page_no
         res = []
         while bucket_page != cf.INVALID:
-            bucket = bucket_cache[data_file_id].get(bucket_page)
-            if bucket is None:
-                bucket = IX_RidBucket.deserialize(pf_manager.read_page(data_file_id, bucket_page))
-                bucket_cache[data_file_id][bucket_page] = bucket
+            bucket = load_bucket(data_file_id, bucket_page)
             res.extend(bucket.get_all_rids())
             bucket_page = bucket.header.next_page
         return res
@@ -192,9 +194,13 @@ class IX_TreeNode:
         self.header = IX_TreeNodeHeader(node_type=node_type,
             page_no=page_no, entry_number=0, prev_sib=cf.INVALID,
             next_sib=cf.INVALID, first_child=cf.INVALID)
-        self.data = np.zeros(cf.PAGE_SIZE, dtype=np.uint8)
+        self.data = np.zeros(pf_manager.get_page_size(file_id), dtype=np.uint8)
         self.data[:IX_TreeNodeHeader.size()] = self.header.serialize()
         self.data_modified = True
+        self.logged: np.ndarray = None  # the page logged last time, None for a page just appended
+        self.logged_page_no = page_no   # the page of self.logged, the root moves to a new page when split
+        self.lsn = 0                    # the LSN of the last logged change
+        self.written: np.ndarray = None # the page written to pf_manager by the last checkpoint
         
     
     def __str__(self) -> str:
@@ -235,6 +241,7 @@ class IX_TreeNode:
         entry_size = self.total_field_size + 12
         off = IX_TreeNodeHeader.size() + idx * entry_size
         self.data[off:off+entry_size] = entry.serialize()
+        self.data_modified = True
         
     
     def search_child_idx(self, field_values:List[Union[int,float,str]]) -> int:
@@ -269,6 +276,8 @@ class IX_TreeNode:
         node = IX_TreeNode(file_id, field_types, field_sizes, node_capacity, 0, 0)
         node.header = IX_TreeNodeHeader.deserialize(data[:IX_TreeNodeHeader.size()])
         node.data[:] = data[:]
+        node.logged = node.written = node.data.copy()
+        node.logged_page_no = node.header.page_no
         return node
         
     
@@ -279,10 +288,16 @@ class IX_TreeNode:
     
 
     def sync(self) -> None:
-        ''' Sync this node into disk.
+        ''' Sync this node into disk, and log its changes since synced last time.
         '''
         if not self.data_modified: return
         self.data_modified = False
+        page_no = self.header.page_no
+        if page_no != self.logged_page_no:
+            (self.logged, self.logged_page_no, self.lsn) = (None, page_no, 0)
+        lsn = lm_manager.log_diff(self.file_id, page_no, self.logged, self.data, buffered=False)
+        self.lsn = max(self.lsn, lsn)
+        self.logged = self.data.copy()
         node_cache[self.file_id][self.header.page_no] = self
         
     
@@ -294,15 +309,12 @@ class IX_TreeNode:
                 print(f' '*4*(depth+1), end=''); print(line)
         if self.header.node_type == cf.NODE_TYPE_INTER:
             for page_no in [self.header.first_child] + [x.page_no for x in self.get_all_entries()]:
-                node = node_cache[self.file_id].get(page_no)
-                if node is None:
-                    node = IX_TreeNode.deserialize(self.file_id,
-                        self.field_types, self.field_sizes, self.node_capacity,
-                        pf_manager.read_page(self.file_id, page_no))
-                    node_cache[self.file_id][page_no] = node
+                node = load_node(self.file_id, self.field_types, self.field_sizes,
+                    self.node_capacity, page_no)
                 node.print_subtree(depth+1)
         
     
+    @traced('ix.node_insert')
     def insert(self, field_values:List[Union[int,float,str]], page_no:int, slot_no:int, verbose:int,
         ancestors:Tuple[int]) -> None:
         ''' Insert an entry to this node recursively.
@@ -342,16 +354,13 @@ class IX_TreeNode:
                 elif entry.slot_no == cf.INVALID:
                     bucket_page = entry.page_no
                     while True:     # find the first free bucket
-                        bucket = bucket_cache[file_id].get(bucket_page)
-                        if bucket is None:
-                            bucket = IX_RidBucket.deserialize(pf_manager.read_page(file_id, bucket_page))
-                            bucket_cache[file_id][bucket_page] = bucket
+                        bucket = load_bucket(file_id, bucket_page)
                         if bucket.free_space() > 0: break
                         if bucket.header.next_page == cf.INVALID:   # alloc a new bucket
                             new_page = pf_manager.append_page(file_id)
                             bucket.set_next_page(new_page)
                             bucket.sync(file_id, bucket_page)
-                            bucket = IX_RidBucket()
+                            bucket = IX_RidBucket(pf_manager.get_page_size(file_id))
                             bucket_page = new_page
                             break
                         bucket_page = bucket.header.next_page
@@ -359,7 +368,7 @@ class IX_TreeNode:
                     bucket.sync(file_id, bucket_page)
                 else:   # alloc the first bucket page here
                     bucket_page = pf_manager.append_page(file_id)
-                    bucket = IX_RidBucket()
+                    bucket = IX_RidBucket(pf_manager.get_page_size(file_id))
                     bucket.insert_rid(RM_Rid(entry.page_no, entry.slot_no), entry.verbose)
                     bucket.insert_rid(RM_Rid(page_no, slot_no), verbose)
                     bucket.sync(file_id, bucket_page)
@@ -406,11 +415,8 @@ class IX_TreeNode:
             new_node.header.prev_sib = header.page_no
             new_node.header.next_sib = header.next_sib
             if header.next_sib != cf.INVALID:
-                next_node = node_cache[file_id].get(header.next_sib)
-                if next_node is None:
-                    next_node = IX_TreeNode.deserialize(file_id, field_types, field_sizes,
-                        node_capacity, pf_manager.read_page(file_id, header.next_sib))
-                    node_cache[file_id][header.next_sib] = next_node
+                next_node = load_node(file_id, field_types, field_sizes,
+                    node_capacity, header.next_sib)
                 next_node.header.prev_sib = new_page
                 next_node.data_modified = True
                 next_node.sync()
@@ -438,11 +444,8 @@ class IX_TreeNode:
                 new_root.data_modified = True
                 new_root.sync()
             else: # current node is not root, insert upward recursively
-                up_node = node_cache[file_id].get(ancestors[-1])
-                if up_node is None:
-                    up_node = IX_TreeNode.deserialize(file_id, field_types, field_sizes,
-                        node_capacity, pf_manager.read_page(file_id, ancestors[-1]))
-                    node_cache[file_id][ancestors[-1]] = up_node
+                up_node = load_node(file_id, field_types, field_sizes,
+                    node_capacity, ancestors[-1])
                 up_node.insert(up_field_values, up_page_no, up_slot_no, up_verbose, ancestors[:-1])
         self.data[:header_size] = header.serialize()
         self.data_modified = True
@@ -469,26 +472,36 @@ class IX_TreeNode:
             self.set_entry(idx-1, entry)
             self.sync()
         elif entry.slot_no == cf.INVALID:   # point to a rid bucket
-            bucket_page = entry.page_no
+            bucket_page, prev_bucket, prev_page = entry.page_no, None, cf.INVALID
             while True:
-                bucket = bucket_cache[file_id].get(bucket_page)
-                if bucket is None:
-                    bucket = IX_RidBucket.deserialize(pf_manager.read_page(file_id, bucket_page))
-                    bucket_cache[file_id][bucket_page] = bucket
+                bucket = load_bucket(file_id, bucket_page)
                 slot = bucket.search_rid(page_no, slot_no)
                 if slot != cf.INVALID:
                     bucket.remove_rid(slot)
-                    bucket.sync(file_id, bucket_page)
+                    if bucket.header.rid_cnt > 0:
+                        bucket.sync(file_id, bucket_page)
+                        break
+                    # unlink the empty bucket and release its page
+                    next_page = bucket.header.next_page
+                    if prev_bucket is None:
+                        entry.page_no = next_page
+                        if next_page == cf.INVALID: entry.slot_no = cf.INVALID
+                        self.set_entry(idx-1, entry)
+                        self.sync()
+                    else:
+                        prev_bucket.set_next_page(next_page)
+                        prev_bucket.sync(file_id, prev_page)
+                    bucket_cache[file_id].pop(bucket_page, None)
+                    lm_manager.release_page(file_id, bucket_page)
                     break
                 if bucket.header.next_page == cf.INVALID: break
-                bucket_page = bucket.header.next_page
+                bucket_page, prev_bucket, prev_page = bucket.header.next_page, bucket, bucket_page
                 
     
     def modify_verbose(self, field_values:List[Union[int,float,str]], delta:int) -> List[int]:
         ''' Add delta to all verbose fileds of the field values.
             Return the modified verbose values.
         '''
-        BYTE_ORDER = cf.BYTE_ORDER
         header = self.header
         if header.node_type != cf.NODE_TYPE_LEAF:
             raise NodeRemoveError(f'Trying to remove an entry from a non-leaf node.')
@@ -507,30 +520,62 @@ class IX_TreeNode:
         res = []
         bucket_page = entry.page_no
         while True:
-            bucket = bucket_cache[file_id].get(bucket_page)
-            if bucket is None:
-                bucket = IX_RidBucket.deserialize(pf_manager.read_page(file_id, bucket_page))
-                bucket_cache[file_id][bucket_page] = bucket
-            base_off = bucket.header.size() + bucket.bitmap.size
-            entry_size = 12
-            for i in bucket.bitmap.occupied_slots():
-                off = base_off + i * entry_size + 8
-                verbose, = struct.unpack(f'{BYTE_ORDER}i', bucket.data[off:off+4].tobytes())
-                bucket.data[off:off+4] = np.frombuffer(
-                    struct.pack(f'{BYTE_ORDER}i', verbose+delta), dtype=np.uint8)
-                res.append(verbose + delta)
-            bucket.data_modified = True
+            bucket = load_bucket(file_id, bucket_page)
+            res += bucket.add_verbose(delta)
             bucket.sync(self.file_id, bucket_page)
             if bucket.header.next_page == cf.INVALID: break
             bucket_page = bucket.header.next_page
         return res
     
 
+def load_node(file_id:int, field_types:List[int], field_sizes:List[int],
+        node_capacity:int, page_no:int) -> IX_TreeNode:
+    ''' Get a tree node from the node cache.
+        If not cached, deserialize it from the pinned page and cache it.
+    '''
+    node = node_cache[file_id].get(page_no)
+    if node is None:
+        page = pf_manager.pin_page(file_id, page_no)
+        try: node = IX_TreeNode.deserialize(file_id, field_types, field_sizes, node_capacity, page)
+        finally: pf_manager.unpin_page(file_id, page_no)
+        with node_cache_lock:
+            node = node_cache[file_id].setdefault(page_no, node)
+    return node
+    
+
+def load_nodes(file_id:int, field_types:List[int], field_sizes:List[int],
+        node_capacity:int, page_nos:List[int]) -> None:
+    ''' Cache the tree nodes not cached yet, reading their pages together by pf_manager.read_pages().
+    '''
+    cache = node_cache[file_id]
+    missed = sorted(set(page_no for page_no in page_nos if page_no not in cache))
+    if not missed: return
+    nodes = [IX_TreeNode.deserialize(file_id, field_types, field_sizes, node_capacity, page)
+        for page in pf_manager.read_pages(file_id, missed)]
+    with node_cache_lock:
+        for page_no, node in zip(missed, nodes):
+            cache.setdefault(page_no, node)
+    
+
+def write_node_cache(file_id:int):
+    ''' Write the nodes logged since written last time to pf_manager, keeping them cached.
+        The image logged is written, which is never changed in place. Called by the checkpoints.
+    '''
+    with node_cache_lock:
+        nodes = list(node_cache.get(file_id, {}).values())
+    for node in nodes:
+        logged = node.logged
+        lsn = node.lsn  # read after the image, it is updated before
+        if logged is None or logged is node.written: continue
+        pf_manager.write_page(file_id, node.logged_page_no, logged, lsn)
+        node.written = logged
+
+
 def flush_node_cache(file_id:int):
     ''' Sync all nodes in node cache to pf_manager.
     '''
     for page_id, node in node_cache[file_id].items():
-        pf_manager.write_page(file_id, page_id, node.serialize())
+        pf_manager.write_page(file_id, page_id, node.data, node.lsn)
     node_cache.pop(file_id, None)
                 
     
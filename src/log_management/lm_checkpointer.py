@@ -0,0 +1,48 @@
+import threading
+
+import config as cf
+
+
+class LM_Checkpointer:
+    ''' A daemon thread taking the checkpoints of a log. Every CHECKPOINT_INTERVAL seconds it calls
+        LM_Manager.checkpoint() if anything was logged since the last checkpoint, or earlier when
+        woken up as CHECKPOINT_LOG_SIZE bytes have been logged.
+    '''
+
+
+    def __init__(self, manager, interval:float=cf.CHECKPOINT_INTERVAL):
+        ''' Init the checkpointer of a LM_Manager, call start() to run it.
+        args:
+            interval: float, the seconds between two checkpoints.
+        '''
+        self.manager = manager
+        self.interval = interval
+        self.stop_event = threading.Event()
+        self.wake_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, name='lm-checkpointer', daemon=True)
+
+
+    def _run(self):
+        while True:
+            self.wake_event.wait(self.interval)
+            self.wake_event.clear()
+            if self.stop_event.is_set(): break
+            if self.manager.next_lsn > self.manager.checkpoint_lsn:
+                self.manager.checkpoint()
+
+
+    def start(self):
+        self.thread.start()
+
+
+    def wake(self):
+        ''' Take a checkpoint now, without waiting for the interval.
+        '''
+        self.wake_event.set()
+
+
+    def stop(self):
+        ''' Stop the checkpointer after its current checkpoint, without waiting for it.
+        '''
+        self.stop_event.set()
+        self.wake_event.set()
@@ -0,0 +1,99 @@
+import zlib
+import struct
+import numpy as np
+from typing import List, Tuple
+
+import config as cf
+from errors.err_log_management import ReadLogError
+
+
+LOG_UPDATE = 0      # the after image of some byte ranges of a page
+LOG_FORMAT = 1      # a page zeroed, e.g. appended to its file, then the byte ranges written
+LOG_COMMIT = 2      # the end of a statement, the records before it are durable once it is
+
+
+class LM_LogRecord:
+    ''' A record of the write-ahead log. The changes of a page are logged physically, as the after
+        images of its changed byte ranges, so a record can be redone any times with the same result.
+        On disk, a record is framed by its body length and the crc32 of its body, so a record torn by
+        a crash is detected.
+    '''
+
+
+    def __init__(self, record_type:int, file_name:str='', page_id:int=cf.INVALID,
+            segments:List[Tuple[int, bytes]]=(), page_size:int=cf.PAGE_SIZE):
+        ''' Init a log record.
+        args:
+            record_type: int, in {LOG_UPDATE, LOG_FORMAT, LOG_COMMIT}.
+            file_name: str, the page file, as it was opened by PF_Manager.
+            page_id: int, the page changed.
+            segments: List[Tuple[int, bytes]], the offsets in the page and the bytes written there.
+            page_size: int, the page size of the file, to redo the record before reading the file meta.
+        '''
+        self.record_type = record_type
+        self.file_name = file_name
+        self.page_id = page_id
+        self.segments = list(segments)
+        self.page_size = page_size
+
+
+    def __str__(self) -> str:
+        return f'{{{self.record_type}, {self.file_name}, {self.page_id}, ' \
+            + f'{[(offset, len(data)) for offset, data in self.segments]}}}'
+
+
+    @staticmethod
+    def frame_size() -> int:
+        return 8    # body length before the body, crc32 after it
+
+
+    def serialize(self) -> bytes:
+        ''' Serialize the record into its framed bytes.
+        '''
+        BYTE_ORDER = cf.BYTE_ORDER
+        name = self.file_name.encode('utf-8')
+        parts = [struct.pack(f'{BYTE_ORDER}biiHH', self.record_type, self.page_id, self.page_size,
+            len(name), len(self.segments)), name]
+        for offset, data in self.segments:
+            parts.append(struct.pack(f'{BYTE_ORDER}ii', offset, len(data)))
+            parts.append(data)
+        body = b''.join(parts)
+        return struct.pack(f'{BYTE_ORDER}I', len(body)) + body + struct.pack(f'{BYTE_ORDER}I', zlib.crc32(body))
+
+
+    @staticmethod
+    def deserialize(data:bytes, off:int=0):
+        ''' Deserialize a framed record at data[off:].
+        return: Tuple[LM_LogRecord, int], the record and its framed size.
+            ReadLogError is raised if the record is incomplete or corrupted.
+        '''
+        BYTE_ORDER = cf.BYTE_ORDER
+        if off + 4 > len(data):
+            raise ReadLogError(f'Incomplete log record at {off}.')
+        (body_size,) = struct.unpack_from(f'{BYTE_ORDER}I', data, off)
+        end = off + 4 + body_size
+        if body_size < 13 or end + 4 > len(data):
+            raise ReadLogError(f'Incomplete log record at {off}.')
+        body = data[off+4:end]
+        if zlib.crc32(body) != struct.unpack_from(f'{BYTE_ORDER}I', data, end)[0]:
+            raise ReadLogError(f'Corrupted log record at {off}.')
+        record_type, page_id, page_size, name_size, segment_cnt = struct.unpack_from(f'{BYTE_ORDER}biiHH', body, 0)
+        pos = 13 + name_size
+        file_name = bytes(body[13:pos]).decode('utf-8')
+        segments = []
+        for _ in range(segment_cnt):
+            offset, size = struct.unpack_from(f'{BYTE_ORDER}ii', body, pos)
+            pos += 8
+            segments.append((offset, bytes(body[pos:pos+size])))
+            pos += size
+        return LM_LogRecord(record_type, file_name, page_id, segments, page_size), end + 4 - off
+
+
+    def apply(self, page:np.ndarray):
+        ''' Redo the record on a page.
+        args:
+            page: np.ndarray[(page_size,), uint8], changed in place.
+        '''
+        if self.record_type == LOG_FORMAT: page[:] = 0
+        for offset, data in self.segments:
+            page[offset:offset+len(data)] = np.frombuffer(data, dtype=np.uint8)
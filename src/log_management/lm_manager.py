@@ -0,0 +1,398 @@
+import os
+import struct
+import threading
+import numpy as np
+from typing import Callable, Dict, Iterator, List, Set, Tuple
+
+import config as cf
+from paged_file.pf_manager import pf_manager
+from paged_file.pf_io import pread, pwrite
+from log_management.lm_log_record import LM_LogRecord, LOG_UPDATE, LOG_FORMAT, LOG_COMMIT
+from log_management.lm_checkpointer import LM_Checkpointer
+from errors.err_log_management import *
+from errors.err_paged_file import MarkDirtyError
+
+
+LOG_MAGIC = b'PYDBWAL1'
+LOG_HEADER_SIZE = 16    # the magic, and the LSN of the first record position
+
+
+class LM_Manager:
+    ''' The write-ahead log manager of the opened database, it is thread-safe.
+        The record management and the index management log the changes of their pages before writing
+        them to PF_Manager, which writes a dirty page back only after the log is durable up to the
+        LSN of the page. The LSN of a record is the position just past it in the log, counted from
+        the creation of the log, so flushing up to an LSN writes and syncs the log up to there.
+        The records are appended to a buffer in memory. A commit waits for its records to be synced,
+        and the commits arriving meanwhile are synced together by the next fsync, i.e. group commit.
+        The pages of memory-mapped files are written back by the OS, the log can not go first there.
+        A fuzzy checkpoint writes back the changes logged before it started while the queries go on,
+        then drops those records from the log, so the recovery after a crash redoes only the records
+        after the last checkpoint.
+    '''
+
+
+    def __init__(self):
+        self.file_id = cf.INVALID
+        self.file_name: str = None
+        self.base_lsn = 0       # the LSN of the first record position of the log file
+        self.buffer = bytearray()
+        self.next_lsn = 0       # the end of the records appended
+        self.flushed_lsn = 0    # the end of the records synced to disk
+        self.flushing = False   # a thread is writing and syncing the buffer
+        self.committers = 0     # the threads in commit()
+        self.condition = threading.Condition()
+        self.logged_files: Set[str] = set()
+        # checkpoints, the hooks write the pages cached out of PF_Manager, e.g. the index nodes
+        self.checkpoint_lock = threading.Lock()
+        self.checkpoint_lsn = 0     # the LSN the last checkpoint started at
+        self.checkpoint_hooks: List[Callable[[], None]] = []
+        self.checkpointer: LM_Checkpointer = None
+        self.stats: Dict[str, int] = dict.fromkeys(('records', 'commits', 'flushes', 'bytes', 'checkpoints', 'redone'), 0)
+
+
+    @property
+    def is_open(self) -> bool:
+        return self.file_id != cf.INVALID
+
+
+    def open(self, file_name:str):
+        ''' Open the log file, create it if it does not exist. A torn record at the end of
+            the log, left by a crash, is truncated.
+        '''
+        with self.condition:
+            if self.is_open:
+                raise OpenLogError(f'Log {self.file_name} has been opened.')
+            try: file_id = os.open(file_name, cf.FILE_OPEN_MODE | os.O_CREAT)
+            except OSError as exception:
+                raise OpenLogError(f'Failed to open log {file_name}: {exception}.')
+            header = pread(file_id, LOG_HEADER_SIZE, 0)
+            if len(header) < LOG_HEADER_SIZE:
+                base_lsn = 0
+                pwrite(file_id, LOG_MAGIC + struct.pack(f'{cf.BYTE_ORDER}q', base_lsn), 0)
+            elif header[:len(LOG_MAGIC)] != LOG_MAGIC:
+                os.close(file_id)
+                raise OpenLogError(f'File {file_name} is not a log file.')
+            else: (base_lsn,) = struct.unpack(f'{cf.BYTE_ORDER}q', header[len(LOG_MAGIC):])
+            (self.file_id, self.file_name, self.base_lsn) = (file_id, file_name, base_lsn)
+            end = base_lsn
+            for lsn, _ in self.read_records(): end = lsn
+            os.ftruncate(file_id, LOG_HEADER_SIZE + end - base_lsn)
+            os.fsync(file_id)
+            self.next_lsn = self.flushed_lsn = self.checkpoint_lsn = end
+            self.buffer.clear()
+            self.logged_files.clear()
+        pf_manager.set_log_flush(self.flush)
+        if cf.CHECKPOINT_INTERVAL > 0:
+            self.checkpointer = LM_Checkpointer(self)
+            self.checkpointer.start()
+
+
+    def close(self):
+        ''' Flush and close the log. If no file logged is opened any more, all pages logged
+            are on disk, then the log is emptied.
+        '''
+        if not self.is_open: return
+        if self.checkpointer is not None:
+            self.checkpointer.stop()
+            self.checkpointer = None
+        with self.checkpoint_lock:      # wait for the running checkpoint
+            self.flush()
+            pf_manager.set_log_flush(None)
+            if not self.logged_files & set(pf_manager.file_name_to_id):
+                self._truncate(self.next_lsn)
+            with self.condition:
+                os.close(self.file_id)
+                self.file_id = cf.INVALID
+                self.file_name = None
+
+
+    def _truncate(self, lsn:int):
+        ''' Drop the records before <lsn> from the log, they should have been synced. The records
+            after it are copied to a new log file, which replaces the old one at once.
+        '''
+        with self.condition:
+            while self.flushing: self.condition.wait()
+            self.flushing = True    # no other thread writes the log file meanwhile
+            flushed_lsn, base_lsn = self.flushed_lsn, self.base_lsn
+        try:
+            tail = pread(self.file_id, flushed_lsn - lsn, LOG_HEADER_SIZE + lsn - base_lsn)
+            temp_name = self.file_name + '.tmp'
+            file_id = os.open(temp_name, cf.FILE_OPEN_MODE | os.O_CREAT | os.O_TRUNC)
+            try:
+                self._write_all(file_id, LOG_MAGIC + struct.pack(f'{cf.BYTE_ORDER}q', lsn) + tail, 0)
+                os.fsync(file_id)
+                os.replace(temp_name, self.file_name)
+            except OSError as exception:
+                os.close(file_id)
+                raise WriteLogError(f'Failed to truncate log {self.file_name}: {exception}.')
+            self._sync_dir()
+            os.close(self.file_id)
+            with self.condition:
+                self.file_id, self.base_lsn = file_id, lsn
+        finally:
+            with self.condition:
+                self.flushing = False
+                self.condition.notify_all()
+
+
+    @staticmethod
+    def _write_all(file_id:int, data:bytes, offset:int):
+        written = 0
+        while written < len(data):
+            written += pwrite(file_id, data[written:], offset + written)
+
+
+    def _sync_dir(self):
+        ''' Sync the directory of the log file, so a log file replaced survives a crash.
+        '''
+        try: dir_id = os.open(os.path.dirname(os.path.abspath(self.file_name)), os.O_RDONLY)
+        except OSError as exception: return     # directories can not be opened, e.g. on Windows
+        try: os.fsync(dir_id)
+        except OSError as exception: pass
+        finally: os.close(dir_id)
+
+
+    def _append(self, record:LM_LogRecord) -> int:
+        ''' Append a record to the log buffer, called holding self.condition.
+        return: int, the LSN of the record.
+        '''
+        data = record.serialize()
+        self.buffer += data
+        self.next_lsn += len(data)
+        self.stats['records'] += 1
+        self.stats['bytes'] += len(data)
+        return self.next_lsn
+
+
+    def _wait_durable(self, lsn:int, delay:float=0.0):
+        ''' Wait until the log is synced up to <lsn>, called holding self.condition.
+            If no other thread is syncing the log, this thread syncs the whole buffer, after
+            waiting <delay> seconds for others to append their records.
+        '''
+        while self.flushed_lsn < lsn:
+            if self.flushing:
+                self.condition.wait()
+                continue
+            self.flushing = True
+            try:
+                if delay > 0: self.condition.wait(delay)
+                data, end = bytes(self.buffer), self.next_lsn
+                self.buffer.clear()
+                self.condition.release()    # let others append their records meanwhile
+                try:
+                    self._write_all(self.file_id, data, LOG_HEADER_SIZE + end - len(data) - self.base_lsn)
+                    os.fsync(self.file_id)
+                except OSError as exception:
+                    raise WriteLogError(f'Failed to write log {self.file_name}: {exception}.')
+                finally: self.condition.acquire()
+                self.flushed_lsn = end
+                self.stats['flushes'] += 1
+            finally:
+                self.flushing = False
+                self.condition.notify_all()
+
+
+    def log_page(self, file_id:int, page_id:int, page:np.ndarray, ranges:List[Tuple[int, int]],
+            new:bool=False, buffered:bool=True) -> int:
+        ''' Log the after image of some byte ranges of a page.
+        args:
+            page: np.ndarray[(page_size,), uint8], the page after the change.
+            ranges: List[Tuple[int, int]], the offsets and sizes of the changed ranges.
+            new: bool, whether the page was zeroed first, e.g. appended or reused.
+            buffered: bool, whether the change has been made in the buffer page of PF_Manager, which is
+                marked dirty with the LSN together, so a checkpoint started later writes it back.
+                Otherwise pass the LSN when writing the page to PF_Manager.
+        return: int, the LSN, 0 if the log is not opened or nothing changed.
+        '''
+        segments = [(offset, page[offset:offset+size].tobytes()) for offset, size in ranges if size > 0]
+        lsn = 0
+        if self.is_open and (segments or new):
+            file_name = pf_manager.file_id_to_name[file_id]
+            with self.condition:
+                self.logged_files.add(file_name)
+                lsn = self._append(LM_LogRecord(LOG_FORMAT if new else LOG_UPDATE, file_name, page_id,
+                    segments, pf_manager.get_page_size(file_id)))
+                if buffered: self._mark_dirty(file_id, page_id, lsn)
+                if self.checkpointer is not None and lsn - self.checkpoint_lsn > cf.CHECKPOINT_LOG_SIZE:
+                    self.checkpointer.wake()
+        elif buffered: self._mark_dirty(file_id, page_id, lsn)
+        return lsn
+
+
+    @staticmethod
+    def _mark_dirty(file_id:int, page_id:int, lsn:int):
+        try: pf_manager.mark_dirty(file_id, page_id, lsn)
+        except MarkDirtyError as exception: pass    # evicted meanwhile, written back with the change
+
+
+    @staticmethod
+    def diff_ranges(old:np.ndarray, new:np.ndarray) -> List[Tuple[int, int]]:
+        ''' Find the changed byte ranges between two images of a page. The ranges closer
+            than WAL_MERGE_GAP bytes are merged, to save the framing of the segments.
+        return: List[Tuple[int, int]], the offsets and sizes.
+        '''
+        changed = np.flatnonzero(old != new)
+        if len(changed) == 0: return []
+        breaks = np.flatnonzero(np.diff(changed) > cf.WAL_MERGE_GAP)
+        starts = np.concatenate(([changed[0]], changed[breaks + 1]))
+        ends = np.concatenate((changed[breaks], [changed[-1]])) + 1
+        return list(zip(starts.tolist(), (ends - starts).tolist()))
+
+
+    def log_diff(self, file_id:int, page_id:int, old:np.ndarray, new:np.ndarray, buffered:bool=True) -> int:
+        ''' Log the changes of a page from its image logged last time.
+        args:
+            old: np.ndarray[(page_size,), uint8] or None, None for a page appended to the file.
+            new: np.ndarray[(page_size,), uint8], the page after the change.
+            buffered: bool, see log_page().
+        return: int, the LSN, 0 if the log is not opened or nothing changed.
+        '''
+        if not self.is_open: return 0
+        if old is None:
+            return self.log_page(file_id, page_id, new, self.diff_ranges(0, new), True, buffered)
+        return self.log_page(file_id, page_id, new, self.diff_ranges(old, new), False, buffered)
+
+
+    def release_page(self, file_id:int, page_id:int):
+        ''' Release a page by pf_manager.release_page(), which zeroes it except the link to the
+            previous released page in its first 4 bytes. The page is logged before it is changed,
+            and a checkpoint starts either before the record or after the change.
+        '''
+        def log(page:np.ndarray) -> int:
+            return self.log_page(file_id, page_id, page, [(0, 4)], new=True, buffered=False)
+        with self.condition:
+            pf_manager.release_page(file_id, page_id, log)
+
+
+    def commit(self) -> int:
+        ''' Log the end of a statement and wait until it is durable. The commits of other
+            threads are synced together. If other threads are committing, the thread syncing
+            waits WAL_COMMIT_DELAY seconds first, so more commits join its fsync.
+        return: int, the LSN of the commit record, 0 if the log is not opened.
+        '''
+        with self.condition:
+            if not self.is_open: return 0
+            self.committers += 1
+            try:
+                lsn = self._append(LM_LogRecord(LOG_COMMIT))
+                self.stats['commits'] += 1
+                self._wait_durable(lsn, cf.WAL_COMMIT_DELAY if self.committers > 1 else 0.0)
+            finally: self.committers -= 1
+        return lsn
+
+
+    def flush(self, lsn:int=None):
+        ''' Sync the log up to <lsn>, all the records appended if None.
+            Called by PF_Manager before writing back a page.
+        '''
+        with self.condition:
+            if not self.is_open: return
+            self._wait_durable(self.next_lsn if lsn is None else min(lsn, self.next_lsn))
+
+
+    def add_checkpoint_hook(self, hook:Callable[[], None]):
+        ''' Add a function called by each checkpoint, to write the logged pages cached out of
+            PF_Manager to it.
+        '''
+        self.checkpoint_hooks.append(hook)
+
+
+    def checkpoint(self) -> int:
+        ''' Take a fuzzy checkpoint. The pages changed before it started are written back and synced,
+            the buffer pages in batches releasing the lock of PF_Manager, so the queries go on meanwhile.
+            The changes made meanwhile are logged after the start, and redone by the recovery.
+            At last the records before the start are dropped from the log.
+        return: int, the LSN the checkpoint started at, 0 if the log is not opened.
+        '''
+        with self.checkpoint_lock:
+            with self.condition:
+                if not self.is_open: return 0
+                start_lsn = self.next_lsn
+            for hook in self.checkpoint_hooks: hook()
+            pf_manager.checkpoint(cf.CHECKPOINT_BATCH_PAGES, cf.CHECKPOINT_BATCH_DELAY)
+            self.flush(start_lsn)
+            self._truncate(start_lsn)
+            with self.condition:
+                self.checkpoint_lsn = start_lsn
+                self.stats['checkpoints'] += 1
+        return start_lsn
+
+
+    def recover(self) -> int:
+        ''' Redo the log after a crash, before the files logged are opened. The log starts at the
+            last checkpoint, so the time is bounded by the checkpoint interval. Every complete record
+            is redone, also those after the last commit: the pages of a statement not finished may
+            have been written back by a checkpoint or an eviction already, and redoing all records
+            keeps the pages on disk consistent with each other. The records of a file not existing
+            any more, e.g. a dropped table, are skipped. The files redone are synced, then the log
+            is emptied.
+        return: int, the number of records redone.
+        '''
+        with self.checkpoint_lock:
+            if not self.is_open:
+                raise ReadLogError(f'No log has been opened.')
+            records = [record for _, record in self.read_records() if record.record_type != LOG_COMMIT]
+            if not records and self.next_lsn == self.base_lsn: return 0
+            file_ids: Dict[str, int] = {}
+            try:
+                for record in records:
+                    file_id = file_ids.get(record.file_name)
+                    if file_id is None:
+                        file_id = cf.INVALID
+                        if os.path.exists(record.file_name):
+                            file_id = pf_manager.open_file(record.file_name)
+                            pf_manager.set_page_size(file_id, record.page_size)
+                        file_ids[record.file_name] = file_id
+                    if file_id == cf.INVALID: continue
+                    page_cnt = pf_manager.get_page_cnt(file_id)
+                    if record.page_id >= page_cnt:
+                        pf_manager.allocate_pages(file_id, record.page_id + 1 - page_cnt)
+                    page = pf_manager.pin_page(file_id, record.page_id)
+                    try:
+                        record.apply(page)
+                        pf_manager.mark_dirty(file_id, record.page_id)
+                    finally: pf_manager.unpin_page(file_id, record.page_id)
+            finally:
+                for file_id in file_ids.values():
+                    if file_id != cf.INVALID: pf_manager.close_file(file_id)    # synced to the disk
+            self._truncate(self.next_lsn)
+            with self.condition:
+                self.checkpoint_lsn = self.next_lsn
+                self.stats['redone'] += len(records)
+            return len(records)
+
+
+    def read_records(self, start_lsn:int=None) -> Iterator[Tuple[int, LM_LogRecord]]:
+        ''' Read the records synced to the log file, stop at the end or a torn record.
+        args:
+            start_lsn: int, the position to start from, the first record if None.
+        return: Iterator[Tuple[int, LM_LogRecord]], the LSNs and records in the log order.
+        '''
+        if not self.is_open:
+            raise ReadLogError(f'No log has been opened.')
+        start = max(self.base_lsn if start_lsn is None else start_lsn, self.base_lsn)
+        size = os.fstat(self.file_id).st_size - LOG_HEADER_SIZE - (start - self.base_lsn)
+        data = pread(self.file_id, max(size, 0), LOG_HEADER_SIZE + start - self.base_lsn)
+        off = 0
+        while off < len(data):
+            try: record, record_size = LM_LogRecord.deserialize(data, off)
+            except ReadLogError as exception: break
+            off += record_size
+            yield start + off, record
+
+
+    def get_stats(self) -> Dict[str, int]:
+        ''' Get the log statistics, the numbers of records, commits, fsync calls and bytes logged.
+        '''
+        with self.condition:
+            return dict(self.stats, next_lsn=self.next_lsn, flushed_lsn=self.flushed_lsn)
+
+
+    def reset_stats(self):
+        with self.condition:
+            self.stats = dict.fromkeys(self.stats, 0)
+
+
+
+lm_manager = LM_Manager()
@@ -9,8 +9,23 @@ import signal
 from sm_manager.sm_manager import sm_manager
 from printer.printer import Printer
 import time
+import asyncio
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from config import ASYNC_QUERY_WORKERS
+from utils.async_rwlock import AsyncRWLock
+from utils.tracing import tracer
 
-def parser_command(line):
+# statements about the tracing, not traced themselves
+TRACE_STATEMENTS = (SQLParser.Set_traceContext, SQLParser.Show_trace_statsContext, SQLParser.Reset_trace_statsContext)
+
+# statements only reading the databases, run concurrently by parser_command_async()
+READ_ONLY_STATEMENTS = (SQLParser.Select_table_Context, SQLParser.Describe_tableContext, SQLParser.Show_dbsContext,
+    SQLParser.Show_tablesContext, SQLParser.Show_indexesContext, SQLParser.Show_buffer_statsContext,
+    SQLParser.Show_buffer_quotasContext, SQLParser.Show_trace_statsContext)
+
+def parse_command(line):
+    # the parse tree to be run by execute_command(), None for a syntax error
     input_stream = InputStream(line)
 
     # lexing
@@ -21,19 +36,51 @@ def parser_command(line):
     parser = SQLParser(stream)
     tree = parser.program()
     if(parser.getNumberOfSyntaxErrors() > 0):
-        return
+        return None
+    return tree
+
+def execute_command(tree):
+    # run a parse tree from parse_command(), return the result and the seconds spent
     # use customized visitor to traverse AST
     visitor = DBVisitor()
+    start_time = time.time()
+    res = visitor.visit(tree)
+    end_time = time.time()
+    return res, end_time - start_time
 
+def parser_command(line):
+    tree = parse_command(line)
+    if tree is None:
+        return
+    traced = tracer.enabled and not any(isinstance(each.getChild(0), TRACE_STATEMENTS) for each in tree.statement())
     try:
-        start_time = time.time()
-        res = visitor.visit(tree)
-        end_time = time.time()
-        printer = Printer(res, end_time - start_time)
+        if traced:
+            tracer.reset()
+        printer = Printer(*execute_command(tree))
         printer.display()
+        if traced:
+            Printer(sm_manager.show_trace_stats(), 0).display()
     except Exception as e:
         print(repr(e))
 
+query_executor = ThreadPoolExecutor(max_workers=ASYNC_QUERY_WORKERS, thread_name_prefix='query')
+query_locks = weakref.WeakKeyDictionary()   # event loop -> AsyncRWLock
+
+async def parser_command_async(line):
+    # the asyncio entry point, return the result and the seconds spent, or None for a syntax error,
+    # and raise the exception of the statement. The statement runs on query_executor, read-only
+    # statements run concurrently, and the others run alone
+    tree = parse_command(line)
+    if tree is None:
+        return None
+    loop = asyncio.get_running_loop()
+    if loop not in query_locks:
+        query_locks[loop] = AsyncRWLock()
+    read_only = all(isinstance(each.getChild(0), READ_ONLY_STATEMENTS) for each in tree.statement())
+    lock = query_locks[loop].shared() if read_only else query_locks[loop].exclusive()
+    async with lock:
+        return await loop.run_in_executor(query_executor, execute_command, tree)
+
 exiting = False
 
 def sigint_exit(signum, frame):
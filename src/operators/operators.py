@@ -117,15 +117,18 @@ class TableScanNode(OperatorBase):
         self._table = table
         tb_name = table.get_name()
         self._inline_condition = []
+        self._pushed_condition = []
         self._condition = []
         self._columns = [Col(col_name, tb_name)
                          for col_name in table.get_column_names()]
 
     def process(self) -> RecordList:
         if (len(self._inline_condition) == 0):
-            records: List[Record] = self._table.load_all_records()
+            records: List[Record] = self._table.load_all_records(self._pushed_condition)
+            conditions = self._condition
         else:
             records: List[Record] = self._table.load_records_with_cond(self._inline_condition)
+            conditions = self._pushed_condition + self._condition
         
         # records: List[Record] = self._table.load_all_records()
         table_name = self._table.get_name()
@@ -133,7 +136,7 @@ class TableScanNode(OperatorBase):
                 for each in self._table.get_column_names()]
         results = []
         for each in records:
-            for cond in self._condition:
+            for cond in conditions:
                 if (not cond.fit(each)):
                     break
             else:
@@ -144,6 +147,9 @@ class TableScanNode(OperatorBase):
         index_no = list_int_to_int([cond.get_col_idx()])
         if(self._table.index_exist(index_no)):
             self._inline_condition.append(cond)
+        elif(self._table.can_push_down(cond)):
+            # evaluated on the raw pages by the file scan
+            self._pushed_condition.append(cond)
         else:
             self._condition.append(cond)
 
@@ -0,0 +1,128 @@
+import asyncio
+import functools
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Union
+
+import config as cf
+from paged_file.pf_manager import PF_Manager, pf_manager
+from paged_file.pf_buffer_ring import PF_BufferRing
+
+
+class PF_AsyncManager:
+    ''' The asyncio facade of PF_Manager, for engines embedded in an event loop.
+        The calls that may touch the disk run on a pool of ASYNC_IO_WORKERS threads, so they never
+        block the event loop. PF_Manager reads the disk without its lock, so the reads of concurrent
+        tasks overlap. A page read hitting the buffer is served in the event loop directly.
+        The calls never touching the disk, e.g. unpin_page(), are forwarded as they are.
+    '''
+
+
+    def __init__(self, manager:PF_Manager=pf_manager, workers:int=cf.ASYNC_IO_WORKERS):
+        ''' Wrap a paged file manager, the threads are started on demand.
+        '''
+        self.manager = manager
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='pf_async')
+
+
+    async def _run(self, method, *args):
+        ''' Run a method of the manager on the thread pool and wait for its result.
+        '''
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(method, *args))
+
+
+    async def read_page(self, file_id:int, page_id:int, ring:PF_BufferRing=None) -> np.ndarray:
+        ''' Read a page, see PF_Manager.read_page().
+        return: np.ndarray[(PAGE_SIZE,), uint8]
+        '''
+        data = self.manager.read_buffered_page(file_id, page_id)
+        if data is not None: return data
+        return await self._run(self.manager.read_page, file_id, page_id, ring)
+
+
+    async def read_pages(self, file_id:int, page_ids:List[int]) -> List[np.ndarray]:
+        ''' Read several pages of a file concurrently.
+        return: List[np.ndarray[(PAGE_SIZE,), uint8]], in the order of <page_ids>.
+        '''
+        return await asyncio.gather(*(self.read_page(file_id, page_id) for page_id in page_ids))
+
+
+    async def pin_page(self, file_id:int, page_id:int) -> np.ndarray:
+        ''' Pin a page, see PF_Manager.pin_page(). Unpin it by unpin_page().
+        return: np.ndarray[(PAGE_SIZE,), uint8], a view of the buffer page, NOT a copy.
+        '''
+        return await self._run(self.manager.pin_page, file_id, page_id)
+
+
+    def unpin_page(self, file_id:int, page_id:int):
+        self.manager.unpin_page(file_id, page_id)
+
+
+    def mark_dirty(self, file_id:int, page_id:int, lsn:int=0):
+        self.manager.mark_dirty(file_id, page_id, lsn)
+
+
+    def get_page_cnt(self, file_id:int) -> int:
+        return self.manager.get_page_cnt(file_id)
+
+
+    async def write_page(self, file_id:int, page_id:int, data:np.ndarray, lsn:int=0):
+        ''' Write a page, see PF_Manager.write_page(). It may write back an evicted page.
+        '''
+        await self._run(self.manager.write_page, file_id, page_id, data, lsn)
+
+
+    async def append_page(self, file_id:int, data:np.ndarray=None) -> int:
+        ''' Append a page, see PF_Manager.append_page().
+        return: int, the appended page id.
+        '''
+        return await self._run(self.manager.append_page, file_id, data)
+
+
+    async def allocate_pages(self, file_id:int, page_cnt:int) -> int:
+        ''' Allocate pages, see PF_Manager.allocate_pages().
+        return: int, the start page id of the allocated pages.
+        '''
+        return await self._run(self.manager.allocate_pages, file_id, page_cnt)
+
+
+    async def release_page(self, file_id:int, page_id:int):
+        await self._run(self.manager.release_page, file_id, page_id)
+
+
+    async def create_file(self, file_name:str):
+        await self._run(self.manager.create_file, file_name)
+
+
+    async def remove_file(self, file_name:str):
+        await self._run(self.manager.remove_file, file_name)
+
+
+    async def open_file(self, file_name:str) -> int:
+        ''' Open a created file.
+        return: int, the file id.
+        '''
+        return await self._run(self.manager.open_file, file_name)
+
+
+    async def close_file(self, file:Union[int,str]):
+        await self._run(self.manager.close_file, file)
+
+
+    async def sync_file(self, file_id:int):
+        await self._run(self.manager.sync_file, file_id)
+
+
+    async def flush_file(self, file_id:int):
+        await self._run(self.manager.flush_file, file_id)
+
+
+    def shutdown(self):
+        ''' Wait for the running calls and stop the threads.
+        '''
+        self.executor.shutdown(wait=True)
+
+
+
+pf_async_manager = PF_AsyncManager()
@@ -0,0 +1,38 @@
+import threading
+
+import config as cf
+
+
+class PF_BackgroundWriter:
+    ''' A daemon thread writing dirty buffer pages back ahead of their eviction,
+        so a query replacing a buffer page seldom waits for a disk write.
+        Every BG_WRITER_INTERVAL seconds it calls PF_Manager.clean_pages().
+    '''
+
+
+    def __init__(self, manager, interval:float=cf.BG_WRITER_INTERVAL, max_pages:int=cf.BG_WRITER_MAX_PAGES):
+        ''' Init the writer of a PF_Manager, call start() to run it.
+        args:
+            interval: float, the seconds between two rounds.
+            max_pages: int, the max number of pages written in a round.
+        '''
+        self.manager = manager
+        self.interval = interval
+        self.max_pages = max_pages
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, name='pf-bg-writer', daemon=True)
+
+
+    def _run(self):
+        while not self.stop_event.wait(self.interval):
+            self.manager.clean_pages(self.max_pages)
+
+
+    def start(self):
+        self.thread.start()
+
+
+    def stop(self):
+        ''' Stop the writer after its current round, without waiting for it.
+        '''
+        self.stop_event.set()
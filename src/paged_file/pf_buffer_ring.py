@@ -0,0 +1,79 @@
+import numpy as np
+from typing import Dict, List, Tuple
+
+import config as cf
+
+
+class PF_BufferRing:
+    ''' A small private ring of buffer pages used by sequential scans.
+        Pages read through a ring do not enter the shared buffer of PF_Manager,
+        so a large scan recycles the ring instead of evicting the hot pages.
+    '''
+
+
+    def __init__(self, size:int=cf.SCAN_RING_SIZE):
+        ''' Init a ring with <size> buffer pages.
+        '''
+        self.size = size
+        self.buffer: np.ndarray = np.zeros((size, cf.PAGE_SIZE), dtype=np.uint8)
+        self.page_size = cf.PAGE_SIZE
+        self.next_id = 0
+        # pages read ahead into the ring, (file_id, page_id) <=> ring frame id
+        self.prefetched: Dict[Tuple[int, int], int] = {}
+        self.frame_version: List[int] = [cf.INVALID] * size
+        self.frame_to_pair: List[Tuple[int, int]] = [None] * size
+
+
+    def fit(self, page_size:int):
+        ''' Make the ring hold pages of <page_size> bytes. If the size changes,
+            the buffer pages are reallocated and the pages read ahead are dropped.
+        '''
+        if page_size == self.page_size: return
+        self.buffer = np.zeros((self.size, page_size), dtype=np.uint8)
+        self.page_size = page_size
+        self.prefetched.clear()
+        self.frame_to_pair = [None] * self.size
+
+
+    def next_frame(self) -> np.ndarray:
+        ''' Return the next buffer page in the ring, it overwrites the oldest one.
+        return: np.ndarray[(PAGE_SIZE,), uint8], a view of the ring buffer page.
+        '''
+        return self.next_prefetch_frame(cf.INVALID, cf.INVALID, cf.INVALID)[0]
+
+
+    def next_prefetch_frame(self, file_id:int, page_id:int, version:int) -> Tuple[np.ndarray, int]:
+        ''' Return the next buffer page in the ring to hold a page read ahead.
+            The page can be found by take_prefetched() until the ring wraps around.
+        args:
+            version: int, the disk write version of the file when the page is read.
+        return: (np.ndarray[(PAGE_SIZE,), uint8], int), a view of the ring buffer page,
+            and the file id of the overwritten page if it was read ahead but never used, else INVALID.
+        '''
+        frame_id = self.next_id
+        self.next_id = (self.next_id + 1) % self.size
+        wasted = cf.INVALID
+        pair = self.frame_to_pair[frame_id]
+        if pair is not None:
+            self.prefetched.pop(pair, None)
+            wasted = pair[0]
+        self.frame_to_pair[frame_id] = None
+        if file_id != cf.INVALID:
+            self.prefetched[(file_id, page_id)] = frame_id
+            self.frame_to_pair[frame_id] = (file_id, page_id)
+            self.frame_version[frame_id] = version
+        return self.buffer[frame_id], wasted
+
+
+    def take_prefetched(self, file_id:int, page_id:int, version:int) -> np.ndarray:
+        ''' Return the ring buffer page holding a page read ahead, and mark it as used.
+            A page read before the file was written to disk again is stale and dropped.
+        return: np.ndarray[(PAGE_SIZE,), uint8] or None if the page is not in the ring.
+        '''
+        frame_id = self.prefetched.pop((file_id, page_id), cf.INVALID)
+        if frame_id == cf.INVALID: return None
+        self.frame_to_pair[frame_id] = None
+        if self.frame_version[frame_id] != version: return None
+        return self.buffer[frame_id]
+
+
@@ -0,0 +1,168 @@
+import os
+import time
+import zlib
+import numpy as np
+from typing import Dict, List, Set, Tuple
+
+import config as cf
+from paged_file.pf_io import pread, pwrite
+
+
+class PF_CompressedFile:
+    ''' A paged file storing each page compressed by zlib, used by the COMPRESSED backend of PF_Manager.
+        A page is stored in a slot of the file, of a multiple of COMPRESSION_ALIGN bytes up to the page size,
+        and a page not smaller after compression is stored as it is. The page map, page_id -> (offset,
+        length, slot size), is kept in the sidecar file <file_name>PAGE_MAP_SUFFIX. A page is rewritten
+        into its slot if it fits and the map on disk does not refer to the slot, otherwise into a free slot
+        or at the end of the file. A slot the map on disk refers to is freed after the map is written again,
+        so after a crash the map on disk still finds the pages it was written with, redone by the log.
+    '''
+
+
+    def __init__(self, file_id:int, file_name:str):
+        ''' Load the page map of an opened file, an empty map if the sidecar file does not exist.
+        '''
+        self.file_id = file_id
+        self.page_size = cf.PAGE_SIZE   # set by PF_Manager.set_page_size()
+        self.map_name = file_name + cf.PAGE_MAP_SUFFIX
+        # page_id -> (offset, length, slot size), offset INVALID for a page never written
+        self.slots: List[Tuple[int, int, int]] = []
+        if os.path.exists(self.map_name):
+            slots = np.fromfile(self.map_name, dtype=np.int64).reshape(-1, 3)
+            self.slots = [tuple(int(x) for x in slot) for slot in slots]
+        self.map_modified = False
+        self.synced_offsets: Set[int] = {offset for offset, _, _ in self.slots if offset != cf.INVALID}
+        self.pending_free: List[Tuple[int, int]] = []   # the slots freed but referred to by the map on disk
+        self.end = 0
+        self.free_slots: Dict[int, List[int]] = {}  # slot size -> offsets of the free slots
+        self._find_free_slots()
+        self.stats: Dict[str, float] = {'pages_written': 0, 'bytes_in': 0, 'bytes_out': 0, 'compress_time': 0.0,
+                                        'pages_read': 0, 'bytes_read': 0, 'decompress_time': 0.0}
+
+
+    @property
+    def page_cnt(self) -> int:
+        return len(self.slots)
+
+
+    def _find_free_slots(self):
+        ''' Find the end of the used slots, and collect the gaps between them as free slots.
+        '''
+        used = sorted((offset, size) for offset, _, size in self.slots if offset != cf.INVALID)
+        for offset, size in used:
+            if offset > self.end: self._free(self.end, offset - self.end)
+            self.end = max(self.end, offset + size)
+
+
+    def _free(self, offset:int, size:int):
+        ''' Return the bytes [offset, offset+size) to the free slots, as slots of at most the page size.
+        '''
+        while size > 0:
+            slot_size = min(size, self.page_size)
+            self.free_slots.setdefault(slot_size, []).append(offset)
+            offset, size = offset + slot_size, size - slot_size
+
+
+    def _release(self, offset:int, size:int):
+        ''' Free the old slot of a page moved, after the next map written if the map on disk refers to it.
+        '''
+        if offset in self.synced_offsets: self.pending_free.append((offset, size))
+        else: self._free(offset, size)
+
+
+    def _slot_size(self, length:int) -> int:
+        return min((length + cf.COMPRESSION_ALIGN - 1) // cf.COMPRESSION_ALIGN * cf.COMPRESSION_ALIGN, self.page_size)
+
+
+    def extend(self, page_cnt:int):
+        ''' Make the map hold <page_cnt> pages, the pages added have not been written.
+        '''
+        if page_cnt > len(self.slots):
+            self.slots += [(cf.INVALID, 0, 0)] * (page_cnt - len(self.slots))
+            self.map_modified = True
+
+
+    def read(self, page_id:int) -> bytes:
+        ''' Read a page, a page never written is empty.
+        return: bytes, of the page size.
+        '''
+        offset, length, _ = self.slots[page_id] if page_id < len(self.slots) else (cf.INVALID, 0, 0)
+        if offset == cf.INVALID: return bytes(self.page_size)
+        data = pread(self.file_id, length, offset)
+        self.stats['pages_read'] += 1
+        self.stats['bytes_read'] += len(data)
+        if length == self.page_size: return data
+        tic = time.perf_counter()
+        data = zlib.decompress(data)
+        self.stats['decompress_time'] += time.perf_counter() - tic
+        return data
+
+
+    def read_run(self, page_id:int, page_cnt:int) -> bytes:
+        ''' Read <page_cnt> continuous pages. A page read ahead but failed to be decompressed,
+            e.g. while it is rewritten by another thread, ends the run.
+        return: bytes, of at least one page.
+        '''
+        pages = [self.read(page_id)]
+        for i in range(page_id + 1, min(page_id + page_cnt, len(self.slots))):
+            try: pages.append(self.read(i))
+            except zlib.error as exception:
+                break
+        return b''.join(pages)
+
+
+    def write(self, page_id:int, data:bytes):
+        ''' Compress and write a page.
+        args:
+            data: bytes, of the page size.
+        '''
+        tic = time.perf_counter()
+        compressed = zlib.compress(data, cf.COMPRESSION_LEVEL)
+        self.stats['compress_time'] += time.perf_counter() - tic
+        if len(compressed) >= self.page_size: compressed = data   # stored as it is
+        self.stats['pages_written'] += 1
+        self.stats['bytes_in'] += len(data)
+        self.stats['bytes_out'] += len(compressed)
+        self.extend(page_id + 1)
+        offset, _, slot_size = self.slots[page_id]
+        if offset == cf.INVALID or slot_size < len(compressed) or offset in self.synced_offsets:
+            if offset != cf.INVALID: self._release(offset, slot_size)
+            slot_size = self._slot_size(len(compressed))
+            free = self.free_slots.get(slot_size)
+            if free: offset = free.pop()
+            else:
+                offset = self.end
+                self.end += slot_size
+        pwrite(self.file_id, compressed, offset)
+        self.slots[page_id] = (offset, len(compressed), slot_size)
+        self.map_modified = True
+
+
+    def sync(self, durable:bool=False):
+        ''' Write the page map to its sidecar file if it is modified, replacing the old one at once.
+        args:
+            durable: bool, whether to sync the pages and then the page map to the disk, e.g. for a
+                checkpoint of the write-ahead log.
+        '''
+        if durable: os.fsync(self.file_id)      # the pages before the map referring to them
+        if self.map_modified:
+            temp_name = self.map_name + '.tmp'
+            np.array(self.slots, dtype=np.int64).reshape(-1, 3).tofile(temp_name)
+            os.replace(temp_name, self.map_name)
+            self.map_modified = False
+            self.synced_offsets = {offset for offset, _, _ in self.slots if offset != cf.INVALID}
+            for offset, size in self.pending_free: self._free(offset, size)
+            self.pending_free.clear()
+        if durable and os.path.exists(self.map_name):
+            for path in (self.map_name, os.path.dirname(os.path.abspath(self.map_name))):
+                try: file_id = os.open(path, os.O_RDONLY)
+                except OSError as exception: continue   # directories can not be opened, e.g. on Windows
+                try: os.fsync(file_id)
+                except OSError as exception: pass
+                finally: os.close(file_id)
+
+
+    def close(self):
+        ''' Write the page map. The file descriptor is not closed.
+        '''
+        self.sync()
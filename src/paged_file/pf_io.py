@@ -0,0 +1,16 @@
+import os
+import threading
+
+
+if hasattr(os, 'pread'):
+    pread, pwrite = os.pread, os.pwrite
+else:   # no positional I/O, e.g. on Windows, emulate it under a lock since the file offset is shared
+    seek_lock = threading.Lock()
+    def pread(file_id:int, size:int, offset:int) -> bytes:
+        with seek_lock:
+            os.lseek(file_id, offset, os.SEEK_SET)
+            return os.read(file_id, size)
+    def pwrite(file_id:int, data:bytes, offset:int) -> int:
+        with seek_lock:
+            os.lseek(file_id, offset, os.SEEK_SET)
+            return os.write(file_id, data)
@@ -1,35 +1,111 @@
 import os
+import time
 import struct
+import functools
+import threading
 import numpy as np
-from typing import NoReturn, List, Tuple, Dict, Set, Union
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, NoReturn, List, Tuple, Dict, Set, Union
 
 import config as cf
 from errors.err_paged_file import *
-from utils.lru_list import LRUList
+from utils.replacer import Replacer, create_replacer
+from utils.tracing import traced
+from paged_file.pf_buffer_ring import PF_BufferRing
+from paged_file.pf_read_ahead import PF_ReadAhead
+from paged_file.pf_bg_writer import PF_BackgroundWriter
+from paged_file.pf_mmap_file import PF_MmapFile
+from paged_file.pf_page_table import PF_PageTable
+from paged_file.pf_compressed_file import PF_CompressedFile
+from paged_file.pf_io import pread, pwrite
+
+
+try: IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError) as exception:
+    IOV_MAX = 1024
+# per file buffer statistics, reads and writes are counted in pages
+STAT_NAMES = ('hits', 'misses', 'reads', 'writes', 'evictions', 'dirty_evictions')
+
+
+def synchronized(method):
+    ''' Run a method of PF_Manager holding its lock, which guards the buffer management state.
+    '''
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+    return wrapper
 
 
 class PF_Manager:
-    ''' The paged file manager.
+    ''' The paged file manager, it is thread-safe.
+        The buffer management state is guarded by self.lock. A page buffered is found and pinned
+        by only locking its partition of the page table, and disk reads are done without self.lock,
+        so concurrent readers mostly wait for each other only when they miss the same page.
+        Each file has its own page size, and a buffer page holds a page of any size.
+        The content of each buffer page is guarded by its latch while it is read from the disk,
+        copied out by read_page() or written by write_page(). The views returned by pin_page()
+        are not latched, the callers should not write a page read by other threads at the same time.
     '''
     
     
-    def __init__(self):
+    def __init__(self, capacity:int=cf.BUFFER_CAPACITY):
         ''' Init the paged file manager.
+            Buffer pages are allocated on demand, up to <capacity> pages.
         '''
         # disk management
         self.page_cnt: Dict[int, int] = {}
+        self.page_size: Dict[int, int] = {}     # file_id -> the page size of the file, PAGE_SIZE by default
         # file_name <=> file_id mapping
         self.file_name_to_id: Dict[str, int] = {}
         self.file_id_to_name: Dict[int, str] = {}
         # buffer management
-        self.buffer: np.ndarray = np.zeros((cf.BUFFER_CAPACITY, cf.PAGE_SIZE), dtype=np.uint8)
-        self.lru_list = LRUList(cf.BUFFER_CAPACITY)
-        self.dirty: np.ndarray = np.zeros(cf.BUFFER_CAPACITY, dtype=np.bool)
+        self.capacity = capacity
+        self.buffer: List[np.ndarray] = [None] * capacity  # None for the pages never used
+        self.replacement_policy = cf.REPLACEMENT_POLICY
+        self.replacer: Replacer = create_replacer(self.replacement_policy, capacity)
+        self.dirty: np.ndarray = np.zeros(capacity, dtype=np.bool)
+        self.page_lsn: np.ndarray = np.zeros(capacity, dtype=np.int64)  # the LSN of the last logged change
+        self.pin_cnt: np.ndarray = np.zeros(capacity, dtype=np.int64)   # changed under the page table lock of the page
+        self.latches: List[threading.Lock] = [threading.Lock() for _ in range(capacity)]
         self.buffered_pages: Dict[int, Set[int]] = {}   # file_id to a set of buffer_ids
         # (file_id, page_id) <=> buffer_id mapping
-        self.pair_to_buffer_id: Dict[Tuple[int, int], int] = {}
-        self.buffer_to_file_id: np.ndarray = np.full(cf.BUFFER_CAPACITY, cf.INVALID, dtype=np.int64)
-        self.buffer_to_page_id: np.ndarray = np.full(cf.BUFFER_CAPACITY, cf.INVALID, dtype=np.int64)
+        self.pair_to_buffer_id: PF_PageTable = PF_PageTable()
+        self.buffer_to_file_id: np.ndarray = np.full(capacity, cf.INVALID, dtype=np.int64)
+        self.buffer_to_page_id: np.ndarray = np.full(capacity, cf.INVALID, dtype=np.int64)
+        # read-ahead
+        self.read_ahead = PF_ReadAhead()
+        self.prefetched: np.ndarray = np.zeros(capacity, dtype=np.bool)  # read ahead but not used
+        self.write_version: int = 0
+        self.file_version: Dict[int, int] = {}  # file_id -> write_version of its last disk write
+        self.pending_reads: Dict[int, Tuple[int, int, int, Future]] = {}    # file_id -> (page_id, page_cnt, version, future)
+        self.executor: ThreadPoolExecutor = None
+        # the buffer hits found without self.lock, (file_id, buffer_id, prefetched), applied to the replacer later
+        self.access_log: deque = deque()
+        # the manager-wide lock, taken for the replacer, the frame allocation and the eviction
+        self.lock = threading.RLock()
+        # background writer
+        self.writer: PF_BackgroundWriter = None
+        self.writer_stats: Dict[str, int] = {'evictions': 0, 'dirty_evictions': 0, 'background_writes': 0,
+            'checkpoint_writes': 0}
+        # write-ahead log, called with an LSN to sync the log up to it before writing back a page
+        self.log_flush: Callable[[int], None] = None
+        # memory-mapped files, which bypass the buffer
+        self.file_backend = cf.FILE_BACKEND
+        self.mmap_files: Dict[int, PF_MmapFile] = {}
+        self.mmap_pin_cnt: Dict[Tuple[int, int], int] = {}
+        # compressed files, whose pages are compressed on disk and buffered as usual
+        self.compressed_files: Dict[int, PF_CompressedFile] = {}
+        # released pages of each file, chained by the first 4 bytes of each released page
+        self.free_page_head: Dict[int, int] = {}
+        self.free_page_cnt: Dict[int, int] = {}
+        # buffer quotas, key -> (reserved, limit) pages, shared by the files matching the key
+        self.buffer_quotas: Dict[str, Tuple[int, int]] = {}
+        self.file_quota: Dict[int, str] = {}   # file_id -> the key of its quota, of the opened files with a quota
+        # statistics
+        self.file_stats: Dict[int, Dict[str, int]] = {}     # file_id -> counters, of the opened files
+        self.closed_stats: Dict[str, Dict[str, int]] = {}   # file_name -> counters, of the closed files
         
         
     def _read_disk(self, file_id:int, page_id:int) -> np.ndarray:
@@ -38,11 +114,13 @@ class PF_Manager:
         '''
         if file_id not in self.file_id_to_name:
             raise ReadDiskError(f'File {file_id} has not been opened.')
-        os.lseek(file_id, page_id * cf.PAGE_SIZE, os.SEEK_SET)
-        data = os.read(file_id, cf.PAGE_SIZE)
-        if len(data) < cf.PAGE_SIZE:
+        page_size = self.page_size[file_id]
+        if file_id in self.compressed_files:
+            data = self.compressed_files[file_id].read(page_id)
+        else: data = pread(file_id, page_size, page_id * page_size)
+        if len(data) < page_size:
             raise ReadDiskError(f'Read page failed. Read bytes: {len(data)}.')
-        return np.frombuffer(data, dtype=np.uint8, count=cf.PAGE_SIZE).copy()
+        return np.frombuffer(data, dtype=np.uint8, count=page_size).copy()
             
     
     def _write_disk(self, file_id:int, page_id:int, data:np.ndarray):
@@ -52,45 +130,733 @@ class PF_Manager:
         '''
         if file_id not in self.file_id_to_name:
             raise WriteDiskError(f'File {file_id} has not been opened.')
-        if len(data) < cf.PAGE_SIZE:
+        page_size = self.page_size[file_id]
+        if len(data) < page_size:
             raise WriteDiskError(f'Not enough data to write a page.')
-        os.lseek(file_id, page_id * cf.PAGE_SIZE, os.SEEK_SET)
-        os.write(file_id, data[:cf.PAGE_SIZE].tobytes())
+        self._bump_version(file_id)
+        self._count(file_id, 'writes')
+        if file_id in self.compressed_files:
+            self.compressed_files[file_id].write(page_id, data[:page_size].tobytes())
+        else: pwrite(file_id, data[:page_size].tobytes(), page_id * page_size)
+        
+        
+    def _write_disk_sorted(self, file_id:int, buffer_ids):
+        ''' Write the pages in <buffer_ids> of a file on disk in the order of page ids.
+            Continuous pages are written by one os.pwritev() call, at most IOV_MAX pages each.
+            The caller should have checked file_id, and should clear the dirty flags.
+        '''
+        pages = sorted((int(self.buffer_to_page_id[i]), i) for i in buffer_ids)
+        if not pages: return
+        self._flush_log(buffer_ids)
+        self._bump_version(file_id)
+        self._count(file_id, 'writes', len(pages))
+        if file_id in self.compressed_files:
+            for page_id, buffer_id in pages:
+                self.compressed_files[file_id].write(page_id, self.buffer[buffer_id].tobytes())
+            return
+        page_size, start = self.page_size[file_id], 0
+        for end in range(1, len(pages) + 1):
+            if end < len(pages) and pages[end][0] == pages[end-1][0] + 1 and end - start < IOV_MAX:
+                continue
+            frames = [self.buffer[buffer_id] for _, buffer_id in pages[start:end]]
+            offset = pages[start][0] * page_size
+            size = len(frames) * page_size
+            written = os.pwritev(file_id, frames, offset) if hasattr(os, 'pwritev') else 0
+            if written < size:     # no pwritev or partially written
+                pwrite(file_id, b''.join(frame.tobytes() for frame in frames)[written:], offset + written)
+            start = end
         
         
-    def _alloc_buffer(self) -> int:
-        ''' Allocate a buffer page.
-            Find a buffer page using LRU strategy.
-            If the page is pinned, unpin it first.
-            If the page is dirty (only if it is pinned), write back to disk.
+    def _flush_log(self, buffer_ids):
+        ''' Sync the write-ahead log up to the LSNs of the buffer pages before writing them back.
+        '''
+        if self.log_flush is None or len(buffer_ids) == 0: return
+        lsn = int(self.page_lsn[list(buffer_ids)].max())
+        if lsn > 0: self.log_flush(lsn)
+        
+        
+    def _count(self, file_id:int, name:str, cnt:int=1):
+        ''' Add <cnt> to the counter <name> in STAT_NAMES of a file.
+        '''
+        stats = self.file_stats.get(file_id)
+        if stats is None:
+            stats = self.file_stats[file_id] = dict.fromkeys(STAT_NAMES, 0)
+        stats[name] += cnt
+        
+        
+    def _count_eviction(self, file_id:int, dirty:bool):
+        ''' Count a page of a file evicted from the buffer, called holding self.lock.
+        '''
+        self.writer_stats['evictions'] += 1
+        self.writer_stats['dirty_evictions'] += int(dirty)
+        self._count(file_id, 'evictions')
+        if dirty: self._count(file_id, 'dirty_evictions')
+        
+        
+    def _bump_version(self, file_id:int):
+        ''' Record a disk write of a file, pages read ahead from the file before it may be stale.
+        '''
+        self.write_version += 1
+        self.file_version[file_id] = self.write_version
+        
+        
+    def _read_disk_run(self, file_id:int, page_id:int, page_cnt:int) -> bytes:
+        ''' Read <page_cnt> continuous pages from a file on disk with one read.
+            The caller should have checked file_id.
+        return: bytes, of at least one page.
+        '''
+        if file_id in self.compressed_files:
+            return self.compressed_files[file_id].read_run(page_id, page_cnt)
+        page_size = self.page_size[file_id]
+        data = pread(file_id, page_cnt * page_size, page_id * page_size)
+        if len(data) < page_size:
+            raise ReadPageError(f'Read page failed. Read bytes: {len(data)}.')
+        return data
+    
+    
+    def _plan_run(self, file_id:int, page_id:int, max_cnt:int) -> Tuple[int, tuple, bool]:
+        ''' Plan the read of a page missed in the buffer, together with the pages read ahead after it.
+            Only the continuous pages not in the buffer are read ahead, so the buffer is never overwritten.
+            Called holding self.lock, the pages are read by _fetch_run() without it.
+        args:
+            max_cnt: int, the max number of pages to read.
+        return: (int, tuple, bool), the number of pages to read, the background read of the file
+            or None, and whether the background read covers the page.
+        '''
+        window = self.read_ahead.on_miss(file_id, page_id) if cf.READ_AHEAD_ENABLED else 1
+        page_cnt = self._unbuffered_run(file_id, page_id, min(window, max_cnt))
+        pending = self.pending_reads.pop(file_id, None)
+        usable = pending is not None and pending[0] <= page_id < pending[0] + pending[1] \
+            and pending[2] == self.file_version.get(file_id, 0)
+        return page_cnt, pending, usable
+    
+    
+    def _fetch_run(self, file_id:int, page_id:int, page_cnt:int, pending:tuple, usable:bool) -> bytes:
+        ''' Read the pages planned by _plan_run(), without holding self.lock.
+        return: bytes, the missed page followed by the pages read ahead, maybe fewer than <page_cnt>.
+        '''
+        data = None
+        if pending is not None:
+            start, _, _, future = pending
+            run = future.result()   # waited even if not usable, the file may be closed next
+            if usable:
+                page_size = self.page_size[file_id]
+                offset = (page_id - start) * page_size
+                data = run[offset: offset + page_cnt * page_size]
+                if len(data) < page_size: data = None
+        if data is None:
+            data = self._read_disk_run(file_id, page_id, page_cnt)
+        return data
+    
+    
+    def _finish_run(self, file_id:int, page_id:int, page_cnt:int):
+        ''' Record <page_cnt> pages read from <page_id>, called holding self.lock.
+            If READ_AHEAD_ASYNC, the next run is read on a background thread before it is demanded.
+        '''
+        self._count(file_id, 'reads', page_cnt)
+        self.read_ahead.on_read(file_id, page_id, page_cnt)
+        if cf.READ_AHEAD_ASYNC and page_cnt > 1 and file_id not in self.pending_reads:
+            self._read_ahead_async(file_id, page_id + page_cnt, self.read_ahead.window[file_id])
+    
+    
+    def _unbuffered_run(self, file_id:int, page_id:int, max_cnt:int) -> int:
+        ''' Count the continuous pages from <page_id> that are not buffered, at most <max_cnt>.
+        '''
+        max_cnt = min(max_cnt, self.page_cnt[file_id] - page_id)
+        page_cnt = 1
+        while page_cnt < max_cnt and (file_id, page_id + page_cnt) not in self.pair_to_buffer_id:
+            page_cnt += 1
+        return page_cnt
+    
+    
+    def _read_ahead_async(self, file_id:int, page_id:int, page_cnt:int):
+        ''' Start reading <page_cnt> pages from <page_id> on the background thread.
+            The background thread only reads the disk, the pages enter the buffer when demanded.
+        '''
+        page_cnt = min(page_cnt, self.page_cnt[file_id] - page_id)
+        if page_cnt <= 0: return
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1)
+        if file_id in self.compressed_files:
+            future = self.executor.submit(self.compressed_files[file_id].read_run, page_id, page_cnt)
+        else:
+            page_size = self.page_size[file_id]
+            future = self.executor.submit(pread, file_id, page_cnt * page_size, page_id * page_size)
+        self.pending_reads[file_id] = (page_id, page_cnt, self.file_version.get(file_id, 0), future)
+        
+        
+    def _record_access(self, file_id:int, buffer_id:int, prefetched:bool):
+        ''' Record a buffer hit found without self.lock, it is applied to the replacer and the statistics later.
+        '''
+        self.access_log.append((file_id, buffer_id, prefetched))
+        if len(self.access_log) > self.capacity and self.lock.acquire(blocking=False):
+            try: self._apply_access_log()
+            finally: self.lock.release()
+        
+        
+    def _apply_access_log(self):
+        ''' Apply the recorded buffer hits in order, called holding self.lock.
+        '''
+        while self.access_log:
+            file_id, buffer_id, prefetched = self.access_log.popleft()
+            if file_id not in self.file_id_to_name: continue
+            self._count(file_id, 'hits')
+            if prefetched: self.read_ahead.on_hit()
+            if buffer_id < self.capacity and self.buffer_to_file_id[buffer_id] == file_id:
+                self.replacer.access(buffer_id)
+        
+        
+    @traced('pf.alloc_buffer')
+    def _alloc_buffer(self, file_id:int=cf.INVALID) -> int:
+        ''' Allocate a buffer page for a page of a file, called holding self.lock.
+            Find a buffer page using the replacement policy, skipping the pinned pages,
+            and the pages kept by the buffer quotas if any.
+            If the page holds another file page, deallocate it first.
+            If the page is dirty, write back to disk.
+            The buffer page is reallocated if it was used by a file of another page size.
         return: int, the buffer id.
         '''
-        buffer_id = self.lru_list.find()
-        self._dealloc_buffer(buffer_id)
-        self.lru_list.access(buffer_id)
+        self._apply_access_log()
+        for _ in range(self.capacity):
+            buffer_id = self._find_quota_victim(file_id) if self.buffer_quotas else self.replacer.find()
+            victim_file_id = int(self.buffer_to_file_id[buffer_id])
+            victim_dirty = bool(self.dirty[buffer_id])
+            if self._dealloc_buffer(buffer_id): break
+            self.replacer.access(buffer_id)
+        else: raise AllocBufferError(f'All {self.capacity} buffer pages are pinned.')
+        if victim_file_id != cf.INVALID:
+            self._count_eviction(victim_file_id, victim_dirty)
+        self.replacer.access(buffer_id)
+        page_size = self.page_size.get(file_id, cf.PAGE_SIZE)
+        if self.buffer[buffer_id] is None or len(self.buffer[buffer_id]) != page_size:
+            self.buffer[buffer_id] = np.empty(page_size, dtype=np.uint8)
+        self.page_lsn[buffer_id] = 0
         return buffer_id
         
     
-    def _dealloc_buffer(self, buffer_id:int):
-        ''' Dealloc a buffer page.
+    def _find_quota_victim(self, file_id:int) -> int:
+        ''' Find the buffer page to be replaced by a page of a file, following the buffer quotas.
+            A file at the limit of its quota replaces its own pages. The pages of a quota holding
+            no more than its reserved pages are not replaced by the files out of the quota.
+        return: int, the buffer id, it is not pinned.
+        '''
+        key = self.file_quota.get(file_id)
+        held: Dict[str, int] = {}
+        def quota_held(key:str) -> int:
+            if key not in held:
+                held[key] = sum(len(self.buffered_pages.get(i, ())) for i, k in self.file_quota.items() if k == key)
+            return held[key]
+        at_limit = key is not None and self.buffer_quotas[key][1] != cf.INVALID \
+            and quota_held(key) >= self.buffer_quotas[key][1]
+        if not at_limit:
+            buffer_id = self.replacer.find()    # free pages are found first
+            if self.buffer_to_file_id[buffer_id] == cf.INVALID and self.pin_cnt[buffer_id] == 0:
+                return buffer_id
+        # look at the next victims first, since the full order of the buffer pages is expensive
+        for count in (min(64, self.capacity), self.capacity):
+            for buffer_id in self.replacer.victims(count):
+                if self.pin_cnt[buffer_id] > 0: continue
+                victim_key = self.file_quota.get(int(self.buffer_to_file_id[buffer_id]))
+                if at_limit and victim_key != key: continue
+                if victim_key is not None and victim_key != key and \
+                    quota_held(victim_key) <= self.buffer_quotas[victim_key][0]: continue
+                return buffer_id
+        if at_limit:
+            raise AllocBufferError(f'All {self.buffer_quotas[key][1]} buffer pages of quota {key} are pinned.')
+        raise AllocBufferError(f'All {self.capacity} buffer pages are pinned or reserved.')
+    
+    
+    def _match_quota(self, file_name:str) -> str:
+        ''' Find the buffer quota of a file, the longest key equal to its name, or a prefix of
+            its name followed by a dot. E.g. 'orders' matches 'orders.data' and 'orders.1.ixdata'.
+        return: str, the key of the quota, or None.
+        '''
+        base_name = os.path.basename(file_name)
+        keys = [key for key in self.buffer_quotas if base_name == key or base_name.startswith(key + '.')]
+        return max(keys, key=len) if keys else None
+    
+    
+    def _dealloc_buffer(self, buffer_id:int) -> bool:
+        ''' Dealloc a buffer page unless it is pinned, called holding self.lock.
             If the page is dirty, write back to disk first.
+        return: bool, False if the page is pinned.
         '''
-        file_id = self.buffer_to_file_id[buffer_id]
-        if file_id == cf.INVALID: return    # unpinned page, need not to deallocate
-        page_id = self.buffer_to_page_id[buffer_id]
+        file_id = int(self.buffer_to_file_id[buffer_id])
+        if file_id == cf.INVALID:   # unused page, need not to deallocate
+            return self.pin_cnt[buffer_id] == 0
+        page_id = int(self.buffer_to_page_id[buffer_id])
+        with self.pair_to_buffer_id.lock((file_id, page_id)):
+            if self.pin_cnt[buffer_id] > 0: return False
+            self._unmap_buffer(buffer_id, file_id, page_id)   # no other thread can pin it any more
         if self.dirty[buffer_id]:
+            self.dirty[buffer_id] = False
+            self._flush_log([buffer_id])
             self._write_disk(file_id, page_id, self.buffer[buffer_id])
-        self.dirty[buffer_id] = False
-        self.pair_to_buffer_id.pop((file_id, page_id), cf.INVALID)
-        self.buffer_to_file_id[buffer_id] = cf.INVALID
-        self.buffer_to_page_id[buffer_id] = cf.INVALID
-        self.lru_list.free(buffer_id)
+        self._free_buffer(buffer_id, file_id)
+        return True
+    
+    
+    def _map_buffer(self, buffer_id:int, file_id:int, page_id:int, pin_cnt:int=0):
+        ''' Map an allocated buffer page to a file page, called holding self.lock.
+            Other threads can find the page since then, so fill the buffer page first or latch it.
+        '''
+        with self.pair_to_buffer_id.lock((file_id, page_id)):
+            self.buffer_to_file_id[buffer_id] = file_id
+            self.buffer_to_page_id[buffer_id] = page_id
+            self.pin_cnt[buffer_id] = pin_cnt
+            self.pair_to_buffer_id[(file_id, page_id)] = buffer_id
+        if file_id not in self.buffered_pages:
+            self.buffered_pages[file_id] = set()
+        self.buffered_pages[file_id].add(buffer_id)
+    
+    
+    def _unmap_buffer(self, buffer_id:int, file_id:int, page_id:int):
+        ''' Remove a buffer page from the page table, so it can not be found by other threads.
+        '''
+        with self.pair_to_buffer_id.lock((file_id, page_id)):
+            self.pair_to_buffer_id.pop((file_id, page_id))
+            self.buffer_to_file_id[buffer_id] = cf.INVALID
+            self.buffer_to_page_id[buffer_id] = cf.INVALID
+    
+    
+    def _free_buffer(self, buffer_id:int, file_id:int):
+        ''' Return an unmapped buffer page of a file to the replacer, called holding self.lock.
+        '''
+        if self.prefetched[buffer_id]:
+            self.prefetched[buffer_id] = False
+            self.read_ahead.on_waste(file_id)
+        self.replacer.free(buffer_id)
         if file_id in self.buffered_pages:
-            if buffer_id in self.buffered_pages[file_id]:
-                self.buffered_pages[file_id].remove(buffer_id)
+            self.buffered_pages[file_id].discard(buffer_id)
             if len(self.buffered_pages[file_id]) == 0:
-                self.buffered_pages.pop(file_id, {})
-                
+                self.buffered_pages.pop(file_id)
+    
+    
+    def _pin_buffer(self, file_id:int, page_id:int) -> int:
+        ''' Pin the buffer page holding a file page, read it from the disk if not buffered.
+            A buffered page is pinned by only locking its partition of the page table.
+            The caller should have checked file_id and page_id.
+        return: int, the buffer id.
+        '''
+        pair = (file_id, page_id)
+        deadline = None
+        while True:
+            with self.pair_to_buffer_id.lock(pair):
+                buffer_id = self.pair_to_buffer_id.get(pair)
+                if buffer_id != cf.INVALID:
+                    self.pin_cnt[buffer_id] += 1
+                    prefetched = bool(self.prefetched[buffer_id])
+                    self.prefetched[buffer_id] = False
+            if buffer_id == cf.INVALID:
+                try: buffer_id = self._load_buffer(file_id, page_id)
+                except AllocBufferError as exception:
+                    deadline = self._wait_unpinned(deadline, exception)
+                    continue
+                if buffer_id != cf.INVALID: return buffer_id
+                continue    # buffered by another thread meanwhile
+            with self.latches[buffer_id]:   # wait if another thread is reading it from the disk
+                if self.buffer_to_file_id[buffer_id] == file_id and self.buffer_to_page_id[buffer_id] == page_id:
+                    self._record_access(file_id, buffer_id, prefetched)
+                    return buffer_id
+            self._unpin_buffer(pair, buffer_id)    # the read failed, try again
+    
+    
+    def _wait_unpinned(self, deadline:float, exception:AllocBufferError) -> float:
+        ''' Wait a while for other threads to unpin buffer pages, when all of them are pinned.
+        args:
+            deadline: float, the deadline returned by the previous call, None for the first call.
+        return: float, the deadline of waiting, after which <exception> is raised.
+        '''
+        if deadline is None: deadline = time.monotonic() + cf.BUFFER_WAIT_TIMEOUT
+        if time.monotonic() >= deadline: raise exception
+        time.sleep(0.001)
+        return deadline
+    
+    
+    def _unpin_buffer(self, pair:Tuple[int, int], buffer_id:int):
+        ''' Unpin a buffer page pinned when it held the page <pair>.
+        '''
+        with self.pair_to_buffer_id.lock(pair):
+            self.pin_cnt[buffer_id] -= 1
+    
+    
+    def _reserve_buffer(self, file_id:int, page_id:int, prefetched:bool) -> int:
+        ''' Allocate a buffer page for a file page to be read from the disk, called holding self.lock.
+            The buffer page is mapped, pinned once and latched, the reader should release them.
+        return: int, the buffer id.
+        '''
+        buffer_id = self._alloc_buffer(file_id)
+        self.latches[buffer_id].acquire()
+        self._map_buffer(buffer_id, file_id, page_id, pin_cnt=1)
+        self.prefetched[buffer_id] = prefetched
+        return buffer_id
+    
+    
+    def _load_buffer(self, file_id:int, page_id:int) -> int:
+        ''' Read a page missed in the buffer from the disk, together with the pages read ahead after it.
+            The buffer pages are reserved holding self.lock, and read without it while they are latched.
+            The caller should have checked file_id and page_id.
+        return: int, the pinned buffer id, or INVALID if another thread has buffered the page meanwhile.
+        '''
+        with self.lock:
+            if (file_id, page_id) in self.pair_to_buffer_id: return cf.INVALID
+            buffer_ids = [self._reserve_buffer(file_id, page_id, False)]
+            self._count(file_id, 'misses')
+            page_cnt, pending, usable = self._plan_run(file_id, page_id, self.capacity // 2)
+            try:
+                for i in range(1, page_cnt):
+                    buffer_ids.append(self._reserve_buffer(file_id, page_id + i, True))
+            except AllocBufferError as exception:
+                pass    # other threads pinned the buffer, read ahead fewer pages
+            self.replacer.access(buffer_ids[0])     # the demanded page is the most recent one
+        read_cnt = 0
+        try:
+            data = self._fetch_run(file_id, page_id, len(buffer_ids), pending, usable)
+            page_size = self.page_size[file_id]
+            read_cnt = min(len(data) // page_size, len(buffer_ids))
+            for i in range(read_cnt):
+                self.buffer[buffer_ids[i]][:] = np.frombuffer(data, dtype=np.uint8, count=page_size, offset=i * page_size)
+        finally:
+            # the pages not read are unmapped before unlatched, so the threads waiting for them try again
+            for i in range(read_cnt, len(buffer_ids)):
+                self._unmap_buffer(buffer_ids[i], file_id, page_id + i)
+            for buffer_id in buffer_ids:
+                self.latches[buffer_id].release()
+            with self.lock:
+                if read_cnt > 0: self._finish_run(file_id, page_id, read_cnt)
+                for i, buffer_id in enumerate(buffer_ids):
+                    if i >= read_cnt: self._free_buffer(buffer_id, file_id)
+                    if i > 0 or read_cnt == 0: self._unpin_buffer((file_id, page_id + i), buffer_id)
+        return buffer_ids[0]
+    
+    
+    def _read_into_ring(self, file_id:int, page_id:int, ring:PF_BufferRing) -> np.ndarray:
+        ''' Read a page not buffered into a ring, together with the pages read ahead after it.
+            The ring is private to its scan, so it is filled without holding self.lock.
+        return: np.ndarray[(PAGE_SIZE,), uint8], a view of the ring buffer page.
+        '''
+        page_size = self.page_size[file_id]
+        with self.lock:
+            version = self.file_version.get(file_id, 0)
+            ring.fit(page_size)
+            frame = ring.take_prefetched(file_id, page_id, version)
+            if frame is not None:
+                self.read_ahead.on_hit()
+                self._count(file_id, 'hits')
+                return frame
+            self._count(file_id, 'misses')
+            page_cnt, pending, usable = self._plan_run(file_id, page_id, ring.size // 2)
+        data = self._fetch_run(file_id, page_id, page_cnt, pending, usable)
+        frames, wasted_files = [], []
+        for i in range(len(data) // page_size):
+            # the demanded page is not registered as a page read ahead
+            pair = (cf.INVALID, cf.INVALID) if i == 0 else (file_id, page_id + i)
+            frame, wasted = ring.next_prefetch_frame(*pair, version)
+            frame[:] = np.frombuffer(data, dtype=np.uint8, count=page_size, offset=i * page_size)
+            if wasted != cf.INVALID: wasted_files.append(wasted)
+            frames.append(frame)
+        with self.lock:
+            self._finish_run(file_id, page_id, len(frames))
+            for wasted in wasted_files:
+                self.read_ahead.on_waste(wasted)
+        return frames[0]
+    
+    
+    
+    @synchronized
+    def set_replacement_policy(self, policy:str):
+        ''' Switch the buffer replacement policy, in {'LRU', 'CLOCK', '2Q', 'LRU-K'}.
+            Buffered pages are kept, but their access history is lost.
+        '''
+        if policy.upper() == self.replacement_policy.upper(): return
+        self._apply_access_log()
+        self.replacer = self._rebuild_replacer(policy, self.capacity)
+        self.replacement_policy = policy
+        
+        
+    def _rebuild_replacer(self, policy:str, capacity:int) -> Replacer:
+        ''' Create a replacer tracking the buffer pages in use, in the order of buffer ids.
+        '''
+        replacer = create_replacer(policy, capacity)
+        for buffer_id in np.flatnonzero(self.buffer_to_file_id[:capacity] != cf.INVALID):
+            replacer.access(int(buffer_id))
+        return replacer
+    
+    
+    @synchronized
+    def set_file_backend(self, backend:str):
+        ''' Switch the backend of the files opened later, in {'BUFFER', 'MMAP', 'COMPRESSED'}.
+            The MMAP backend maps the files with a suffix in MMAP_FILE_SUFFIXES into memory,
+            and serves their pages from the mapping instead of the buffer.
+            The COMPRESSED backend compresses the pages of the empty files with a suffix in
+            COMPRESSED_FILE_SUFFIXES when they are written back. A file compressed once stays
+            compressed under any backend, and a file not empty is never compressed later.
+        '''
+        if backend.upper() not in ('BUFFER', 'MMAP', 'COMPRESSED'):
+            raise ValueError(f'Unknown file backend {backend}, must be in {{"BUFFER", "MMAP", "COMPRESSED"}}.')
+        self.file_backend = backend.upper()
+
+
+    @synchronized
+    def set_log_flush(self, log_flush:Callable[[int], None]):
+        ''' Set the callback syncing the write-ahead log up to an LSN, or None for no log.
+            A dirty page with an LSN is written back after calling it, except the pages of
+            memory-mapped files, which are written back by the OS.
+        '''
+        self.log_flush = log_flush
+
+
+    @synchronized
+    def set_buffer_quota(self, key:str, reserved:int=0, limit:int=cf.INVALID):
+        ''' Set the buffer quota of the files matching <key>, see _match_quota(), shared by these files.
+            The pages of the files are not replaced by other files while they hold no more than <reserved>
+            pages, and they replace their own pages instead of holding more than <limit> pages.
+            The pages held beyond a new limit are evicted at once, except the pinned ones.
+        args:
+            reserved: int, the pages guaranteed to the files, 0 for none.
+            limit: int, the max pages held by the files, INVALID for no limit.
+        '''
+        if reserved < 0 or (limit != cf.INVALID and limit < max(reserved, 1)):
+            raise BufferQuotaError(f'Invalid buffer quota of {key}, reserved: {reserved}, limit: {limit}.')
+        total = reserved + sum(quota[0] for k, quota in self.buffer_quotas.items() if k != key)
+        if total >= self.capacity:
+            raise BufferQuotaError(f'{total} reserved pages leave no buffer page for other files.')
+        self.buffer_quotas[key] = (reserved, limit)
+        self._assign_quotas()
+        self._evict_over_limits()
+        
+        
+    @synchronized
+    def remove_buffer_quota(self, key:str):
+        ''' Remove the buffer quota set by set_buffer_quota().
+        '''
+        if key not in self.buffer_quotas:
+            raise BufferQuotaError(f'No buffer quota of {key}.')
+        self.buffer_quotas.pop(key)
+        self._assign_quotas()
+        self._evict_over_limits()   # the files may fall into a quota of a shorter key
+        
+        
+    @synchronized
+    def set_buffer_quotas(self, quotas:Dict[str, Tuple[int, int]]):
+        ''' Replace all buffer quotas, key -> (reserved, limit), see set_buffer_quota().
+        '''
+        self.buffer_quotas.clear()
+        self._assign_quotas()
+        for key, (reserved, limit) in quotas.items():
+            self.set_buffer_quota(key, reserved, limit)
+        
+        
+    @synchronized
+    def get_buffer_quotas(self) -> Dict[str, Tuple[int, int, int]]:
+        ''' Get the buffer quotas.
+        return: Dict[str, Tuple[int, int, int]], key -> (reserved, limit, the pages held now).
+        '''
+        res = {}
+        for key, (reserved, limit) in self.buffer_quotas.items():
+            held = sum(len(self.buffered_pages.get(i, ())) for i, k in self.file_quota.items() if k == key)
+            res[key] = (reserved, limit, held)
+        return res
+        
+        
+    def _assign_quotas(self):
+        ''' Match the opened files with the buffer quotas again.
+        '''
+        self.file_quota.clear()
+        for file_id, file_name in self.file_id_to_name.items():
+            key = self._match_quota(file_name)
+            if key is not None: self.file_quota[file_id] = key
+        
+        
+    def _evict_over_limits(self):
+        ''' Evict the unpinned pages of the quotas holding more pages than their limits, in the order
+            of the replacer, called holding self.lock. A quota still over its limit because of pinned
+            pages replaces its own pages until it is back under the limit.
+        '''
+        self._apply_access_log()
+        for key, (reserved, limit) in self.buffer_quotas.items():
+            if limit == cf.INVALID: continue
+            file_ids = set(i for i, k in self.file_quota.items() if k == key)
+            over = sum(len(self.buffered_pages.get(i, ())) for i in file_ids) - limit
+            if over <= 0: continue
+            for buffer_id in self.replacer.victims(self.capacity):
+                file_id = int(self.buffer_to_file_id[buffer_id])
+                if file_id not in file_ids: continue
+                dirty = bool(self.dirty[buffer_id])
+                if not self._dealloc_buffer(buffer_id): continue
+                self._count_eviction(file_id, dirty)
+                over -= 1
+                if over == 0: break
+        
+        
+    @synchronized
+    def resize(self, capacity:int):
+        ''' Change the max number of buffer pages.
+            When shrinking, the file pages in the removed buffer pages are written back and evicted.
+            Buffered pages are kept, but their access history is lost.
+        '''
+        if capacity <= 0:
+            raise ResizeBufferError(f'Buffer capacity {capacity} is not positive.')
+        if capacity == self.capacity: return
+        reserved = sum(quota[0] for quota in self.buffer_quotas.values())
+        if capacity <= reserved:
+            raise ResizeBufferError(f'Buffer capacity {capacity} is not more than the {reserved} reserved pages.')
+        self._apply_access_log()
+        with self.pair_to_buffer_id.lock_all():     # no page can be pinned meanwhile
+            self._resize(capacity)
+        
+        
+    def _resize(self, capacity:int):
+        if capacity < self.capacity:
+            removed = range(capacity, self.capacity)
+            if np.any(self.pin_cnt[removed] > 0):
+                raise ResizeBufferError(f'Pinned pages can not be evicted to shrink the buffer.')
+            for buffer_id in removed:
+                self._dealloc_buffer(buffer_id)
+            self.buffer = self.buffer[:capacity]
+            self.latches = self.latches[:capacity]
+            self.dirty = self.dirty[:capacity].copy()
+            self.page_lsn = self.page_lsn[:capacity].copy()
+            self.pin_cnt = self.pin_cnt[:capacity].copy()
+            self.buffer_to_file_id = self.buffer_to_file_id[:capacity].copy()
+            self.buffer_to_page_id = self.buffer_to_page_id[:capacity].copy()
+            self.prefetched = self.prefetched[:capacity].copy()
+        else:
+            extra = capacity - self.capacity
+            self.buffer = self.buffer + [None] * extra
+            self.latches = self.latches + [threading.Lock() for _ in range(extra)]
+            self.dirty = np.concatenate([self.dirty, np.zeros(extra, dtype=np.bool)])
+            self.page_lsn = np.concatenate([self.page_lsn, np.zeros(extra, dtype=np.int64)])
+            self.pin_cnt = np.concatenate([self.pin_cnt, np.zeros(extra, dtype=np.int64)])
+            self.buffer_to_file_id = np.concatenate([self.buffer_to_file_id, np.full(extra, cf.INVALID, dtype=np.int64)])
+            self.buffer_to_page_id = np.concatenate([self.buffer_to_page_id, np.full(extra, cf.INVALID, dtype=np.int64)])
+            self.prefetched = np.concatenate([self.prefetched, np.zeros(extra, dtype=np.bool)])
+        self.replacer = self._rebuild_replacer(self.replacement_policy, capacity)
+        self.capacity = capacity
+        
+    
+    @synchronized
+    def get_buffer_stats(self) -> Dict[str, Dict[str, int]]:
+        ''' Get the buffer statistics of each file since the last reset, including the closed files.
+        return: Dict[str, Dict[str, int]], file name -> counter name in STAT_NAMES -> count.
+        '''
+        self._apply_access_log()
+        res = {name: dict(stats) for name, stats in self.closed_stats.items()}
+        for file_id, stats in self.file_stats.items():
+            total = res.setdefault(self.file_id_to_name[file_id], dict.fromkeys(STAT_NAMES, 0))
+            for name in STAT_NAMES:
+                total[name] += stats[name]
+        return res
+    
+    
+    @synchronized
+    def reset_buffer_stats(self):
+        ''' Reset the buffer statistics, the read-ahead and the write-back counters.
+        '''
+        self._apply_access_log()
+        self.file_stats.clear()
+        self.closed_stats.clear()
+        for stats in (self.read_ahead.stats, self.writer_stats):
+            for name in stats:
+                stats[name] = 0
+    
+    
+    @synchronized
+    def get_read_ahead_stats(self) -> Dict[str, int]:
+        ''' Get the read-ahead counters.
+        return: Dict[str, int], 'issued' for pages read ahead, 'hits' for those used later,
+            and 'wasted' for those evicted before being used.
+        '''
+        self._apply_access_log()
+        return dict(self.read_ahead.stats)
+    
+    
+    @synchronized
+    def clean_pages(self, max_pages:int) -> int:
+        ''' Write back the dirty pages to be replaced soon, and more dirty pages while the
+            ratio of dirty buffer pages is above BG_WRITER_DIRTY_RATIO. Pinned pages are skipped.
+            Called by the background writer.
+        args:
+            max_pages: int, the max number of pages to write.
+        return: int, the number of pages written.
+        '''
+        self._apply_access_log()
+        candidates = [i for i in self.replacer.victims(max_pages) if self.dirty[i] and self.pin_cnt[i] == 0]
+        excess = int(np.count_nonzero(self.dirty)) - int(cf.BG_WRITER_DIRTY_RATIO * self.capacity)
+        if excess > len(candidates):
+            chosen = set(candidates)
+            others = np.flatnonzero(self.dirty & (self.pin_cnt == 0))
+            candidates += [int(i) for i in others if i not in chosen][:excess - len(candidates)]
+        candidates = candidates[:max_pages]
+        # cleared before writing, a page changed by its pinner meanwhile is marked dirty again
+        self.dirty[candidates] = False
+        for file_id in set(int(self.buffer_to_file_id[i]) for i in candidates):
+            self._write_disk_sorted(file_id, [i for i in candidates if self.buffer_to_file_id[i] == file_id])
+        self.writer_stats['background_writes'] += len(candidates)
+        return len(candidates)
+    
+    
+    def checkpoint(self, batch_pages:int=cf.CHECKPOINT_BATCH_PAGES, batch_delay:float=cf.CHECKPOINT_BATCH_DELAY) -> int:
+        ''' Write back the pages dirty now and sync the opened files to the disk, for a checkpoint
+            of the write-ahead log. The pages are written in batches, releasing self.lock between,
+            so the queries are not stalled. Pinned pages are written as well, a change made meanwhile
+            is logged after the checkpoint started, and marks the page dirty again.
+        args:
+            batch_pages: int, the max number of pages written holding self.lock.
+            batch_delay: float, the seconds slept between two batches.
+        return: int, the number of pages written.
+        '''
+        with self.lock:
+            pairs = [(int(self.buffer_to_file_id[i]), int(self.buffer_to_page_id[i])) for i in np.flatnonzero(self.dirty)]
+        written = 0
+        for start in range(0, len(pairs), max(batch_pages, 1)):
+            if start > 0 and batch_delay > 0: time.sleep(batch_delay)
+            with self.lock:
+                # written back or evicted meanwhile
+                buffer_ids = [self.pair_to_buffer_id.get(pair) for pair in pairs[start:start+batch_pages]]
+                buffer_ids = [i for i in buffer_ids if i != cf.INVALID and self.dirty[i]]
+                self.dirty[buffer_ids] = False
+                for file_id in set(int(self.buffer_to_file_id[i]) for i in buffer_ids):
+                    self._write_disk_sorted(file_id, [i for i in buffer_ids if self.buffer_to_file_id[i] == file_id])
+                written += len(buffer_ids)
+                self.writer_stats['checkpoint_writes'] += len(buffer_ids)
+        for file_id in list(self.file_id_to_name):
+            with self.lock:
+                if file_id in self.file_id_to_name: self._fsync_file(file_id)
+        return written
+
+
+    def _fsync_file(self, file_id:int):
+        ''' Sync a file written back to the disk, called holding self.lock.
+        '''
+        if file_id in self.mmap_files:
+            self.mmap_files[file_id].flush()
+        if file_id in self.compressed_files:
+            self.compressed_files[file_id].sync(durable=True)
+        else: os.fsync(file_id)
+    
+    
+    def get_writer_stats(self) -> Dict[str, int]:
+        ''' Get the write-back counters.
+        return: Dict[str, int], 'evictions' for pages replaced, 'dirty_evictions' for those
+            written back on replacement, 'background_writes' for pages written by clean_pages(),
+            and 'checkpoint_writes' for pages written by checkpoint().
+        '''
+        return dict(self.writer_stats)
+    
+    
+    @synchronized
+    def get_compression_stats(self) -> Dict[str, Dict[str, float]]:
+        ''' Get the counters of the opened compressed files.
+        return: Dict[str, Dict[str, float]], file name -> 'pages_written', 'bytes_in' and 'bytes_out' of
+            the pages compressed, 'pages_read' and 'bytes_read' of the pages read, 'compress_time' and
+            'decompress_time' in seconds, and 'file_size' in bytes.
+        '''
+        res = {}
+        for file_id, compressed_file in self.compressed_files.items():
+            res[self.file_id_to_name[file_id]] = dict(compressed_file.stats, file_size=compressed_file.end)
+        return res
+    
     
     def get_page_cnt(self, file_id:int) -> int:
         ''' Get the page cnt of a specific file.
@@ -114,8 +880,11 @@ class PF_Manager:
         if not os.path.exists(file_name):
             raise RemoveFileError(f'File {file_name} does not exist.')
         os.remove(file_name)
+        if os.path.exists(file_name + cf.PAGE_MAP_SUFFIX):
+            os.remove(file_name + cf.PAGE_MAP_SUFFIX)
     
     
+    @synchronized
     def open_file(self, file_name:str) -> int:
         ''' Open a created file.
         return: int, the file id.
@@ -123,13 +892,76 @@ class PF_Manager:
         if file_name in self.file_name_to_id:
             raise OpenFileError(f'File {file_name} has been opened.')
         file_id = os.open(file_name, cf.FILE_OPEN_MODE)
-        file_size = os.lseek(file_id, 0, os.SEEK_END)
+        file_size = os.fstat(file_id).st_size
         self.page_cnt[file_id] = file_size // cf.PAGE_SIZE
+        self.page_size[file_id] = cf.PAGE_SIZE
+        self._bump_version(file_id)
         self.file_name_to_id[file_name] = file_id
         self.file_id_to_name[file_id] = file_name
+        key = self._match_quota(file_name)
+        if key is not None: self.file_quota[file_id] = key
+        if os.path.exists(file_name + cf.PAGE_MAP_SUFFIX) or (file_size == 0 and
+            self.file_backend == 'COMPRESSED' and file_name.endswith(cf.COMPRESSED_FILE_SUFFIXES)):
+            self.compressed_files[file_id] = PF_CompressedFile(file_id, file_name)
+            self.page_cnt[file_id] = self.compressed_files[file_id].page_cnt
+        elif self.file_backend == 'MMAP' and file_name.endswith(cf.MMAP_FILE_SUFFIXES):
+            self.mmap_files[file_id] = PF_MmapFile(file_id, self.page_cnt[file_id], cf.PAGE_SIZE)
+        if cf.BG_WRITER_ENABLED and self.writer is None:
+            self.writer = PF_BackgroundWriter(self)
+            self.writer.start()
         return file_id
     
     
+    @staticmethod
+    def check_page_size(page_size:int):
+        ''' Check a page size, it must be PAGE_SIZE * 2**k, up to MAX_PAGE_SIZE.
+        '''
+        ratio = page_size // cf.PAGE_SIZE
+        if not (cf.PAGE_SIZE <= page_size <= cf.MAX_PAGE_SIZE) or page_size % cf.PAGE_SIZE != 0 or ratio & (ratio - 1) != 0:
+            raise PageSizeError(f'Page size {page_size} must be PAGE_SIZE * 2**k, from {cf.PAGE_SIZE} to {cf.MAX_PAGE_SIZE}.')
+        
+        
+    @synchronized
+    def set_page_size(self, file_id:int, page_size:int):
+        ''' Set the page size of an opened file, PAGE_SIZE when it is opened. The page size is not stored
+            by the file, the client should record it, e.g. in its meta file, and set it after opening the file.
+            It is set before any page of the file is read or written, otherwise the pages are regarded
+            as the pages of the new size.
+        args:
+            page_size: int, PAGE_SIZE * 2**k, up to MAX_PAGE_SIZE.
+        '''
+        if file_id not in self.file_id_to_name:
+            raise PageSizeError(f'File {file_id} has not been opened.')
+        self.check_page_size(page_size)
+        if page_size == self.page_size[file_id]: return
+        self._apply_access_log()
+        if self.buffered_pages.get(file_id) or any(pair[0] == file_id for pair in self.mmap_pin_cnt):
+            raise PageSizeError(f'Pages of file {file_id} are buffered or pinned.')
+        pending = self.pending_reads.pop(file_id, None)
+        if pending is not None:
+            pending[3].result()
+        self.read_ahead.forget(file_id)
+        self._bump_version(file_id)     # the pages read ahead before are of the old size
+        self.page_size[file_id] = page_size
+        if file_id in self.compressed_files:
+            self.compressed_files[file_id].page_size = page_size
+        elif file_id in self.mmap_files:
+            self.mmap_files.pop(file_id).close()
+            page_cnt = os.fstat(file_id).st_size // page_size
+            self.mmap_files[file_id] = PF_MmapFile(file_id, page_cnt, page_size)
+            self.page_cnt[file_id] = page_cnt
+        else: self.page_cnt[file_id] = os.fstat(file_id).st_size // page_size
+        
+        
+    def get_page_size(self, file_id:int) -> int:
+        ''' Get the page size of an opened file.
+        '''
+        if file_id not in self.file_id_to_name:
+            raise PageSizeError(f'File {file_id} has not been opened.')
+        return self.page_size[file_id]
+    
+    
+    @synchronized
     def close_file(self, file:Union[int,str]):
         ''' Closed an opened file by its file id or file name.
         args:
@@ -140,44 +972,82 @@ class PF_Manager:
             file_id = self.file_name_to_id.get(file, cf.INVALID)
         if file_id not in self.file_id_to_name:
             raise CloseFileError(f'File {file_id} has not been opened.')
+        self._apply_access_log()
         self.flush_file(file_id)
+        if self.log_flush is not None:  # the log may be emptied once the file is closed
+            self._fsync_file(file_id)
+        pending = self.pending_reads.pop(file_id, None)
+        if pending is not None:
+            pending[3].result()
+        self.read_ahead.forget(file_id)
+        if file_id in self.mmap_files:
+            self.mmap_files.pop(file_id).close()
+        if file_id in self.compressed_files:
+            compressed_file = self.compressed_files.pop(file_id)
+            compressed_file.extend(self.page_cnt[file_id])
+            compressed_file.close()
         os.close(file_id)
         file_name = self.file_id_to_name[file_id]
+        stats = self.file_stats.pop(file_id, None)
+        if stats is not None:
+            total = self.closed_stats.setdefault(file_name, dict.fromkeys(STAT_NAMES, 0))
+            for name in STAT_NAMES:
+                total[name] += stats[name]
         self.file_id_to_name.pop(file_id)
         self.file_name_to_id.pop(file_name)
         self.page_cnt.pop(file_id, cf.INVALID)
+        self.page_size.pop(file_id, None)
+        self.file_quota.pop(file_id, None)
+        self.free_page_head.pop(file_id, None)
+        self.free_page_cnt.pop(file_id, None)
+        if self.writer is not None and not self.file_id_to_name:
+            self.writer.stop()
+            self.writer = None
         
     
+    @synchronized
     def sync_file(self, file_id:int):
         ''' Sync the file from buffer to the disk.
             Mark all buffered pages as not dirty but do not change the buffer content.
         '''
-        buffer_ids = self.buffered_pages.get(file_id, {})
-        for buffer_id in buffer_ids:
-            if not self.dirty[buffer_id]: continue
-            page_id = self.buffer_to_page_id[buffer_id]
-            self._write_disk(file_id, page_id, self.buffer[buffer_id])
-            self.dirty[buffer_id] = False
+        if file_id in self.mmap_files:
+            self.mmap_files[file_id].flush()
+            return
+        buffer_ids = [i for i in self.buffered_pages.get(file_id, {}) if self.dirty[i]]
+        self.dirty[buffer_ids] = False
+        self._write_disk_sorted(file_id, buffer_ids)
+        if file_id in self.compressed_files:
+            self.compressed_files[file_id].sync()
         
         
+    @synchronized
     def flush_file(self, file_id:int):
         ''' Flush the file from buffer to the disk.
             Unpin all buffer pages from the buffer.
             After flushing, the buffer will not contain any pages of the file.
         '''
-        buffer_ids = self.buffered_pages.get(file_id, {})
+        if file_id in self.mmap_files:
+            for pair in self.mmap_pin_cnt:
+                if pair[0] == file_id:
+                    raise FlushFileError(f'Page {pair[1]} of file {file_id} is pinned.')
+            self.mmap_files[file_id].flush()
+            return
+        buffer_ids = list(self.buffered_pages.get(file_id, {}))
         for buffer_id in buffer_ids:
-            page_id = self.buffer_to_page_id[buffer_id]
-            if self.dirty[buffer_id]:
-                self._write_disk(file_id, page_id, self.buffer[buffer_id])
-            self.dirty[buffer_id] = False
-            self.pair_to_buffer_id.pop((file_id, page_id), cf.INVALID)
-            self.buffer_to_file_id[buffer_id] = cf.INVALID
-            self.buffer_to_page_id[buffer_id] = cf.INVALID
-            self.lru_list.free(buffer_id)
-        self.buffered_pages.pop(file_id, {})
+            if self.pin_cnt[buffer_id] > 0:
+                raise FlushFileError(f'Page {self.buffer_to_page_id[buffer_id]} of file {file_id} is pinned.')
+        dirty_ids = [i for i in buffer_ids if self.dirty[i]]
+        self.dirty[dirty_ids] = False
+        self._write_disk_sorted(file_id, dirty_ids)
+        for buffer_id in buffer_ids:
+            # a page pinned by another thread meanwhile is kept
+            if not self._dealloc_buffer(buffer_id):
+                raise FlushFileError(f'Page {self.buffer_to_page_id[buffer_id]} of file {file_id} is pinned.')
+        if file_id in self.compressed_files:
+            self.compressed_files[file_id].sync()
         
 
+    @synchronized
     def allocate_pages(self, file_id:int, page_cnt:int) -> int:
         ''' Allocate <page_cnt> empty pages continuously at the end of the file.
             Only write empty data to the buffer.
@@ -188,23 +1058,24 @@ class PF_Manager:
         '''
         if file_id not in self.file_id_to_name:
             raise AppendPageError(f'File {file_id} has not been opened.')
+        if file_id in self.mmap_files:
+            page_id = self.mmap_files[file_id].extend(page_cnt)
+            self.page_cnt[file_id] = page_id + page_cnt
+            return page_id
         page_id = self.page_cnt[file_id]
         self.page_cnt[file_id] = page_id + page_cnt
-        if file_id not in self.buffered_pages:
-            self.buffered_pages[file_id] = set()
         for i in range(page_cnt):
-            buffer_id = self._alloc_buffer()
-            self.buffer[buffer_id] = np.zeros(cf.PAGE_SIZE, dtype=np.uint8)
+            buffer_id = self._alloc_buffer(file_id)
+            self.buffer[buffer_id][:] = 0
             self.dirty[buffer_id] = True
-            self.pair_to_buffer_id[(file_id, page_id+i)] = buffer_id
-            self.buffer_to_file_id[buffer_id] = file_id
-            self.buffer_to_page_id[buffer_id] = page_id + i
-            self.buffered_pages[file_id].add(buffer_id)
+            self._map_buffer(buffer_id, file_id, page_id + i)
         return page_id
         
         
+    @synchronized
     def append_page(self, file_id:int, data:np.ndarray=None) -> int:
         ''' Append a new page at the end of the file.
+            If the file has released pages, reuse the last released one instead.
         args:
             file_id: int,
             data: np.ndarray[(>=PAGE_SIZE,), uint8] or None, the data to be appended.
@@ -213,75 +1084,338 @@ class PF_Manager:
         '''
         if file_id not in self.file_id_to_name:
             raise AppendPageError(f'File {file_id} has not been opened.')
-        if data is None: data = np.zeros(cf.PAGE_SIZE, dtype=np.uint8)
-        if len(data) < cf.PAGE_SIZE:
+        page_size = self.page_size[file_id]
+        if data is not None and len(data) < page_size:
             raise AppendPageError(f'Data size is not enough to append a page.')
+        if self.free_page_cnt.get(file_id, 0) > 0:    # reuse a released page
+            page_id = self.free_page_head[file_id]
+            (next_free,) = struct.unpack(f'{cf.BYTE_ORDER}i', self.read_page(file_id, page_id)[:4].tobytes())
+            self.free_page_head[file_id] = next_free
+            self.free_page_cnt[file_id] -= 1
+            self.write_page(file_id, page_id, np.zeros(page_size, dtype=np.uint8) if data is None else data)
+            return page_id
+        if file_id in self.mmap_files:
+            mmap_file = self.mmap_files[file_id]
+            page_id = mmap_file.extend(1)
+            self.page_cnt[file_id] = page_id + 1
+            if data is not None: mmap_file.page(page_id)[:] = data[:page_size]
+            return page_id
+        buffer_id = self._alloc_buffer(file_id)
+        if data is None: self.buffer[buffer_id][:] = 0
+        else: self.buffer[buffer_id][:] = data[:page_size]
+        self.dirty[buffer_id] = True
         page_id = self.page_cnt[file_id]
         self.page_cnt[file_id] = page_id + 1
-        buffer_id = self._alloc_buffer()
-        self.buffer[buffer_id] = data[:cf.PAGE_SIZE]
-        self.dirty[buffer_id] = True
-        self.pair_to_buffer_id[(file_id, page_id)] = buffer_id
-        self.buffer_to_file_id[buffer_id] = file_id
-        self.buffer_to_page_id[buffer_id] = page_id
-        if file_id not in self.buffered_pages:
-            self.buffered_pages[file_id] = set()
-        self.buffered_pages[file_id].add(buffer_id)
+        self._map_buffer(buffer_id, file_id, page_id)
         return page_id
         
     
-    def read_page(self, file_id:int, page_id:int) -> np.ndarray:
+    @synchronized
+    def release_page(self, file_id:int, page_id:int, log:Callable[[np.ndarray], int]=None):
+        ''' Release a page no longer used, it will be reused by append_page().
+            The page is zeroed except that its first 4 bytes link to the previous released page.
+            The caller should persist the free page list by get_free_pages().
+        args:
+            log: Callable[[np.ndarray], int] or None, logs the released page before it is written,
+                and returns the LSN, see write_page().
+        '''
+        if file_id not in self.file_id_to_name:
+            raise ReleasePageError(f'File {file_id} has not been opened.')
+        if page_id >= self.page_cnt[file_id]:
+            raise ReleasePageError(f'Page {page_id} has not been allocated.')
+        buffer_id = self.pair_to_buffer_id.get((file_id, page_id), cf.INVALID)
+        if (buffer_id != cf.INVALID and self.pin_cnt[buffer_id] > 0) or (file_id, page_id) in self.mmap_pin_cnt:
+            raise ReleasePageError(f'Page {page_id} of file {file_id} is pinned.')
+        page = np.zeros(self.page_size[file_id], dtype=np.uint8)
+        page[:4] = np.frombuffer(struct.pack(f'{cf.BYTE_ORDER}i', self.free_page_head.get(file_id, cf.INVALID)), dtype=np.uint8)
+        lsn = log(page) if log is not None else 0
+        self.write_page(file_id, page_id, page, lsn)
+        self.free_page_head[file_id] = page_id
+        self.free_page_cnt[file_id] = self.free_page_cnt.get(file_id, 0) + 1
+        
+        
+    def get_free_pages(self, file_id:int) -> Tuple[int, int]:
+        ''' Get the free page list of a file.
+        return: Tuple[int, int], the number of released pages and the last released page.
+        '''
+        return self.free_page_cnt.get(file_id, 0), self.free_page_head.get(file_id, cf.INVALID)
+    
+    
+    def set_free_pages(self, file_id:int, free_page_cnt:int, free_page_head:int):
+        ''' Restore the free page list of a file from its meta after opening it.
+            An invalid list is regarded as empty, e.g. zeros stored by older files.
+        '''
+        if file_id not in self.file_id_to_name:
+            raise ReleasePageError(f'File {file_id} has not been opened.')
+        page_cnt = self.page_cnt[file_id]
+        if not (0 < free_page_cnt <= page_cnt and 0 <= free_page_head < page_cnt):
+            free_page_cnt, free_page_head = 0, cf.INVALID
+        self.free_page_cnt[file_id] = free_page_cnt
+        self.free_page_head[file_id] = free_page_head
+        
+        
+    @traced('pf.read_page')
+    def read_page(self, file_id:int, page_id:int, ring:PF_BufferRing=None) -> np.ndarray:
         ''' Read a page from the file.
             If the page is buffered, read it from the buffer.
             If not, read it from the disk and buffer it.
+        args:
+            ring: PF_BufferRing or None. If specified, a page not buffered is read into
+                the ring instead of the buffer, and the returned view is valid until the
+                ring wraps around. Used by sequential scans to keep the buffer hit rate.
         return: np.ndarray[(PAGE_SIZE,), uint8]
         '''
         if file_id not in self.file_id_to_name:
             raise ReadPageError(f'File {file_id} has not been opened.')
         if page_id >= self.page_cnt[file_id]:
             raise ReadPageError(f'Page {page_id} has not been allocated.')
-        buffer_id = self.pair_to_buffer_id.get((file_id, page_id), cf.INVALID)
-        if buffer_id == cf.INVALID: # not buffered
-            os.lseek(file_id, page_id * cf.PAGE_SIZE, os.SEEK_SET)
-            data = os.read(file_id, cf.PAGE_SIZE)
-            if len(data) != cf.PAGE_SIZE:
-                raise ReadPageError(f'Read page failed. Read bytes: {len(data)}.')
-            buffer_id = self._alloc_buffer()
-            self.buffer[buffer_id] = np.frombuffer(data, dtype=np.uint8, count=cf.PAGE_SIZE)
-            self.pair_to_buffer_id[(file_id, page_id)] = buffer_id
-            self.buffer_to_file_id[buffer_id] = file_id
-            self.buffer_to_page_id[buffer_id] = page_id
-            if file_id not in self.buffered_pages:
-                self.buffered_pages[file_id] = set()
-            self.buffered_pages[file_id].add(buffer_id)
-            return np.frombuffer(data, dtype=np.uint8, count=cf.PAGE_SIZE).copy()
-        self.lru_list.access(buffer_id)
-        return self.buffer[buffer_id].copy()
+        if file_id in self.mmap_files:
+            with self.lock:
+                return self.mmap_files[file_id].page(page_id).copy()
+        if ring is not None and (file_id, page_id) not in self.pair_to_buffer_id:
+            return self._read_into_ring(file_id, page_id, ring)
+        buffer_id = self._pin_buffer(file_id, page_id)
+        try:
+            with self.latches[buffer_id]:
+                return self.buffer[buffer_id].copy()
+        finally: self._unpin_buffer((file_id, page_id), buffer_id)
+    
+    
+    def read_pages(self, file_id:int, page_ids:List[int]) -> List[np.ndarray]:
+        ''' Read several pages of a file, e.g. the heap pages of the rids found by an index scan.
+            The pages missed in the buffer are reserved in one pass holding self.lock, then read
+            without it by one os.preadv() call per run of continuous pages, directly into the buffer.
+        args:
+            page_ids: List[int], in any order, duplicates allowed.
+        return: List[np.ndarray[(page_size,), uint8]], copies of the pages in the order of <page_ids>.
+        '''
+        if file_id not in self.file_id_to_name:
+            raise ReadPageError(f'File {file_id} has not been opened.')
+        page_ids = [int(page_id) for page_id in page_ids]
+        for page_id in page_ids:
+            if page_id >= self.page_cnt[file_id]:
+                raise ReadPageError(f'Page {page_id} has not been allocated.')
+        if file_id in self.mmap_files:
+            with self.lock:
+                return [self.mmap_files[file_id].page(page_id).copy() for page_id in page_ids]
+        pages: Dict[int, np.ndarray] = {}
+        missed = []
+        for page_id in sorted(set(page_ids)):
+            page = self.read_buffered_page(file_id, page_id)
+            if page is None: missed.append(page_id)
+            else: pages[page_id] = page
+        batch_size = max(self.capacity // 2, 1)    # pinned together, leave the buffer to other threads
+        for start in range(0, len(missed), batch_size):
+            pages.update(self._load_pages(file_id, missed[start:start+batch_size]))
+        for page_id in missed:
+            if page_id not in pages:    # being read by another thread, or no buffer page reserved
+                pages[page_id] = self.read_page(file_id, page_id)
+        return [pages[page_id] for page_id in page_ids]
+    
+    
+    def prefetch_pages(self, file_id:int, page_ids:List[int]) -> int:
+        ''' Read some pages of a file into the free buffer pages, e.g. to warm the buffer up after
+            opening a database. The buffered pages are skipped, and no page is evicted for them.
+        return: int, the number of pages read.
+        '''
+        if file_id not in self.file_id_to_name:
+            raise ReadPageError(f'File {file_id} has not been opened.')
+        if file_id in self.mmap_files: return 0
+        with self.lock:
+            free_cnt = self.capacity - len(self.pair_to_buffer_id)
+            page_ids = [page_id for page_id in sorted(set(page_ids)) if page_id < self.page_cnt[file_id]
+                and (file_id, page_id) not in self.pair_to_buffer_id][:free_cnt]
+        if not page_ids: return 0
+        return len(self._load_pages(file_id, page_ids))
+    
+    
+    @synchronized
+    def get_resident_pages(self) -> Dict[str, List[int]]:
+        ''' Get the buffered pages of the opened files, to be prefetched after reopening them.
+        return: Dict[str, List[int]], file_name -> sorted page ids.
+        '''
+        return {self.file_id_to_name[file_id]: sorted(int(self.buffer_to_page_id[i]) for i in buffer_ids)
+            for file_id, buffer_ids in self.buffered_pages.items() if file_id in self.file_id_to_name}
+    
+    
+    def _load_pages(self, file_id:int, page_ids:List[int]) -> Dict[int, np.ndarray]:
+        ''' Read the pages of a file missed in the buffer into it, called by read_pages().
+        args:
+            page_ids: List[int], sorted and distinct.
+        return: Dict[int, np.ndarray], page_id -> a copy of the page, of the pages read.
+        '''
+        reserved: List[Tuple[int, int]] = []    # (page_id, buffer_id), pinned and latched
+        with self.lock:
+            try:
+                for page_id in page_ids:
+                    if (file_id, page_id) in self.pair_to_buffer_id: continue
+                    reserved.append((page_id, self._reserve_buffer(file_id, page_id, False)))
+                    self._count(file_id, 'misses')
+            except AllocBufferError as exception:
+                pass    # other threads pinned the buffer, the rest are read one by one
+        pages: Dict[int, np.ndarray] = {}
+        try:
+            page_size = self.page_size[file_id]
+            start = 0
+            for end in range(1, len(reserved) + 1):
+                if end < len(reserved) and reserved[end][0] == reserved[end-1][0] + 1 and end - start < IOV_MAX:
+                    continue
+                run = reserved[start:end]
+                frames = [self.buffer[buffer_id] for _, buffer_id in run]
+                offset = run[0][0] * page_size
+                read = 0
+                if file_id not in self.compressed_files and hasattr(os, 'preadv'):
+                    read = os.preadv(file_id, frames, offset)
+                if read < len(frames) * page_size:     # no preadv, compressed or partially read
+                    data = self._read_disk_run(file_id, run[0][0], len(run))
+                    for i, frame in enumerate(frames[:len(data) // page_size]):
+                        frame[:] = np.frombuffer(data, dtype=np.uint8, count=page_size, offset=i * page_size)
+                    read = len(data)
+                for (page_id, buffer_id), _ in zip(run, range(read // page_size)):
+                    pages[page_id] = self.buffer[buffer_id].copy()
+                start = end
+        finally:
+            # the pages not read are unmapped before unlatched, so the threads waiting for them try again
+            for page_id, buffer_id in reserved:
+                if page_id not in pages: self._unmap_buffer(buffer_id, file_id, page_id)
+                self.latches[buffer_id].release()
+            with self.lock:
+                self._count(file_id, 'reads', len(pages))
+                for page_id, buffer_id in reserved:
+                    if page_id not in pages: self._free_buffer(buffer_id, file_id)
+                    self._unpin_buffer((file_id, page_id), buffer_id)
+        return pages
+    
+    
+    def read_buffered_page(self, file_id:int, page_id:int) -> np.ndarray:
+        ''' Read a page only if it is buffered and not being read from the disk or written,
+            so it never waits for the disk. A page of a memory-mapped file is never read here.
+        return: np.ndarray[(PAGE_SIZE,), uint8], or None if it would wait.
+        '''
+        if file_id not in self.file_id_to_name:
+            raise ReadPageError(f'File {file_id} has not been opened.')
+        if file_id in self.mmap_files: return None
+        pair = (file_id, page_id)
+        with self.pair_to_buffer_id.lock(pair):
+            buffer_id = self.pair_to_buffer_id.get(pair)
+            if buffer_id == cf.INVALID: return None
+            self.pin_cnt[buffer_id] += 1
+        try:
+            if not self.latches[buffer_id].acquire(blocking=False): return None
+            try:
+                if self.buffer_to_file_id[buffer_id] != file_id or self.buffer_to_page_id[buffer_id] != page_id:
+                    return None
+                with self.pair_to_buffer_id.lock(pair):
+                    prefetched = bool(self.prefetched[buffer_id])
+                    self.prefetched[buffer_id] = False
+                self._record_access(file_id, buffer_id, prefetched)
+                return self.buffer[buffer_id].copy()
+            finally: self.latches[buffer_id].release()
+        finally: self._unpin_buffer(pair, buffer_id)
+    
+    
+    def pin_page(self, file_id:int, page_id:int) -> np.ndarray:
+        ''' Pin a page in the buffer and return a writable view of the buffer page.
+            The page will not be evicted until unpin_page() is called as many times as pin_page().
+            After modifying the view, call mark_dirty() before unpinning it.
+            Do not keep the view after unpinning it, it may be reused by other pages.
+        return: np.ndarray[(PAGE_SIZE,), uint8], a view of the buffer page, NOT a copy.
+        '''
+        if file_id not in self.file_id_to_name:
+            raise PinPageError(f'File {file_id} has not been opened.')
+        if page_id >= self.page_cnt[file_id]:
+            raise PinPageError(f'Page {page_id} has not been allocated.')
+        if file_id in self.mmap_files:
+            with self.lock:
+                self.mmap_pin_cnt[(file_id, page_id)] = self.mmap_pin_cnt.get((file_id, page_id), 0) + 1
+                return self.mmap_files[file_id].page(page_id)
+        return self.buffer[self._pin_buffer(file_id, page_id)]
+    
+    
+    def unpin_page(self, file_id:int, page_id:int):
+        ''' Unpin a page pinned by pin_page().
+        '''
+        if file_id in self.mmap_files:
+            with self.lock:
+                pin_cnt = self.mmap_pin_cnt.pop((file_id, page_id), 0)
+                if pin_cnt <= 0:
+                    raise UnpinPageError(f'Page {page_id} of file {file_id} is not pinned.')
+                if pin_cnt > 1: self.mmap_pin_cnt[(file_id, page_id)] = pin_cnt - 1
+                return
+        pair = (file_id, page_id)
+        with self.pair_to_buffer_id.lock(pair):
+            buffer_id = self.pair_to_buffer_id.get(pair)
+            if buffer_id == cf.INVALID or self.pin_cnt[buffer_id] <= 0:
+                raise UnpinPageError(f'Page {page_id} of file {file_id} is not pinned.')
+            self.pin_cnt[buffer_id] -= 1
+        
+        
+    def mark_dirty(self, file_id:int, page_id:int, lsn:int=0):
+        ''' Mark a buffered page as dirty, i.e. it will be written back to disk when it is evicted.
+            Use it after modifying the view returned by pin_page().
+        args:
+            lsn: int, the LSN of the logged change, the log is synced up to it before writing back the page.
+        '''
+        if file_id in self.mmap_files:
+            if page_id >= self.page_cnt[file_id]:
+                raise MarkDirtyError(f'Page {page_id} of file {file_id} is not buffered.')
+            return
+        pair = (file_id, page_id)
+        with self.pair_to_buffer_id.lock(pair):
+            buffer_id = self.pair_to_buffer_id.get(pair)
+            if buffer_id == cf.INVALID:
+                raise MarkDirtyError(f'Page {page_id} of file {file_id} is not buffered.')
+            self.dirty[buffer_id] = True
+            if lsn > self.page_lsn[buffer_id]: self.page_lsn[buffer_id] = lsn
             
     
-    def write_page(self, file_id:int, page_id:int, data:np.ndarray):
+    @traced('pf.write_page')
+    def write_page(self, file_id:int, page_id:int, data:np.ndarray, lsn:int=0):
         ''' Write a page to the file.
             Only write to the buffer.
         args:
             data: np.ndarray[(>=PAGE_SIZE,), uint8] the data to be written.
+            lsn: int, the LSN of the logged change, see mark_dirty().
         '''
         if file_id not in self.file_id_to_name:
             raise WritePageError(f'File {file_id} has not been opened.')
-        if len(data) < cf.PAGE_SIZE:
+        page_size = self.page_size[file_id]
+        if len(data) < page_size:
             raise WritePageError(f'Not enough data to write a page.')
         if page_id >= self.page_cnt[file_id]:
             raise WritePageError(f'Page {page_id} has not been allocated.')
-        buffer_id = self.pair_to_buffer_id.get((file_id, page_id), cf.INVALID)
-        if buffer_id == cf.INVALID:
-            buffer_id = self._alloc_buffer()
-            self.pair_to_buffer_id[(file_id, page_id)] = buffer_id
-            self.buffer_to_file_id[buffer_id] = file_id
-            self.buffer_to_page_id[buffer_id] = page_id
-            if file_id not in self.buffered_pages:
-                self.buffered_pages[file_id] = set()
-            self.buffered_pages[file_id].add(buffer_id)
-        self.buffer[buffer_id] = data[:cf.PAGE_SIZE]
-        self.dirty[buffer_id] = True
+        if file_id in self.mmap_files:
+            with self.lock:
+                self.mmap_files[file_id].page(page_id)[:] = data[:page_size]
+                return
+        pair = (file_id, page_id)
+        deadline = None
+        while True:
+            with self.pair_to_buffer_id.lock(pair):
+                buffer_id = self.pair_to_buffer_id.get(pair)
+                if buffer_id != cf.INVALID: self.pin_cnt[buffer_id] += 1
+            if buffer_id == cf.INVALID:
+                try:
+                    with self.lock:
+                        if pair in self.pair_to_buffer_id: continue     # buffered by another thread meanwhile
+                        buffer_id = self._alloc_buffer(file_id)
+                        self.buffer[buffer_id][:] = data[:page_size]
+                        self.dirty[buffer_id] = True
+                        self.page_lsn[buffer_id] = lsn
+                        self._map_buffer(buffer_id, file_id, page_id)
+                        return
+                except AllocBufferError as exception:
+                    deadline = self._wait_unpinned(deadline, exception)
+                    continue
+            try:
+                with self.latches[buffer_id]:   # wait if another thread is reading it from the disk
+                    if self.buffer_to_file_id[buffer_id] == file_id and self.buffer_to_page_id[buffer_id] == page_id:
+                        self.buffer[buffer_id][:] = data[:page_size]
+                        self.dirty[buffer_id] = True
+                        if lsn > self.page_lsn[buffer_id]: self.page_lsn[buffer_id] = lsn
+                        return
+            finally: self._unpin_buffer(pair, buffer_id)
+    
     
     
 pf_manager = PF_Manager()
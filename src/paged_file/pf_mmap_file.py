@@ -0,0 +1,83 @@
+import os
+import mmap
+import numpy as np
+from typing import List
+
+import config as cf
+
+
+class PF_MmapFile:
+    ''' A paged file mapped into memory, used by the MMAP backend of PF_Manager.
+        Pages are numpy views over the mapping, and the OS page cache does the caching.
+        The file is mapped by segments of about MMAP_SEGMENT_PAGES pages. It grows by
+        whole segments, so the views of old pages stay valid, and it is truncated
+        to its pages when closed.
+    '''
+
+
+    def __init__(self, file_id:int, page_cnt:int, page_size:int=cf.PAGE_SIZE):
+        ''' Map an opened file with <page_cnt> pages of <page_size> bytes.
+        '''
+        granularity = mmap.ALLOCATIONGRANULARITY
+        segment_size = cf.MMAP_SEGMENT_PAGES * page_size
+        segment_size = (segment_size + granularity - 1) // granularity * granularity
+        self.file_id = file_id
+        self.page_cnt = page_cnt
+        self.page_size = page_size
+        self.segment_pages = segment_size // page_size
+        self.segments: List[mmap.mmap] = []
+        self.views: List[np.ndarray] = []   # np.ndarray[(segment_pages, page_size), uint8] of each segment
+        self._map(page_cnt)
+
+
+    def _map(self, page_cnt:int):
+        ''' Map the segments to hold <page_cnt> pages, extending the file if needed.
+        '''
+        segment_cnt = (page_cnt + self.segment_pages - 1) // self.segment_pages
+        if segment_cnt <= len(self.segments): return
+        segment_size = self.segment_pages * self.page_size
+        if os.fstat(self.file_id).st_size < segment_cnt * segment_size:
+            os.ftruncate(self.file_id, segment_cnt * segment_size)
+        for i in range(len(self.segments), segment_cnt):
+            segment = mmap.mmap(self.file_id, segment_size, offset=i*segment_size)
+            self.segments.append(segment)
+            self.views.append(np.frombuffer(segment, dtype=np.uint8).reshape(self.segment_pages, self.page_size))
+
+
+    def page(self, page_id:int) -> np.ndarray:
+        ''' Get a page by its id, the caller should have checked page_id.
+        return: np.ndarray[(page_size,), uint8], a writable view of the mapping.
+        '''
+        return self.views[page_id // self.segment_pages][page_id % self.segment_pages]
+
+
+    def extend(self, page_cnt:int) -> int:
+        ''' Append <page_cnt> empty pages at the end of the file.
+        return: int, the first appended page id.
+        '''
+        page_id = self.page_cnt
+        self._map(page_id + page_cnt)
+        self.page_cnt = page_id + page_cnt
+        for i in range(page_id, page_id + page_cnt):
+            self.page(i)[:] = 0
+        return page_id
+
+
+    def flush(self):
+        ''' Write the modified pages back to the disk.
+        '''
+        for segment in self.segments:
+            segment.flush()
+
+
+    def close(self):
+        ''' Unmap the file and truncate it to its pages. The file descriptor is not closed.
+        '''
+        self.flush()
+        self.views.clear()
+        for segment in self.segments:
+            try: segment.close()
+            except BufferError as exception:
+                pass    # a page view is still referenced, unmapped when it is released
+        self.segments.clear()
+        os.ftruncate(self.file_id, self.page_cnt * self.page_size)
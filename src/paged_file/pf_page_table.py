@@ -0,0 +1,84 @@
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
+
+import config as cf
+
+
+class PF_PageTable:
+    ''' The (file_id, page_id) -> buffer_id mapping of PF_Manager, split into partitions by the hash of the pair.
+        Each partition has its own lock, so threads looking up different pages seldom wait for each other.
+        Every method locks the partition of its pair. Hold lock() to make several steps atomic,
+        e.g. looking up a page and pinning its buffer page before it can be evicted.
+    '''
+
+
+    def __init__(self, partitions:int=cf.PAGE_TABLE_PARTITIONS):
+        ''' Init an empty page table with <partitions> partitions.
+        '''
+        self.maps: List[Dict[Tuple[int, int], int]] = [{} for _ in range(partitions)]
+        self.locks: List[threading.RLock] = [threading.RLock() for _ in range(partitions)]
+
+
+    def _partition(self, pair:Tuple[int, int]) -> int:
+        return hash(pair) % len(self.maps)
+
+
+    def lock(self, pair:Tuple[int, int]) -> threading.RLock:
+        ''' Get the lock of the partition holding <pair>, it is reentrant.
+        '''
+        return self.locks[self._partition(pair)]
+
+
+    @contextmanager
+    def lock_all(self):
+        ''' Hold the locks of all partitions, in the order of partitions.
+        '''
+        for lock in self.locks:
+            lock.acquire()
+        try: yield
+        finally:
+            for lock in reversed(self.locks):
+                lock.release()
+
+
+    def get(self, pair:Tuple[int, int], default:int=cf.INVALID) -> int:
+        i = self._partition(pair)
+        with self.locks[i]:
+            return self.maps[i].get(pair, default)
+
+
+    def pop(self, pair:Tuple[int, int], default:int=cf.INVALID) -> int:
+        i = self._partition(pair)
+        with self.locks[i]:
+            return self.maps[i].pop(pair, default)
+
+
+    def keys(self) -> List[Tuple[int, int]]:
+        ''' Get all the pairs, which is a snapshot if other threads are changing the table.
+        '''
+        return [pair for partition in self.maps for pair in list(partition)]
+
+
+    def __getitem__(self, pair:Tuple[int, int]) -> int:
+        i = self._partition(pair)
+        with self.locks[i]:
+            return self.maps[i][pair]
+
+
+    def __setitem__(self, pair:Tuple[int, int], buffer_id:int):
+        i = self._partition(pair)
+        with self.locks[i]:
+            self.maps[i][pair] = buffer_id
+
+
+    def __contains__(self, pair:Tuple[int, int]) -> bool:
+        return pair in self.maps[self._partition(pair)]
+
+
+    def __iter__(self):
+        return iter(self.keys())
+
+
+    def __len__(self) -> int:
+        return sum(len(partition) for partition in self.maps)
@@ -0,0 +1,60 @@
+from typing import Dict
+
+import config as cf
+
+
+class PF_ReadAhead:
+    ''' Sequential access detection and the adaptive read-ahead window of each file.
+        A miss on the page right after the previous read run is sequential,
+        then the next <window> pages are read together with the missed page.
+        The window doubles each time a sequential run continues and halves
+        each time a prefetched page is evicted before being used.
+    '''
+
+
+    def __init__(self):
+        ''' Init the read-ahead state.
+        '''
+        self.next_page: Dict[int, int] = {}  # file_id -> the page after the last read run
+        self.window: Dict[int, int] = {}     # file_id -> the current window size
+        self.stats: Dict[str, int] = {'issued': 0, 'hits': 0, 'wasted': 0}
+
+
+    def on_miss(self, file_id:int, page_id:int) -> int:
+        ''' Called on a buffer miss of a page.
+        return: int, the number of pages to read from <page_id>, 1 if the access is not sequential.
+        '''
+        if self.next_page.get(file_id, cf.INVALID) != page_id:
+            self.window[file_id] = cf.READ_AHEAD_MIN_WINDOW
+            return 1
+        window = self.window.get(file_id, cf.READ_AHEAD_MIN_WINDOW)
+        self.window[file_id] = min(window * 2, cf.READ_AHEAD_MAX_WINDOW)
+        return window
+
+
+    def on_read(self, file_id:int, page_id:int, page_cnt:int):
+        ''' Called after <page_cnt> pages from <page_id> are read, the first one is demanded.
+        '''
+        self.next_page[file_id] = page_id + page_cnt
+        self.stats['issued'] += page_cnt - 1
+
+
+    def on_hit(self):
+        ''' Called when a prefetched page is used for the first time.
+        '''
+        self.stats['hits'] += 1
+
+
+    def on_waste(self, file_id:int):
+        ''' Called when a prefetched page is evicted without being used.
+        '''
+        self.stats['wasted'] += 1
+        if file_id in self.window:
+            self.window[file_id] = max(self.window[file_id] // 2, cf.READ_AHEAD_MIN_WINDOW)
+
+
+    def forget(self, file_id:int):
+        ''' Drop the state of a closed file.
+        '''
+        self.next_page.pop(file_id, None)
+        self.window.pop(file_id, None)
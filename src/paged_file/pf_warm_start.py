@@ -0,0 +1,74 @@
+import os
+import json
+import threading
+from typing import Dict, List
+
+import config as cf
+from errors.err_paged_file import ReadPageError, AllocBufferError
+
+
+class PF_WarmStarter:
+    ''' A daemon thread reading the pages buffered when a database was closed back into the buffer
+        after it is reopened, so the first queries do not run against a cold buffer.
+        The pages of each file are read in page order, WARM_START_BATCH_PAGES at a time, into the
+        free buffer pages only, so the pages read by the queries meanwhile are never evicted.
+    '''
+
+
+    def __init__(self, manager, pages:Dict[str, List[int]], batch_pages:int=cf.WARM_START_BATCH_PAGES):
+        ''' Init the warm starter of a PF_Manager, call start() to run it.
+        args:
+            pages: Dict[str, List[int]], file_name -> page ids, the files not opened are skipped.
+            batch_pages: int, the max number of pages read at a time.
+        '''
+        self.manager = manager
+        self.pages = pages
+        self.batch_pages = max(batch_pages, 1)
+        self.pages_read = 0
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, name='pf-warm-start', daemon=True)
+
+
+    def _run(self):
+        for file_name in sorted(self.pages):
+            page_ids = sorted(set(self.pages[file_name]))
+            for start in range(0, len(page_ids), self.batch_pages):
+                if self.stop_event.is_set(): return
+                file_id = self.manager.file_name_to_id.get(file_name, cf.INVALID)
+                if file_id == cf.INVALID: break     # not opened, e.g. dropped
+                try: self.pages_read += self.manager.prefetch_pages(file_id, page_ids[start:start+self.batch_pages])
+                except (ReadPageError, AllocBufferError) as exception: break
+
+
+    def start(self):
+        self.thread.start()
+
+
+    def stop(self):
+        ''' Stop the warm starter and wait for its current batch, before closing the files.
+        '''
+        self.stop_event.set()
+        if self.thread.is_alive() and self.thread is not threading.current_thread():
+            self.thread.join()
+
+
+    @staticmethod
+    def save(file_name:str, pages:Dict[str, List[int]]):
+        ''' Save the pages to be warmed up to a file, replacing the old one at once.
+        '''
+        temp_name = file_name + '.tmp'
+        with open(temp_name, 'w') as file:
+            json.dump(pages, file)
+        os.replace(temp_name, file_name)
+
+
+    @staticmethod
+    def load(file_name:str) -> Dict[str, List[int]]:
+        ''' Load the pages saved by save().
+        return: Dict[str, List[int]], empty if the file does not exist or is broken.
+        '''
+        try:
+            with open(file_name) as file:
+                pages = json.load(file)
+            return {str(name): [int(page_id) for page_id in page_ids] for name, page_ids in pages.items()}
+        except (OSError, ValueError, TypeError, AttributeError) as exception: return {}
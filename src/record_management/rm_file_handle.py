@@ -4,11 +4,14 @@ from typing import Union, List, Dict, Tuple, Any
 
 import config as cf
 from utils.bitmap import Bitmap
+from utils.tracing import traced
 from paged_file.pf_manager import pf_manager
+from log_management.lm_manager import lm_manager
 from record_management.rm_rid import RM_Rid
 from record_management.rm_record import RM_Record
 from record_management.rm_page_header import RM_PageHeader
 from errors.err_record_management import *
+from errors.err_paged_file import PageSizeError
 
 
 class RM_FileHandle:
@@ -26,18 +29,57 @@ class RM_FileHandle:
         self.data_file_id = data_file_id
         self.meta = {}
         self.meta_modified = False  # whether meta in mem is the same as it in disk
+        self.logged_meta: np.ndarray = None    # the meta pages logged last time
         self.is_opened = True
         
         
     def _set_page_next_free(self, page_no:int, next_free:int):
-        ''' Read a page, change its next_free in header, and write it back.
+        ''' Pin a page, change its next_free in header, and mark it as dirty.
         '''
-        page = pf_manager.read_page(self.data_file_id, page_no)
         header_size = RM_PageHeader.size()
-        header = RM_PageHeader.deserialize(page[:header_size])
-        header.next_free = next_free
-        page[:header_size] = header.serialize()
-        pf_manager.write_page(self.data_file_id, page_no, page)
+        page = pf_manager.pin_page(self.data_file_id, page_no)
+        try:
+            header = RM_PageHeader.deserialize(page[:header_size])
+            header.next_free = next_free
+            page[:header_size] = header.serialize()
+            lm_manager.log_page(self.data_file_id, page_no, page, [(0, header_size)])   # marks it dirty
+        finally: pf_manager.unpin_page(self.data_file_id, page_no)
+        
+        
+    def _unlink_free_page(self, page_no:int, next_free:int) -> bool:
+        ''' Unlink a page from the free slot list, searching its previous page from the head.
+            The headers are read in the pinned pages, not copied out by read_page().
+        args:
+            next_free: int, the next_free in the header of the page.
+        return: bool, False if the page is not in the list.
+        '''
+        meta = self.meta
+        if meta['next_free_page'] == page_no:
+            meta['next_free_page'] = next_free
+            return True
+        header_size = RM_PageHeader.size()
+        prev_page = meta['next_free_page']
+        while prev_page != cf.INVALID:
+            page = pf_manager.pin_page(self.data_file_id, prev_page)
+            try: prev_next = RM_PageHeader.deserialize(page[:header_size]).next_free
+            finally: pf_manager.unpin_page(self.data_file_id, prev_page)
+            if prev_next == page_no:
+                self._set_page_next_free(prev_page, next_free)
+                return True
+            prev_page = prev_next
+        return False
+        
+        
+    def _write_meta_pages(self, meta_pages:np.ndarray):
+        ''' Write the meta pages to the .meta file, and log their changes since logged last time.
+        args:
+            meta_pages: np.ndarray[(meta_page_number, PAGE_SIZE), uint8].
+        '''
+        for i in range(self.meta['meta_page_number']):
+            old = None if self.logged_meta is None else self.logged_meta[i]
+            pf_manager.write_page(self.meta_file_id, i, meta_pages[i,:])
+            lm_manager.log_diff(self.meta_file_id, i, old, meta_pages[i,:])    # the LSN of the buffer page
+        self.logged_meta = meta_pages
         
         
     @staticmethod
@@ -78,6 +120,13 @@ class RM_FileHandle:
                 bytes(fk['foreign_key_name'], encoding='utf-8')[:len1], len2,
                 bytes(fk['target_table_name'], encoding='utf-8')[:len2], len3, *pairs)
             meta_pages[off:off+len(data)] = np.frombuffer(data, dtype=np.uint8); off += len(data)
+        # the free page list and the data page size, skipped if the meta pages of an older file are full
+        data = struct.pack(f'{BYTE_ORDER}ii', meta.get('free_page_number', 0), meta.get('free_page_head', cf.INVALID))
+        if off + len(data) <= len(meta_pages):
+            meta_pages[off:off+len(data)] = np.frombuffer(data, dtype=np.uint8); off += len(data)
+        data = struct.pack(f'{BYTE_ORDER}i', meta.get('page_size', cf.PAGE_SIZE))
+        if off + len(data) <= len(meta_pages):
+            meta_pages[off:off+len(data)] = np.frombuffer(data, dtype=np.uint8); off += len(data)
         meta_pages = meta_pages.reshape((meta['meta_page_number'], cf.PAGE_SIZE))
         return meta_pages
         
@@ -130,11 +179,20 @@ class RM_FileHandle:
             foreign_keys.append({'foreign_key_name_length': foreign_key_name_length, 'foreign_key_name': foreign_key_name,
                 'target_table_name_length': target_table_name_length, 'target_table_name': target_table_name,
                 'foreign_key_size': foreign_key_size, 'foreign_key_pairs': foreign_key_pairs})    
+        free_page_number, free_page_head = 0, cf.INVALID   # zeros in older files mean no free pages
+        if off + 8 <= len(data):
+            (free_page_number, free_page_head) = struct.unpack(f'{BYTE_ORDER}ii', data[off:off+8])
+        off += 8
+        page_size = cf.PAGE_SIZE    # zeros in older files mean the default page size
+        if off + 4 <= len(data):
+            (page_size,) = struct.unpack(f'{BYTE_ORDER}i', data[off:off+4])
+            page_size = page_size or cf.PAGE_SIZE
         meta = {'record_size': record_size, 'record_per_page': record_per_page, 'bitmap_size': bitmap_size,
             'meta_page_number': meta_page_number, 'page_number': page_number, 'record_number': record_number,
             'next_free_page': next_free_page, 'column_number': column_number, 'columns': columns,
             'primary_key_size': primary_key_size, 'primary_keys': primary_keys,
-            'foreign_key_number': foreign_key_number, 'foreign_keys': foreign_keys}
+            'foreign_key_number': foreign_key_number, 'foreign_keys': foreign_keys,
+            'free_page_number': free_page_number, 'free_page_head': free_page_head, 'page_size': page_size}
         return meta
         
         
@@ -170,6 +228,9 @@ class RM_FileHandle:
                     'foreign_key_size': int,                        # MUST, the number of columns controlled by the foreign key
                     'foreign_key_pairs': List[Tuple[int,int]],      # MUST, a list of pairs, (column index of the current table, ~ the target table)
                 }, {...}, ...],
+                'free_page_number': int,                            # OPTIONAL, the number of released data pages, 0
+                'free_page_head': int,                              # OPTIONAL, the last released data page, INVALID
+                'page_size': int,                                   # OPTIONAL, the data page size, PAGE_SIZE * 2**k, PAGE_SIZE
             }
         '''
         if not self.is_opened:
@@ -179,12 +240,16 @@ class RM_FileHandle:
         if page_cnt != 0:
             raise InitMetaError(f'File meta has already been written.')
         # calc the meta info
+        page_size = meta.get('page_size', cf.PAGE_SIZE)
         record_size = meta['record_size']
-        max_record_size = cf.PAGE_SIZE - RM_PageHeader.size() - 1
+        max_record_size = page_size - RM_PageHeader.size() - 1
         if record_size > max_record_size:
             raise InitMetaError(f'Record size {record_size} is too large, must <= {max_record_size}.')
-        record_per_page = (8*(cf.PAGE_SIZE-RM_PageHeader.size())-7) // (8*record_size+1)
-        total_size = 40     # 10 fixed ints
+        try: pf_manager.set_page_size(self.data_file_id, page_size)
+        except PageSizeError as exception:
+            raise InitMetaError(str(exception))
+        record_per_page = (8*(page_size-RM_PageHeader.size())-7) // (8*record_size+1)
+        total_size = 52     # 13 fixed ints
         for col in meta['columns'][:meta['column_number']]:
             total_size += (13 + col['column_name_length'] + col['column_size'])
         total_size += 4 * meta['primary_key_size']
@@ -195,12 +260,14 @@ class RM_FileHandle:
             'meta_page_number': meta_page_number, 'page_number': 0, 'record_number': 0,
             'next_free_page': cf.INVALID, 'column_number': meta['column_number'], 'columns': meta['columns'],
             'primary_key_size': meta['primary_key_size'], 'primary_keys': meta['primary_keys'], 'foreign_key_number': meta['foreign_key_number'],
-            'foreign_keys': meta['foreign_keys']}
+            'foreign_keys': meta['foreign_keys'], 'free_page_number': 0, 'free_page_head': cf.INVALID, 'page_size': page_size}
         self.meta = new_meta
         # store meta info in the pages
         meta_pages = self._serialize_meta(self.meta)
         for i in range(meta_page_number):
-            pf_manager.append_page(self.meta_file_id, meta_pages[i,:])
+            pf_manager.append_page(self.meta_file_id)
+        self.logged_meta = None
+        self._write_meta_pages(meta_pages)
         self.meta_modified = False
         
         
@@ -223,7 +290,10 @@ class RM_FileHandle:
         for i in range(1, meta_page_number):
             meta_pages.append(pf_manager.read_page(self.meta_file_id, i))
         meta_pages = np.row_stack(meta_pages)
+        self.logged_meta = meta_pages
         self.meta = self._deserialize_meta(meta_pages)
+        pf_manager.set_page_size(self.data_file_id, self.meta['page_size'])
+        pf_manager.set_free_pages(self.data_file_id, self.meta['free_page_number'], self.meta['free_page_head'])
         self.meta_modified = False
         return self.meta
     
@@ -232,14 +302,16 @@ class RM_FileHandle:
         ''' Sync self.meta to the .meta file. Note that read or write records may change
             the file meta, and we don't want to wtite meta to disk each time when reading or
             writing the records. We only need to modify self.meta each time, and use this
-            interface to sync meta info just once. Only page_number, record_number, and
-            next_free_page are changable, so we only need to sync the first page to .meta file.
+            interface to sync meta info just once. Only page_number, record_number,
+            next_free_page and the free page list are changable. The free page list is
+            at the end of the meta, so all meta pages are synced.
         '''
         if not self.is_opened:
             raise FileNotOpenedError(f'File {self.file_name} not opened.')
         if not self.meta_modified: return
+        (self.meta['free_page_number'], self.meta['free_page_head']) = pf_manager.get_free_pages(self.data_file_id)
         meta_pages = self._serialize_meta(self.meta)
-        pf_manager.write_page(self.meta_file_id, 0, meta_pages[0,:])
+        self._write_meta_pages(meta_pages)
         self.meta_modified = False
         
     
@@ -252,8 +324,7 @@ class RM_FileHandle:
         for key in ('primary_key_size', 'primary_keys', 'foreign_key_number', 'foreign_keys'):
             self.meta[key] = info[key]
         meta_pages = self._serialize_meta(self.meta)
-        for i in range(self.meta['meta_page_number']):
-            pf_manager.write_page(self.meta_file_id, i, meta_pages[i,:])
+        self._write_meta_pages(meta_pages)
         self.meta_modified = False
         
     
@@ -263,14 +334,17 @@ class RM_FileHandle:
         meta = self.meta
         next_free_page = meta['next_free_page']
         if next_free_page == cf.INVALID: return None
-        page = pf_manager.read_page(self.data_file_id, next_free_page)
         header_size = RM_PageHeader.size()
-        bitmap = Bitmap.deserialize(capacity=meta['record_per_page'],
-            data=page[header_size:header_size+meta['bitmap_size']])
+        page = pf_manager.pin_page(self.data_file_id, next_free_page)
+        try:
+            bitmap = Bitmap.deserialize(capacity=meta['record_per_page'],
+                data=page[header_size:header_size+meta['bitmap_size']])
+        finally: pf_manager.unpin_page(self.data_file_id, next_free_page)
         slot_no = bitmap.first_free()
         return RM_Rid(page_no=next_free_page, slot_no=slot_no)
                 
     
+    @traced('rm.get_record')
     def get_record(self, rid:RM_Rid) -> RM_Record:
         ''' Get a record by its rid.
         '''
@@ -279,10 +353,30 @@ class RM_FileHandle:
         meta = self.meta
         record_size = meta['record_size']
         off = RM_PageHeader.size() + meta['bitmap_size'] + rid.slot_no*record_size
-        page = pf_manager.read_page(self.data_file_id, rid.page_no)
-        record_data = page[off:off+record_size]
+        page = pf_manager.pin_page(self.data_file_id, rid.page_no)
+        try: record_data = page[off:off+record_size].copy()
+        finally: pf_manager.unpin_page(self.data_file_id, rid.page_no)
         return RM_Record(rid=rid, data=record_data)
     
+    
+    def get_records(self, rids:List[RM_Rid]) -> List[RM_Record]:
+        ''' Get the records of some rids, e.g. found by an index scan.
+            Their pages are read together by pf_manager.read_pages().
+        return: List[RM_Record], in the order of <rids>.
+        '''
+        if not self.is_opened:
+            raise FileNotOpenedError(f'File {self.file_name} not opened.')
+        meta = self.meta
+        record_size = meta['record_size']
+        base = RM_PageHeader.size() + meta['bitmap_size']
+        page_nos = sorted(set(rid.page_no for rid in rids))
+        pages = dict(zip(page_nos, pf_manager.read_pages(self.data_file_id, page_nos)))
+        records = []
+        for rid in rids:
+            off = base + rid.slot_no * record_size
+            records.append(RM_Record(rid=rid, data=pages[rid.page_no][off:off+record_size].copy()))
+        return records
+    
 
     def pack_record(self, fields:np.ndarray) -> np.ndarray:
         ''' Pack the fields to record data by columns info in meta.
@@ -338,8 +432,94 @@ class RM_FileHandle:
             else: raise UnpackRecordError(f'Type {col_type} is invalid.')
             off += col_size
         return np.array(fields, dtype=object)
-        
-    
+
+
+    def get_dtype(self) -> np.dtype:
+        ''' Get the numpy structured dtype of a record by columns info in meta, e.g.
+            [('col_int', '<i4'), ('col_float', '<f8'), ('col_str', 'S10')], of itemsize record_size.
+        '''
+        meta = self.meta
+        BYTE_ORDER = cf.BYTE_ORDER
+        names, formats, offsets, off = [], [], [], 0
+        for i, col in enumerate(meta['columns'][:meta['column_number']]):
+            col_type = col['column_type']
+            col_size = col['column_size']
+            if col_type == cf.TYPE_INT: formats.append(f'{BYTE_ORDER}i4')
+            elif col_type == cf.TYPE_FLOAT: formats.append(f'{BYTE_ORDER}f8')
+            elif col_type == cf.TYPE_STR: formats.append(f'S{col_size}')
+            else: raise UnpackRecordError(f'Type {col_type} is invalid.')
+            names.append(f'f{i}')   # the column names are not required to be unique here
+            offsets.append(off)
+            off += col_size
+        return np.dtype({'names': names, 'formats': formats, 'offsets': offsets, 'itemsize': meta['record_size']})
+
+
+    def pack_records(self, fields_list:np.ndarray) -> np.ndarray:
+        ''' Pack the rows of fields to records data at once, column by column.
+        args:
+            fields_list: np.ndarray[(N, >=column_number), object], or a list of rows.
+        return: np.ndarray[(N, record_size), uint8].
+        '''
+        meta = self.meta
+        column_number = meta['column_number']
+        fields_list = np.asarray(fields_list, dtype=object)
+        if len(fields_list) == 0: return np.zeros((0, meta['record_size']), dtype=np.uint8)
+        if fields_list.ndim != 2 or fields_list.shape[1] < column_number:
+            raise PackRecordError(f'No enough fields to pack, len must >= {column_number}.')
+        dtype = self.get_dtype()
+        records = np.zeros(len(fields_list), dtype=dtype)
+        try:
+            for i, col in enumerate(meta['columns'][:column_number]):
+                column = fields_list[:, i]
+                if col['column_type'] == cf.TYPE_STR:
+                    column = np.char.encode(column.astype(str), 'utf-8')
+                records[f'f{i}'] = column
+        except (OverflowError, ValueError, TypeError) as exception:
+            raise PackRecordError(f'Failed to pack column {i}: {exception}.')
+        return records.view(np.uint8).reshape(len(records), dtype.itemsize)
+
+
+    def unpack_columns(self, data:np.ndarray) -> List[np.ndarray]:
+        ''' Unpack records data into columns at once.
+        args:
+            data: np.ndarray[(N, >=record_size), uint8], e.g. the slots of a page.
+        return: List[np.ndarray], column_number arrays of N int32, float64 or str.
+        '''
+        meta = self.meta
+        if data.ndim != 2 or data.shape[1] < meta['record_size']:
+            raise UnpackRecordError(f'No enough data to unpack, len must >= {meta["record_size"]}.')
+        dtype = self.get_dtype()
+        records = np.ascontiguousarray(data[:, :dtype.itemsize]).view(dtype)[:, 0]
+        columns = []
+        for i, col in enumerate(meta['columns'][:meta['column_number']]):
+            column = records[f'f{i}']
+            if col['column_type'] == cf.TYPE_STR:
+                column = np.char.decode(np.char.strip(column, b'\0'), 'utf-8')
+            columns.append(column)
+        return columns
+
+
+    def unpack_records(self, data:np.ndarray) -> np.ndarray:
+        ''' Unpack records data into rows of fields at once, as unpack_record() does for each.
+        args:
+            data: np.ndarray[(N, >=record_size), uint8].
+        return: np.ndarray[(N, column_number), object], of Python int, float and str.
+        '''
+        return self.columns_to_rows(self.unpack_columns(data))
+
+
+    @staticmethod
+    def columns_to_rows(columns:List[np.ndarray]) -> np.ndarray:
+        ''' Convert the columns returned by unpack_columns() to rows of fields.
+        return: np.ndarray[(N, len(columns)), object], of Python int, float and str.
+        '''
+        fields_list = np.empty((len(columns[0]) if columns else 0, len(columns)), dtype=object)
+        for i, column in enumerate(columns):
+            fields_list[:, i] = column.tolist()
+        return fields_list
+
+
+    @traced('rm.insert_record')
     def insert_record(self, data:np.ndarray) -> RM_Rid:
         ''' Insert a record, return the allocated rid.
         args:
@@ -360,30 +540,38 @@ class RM_FileHandle:
             header = RM_PageHeader(1, cf.INVALID)
             bitmap = Bitmap(capacity=record_per_page)
             bitmap.set_bit(0, True)
-            page_data = np.zeros(cf.PAGE_SIZE, dtype=np.uint8)
-            data_size = header_size + bitmap_size + record_size
-            page_data[:data_size] = np.concatenate([header.serialize(), bitmap.serialize(), data])
-            page_no = pf_manager.append_page(self.data_file_id, page_data)
-            meta['page_number'] += 1
+            page_no = pf_manager.append_page(self.data_file_id)    # may reuse a released page
+            page_data = pf_manager.pin_page(self.data_file_id, page_no)
+            try:
+                page_data[:header_size] = header.serialize()
+                page_data[header_size:header_size+bitmap_size] = bitmap.serialize()
+                page_data[header_size+bitmap_size:header_size+bitmap_size+record_size] = data
+                lm_manager.log_page(self.data_file_id, page_no, page_data,
+                    [(0, header_size+bitmap_size+record_size)], new=True)
+            finally: pf_manager.unpin_page(self.data_file_id, page_no)
+            meta['page_number'] = pf_manager.get_page_cnt(self.data_file_id)
             meta['record_number'] += 1
             meta['next_free_page'] = page_no if record_per_page > 1 else cf.INVALID
             self.meta = meta
             self.meta_modified = True
             return RM_Rid(page_no=page_no, slot_no=0)
-        page_data = pf_manager.read_page(self.data_file_id, first_free_page)
-        header:RM_PageHeader = RM_PageHeader.deserialize(page_data[:header_size])
-        header.record_cnt += 1
-        bitmap:Bitmap = Bitmap.deserialize(capacity=record_per_page,
-            data=page_data[header_size:header_size+bitmap_size])
-        slot_no = bitmap.first_free()
-        if slot_no == cf.INVALID:
-            raise InsertRecordError(f'Can not find free slot on page {first_free_page} to insert.')
-        bitmap.set_bit(slot_no, True)
-        off = header_size + bitmap_size + slot_no * record_size
-        page_data[:header_size] = header.serialize()
-        page_data[header_size:header_size+bitmap_size] = bitmap.serialize()
-        page_data[off:off+record_size] = data
-        pf_manager.write_page(self.data_file_id, first_free_page, page_data)
+        page_data = pf_manager.pin_page(self.data_file_id, first_free_page)
+        try:
+            header:RM_PageHeader = RM_PageHeader.deserialize(page_data[:header_size])
+            header.record_cnt += 1
+            bitmap:Bitmap = Bitmap.deserialize(capacity=record_per_page,
+                data=page_data[header_size:header_size+bitmap_size])
+            slot_no = bitmap.first_free()
+            if slot_no == cf.INVALID:
+                raise InsertRecordError(f'Can not find free slot on page {first_free_page} to insert.')
+            bitmap.set_bit(slot_no, True)
+            off = header_size + bitmap_size + slot_no * record_size
+            page_data[:header_size] = header.serialize()
+            page_data[header_size:header_size+bitmap_size] = bitmap.serialize()
+            page_data[off:off+record_size] = data
+            lm_manager.log_page(self.data_file_id, first_free_page, page_data,
+                [(0, header_size+bitmap_size), (off, record_size)])
+        finally: pf_manager.unpin_page(self.data_file_id, first_free_page)
         # modify meta
         meta['record_number'] += 1
         if header.record_cnt >= record_per_page:
@@ -392,7 +580,66 @@ class RM_FileHandle:
         self.meta_modified = True
         return RM_Rid(page_no=first_free_page, slot_no=slot_no)
 
-    
+
+    @traced('rm.insert_records')
+    def insert_records(self, datas:np.ndarray) -> List[RM_Rid]:
+        ''' Insert many records, filling the free slots of each page at once.
+        args:
+            datas: np.ndarray[(N, >=record_size), uint8], e.g. returned by pack_records().
+        return:
+            List[RM_Rid], the inserted positions, in the order of <datas>.
+        '''
+        if not self.is_opened:
+            raise FileNotOpenedError(f'File {self.file_name} not opened.')
+        meta = self.meta
+        header_size = RM_PageHeader.size()
+        record_size = meta['record_size']
+        bitmap_size = meta['bitmap_size']
+        record_per_page = meta['record_per_page']
+        base = header_size + bitmap_size
+        rids, idx = [], 0
+        while idx < len(datas):
+            page_no = meta['next_free_page']
+            new = page_no == cf.INVALID
+            if new:
+                page_no = pf_manager.append_page(self.data_file_id)    # may reuse a released page
+            page_data = pf_manager.pin_page(self.data_file_id, page_no)
+            try:
+                if new:
+                    header, bitmap = RM_PageHeader(0, cf.INVALID), Bitmap(capacity=record_per_page)
+                else:
+                    header:RM_PageHeader = RM_PageHeader.deserialize(page_data[:header_size])
+                    bitmap:Bitmap = Bitmap.deserialize(capacity=record_per_page, data=page_data[header_size:base])
+                slots = bitmap.first_free_bits(len(datas) - idx)
+                if len(slots) == 0:
+                    raise InsertRecordError(f'Can not find free slot on page {page_no} to insert.')
+                bitmap.set_bits(slots, True)
+                header.record_cnt += len(slots)
+                page_data[:header_size] = header.serialize()
+                page_data[header_size:base] = bitmap.serialize()
+                records = page_data[base:base+record_per_page*record_size].reshape(record_per_page, record_size)
+                records[slots] = datas[idx:idx+len(slots), :record_size]
+                first, last = int(slots[0]), int(slots[-1]) + 1
+                if new:
+                    lm_manager.log_page(self.data_file_id, page_no, page_data, [(0, base+last*record_size)], new=True)
+                else:
+                    lm_manager.log_page(self.data_file_id, page_no, page_data,
+                        [(0, base), (base+first*record_size, (last-first)*record_size)])
+            finally: pf_manager.unpin_page(self.data_file_id, page_no)
+            rids += [RM_Rid(page_no=page_no, slot_no=slot_no) for slot_no in slots.tolist()]
+            idx += len(slots)
+            # modify meta
+            meta['record_number'] += len(slots)
+            if new:
+                meta['page_number'] = pf_manager.get_page_cnt(self.data_file_id)
+                meta['next_free_page'] = page_no if header.record_cnt < record_per_page else cf.INVALID
+            elif header.record_cnt >= record_per_page:
+                meta['next_free_page'] = header.next_free
+            self.meta = meta
+            self.meta_modified = True
+        return rids
+
+
     def remove_record(self, rid:RM_Rid) -> None:
         ''' Remove a record by its rid.
         '''
@@ -403,20 +650,25 @@ class RM_FileHandle:
         bitmap_size = meta['bitmap_size']
         first_free_page = meta['next_free_page']
         record_per_page = meta['record_per_page']
-        page_data = pf_manager.read_page(self.data_file_id, rid.page_no)
-        header:RM_PageHeader = RM_PageHeader.deserialize(page_data[:header_size])
-        bitmap:Bitmap = Bitmap.deserialize(capacity=record_per_page,
-            data=page_data[header_size:header_size+bitmap_size])
-        if not bitmap.get_bit(rid.slot_no):
-            raise RemoveRecordError(f'Record {rid} does not exist.')
-        header.record_cnt -= 1
-        if header.record_cnt == record_per_page - 1:
-            header.next_free = first_free_page
-            meta['next_free_page'] = rid.page_no
-        bitmap.set_bit(rid.slot_no, False)
-        page_data[:header_size] = header.serialize()
-        page_data[header_size:header_size+bitmap_size] = bitmap.serialize()
-        pf_manager.write_page(self.data_file_id, rid.page_no, page_data)
+        page_data = pf_manager.pin_page(self.data_file_id, rid.page_no)
+        try:
+            header:RM_PageHeader = RM_PageHeader.deserialize(page_data[:header_size])
+            bitmap:Bitmap = Bitmap.deserialize(capacity=record_per_page,
+                data=page_data[header_size:header_size+bitmap_size])
+            if not bitmap.get_bit(rid.slot_no):
+                raise RemoveRecordError(f'Record {rid} does not exist.')
+            header.record_cnt -= 1
+            if header.record_cnt == record_per_page - 1:
+                header.next_free = first_free_page
+                meta['next_free_page'] = rid.page_no
+            bitmap.set_bit(rid.slot_no, False)
+            page_data[:header_size] = header.serialize()
+            page_data[header_size:header_size+bitmap_size] = bitmap.serialize()
+            lm_manager.log_page(self.data_file_id, rid.page_no, page_data, [(0, header_size+bitmap_size)])
+        finally: pf_manager.unpin_page(self.data_file_id, rid.page_no)
+        # release an empty page, unlinking it from the free slot list wherever it sits
+        if header.record_cnt == 0 and self._unlink_free_page(rid.page_no, header.next_free):
+            lm_manager.release_page(self.data_file_id, rid.page_no)
         meta['record_number'] -= 1
         self.meta = meta
         self.meta_modified = True
@@ -435,14 +687,16 @@ class RM_FileHandle:
         record_size = meta['record_size']
         bitmap_size = meta['bitmap_size']
         data = data[:record_size]
-        page_data = pf_manager.read_page(self.data_file_id, rid.page_no)
-        bitmap:Bitmap = Bitmap.deserialize(capacity=meta['record_per_page'],
-            data=page_data[header_size:header_size+bitmap_size])
-        if not bitmap.get_bit(rid.slot_no):
-            raise UpdateRecordError(f'Record {rid} does not exist.')
-        off = header_size + bitmap_size + rid.slot_no * record_size
-        page_data[off:off+record_size] = data
-        pf_manager.write_page(self.data_file_id, rid.page_no, page_data)
+        page_data = pf_manager.pin_page(self.data_file_id, rid.page_no)
+        try:
+            bitmap:Bitmap = Bitmap.deserialize(capacity=meta['record_per_page'],
+                data=page_data[header_size:header_size+bitmap_size])
+            if not bitmap.get_bit(rid.slot_no):
+                raise UpdateRecordError(f'Record {rid} does not exist.')
+            off = header_size + bitmap_size + rid.slot_no * record_size
+            page_data[off:off+record_size] = data
+            lm_manager.log_page(self.data_file_id, rid.page_no, page_data, [(off, record_size)])
+        finally: pf_manager.unpin_page(self.data_file_id, rid.page_no)
 
 
 if __name__ == '__main__':
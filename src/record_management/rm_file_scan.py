@@ -1,4 +1,4 @@
-import struct
+import operator
 import numpy as np
 from typing import Union, List, Tuple
 
@@ -6,6 +6,7 @@ import config as cf
 from utils.enums import CompOp
 from utils.bitmap import Bitmap
 from paged_file.pf_manager import pf_manager
+from paged_file.pf_buffer_ring import PF_BufferRing
 from record_management.rm_rid import RM_Rid
 from record_management.rm_record import RM_Record
 from record_management.rm_file_handle import RM_FileHandle
@@ -13,6 +14,10 @@ from record_management.rm_page_header import RM_PageHeader
 from errors.err_record_management import * 
 
 
+COMPARATORS = {CompOp.EQ: operator.eq, CompOp.LT: operator.lt, CompOp.GT: operator.gt,
+    CompOp.LE: operator.le, CompOp.GE: operator.ge, CompOp.NE: operator.ne}
+
+
 class RM_FileScan:
     ''' Scan all records within a file, possibly restricted with some conditions.
     '''
@@ -34,6 +39,7 @@ class RM_FileScan:
             comp_op: CompOp, the filter condition. If comp_op == CompOp.NO, the following
                 parameters (field_value, field_type, field_size, and field_off) will all be
                 ignored, and all records will be returned by the scanning operation.
+                More conditions can be added by add_condition().
             field_value: Union[int,float,str,None], the field to be compared with.
             field_type: int, in {cf.TYPE_INT, cf.TYPE_FLAOT, cf.TYPE_STR}.
             field_size: int, the size of the field to be compared.
@@ -41,12 +47,35 @@ class RM_FileScan:
         '''
         self.is_opened = True
         self.file_handle = file_handle
+        self.conditions: List[Tuple[CompOp, Union[int,float,str,list], int, int, int]] = []
         if not file_handle.is_opened:
             raise OpenScanError(f'The file to be scanned is not opened.')
+        if comp_op != CompOp.NO:
+            self.add_condition(comp_op, field_value, field_type, field_size, field_off)
+        elif field_type not in {cf.TYPE_INT, cf.TYPE_FLOAT, cf.TYPE_STR}:
+            raise OpenScanError(f'Wrong field type: {field_type}.')
+        
+    
+    def add_condition(self, comp_op:CompOp, field_value:Union[int,float,str,list],
+            field_type:int=cf.TYPE_INT, field_size:int=cf.SIZE_INT, field_off:int=0) -> None:
+        ''' Restrict the opened file scan with one more condition, the records returned
+            satisfy all of them. The conditions are evaluated on the raw records of each page,
+            before any record is returned.
+        args:
+            comp_op: CompOp, in {EQ, LT, GT, LE, GE, NE, IN}.
+            field_value: Union[int,float,str,list], the field to be compared with,
+                or the list of fields for CompOp.IN.
+            field_type, field_size, field_off: as specified in open_scan().
+        '''
+        if not self.is_opened:
+            raise OpenScanError(f'The file scan is not opened.')
+        if comp_op not in COMPARATORS and comp_op != CompOp.IN:
+            raise OpenScanError(f'Wrong comp_op: {comp_op}.')
         if field_type not in {cf.TYPE_INT, cf.TYPE_FLOAT, cf.TYPE_STR}:
             raise OpenScanError(f'Wrong field type: {field_type}.')
-        (self.comp_op, self.field_value, self.field_type, self.field_size, self.field_off) \
-            = comp_op, field_value, field_type, field_size, field_off
+        if comp_op == CompOp.IN:
+            field_value = list(field_value)
+        self.conditions.append((comp_op, field_value, field_type, field_size, field_off))
         
     
     def next(self) -> Union[RM_Record, None]:
@@ -58,57 +87,102 @@ class RM_FileScan:
                     # do something with the record
             ```
         '''
+        for page_no, slots, records in self._scan_pages():
+            for slot_no, data in zip(slots.tolist(), records):
+                yield RM_Record(rid=RM_Rid(page_no, slot_no), data=data)
+        return None
+        
+    
+    def next_batch(self, batch_pages:int=cf.SCAN_BATCH_PAGES) -> Tuple[np.ndarray, List[np.ndarray]]:
+        ''' Yield the scanned records that satisfy the filtering condition, <batch_pages> pages at a time,
+            as columns instead of records.
+        args:
+            batch_pages: int, the number of data pages in a batch.
+        return: Tuple[np.ndarray, List[np.ndarray]], (rids, columns) of each batch not empty,
+            rids: np.ndarray[(N, 2), int32], the page_no and slot_no of the records.
+            columns: List[np.ndarray], as RM_FileHandle.unpack_columns() returns.
+        note:
+            Should use the generator like this:
+            ``` python
+                for rids, columns in file_scan.next_batch():
+                    # do something with the columns
+            ```
+        '''
+        if not self.is_opened: return None
+        batch_pages = max(batch_pages, 1)
+        rids, datas, pages = [], [], 0
+        for page_no, slots, records in self._scan_pages():
+            if len(slots) > 0:
+                rids.append(np.stack([np.full(len(slots), page_no, dtype=np.int32), slots.astype(np.int32)], axis=1))
+                datas.append(records)
+            pages += 1
+            if pages < batch_pages: continue
+            if len(rids) > 0:
+                yield np.concatenate(rids), self.file_handle.unpack_columns(np.concatenate(datas))
+            rids, datas, pages = [], [], 0
+        if len(rids) > 0:
+            yield np.concatenate(rids), self.file_handle.unpack_columns(np.concatenate(datas))
+        return None
+        
+    
+    def _scan_pages(self) -> Tuple[int, np.ndarray, np.ndarray]:
+        ''' Yield the records of each data page that satisfy the filtering condition.
+        return: Tuple[int, np.ndarray, np.ndarray], (page_no, slots, records) of each page,
+            slots: np.ndarray[(N,), int64], records: np.ndarray[(N, record_size), uint8].
+        '''
         if not self.is_opened: return None
         file_handle = self.file_handle
         if not file_handle.is_opened:
             raise ScanNextError(f'The file to be scanned is not opened.')
-        BYTE_ORDER = cf.BYTE_ORDER
-        (comp_op, field_value, field_type, field_size, field_off) \
-            = self.comp_op, self.field_value, self.field_type, self.field_size, self.field_off
         meta = file_handle.meta
         data_file_id = file_handle.data_file_id
         record_number = meta['record_number']
         record_per_page = meta['record_per_page']
+        record_size = meta['record_size']
         header_size = RM_PageHeader.size()
         bitmap_size = meta['bitmap_size']
+        base = header_size + bitmap_size
+        # large tables are scanned through a private ring to keep the hot pages buffered
+        ring = PF_BufferRing() if meta['page_number'] > cf.SCAN_RING_THRESHOLD * pf_manager.capacity else None
         idx, page_no = 0, 0
         while idx < record_number:
-            # if page_no == cf.INVALID:
-            #     raise ScanNextError(f'Next page is invalid.')
-            page_data = pf_manager.read_page(data_file_id, page_no)
-            page_header:RM_PageHeader = RM_PageHeader.deserialize(page_data[:header_size])
-            bitmap:Bitmap = Bitmap.deserialize(record_per_page,
-                page_data[header_size:header_size+bitmap_size])
-            for slot_no in range(record_per_page):
-                if not bitmap.get_bit(slot_no): continue
-                idx += 1
-                record = file_handle.get_record(rid=RM_Rid(page_no, slot_no))
-                if comp_op == CompOp.NO: # ignore comparison
-                    yield record
-                else:
-                    if field_type == cf.TYPE_INT:
-                        (field,) = struct.unpack(f'{BYTE_ORDER}i', record.data[field_off:field_off+4].tobytes())
-                    elif field_type == cf.TYPE_FLOAT:
-                        (field,) = struct.unpack(f'{BYTE_ORDER}d', record.data[field_off:field_off+8].tobytes())
-                    elif field_type == cf.TYPE_STR:
-                        (field,) = struct.unpack(f'{BYTE_ORDER}{field_size}s',
-                            record.data[field_off:field_off+field_size].tobytes())
-                        field = str(field, encoding='utf-8').strip('\0')
-                    else: raise ScanNextError(f'Wrong field type: {field_type}.')
-                    valid = True
-                    if comp_op == CompOp.EQ: valid = (field == field_value)
-                    elif comp_op == CompOp.LT: valid = (field < field_value)
-                    elif comp_op == CompOp.GT: valid = (field > field_value)
-                    elif comp_op == CompOp.LE: valid = (field <= field_value)
-                    elif comp_op == CompOp.GE: valid = (field >= field_value)
-                    elif comp_op == CompOp.NE: valid = (field != field_value)
-                    else: raise ScanNextError(f'Wrong comp_op: {comp_op}.')
-                    if valid: yield record
-                if idx >= record_number: break
+            # each page is read once, its live slots are cut from it and decoded together
+            page_data = pf_manager.read_page(data_file_id, page_no, ring)
+            slots = Bitmap(record_per_page, page_data[header_size:base]).occupied_array()[:record_number - idx]
+            idx += len(slots)
+            records = page_data[base:base+record_per_page*record_size].reshape(record_per_page, record_size)[slots]
+            if self.conditions and len(slots) > 0:
+                valid = self._match(records)
+                slots, records = slots[valid], records[valid]
+            yield page_no, slots, records
             page_no += 1
         return None
         
     
+    def _match(self, records:np.ndarray) -> np.ndarray:
+        ''' Evaluate the filtering conditions on the records of a page together.
+        args:
+            records: np.ndarray[(N, record_size), uint8].
+        return: np.ndarray[(N,), bool].
+        '''
+        BYTE_ORDER = cf.BYTE_ORDER
+        valid = np.ones(len(records), dtype=bool)
+        for comp_op, field_value, field_type, field_size, field_off in self.conditions:
+            field_records = np.ascontiguousarray(records[valid, field_off:field_off+field_size])
+            if field_type == cf.TYPE_INT:
+                fields = field_records.view(f'{BYTE_ORDER}i4')[:, 0].astype(np.int64)
+            elif field_type == cf.TYPE_FLOAT:
+                fields = field_records.view(f'{BYTE_ORDER}f8')[:, 0]
+            else:
+                fields = np.char.decode(np.char.strip(field_records.view(f'S{field_size}')[:, 0], b'\0'), 'utf-8')
+            if comp_op == CompOp.IN:
+                matched = np.isin(fields, field_value) if len(field_value) > 0 else np.zeros(len(fields), dtype=bool)
+            else: matched = COMPARATORS[comp_op](fields, field_value)
+            valid[valid] = np.asarray(matched, dtype=bool)
+            if not valid.any(): break
+        return valid
+        
+    
     def close_scan(self) -> None:
         ''' Close the file scan.
         '''
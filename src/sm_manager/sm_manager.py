@@ -4,13 +4,17 @@ from config import *
 from table.table import Table
 from typing import Dict, Set, List
 from record_management.rm_manager import rm_manager
+from paged_file.pf_manager import pf_manager
+from paged_file.pf_warm_start import PF_WarmStarter
+from index_management.ix_manager import ix_manager
+from utils.tracing import tracer
+from log_management.lm_manager import lm_manager
 from record_management.rm_rid import RM_Rid
 from typing import List, Union, Tuple
 from functools import wraps
 import shutil
 from common.common import *
 import pandas as pd
-from operators.operators import TableScanNode
 from utils.bitwise import list_int_to_int, int_to_list_int
 
 
@@ -23,11 +27,39 @@ def require_using_db(func):
     return wrapfunc
 
 
+def commit_log(func):
+    # the changes of a modifying statement are durable in the log when it returns
+    @wraps(func)
+    def wrapfunc(self, rel_name, *args, **kwargs):
+        self._touched.add(rel_name)
+        try:
+            return func(self, rel_name, *args, **kwargs)
+        finally:
+            sm_manager.commit()
+    return wrapfunc
+
+
+def checkpoint_log(func):
+    # the records of the files dropped are dropped from the log, not redone on new files of the same names
+    @wraps(func)
+    def wrapfunc(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            lm_manager.checkpoint()
+    return wrapfunc
+
+
 class SM_Manager():
     def __init__(self):
         self._using_db: str = ""
         self._db_names: Set[str] = set()
         self._tables: Dict[str, Table] = dict()
+        self._touched: Set[str] = set()     # the tables changed by the running statement
+        self._page_size: int = TABLE_PAGE_SIZE
+        self._warm_starter: PF_WarmStarter = None
+        if TRACE_ENABLED:
+            tracer.enable()
 
         if (not os.path.exists(DATABASE_PATH)):
             os.mkdir(DATABASE_PATH)
@@ -46,12 +78,50 @@ class SM_Manager():
                     f'Database {db_name} is not existed')
             self._tables.clear()
             self._using_db = db_name
+            pf_manager.set_replacement_policy(
+                DATABASE_REPLACEMENT_POLICY.get(db_name, REPLACEMENT_POLICY))
+            pf_manager.set_file_backend(
+                DATABASE_FILE_BACKEND.get(db_name, FILE_BACKEND))
+            pf_manager.set_buffer_quotas(
+                DATABASE_BUFFER_QUOTAS.get(db_name, BUFFER_QUOTAS))
             os.chdir(os.path.join(self._base_dir, db_name))
+            if WAL_ENABLED:
+                lm_manager.open(WAL_FILE_NAME)
+                lm_manager.recover()    # redo the changes after the last checkpoint if crashed
             files = os.listdir(".")
             for file in files:
                 if (file.endswith(TABLE_DATA_SUFFIX)):
                     self._tables[file[:-len(TABLE_DATA_SUFFIX)]
                                  ] = Table(file[:-len(TABLE_DATA_SUFFIX)])
+            if WARM_START != 'NONE':
+                self._warm_start()
+
+    def _warm_start(self):
+        # reload the pages buffered when the database was closed last time, in the background
+        pages = PF_WarmStarter.load(WARM_START_FILE_NAME)
+        if pages:
+            self._warm_starter = PF_WarmStarter(pf_manager, pages)
+            self._warm_starter.start()
+
+    def _stop_warm_start(self):
+        # the files can not be closed while the warm starter reads them
+        if self._warm_starter is not None:
+            self._warm_starter.stop()
+            self._warm_starter = None
+
+    def _save_warm_start(self):
+        # record the pages buffered now, before the tables are closed
+        if WARM_START == 'INDEX':
+            pages = ix_manager.get_cached_pages(inter_only=True)
+        else:
+            pages = pf_manager.get_resident_pages()
+            for file_name, page_ids in ix_manager.get_cached_pages().items():
+                pages[file_name] = sorted(set(pages.get(file_name, [])) | set(page_ids))
+        pages = {name: page_ids for name, page_ids in pages.items() if page_ids}
+        try:
+            PF_WarmStarter.save(WARM_START_FILE_NAME, pages)
+        except OSError:
+            pass
 
     def create_db(self, db_name: str):
         if (db_name in self._db_names):
@@ -73,19 +143,113 @@ class SM_Manager():
         if (self._using_db == ""):
             return
         self._using_db = ""
+        self._stop_warm_start()
+        if WARM_START != 'NONE':
+            self._save_warm_start()
         for each in self._tables.values():
             del each
         self._tables.clear()
+        lm_manager.close()
         os.chdir(self._base_dir)
 
+    def commit(self):
+        # sync the metas of the tables changed by the statement, then wait for the log to be durable
+        touched, self._touched = self._touched, set()
+        if not lm_manager.is_open:
+            return
+        for each in touched:
+            if each in self._tables:
+                self._tables[each].sync_meta()
+        lm_manager.commit()
+
     def show_dbs(self):
         return Result(["Databases"], [[each] for each in list(self._db_names)], [])
 
+    def show_buffer_stats(self):
+        stats = pf_manager.get_buffer_stats()
+        header = ["File", "Hits", "Misses", "Hit Ratio", "Reads", "Writes", "Evictions", "Dirty Evictions"]
+        total = {name: 0 for name in ["hits", "misses", "reads", "writes", "evictions", "dirty_evictions"]}
+        results = []
+        for file_name in sorted(stats):
+            results.append([file_name] + self._buffer_stats_row(stats[file_name]))
+            for name in total:
+                total[name] += stats[file_name][name]
+        results.append(["TOTAL"] + self._buffer_stats_row(total))
+        read_ahead = pf_manager.get_read_ahead_stats()
+        writer = pf_manager.get_writer_stats()
+        addition = [f'Buffer pages: {pf_manager.capacity}, policy: {pf_manager.replacement_policy}',
+                    f'Read-ahead: {read_ahead["issued"]} issued, {read_ahead["hits"]} hits, {read_ahead["wasted"]} wasted',
+                    f'Background writer: {writer["background_writes"]} pages written']
+        return Result(header, results, addition)
+
+    @staticmethod
+    def _buffer_stats_row(stats: Dict[str, int]) -> list:
+        accesses = stats["hits"] + stats["misses"]
+        hit_ratio = "%.3f" % (stats["hits"] / accesses) if accesses > 0 else "-"
+        return [stats["hits"], stats["misses"], hit_ratio, stats["reads"], stats["writes"],
+                stats["evictions"], stats["dirty_evictions"]]
+
+    def reset_buffer_stats(self):
+        pf_manager.reset_buffer_stats()
+
+    def set_trace(self, enabled: bool):
+        if enabled:
+            tracer.reset()
+            tracer.enable()
+        else:
+            tracer.disable()
+
+    def show_trace_stats(self):
+        stats = tracer.get_stats()
+        header = ["Call", "Count", "Total (ms)", "Mean (us)", "P50 (us)", "P99 (us)", "Max (us)"]
+        results = [[name, each["count"], "%.3f" % (each["total_us"] / 1000), "%.1f" % each["mean_us"],
+                    "%.1f" % each["p50_us"], "%.1f" % each["p99_us"], "%.1f" % each["max_us"]]
+                   for name, each in sorted(stats.items())]
+        addition = [f'Tracing: {"on" if tracer.enabled else "off"}, the times of nested calls are inclusive']
+        return Result(header, results, addition)
+
+    def reset_trace_stats(self):
+        tracer.reset()
+
+    def _buffer_quota_key(self, rel_name: str, idents: List[str]) -> str:
+        # the files of a table share the table name as the prefix, and an index adds its index_no
+        if (rel_name not in self._tables):
+            raise TableNotExistsError(rel_name)
+        if not idents:
+            return rel_name
+        table = self._tables[rel_name]
+        index_no = list_int_to_int([table.get_column_idx(each) for each in idents])
+        if not table.index_exist(index_no):
+            raise Exception(f'No index on {rel_name}({", ".join(idents)})')
+        return f'{rel_name}.{index_no}'
+
+    @require_using_db
+    def set_buffer_quota(self, rel_name: str, idents: List[str], reserved: int, limit: int):
+        pf_manager.set_buffer_quota(self._buffer_quota_key(rel_name, idents), reserved, limit)
+
+    @require_using_db
+    def drop_buffer_quota(self, rel_name: str, idents: List[str]):
+        pf_manager.remove_buffer_quota(self._buffer_quota_key(rel_name, idents))
+
+    def show_buffer_quotas(self):
+        quotas = pf_manager.get_buffer_quotas()
+        results = [[key, reserved, limit if limit != INVALID else "-", held]
+                   for key, (reserved, limit, held) in sorted(quotas.items())]
+        reserved = sum(each[0] for each in quotas.values())
+        return Result(["Files", "Reserved", "Limit", "Pages"], results,
+                      [f'Buffer pages: {pf_manager.capacity}, reserved: {reserved}'])
+
+    def set_page_size(self, page_size: int):
+        # the page size of the tables created later, and of their indexes
+        pf_manager.check_page_size(page_size)
+        self._page_size = page_size
+
     @require_using_db
     def show_tables(self):
         return Result(["Tables"], [[each] for each in list(self._tables.keys())], [])
 
     @require_using_db
+    @commit_log
     def create_table(self, rel_name: str, columns: List[Column], pk: List[str], fk: List[Dict]):
         if (rel_name in self._tables):
             raise TableExistsError(rel_name)
@@ -113,7 +277,7 @@ class SM_Manager():
             fk_dict["foreign_key_pairs"] = list(zip(local_idx, target_idx))
             fk_dict.pop("local_idents")
             fk_dict.pop("target_idents")
-        Table.create_table(rel_name, columns, pk_idx, fk)
+        Table.create_table(rel_name, columns, pk_idx, fk, self._page_size)
         self._tables[rel_name] = Table(rel_name)
 
     @require_using_db
@@ -177,12 +341,15 @@ class SM_Manager():
         return res
 
     @require_using_db
+    @checkpoint_log
+    @commit_log
     def drop_table(self, rel_name: str):
         if (self._using_db == ""):
             raise NoUsingDatabaseError((f'No database is opened'))
         if (rel_name not in self._tables):
             raise TableNotExistsError(rel_name)
         table = self._tables[rel_name]
+        self._stop_warm_start()
         table.drop()
         self._tables.pop(rel_name)
         rm_manager.remove_file(rel_name)
@@ -204,12 +371,14 @@ class SM_Manager():
     def _modify_ref_cnt(self, fk: Dict, values: np.ndarray, delta: int):
         for each in fk:
             target_table = self.get_table(each["target_table_name"])
+            self._touched.add(each["target_table_name"])
             fk_pairs: List[Tuple] = each["foreign_key_pairs"]
             local_idx = [each[0] for each in fk_pairs]
             val_list = values[:, local_idx]
             target_table.modify_ref_cnt(val_list, delta)
 
     @require_using_db
+    @commit_log
     def insert(self, rel_name: str, values: np.ndarray):
         if (rel_name not in self._tables):
             raise TableNotExistsError(rel_name)
@@ -224,6 +393,7 @@ class SM_Manager():
         self._modify_ref_cnt(fk, values, 1)
 
     @require_using_db
+    @commit_log
     def delete(self, rel_name: str, records: RecordList):
         if (rel_name not in self._tables):
             raise TableNotExistsError(rel_name)
@@ -240,6 +410,7 @@ class SM_Manager():
         self._modify_ref_cnt(fk, vals, -1)
 
     @require_using_db
+    @commit_log
     def update(self, rel_name: str, records: RecordList, set_clause: List):
         if (rel_name not in self._tables):
             raise TableNotExistsError(rel_name)
@@ -265,6 +436,7 @@ class SM_Manager():
             table.update_record(each.rid, each)
 
     @require_using_db
+    @commit_log
     def create_index(self, rel_name: str, idents: List[str]):
         if (rel_name not in self._tables):
             raise TableNotExistsError(rel_name)
@@ -277,15 +449,19 @@ class SM_Manager():
         table.create_index(column_idx, records)
 
     @require_using_db
+    @checkpoint_log
+    @commit_log
     def drop_index(self, rel_name: str, idents: List[str]):
         if (rel_name not in self._tables):
             raise TableNotExistsError(rel_name)
         table = self._tables[rel_name]
         column_idx = [table.get_column_idx(each) for each in idents]
         index_no = list_int_to_int(column_idx)
+        self._stop_warm_start()
         table.drop_index(index_no)
 
     @require_using_db
+    @commit_log
     def load(self, rel_name: str, file_name: str):
         if (rel_name not in self._tables):
             raise TableNotExistsError(rel_name)
@@ -308,12 +484,11 @@ class SM_Manager():
     def dump(self, rel_name: str, file_name: str):
         if (rel_name not in self._tables):
             raise TableNotExistsError(rel_name)
-        node = TableScanNode(self._tables[rel_name])
-        records = node.process()
-        values = [each.data for each in records.records]
-        pd.DataFrame(values).to_csv(file_name, header=False, index=False)
+        columns = self._tables[rel_name].load_all_columns()
+        pd.DataFrame(dict(enumerate(columns))).to_csv(file_name, header=False, index=False)
 
     @require_using_db
+    @commit_log
     def add_pk(self, rel_name: str, idents: list):
         if (rel_name not in self._tables):
             raise TableNotExistsError(rel_name)
@@ -324,6 +499,7 @@ class SM_Manager():
         table.add_pk(pk_idx)
 
     @require_using_db
+    @commit_log
     def drop_pk(self, rel_name: str):
         if (rel_name not in self._tables):
             raise TableNotExistsError(rel_name)
@@ -331,6 +507,7 @@ class SM_Manager():
         table.drop_pk()
 
     @require_using_db
+    @commit_log
     def add_fk(self, rel_name: str, fk_name: str, target_table_name: str, local_idents: List[str], target_idents: List[str]):
         if (rel_name not in self._tables):
             raise TableNotExistsError(rel_name)
@@ -356,6 +533,7 @@ class SM_Manager():
         table.add_fk(fk)
 
     @require_using_db
+    @commit_log
     def drop_fk(self, rel_name: str, fk_name: str):
         if (rel_name not in self._tables):
             raise TableNotExistsError(rel_name)
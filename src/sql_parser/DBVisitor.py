@@ -27,22 +27,24 @@ class DBVisitor(SQLVisitor):
             return ctx.table_statement().accept(self)
         if (ctx.alter_statement()):
             return ctx.alter_statement().accept(self)
+        if (ctx.system_statement()):
+            return ctx.system_statement().accept(self)
         if (ctx.Annotation()):
             return ctx.Annotation().accept(self)
         return None
     
     def visitCreate_db(self, ctx: SQLParser.Create_dbContext):
-        return sm_manager.create_db(str(ctx.Identifier()))
+        return sm_manager.create_db(ctx.identifier().getText())
 
     def visitDrop_db(self, ctx: SQLParser.Drop_dbContext):
-        return sm_manager.drop_db(str(ctx.Identifier()))
+        return sm_manager.drop_db(ctx.identifier().getText())
 
     def visitShow_dbs(self, ctx: SQLParser.Show_dbsContext):
         dbs = sm_manager.show_dbs()
         return dbs
 
     def visitUse_db(self, ctx: SQLParser.Use_dbContext):
-        return sm_manager.open_db(str(ctx.Identifier()))
+        return sm_manager.open_db(ctx.identifier().getText())
 
     def visitShow_tables(self, ctx: SQLParser.Show_tablesContext):
         tables = sm_manager.show_tables()
@@ -53,35 +55,71 @@ class DBVisitor(SQLVisitor):
 
     def visitLoad_data(self, ctx: SQLParser.Load_dataContext):
         file_name: str = str(ctx.String())[1:-1]
-        table_name: str = str(ctx.Identifier())
+        table_name: str = ctx.identifier().getText()
         sm_manager.load(table_name, file_name)
     
     def visitDump_data(self, ctx: SQLParser.Dump_dataContext):
         file_name = str(ctx.String())[1:-1]
-        table_name = str(ctx.Identifier())
+        table_name = ctx.identifier().getText()
         sm_manager.dump(table_name, file_name)
 
+    def visitShow_buffer_stats(self, ctx: SQLParser.Show_buffer_statsContext):
+        return sm_manager.show_buffer_stats()
+
+    def visitReset_buffer_stats(self, ctx: SQLParser.Reset_buffer_statsContext):
+        return sm_manager.reset_buffer_stats()
+
+    def visitSet_buffer_quota(self, ctx: SQLParser.Set_buffer_quotaContext):
+        # the quota of a table with its indexes, or of the index on the columns listed
+        table_name = ctx.identifier().getText()
+        idents = ctx.identifiers().accept(self) if ctx.identifiers() else []
+        reserved = int(ctx.reserve.text) if ctx.reserve else 0
+        limit = int(ctx.limit.text) if ctx.limit else INVALID
+        return sm_manager.set_buffer_quota(table_name, idents, reserved, limit)
+
+    def visitDrop_buffer_quota(self, ctx: SQLParser.Drop_buffer_quotaContext):
+        table_name = ctx.identifier().getText()
+        idents = ctx.identifiers().accept(self) if ctx.identifiers() else []
+        return sm_manager.drop_buffer_quota(table_name, idents)
+
+    def visitShow_buffer_quotas(self, ctx: SQLParser.Show_buffer_quotasContext):
+        return sm_manager.show_buffer_quotas()
+
+    def visitSet_page_size(self, ctx: SQLParser.Set_page_sizeContext):
+        # the page size in bytes of the tables created later
+        return sm_manager.set_page_size(int(ctx.Integer().getText()))
+
+    def visitSet_trace(self, ctx: SQLParser.Set_traceContext):
+        # trace the hot paths of the storage layers, dumped after each statement
+        return sm_manager.set_trace(ctx.on_off.text == 'ON')
+
+    def visitShow_trace_stats(self, ctx: SQLParser.Show_trace_statsContext):
+        return sm_manager.show_trace_stats()
+
+    def visitReset_trace_stats(self, ctx: SQLParser.Reset_trace_statsContext):
+        return sm_manager.reset_trace_stats()
+
     def visitCreate_table(self, ctx: SQLParser.Create_tableContext):
         self._attrs: list = list()
         self._pk: list = list()
         self._fk: list = list()
         ctx.field_list().accept(self)
         sm_manager.create_table(
-            str(ctx.Identifier()), self._attrs, self._pk, self._fk)
+            ctx.identifier().getText(), self._attrs, self._pk, self._fk)
 
     def visitDrop_table(self, ctx: SQLParser.Drop_tableContext):
-        sm_manager.drop_table(str(ctx.Identifier()))
+        sm_manager.drop_table(ctx.identifier().getText())
 
     def visitDescribe_table(self, ctx: SQLParser.Describe_tableContext):
-        return sm_manager.describe_table(str(ctx.Identifier()))
+        return sm_manager.describe_table(ctx.identifier().getText())
 
     def visitInsert_into_table(self, ctx: SQLParser.Insert_into_tableContext):
-        table_name = str(ctx.Identifier())
+        table_name = ctx.identifier().getText()
         values = ctx.value_lists().accept(self)
         sm_manager.insert(table_name, values)
 
     def visitDelete_from_table(self, ctx: SQLParser.Delete_from_tableContext):
-        table_name = str(ctx.Identifier())
+        table_name = ctx.identifier().getText()
         self._table_scan = {}
         self._table_scan[table_name] = TableScanNode(sm_manager.get_table(table_name))
         self._table_names = [table_name]
@@ -93,7 +131,7 @@ class DBVisitor(SQLVisitor):
 
         
     def visitUpdate_table(self, ctx: SQLParser.Update_tableContext):
-        table_name = str(ctx.Identifier())
+        table_name = ctx.identifier().getText()
         self._table_names = [table_name]
         self._table_scan = {}
         self._table_scan[table_name] = TableScanNode(sm_manager.get_table(table_name))
@@ -159,39 +197,39 @@ class DBVisitor(SQLVisitor):
         return node.process()
         
     def visitAlter_add_index(self, ctx: SQLParser.Alter_add_indexContext):
-        table_name = str(ctx.Identifier())
+        table_name = ctx.identifier().getText()
         idents = ctx.identifiers().accept(self)
         sm_manager.create_index(table_name, idents)
 
     def visitAlter_drop_index(self, ctx: SQLParser.Alter_drop_indexContext):
-        table_name = str(ctx.Identifier())
+        table_name = ctx.identifier().getText()
         idents = ctx.identifiers().accept(self)
         sm_manager.drop_index(table_name, idents)
 
     def visitAlter_table_drop_pk(self, ctx: SQLParser.Alter_table_drop_pkContext):
-        table_name = str(ctx.Identifier(0))
+        table_name = ctx.identifier(0).getText()
         sm_manager.drop_pk(table_name)
 
     def visitAlter_table_drop_foreign_key(self, ctx: SQLParser.Alter_table_drop_foreign_keyContext):
-        table_name = str(ctx.Identifier())
-        idents = ctx.Identifier()
-        sm_manager.drop_fk(table_name, idents)
+        table_name = ctx.identifier(0).getText()
+        fk_name = ctx.identifier(1).getText()
+        sm_manager.drop_fk(table_name, fk_name)
 
     def visitAlter_table_add_pk(self, ctx: SQLParser.Alter_table_add_pkContext):
-        table_name: str = str(ctx.Identifier(0))
+        table_name: str = ctx.identifier(0).getText()
         idents: List[str] = ctx.identifiers().accept(self)
         sm_manager.add_pk(table_name, idents)
         
     def visitAlter_table_add_foreign_key(self, ctx: SQLParser.Alter_table_add_foreign_keyContext):
-        table_name = str(ctx.Identifier(0))
-        fk_name = str(ctx.Identifier(1))
-        target_table = str(ctx.Identifier(2))
+        table_name = ctx.identifier(0).getText()
+        fk_name = ctx.identifier(1).getText()
+        target_table = ctx.identifier(2).getText()
         local_idents = ctx.identifiers(0).accept(self)
         target_idents = ctx.identifiers(1).accept(self)
         sm_manager.add_fk(table_name, fk_name, target_table, local_idents, target_idents)
 
     def visitAlter_table_add_unique(self, ctx: SQLParser.Alter_table_add_uniqueContext):
-        table_name = str(ctx.Identifier(0))
+        table_name = ctx.identifier().getText()
         idents: List[str] = ctx.identifiers().accept(self)
         raise NotImplementedError()
         
@@ -205,7 +243,7 @@ class DBVisitor(SQLVisitor):
     
     def visitNormal_field(self, ctx: SQLParser.Normal_fieldContext):
         (type_t, type_len) = ctx.type_().accept(self)
-        ident: str = str(ctx.Identifier())
+        ident: str = ctx.identifier().getText()
         nullable: bool = ctx.Null() is not None
         default_val = ctx.value()
         if default_val is not None:
@@ -222,14 +260,14 @@ class DBVisitor(SQLVisitor):
         self._pk: List[str] = ctx.identifiers().accept(self)
 
     def visitForeign_key_field(self, ctx: SQLParser.Foreign_key_fieldContext):
-        ident = ctx.Identifier(0)
-        target_table = ctx.Identifier(1)
+        ident = ctx.identifier(0)
+        target_table = ctx.identifier(1)
         if (target_table is None):
-            target_table = str(ident)
+            target_table = ident.getText()
             ident = "_fk_" + str(len(self._fk))
         else:
-            ident = str(ident)
-            target_table = str(target_table)
+            ident = ident.getText()
+            target_table = target_table.getText()
 
         fk = {}
         fk["foreign_key_name"] = ident
@@ -360,17 +398,17 @@ class DBVisitor(SQLVisitor):
         pass
 
     def visitColumn(self, ctx: SQLParser.ColumnContext) -> Col:
-        table_name = str(ctx.Identifier(0))
-        col_name = ctx.Identifier(1)
+        table_name = ctx.identifier(0).getText()
+        col_name = ctx.identifier(1)
         if col_name is None:
             col_name = table_name
             table_name = None
         else:
-            col_name = str(col_name)
+            col_name = col_name.getText()
         return Col(col_name, table_name)
 
     def visitSet_clause(self, ctx: SQLParser.Set_clauseContext):
-        idents = [str(each) for each in ctx.Identifier()]
+        idents = [each.getText() for each in ctx.identifier()]
         values = [each.accept(self) for each in ctx.value()]
         return list(zip(idents, values))
 
@@ -388,7 +426,7 @@ class DBVisitor(SQLVisitor):
         return Col("*", None, Aggregator.COUNT)
     
     def visitIdentifiers(self, ctx: SQLParser.IdentifiersContext):
-        idents: List[str] = [str(each) for each in ctx.Identifier()]
+        idents: List[str] = [each.getText() for each in ctx.identifier()]
         return idents
     
     def visitOperator_(self, ctx: SQLParser.Operator_Context):
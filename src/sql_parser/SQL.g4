@@ -30,31 +30,32 @@ statement
     | io_statement ';'
     | table_statement ';'
     | alter_statement ';'
+    | system_statement ';'
     | Annotation ';'
     | Null ';'
     ;
 
 db_statement
-    : 'CREATE' 'DATABASE' Identifier    # create_db
-    | 'DROP' 'DATABASE' Identifier      # drop_db
+    : 'CREATE' 'DATABASE' identifier    # create_db
+    | 'DROP' 'DATABASE' identifier      # drop_db
     | 'SHOW' 'DATABASES'                # show_dbs
-    | 'USE' Identifier                  # use_db                  
+    | 'USE' identifier                  # use_db                  
     | 'SHOW' 'TABLES'                   # show_tables
 	| 'SHOW' 'INDEXES'					# show_indexes
     ;
 
 io_statement
-    : 'LOAD' 'FROM' 'FILE' String 'TO' 'TABLE' Identifier     # load_data
-    | 'DUMP' 'TO' 'FILE' String 'FROM' 'TABLE' Identifier     # dump_data
+    : 'LOAD' 'FROM' 'FILE' String 'TO' 'TABLE' identifier     # load_data
+    | 'DUMP' 'TO' 'FILE' String 'FROM' 'TABLE' identifier     # dump_data
     ;
 
 table_statement
-    : 'CREATE' 'TABLE' Identifier '(' field_list ')'                    # create_table
-    | 'DROP' 'TABLE' Identifier                                         # drop_table
-    | 'DESC' Identifier                                                 # describe_table
-    | 'INSERT' 'INTO' Identifier 'VALUES' value_lists                   # insert_into_table
-    | 'DELETE' 'FROM' Identifier 'WHERE' where_and_clause               # delete_from_table
-    | 'UPDATE' Identifier 'SET' set_clause 'WHERE' where_and_clause     # update_table
+    : 'CREATE' 'TABLE' identifier '(' field_list ')'                    # create_table
+    | 'DROP' 'TABLE' identifier                                         # drop_table
+    | 'DESC' identifier                                                 # describe_table
+    | 'INSERT' 'INTO' identifier 'VALUES' value_lists                   # insert_into_table
+    | 'DELETE' 'FROM' identifier 'WHERE' where_and_clause               # delete_from_table
+    | 'UPDATE' identifier 'SET' set_clause 'WHERE' where_and_clause     # update_table
     | select_table                                                      # select_table_
     ;
 
@@ -63,13 +64,25 @@ select_table
     ;
 
 alter_statement
-    : 'ALTER' 'TABLE' Identifier 'ADD' 'INDEX' '(' identifiers ')'   			# alter_add_index
-    | 'ALTER' 'TABLE' Identifier 'DROP' 'INDEX' '(' identifiers ')'             # alter_drop_index
-    | 'ALTER' 'TABLE' Identifier 'DROP' 'PRIMARY' 'KEY' (Identifier)?           # alter_table_drop_pk
-    | 'ALTER' 'TABLE' Identifier 'DROP' 'FOREIGN' 'KEY' Identifier              # alter_table_drop_foreign_key
-    | 'ALTER' 'TABLE' Identifier 'ADD' 'CONSTRAINT' (Identifier)? 'PRIMARY' 'KEY' '(' identifiers ')'      # alter_table_add_pk
-    | 'ALTER' 'TABLE' Identifier 'ADD' 'CONSTRAINT' (Identifier)? 'FOREIGN' 'KEY' '(' identifiers ')' 'REFERENCES' Identifier '(' identifiers ')'  # alter_table_add_foreign_key
-    | 'ALTER' 'TABLE' Identifier 'ADD' 'UNIQUE' '(' identifiers ')'             # alter_table_add_unique
+    : 'ALTER' 'TABLE' identifier 'ADD' 'INDEX' '(' identifiers ')'   			# alter_add_index
+    | 'ALTER' 'TABLE' identifier 'DROP' 'INDEX' '(' identifiers ')'             # alter_drop_index
+    | 'ALTER' 'TABLE' identifier 'DROP' 'PRIMARY' 'KEY' (identifier)?           # alter_table_drop_pk
+    | 'ALTER' 'TABLE' identifier 'DROP' 'FOREIGN' 'KEY' identifier              # alter_table_drop_foreign_key
+    | 'ALTER' 'TABLE' identifier 'ADD' 'CONSTRAINT' (identifier)? 'PRIMARY' 'KEY' '(' identifiers ')'      # alter_table_add_pk
+    | 'ALTER' 'TABLE' identifier 'ADD' 'CONSTRAINT' (identifier)? 'FOREIGN' 'KEY' '(' identifiers ')' 'REFERENCES' identifier '(' identifiers ')'  # alter_table_add_foreign_key
+    | 'ALTER' 'TABLE' identifier 'ADD' 'UNIQUE' '(' identifiers ')'             # alter_table_add_unique
+    ;
+
+system_statement
+    : 'SHOW' 'BUFFER' 'STATS'           # show_buffer_stats
+    | 'RESET' 'BUFFER' 'STATS'          # reset_buffer_stats
+    | 'SET' 'BUFFER' 'QUOTA' identifier ('(' identifiers ')')? ('RESERVE' reserve=Integer)? ('LIMIT' limit=Integer)?   # set_buffer_quota
+    | 'DROP' 'BUFFER' 'QUOTA' identifier ('(' identifiers ')')?                                                     # drop_buffer_quota
+    | 'SHOW' 'BUFFER' 'QUOTAS'          # show_buffer_quotas
+    | 'SET' 'PAGE' 'SIZE' Integer       # set_page_size
+    | 'SET' 'TRACE' on_off=('ON' | 'OFF')   # set_trace
+    | 'SHOW' 'TRACE' 'STATS'            # show_trace_stats
+    | 'RESET' 'TRACE' 'STATS'           # reset_trace_stats
     ;
 
 field_list
@@ -77,9 +90,9 @@ field_list
     ;
 
 field
-    : Identifier type_ ('NOT' Null)? ('DEFAULT' value)?                                               # normal_field
-    | 'PRIMARY' 'KEY' (Identifier)? '(' identifiers ')'                                               # primary_key_field
-    | 'FOREIGN' 'KEY' (Identifier)? '(' identifiers ')' 'REFERENCES' Identifier '(' identifiers ')'   # foreign_key_field
+    : identifier type_ ('NOT' Null)? ('DEFAULT' value)?                                               # normal_field
+    | 'PRIMARY' 'KEY' (identifier)? '(' identifiers ')'                                               # primary_key_field
+    | 'FOREIGN' 'KEY' (identifier)? '(' identifiers ')' 'REFERENCES' identifier '(' identifiers ')'   # foreign_key_field
     ;
 
 type_
@@ -117,7 +130,7 @@ where_clause
     ;
 
 column
-    : (Identifier '.')? Identifier
+    : (identifier '.')? identifier
     ;
 
 expression
@@ -126,7 +139,7 @@ expression
     ;
 
 set_clause
-    : Identifier EqualOrAssign value (',' Identifier EqualOrAssign value)*
+    : identifier EqualOrAssign value (',' identifier EqualOrAssign value)*
     ;
 
 selectors
@@ -141,7 +154,14 @@ selector
     ;
 
 identifiers
-    : Identifier (',' Identifier)*
+    : identifier (',' identifier)*
+    ;
+
+// the keywords of system_statement are not reserved, they are usable as names
+identifier
+    : Identifier
+    | 'BUFFER' | 'STATS' | 'RESET' | 'QUOTA' | 'QUOTAS' | 'RESERVE'
+    | 'PAGE' | 'SIZE' | 'TRACE' | 'ON' | 'OFF'
     ;
 
 operator_
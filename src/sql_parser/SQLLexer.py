@@ -7,8 +7,8 @@ import sys
 
 def serializedATN():
     with StringIO() as buf:
-        buf.write("\3\u608b\ua72a\u8133\ub9ed\u417c\u3be7\u7786\u5964\2G")
-        buf.write("\u0204\b\1\4\2\t\2\4\3\t\3\4\4\t\4\4\5\t\5\4\6\t\6\4\7")
+        buf.write("\3\u608b\ua72a\u8133\ub9ed\u417c\u3be7\u7786\u5964\2R")
+        buf.write("\u0259\b\1\4\2\t\2\4\3\t\3\4\4\t\4\4\5\t\5\4\6\t\6\4\7")
         buf.write("\t\7\4\b\t\b\4\t\t\t\4\n\t\n\4\13\t\13\4\f\t\f\4\r\t\r")
         buf.write("\4\16\t\16\4\17\t\17\4\20\t\20\4\21\t\21\4\22\t\22\4\23")
         buf.write("\t\23\4\24\t\24\4\25\t\25\4\26\t\26\4\27\t\27\4\30\t\30")
@@ -18,208 +18,243 @@ def serializedATN():
         buf.write("\t.\4/\t/\4\60\t\60\4\61\t\61\4\62\t\62\4\63\t\63\4\64")
         buf.write("\t\64\4\65\t\65\4\66\t\66\4\67\t\67\48\t8\49\t9\4:\t:")
         buf.write("\4;\t;\4<\t<\4=\t=\4>\t>\4?\t?\4@\t@\4A\tA\4B\tB\4C\t")
-        buf.write("C\4D\tD\4E\tE\4F\tF\3\2\3\2\3\3\3\3\3\3\3\3\3\3\3\3\3")
-        buf.write("\3\3\4\3\4\3\4\3\4\3\4\3\4\3\4\3\4\3\4\3\5\3\5\3\5\3\5")
-        buf.write("\3\5\3\6\3\6\3\6\3\6\3\6\3\7\3\7\3\7\3\7\3\7\3\7\3\7\3")
-        buf.write("\7\3\7\3\7\3\b\3\b\3\b\3\b\3\t\3\t\3\t\3\t\3\t\3\t\3\t")
-        buf.write("\3\n\3\n\3\n\3\n\3\n\3\n\3\n\3\n\3\13\3\13\3\13\3\13\3")
-        buf.write("\13\3\f\3\f\3\f\3\f\3\f\3\r\3\r\3\r\3\r\3\r\3\16\3\16")
-        buf.write("\3\16\3\17\3\17\3\17\3\17\3\17\3\17\3\20\3\20\3\20\3\20")
-        buf.write("\3\20\3\21\3\21\3\22\3\22\3\23\3\23\3\23\3\23\3\23\3\24")
-        buf.write("\3\24\3\24\3\24\3\24\3\24\3\24\3\25\3\25\3\25\3\25\3\25")
-        buf.write("\3\26\3\26\3\26\3\26\3\26\3\26\3\26\3\27\3\27\3\27\3\27")
-        buf.write("\3\27\3\27\3\27\3\30\3\30\3\30\3\30\3\30\3\30\3\31\3\31")
-        buf.write("\3\31\3\31\3\31\3\31\3\31\3\32\3\32\3\32\3\32\3\33\3\33")
-        buf.write("\3\33\3\33\3\33\3\33\3\33\3\34\3\34\3\34\3\34\3\34\3\34")
-        buf.write("\3\35\3\35\3\35\3\36\3\36\3\36\3\36\3\36\3\36\3\37\3\37")
-        buf.write("\3\37\3\37\3\37\3\37\3\37\3 \3 \3 \3 \3 \3 \3!\3!\3!\3")
-        buf.write("!\3\"\3\"\3\"\3\"\3\"\3\"\3#\3#\3#\3#\3#\3#\3#\3#\3$\3")
-        buf.write("$\3$\3$\3%\3%\3%\3%\3%\3%\3%\3%\3&\3&\3&\3&\3&\3&\3&\3")
-        buf.write("&\3&\3&\3&\3\'\3\'\3\'\3\'\3\'\3\'\3\'\3\'\3\'\3\'\3\'")
-        buf.write("\3(\3(\3(\3(\3(\3(\3(\3)\3)\3*\3*\3*\3*\3+\3+\3+\3+\3")
-        buf.write("+\3+\3+\3+\3,\3,\3,\3,\3-\3-\3-\3-\3-\3-\3-\3-\3.\3.\3")
-        buf.write(".\3.\3.\3.\3/\3/\3/\3/\3\60\3\60\3\60\3\61\3\61\3\61\3")
-        buf.write("\62\3\62\3\62\3\62\3\62\3\63\3\63\3\64\3\64\3\65\3\65")
-        buf.write("\3\66\3\66\3\67\3\67\3\67\38\38\39\39\39\3:\3:\3:\3;\3")
-        buf.write(";\3;\3;\3;\3;\3<\3<\3<\3<\3=\3=\3=\3=\3>\3>\3>\3>\3?\3")
-        buf.write("?\3?\3?\3@\3@\3@\3@\3@\3A\3A\7A\u01d5\nA\fA\16A\u01d8")
-        buf.write("\13A\3B\6B\u01db\nB\rB\16B\u01dc\3C\3C\7C\u01e1\nC\fC")
-        buf.write("\16C\u01e4\13C\3C\3C\3D\5D\u01e9\nD\3D\6D\u01ec\nD\rD")
-        buf.write("\16D\u01ed\3D\3D\7D\u01f2\nD\fD\16D\u01f5\13D\3E\6E\u01f8")
-        buf.write("\nE\rE\16E\u01f9\3E\3E\3F\3F\3F\6F\u0201\nF\rF\16F\u0202")
-        buf.write("\2\2G\3\3\5\4\7\5\t\6\13\7\r\b\17\t\21\n\23\13\25\f\27")
-        buf.write("\r\31\16\33\17\35\20\37\21!\22#\23%\24\'\25)\26+\27-\30")
-        buf.write("/\31\61\32\63\33\65\34\67\359\36;\37= ?!A\"C#E$G%I&K\'")
-        buf.write("M(O)Q*S+U,W-Y.[/]\60_\61a\62c\63e\64g\65i\66k\67m8o9q")
-        buf.write(":s;u<w=y>{?}@\177A\u0081B\u0083C\u0085D\u0087E\u0089F")
-        buf.write("\u008bG\3\2\b\5\2C\\aac|\6\2\62;C\\aac|\3\2\62;\3\2))")
-        buf.write("\5\2\13\f\17\17\"\"\3\2==\2\u020b\2\3\3\2\2\2\2\5\3\2")
-        buf.write("\2\2\2\7\3\2\2\2\2\t\3\2\2\2\2\13\3\2\2\2\2\r\3\2\2\2")
-        buf.write("\2\17\3\2\2\2\2\21\3\2\2\2\2\23\3\2\2\2\2\25\3\2\2\2\2")
-        buf.write("\27\3\2\2\2\2\31\3\2\2\2\2\33\3\2\2\2\2\35\3\2\2\2\2\37")
-        buf.write("\3\2\2\2\2!\3\2\2\2\2#\3\2\2\2\2%\3\2\2\2\2\'\3\2\2\2")
-        buf.write("\2)\3\2\2\2\2+\3\2\2\2\2-\3\2\2\2\2/\3\2\2\2\2\61\3\2")
-        buf.write("\2\2\2\63\3\2\2\2\2\65\3\2\2\2\2\67\3\2\2\2\29\3\2\2\2")
-        buf.write("\2;\3\2\2\2\2=\3\2\2\2\2?\3\2\2\2\2A\3\2\2\2\2C\3\2\2")
-        buf.write("\2\2E\3\2\2\2\2G\3\2\2\2\2I\3\2\2\2\2K\3\2\2\2\2M\3\2")
-        buf.write("\2\2\2O\3\2\2\2\2Q\3\2\2\2\2S\3\2\2\2\2U\3\2\2\2\2W\3")
-        buf.write("\2\2\2\2Y\3\2\2\2\2[\3\2\2\2\2]\3\2\2\2\2_\3\2\2\2\2a")
-        buf.write("\3\2\2\2\2c\3\2\2\2\2e\3\2\2\2\2g\3\2\2\2\2i\3\2\2\2\2")
-        buf.write("k\3\2\2\2\2m\3\2\2\2\2o\3\2\2\2\2q\3\2\2\2\2s\3\2\2\2")
-        buf.write("\2u\3\2\2\2\2w\3\2\2\2\2y\3\2\2\2\2{\3\2\2\2\2}\3\2\2")
-        buf.write("\2\2\177\3\2\2\2\2\u0081\3\2\2\2\2\u0083\3\2\2\2\2\u0085")
-        buf.write("\3\2\2\2\2\u0087\3\2\2\2\2\u0089\3\2\2\2\2\u008b\3\2\2")
-        buf.write("\2\3\u008d\3\2\2\2\5\u008f\3\2\2\2\7\u0096\3\2\2\2\t\u009f")
-        buf.write("\3\2\2\2\13\u00a4\3\2\2\2\r\u00a9\3\2\2\2\17\u00b3\3\2")
-        buf.write("\2\2\21\u00b7\3\2\2\2\23\u00be\3\2\2\2\25\u00c6\3\2\2")
-        buf.write("\2\27\u00cb\3\2\2\2\31\u00d0\3\2\2\2\33\u00d5\3\2\2\2")
-        buf.write("\35\u00d8\3\2\2\2\37\u00de\3\2\2\2!\u00e3\3\2\2\2#\u00e5")
-        buf.write("\3\2\2\2%\u00e7\3\2\2\2\'\u00ec\3\2\2\2)\u00f3\3\2\2\2")
-        buf.write("+\u00f8\3\2\2\2-\u00ff\3\2\2\2/\u0106\3\2\2\2\61\u010c")
-        buf.write("\3\2\2\2\63\u0113\3\2\2\2\65\u0117\3\2\2\2\67\u011e\3")
-        buf.write("\2\2\29\u0124\3\2\2\2;\u0127\3\2\2\2=\u012d\3\2\2\2?\u0134")
-        buf.write("\3\2\2\2A\u013a\3\2\2\2C\u013e\3\2\2\2E\u0144\3\2\2\2")
-        buf.write("G\u014c\3\2\2\2I\u0150\3\2\2\2K\u0158\3\2\2\2M\u0163\3")
-        buf.write("\2\2\2O\u016e\3\2\2\2Q\u0175\3\2\2\2S\u0177\3\2\2\2U\u017b")
-        buf.write("\3\2\2\2W\u0183\3\2\2\2Y\u0187\3\2\2\2[\u018f\3\2\2\2")
-        buf.write("]\u0195\3\2\2\2_\u0199\3\2\2\2a\u019c\3\2\2\2c\u019f\3")
-        buf.write("\2\2\2e\u01a4\3\2\2\2g\u01a6\3\2\2\2i\u01a8\3\2\2\2k\u01aa")
-        buf.write("\3\2\2\2m\u01ac\3\2\2\2o\u01af\3\2\2\2q\u01b1\3\2\2\2")
-        buf.write("s\u01b4\3\2\2\2u\u01b7\3\2\2\2w\u01bd\3\2\2\2y\u01c1\3")
-        buf.write("\2\2\2{\u01c5\3\2\2\2}\u01c9\3\2\2\2\177\u01cd\3\2\2\2")
-        buf.write("\u0081\u01d2\3\2\2\2\u0083\u01da\3\2\2\2\u0085\u01de\3")
-        buf.write("\2\2\2\u0087\u01e8\3\2\2\2\u0089\u01f7\3\2\2\2\u008b\u01fd")
-        buf.write("\3\2\2\2\u008d\u008e\7=\2\2\u008e\4\3\2\2\2\u008f\u0090")
-        buf.write("\7E\2\2\u0090\u0091\7T\2\2\u0091\u0092\7G\2\2\u0092\u0093")
-        buf.write("\7C\2\2\u0093\u0094\7V\2\2\u0094\u0095\7G\2\2\u0095\6")
-        buf.write("\3\2\2\2\u0096\u0097\7F\2\2\u0097\u0098\7C\2\2\u0098\u0099")
-        buf.write("\7V\2\2\u0099\u009a\7C\2\2\u009a\u009b\7D\2\2\u009b\u009c")
-        buf.write("\7C\2\2\u009c\u009d\7U\2\2\u009d\u009e\7G\2\2\u009e\b")
-        buf.write("\3\2\2\2\u009f\u00a0\7F\2\2\u00a0\u00a1\7T\2\2\u00a1\u00a2")
-        buf.write("\7Q\2\2\u00a2\u00a3\7R\2\2\u00a3\n\3\2\2\2\u00a4\u00a5")
-        buf.write("\7U\2\2\u00a5\u00a6\7J\2\2\u00a6\u00a7\7Q\2\2\u00a7\u00a8")
-        buf.write("\7Y\2\2\u00a8\f\3\2\2\2\u00a9\u00aa\7F\2\2\u00aa\u00ab")
-        buf.write("\7C\2\2\u00ab\u00ac\7V\2\2\u00ac\u00ad\7C\2\2\u00ad\u00ae")
-        buf.write("\7D\2\2\u00ae\u00af\7C\2\2\u00af\u00b0\7U\2\2\u00b0\u00b1")
-        buf.write("\7G\2\2\u00b1\u00b2\7U\2\2\u00b2\16\3\2\2\2\u00b3\u00b4")
-        buf.write("\7W\2\2\u00b4\u00b5\7U\2\2\u00b5\u00b6\7G\2\2\u00b6\20")
-        buf.write("\3\2\2\2\u00b7\u00b8\7V\2\2\u00b8\u00b9\7C\2\2\u00b9\u00ba")
-        buf.write("\7D\2\2\u00ba\u00bb\7N\2\2\u00bb\u00bc\7G\2\2\u00bc\u00bd")
-        buf.write("\7U\2\2\u00bd\22\3\2\2\2\u00be\u00bf\7K\2\2\u00bf\u00c0")
-        buf.write("\7P\2\2\u00c0\u00c1\7F\2\2\u00c1\u00c2\7G\2\2\u00c2\u00c3")
-        buf.write("\7Z\2\2\u00c3\u00c4\7G\2\2\u00c4\u00c5\7U\2\2\u00c5\24")
-        buf.write("\3\2\2\2\u00c6\u00c7\7N\2\2\u00c7\u00c8\7Q\2\2\u00c8\u00c9")
-        buf.write("\7C\2\2\u00c9\u00ca\7F\2\2\u00ca\26\3\2\2\2\u00cb\u00cc")
-        buf.write("\7H\2\2\u00cc\u00cd\7T\2\2\u00cd\u00ce\7Q\2\2\u00ce\u00cf")
-        buf.write("\7O\2\2\u00cf\30\3\2\2\2\u00d0\u00d1\7H\2\2\u00d1\u00d2")
-        buf.write("\7K\2\2\u00d2\u00d3\7N\2\2\u00d3\u00d4\7G\2\2\u00d4\32")
-        buf.write("\3\2\2\2\u00d5\u00d6\7V\2\2\u00d6\u00d7\7Q\2\2\u00d7\34")
-        buf.write("\3\2\2\2\u00d8\u00d9\7V\2\2\u00d9\u00da\7C\2\2\u00da\u00db")
-        buf.write("\7D\2\2\u00db\u00dc\7N\2\2\u00dc\u00dd\7G\2\2\u00dd\36")
-        buf.write("\3\2\2\2\u00de\u00df\7F\2\2\u00df\u00e0\7W\2\2\u00e0\u00e1")
-        buf.write("\7O\2\2\u00e1\u00e2\7R\2\2\u00e2 \3\2\2\2\u00e3\u00e4")
-        buf.write("\7*\2\2\u00e4\"\3\2\2\2\u00e5\u00e6\7+\2\2\u00e6$\3\2")
-        buf.write("\2\2\u00e7\u00e8\7F\2\2\u00e8\u00e9\7G\2\2\u00e9\u00ea")
-        buf.write("\7U\2\2\u00ea\u00eb\7E\2\2\u00eb&\3\2\2\2\u00ec\u00ed")
-        buf.write("\7K\2\2\u00ed\u00ee\7P\2\2\u00ee\u00ef\7U\2\2\u00ef\u00f0")
-        buf.write("\7G\2\2\u00f0\u00f1\7T\2\2\u00f1\u00f2\7V\2\2\u00f2(\3")
-        buf.write("\2\2\2\u00f3\u00f4\7K\2\2\u00f4\u00f5\7P\2\2\u00f5\u00f6")
-        buf.write("\7V\2\2\u00f6\u00f7\7Q\2\2\u00f7*\3\2\2\2\u00f8\u00f9")
-        buf.write("\7X\2\2\u00f9\u00fa\7C\2\2\u00fa\u00fb\7N\2\2\u00fb\u00fc")
-        buf.write("\7W\2\2\u00fc\u00fd\7G\2\2\u00fd\u00fe\7U\2\2\u00fe,\3")
-        buf.write("\2\2\2\u00ff\u0100\7F\2\2\u0100\u0101\7G\2\2\u0101\u0102")
-        buf.write("\7N\2\2\u0102\u0103\7G\2\2\u0103\u0104\7V\2\2\u0104\u0105")
-        buf.write("\7G\2\2\u0105.\3\2\2\2\u0106\u0107\7Y\2\2\u0107\u0108")
-        buf.write("\7J\2\2\u0108\u0109\7G\2\2\u0109\u010a\7T\2\2\u010a\u010b")
-        buf.write("\7G\2\2\u010b\60\3\2\2\2\u010c\u010d\7W\2\2\u010d\u010e")
-        buf.write("\7R\2\2\u010e\u010f\7F\2\2\u010f\u0110\7C\2\2\u0110\u0111")
-        buf.write("\7V\2\2\u0111\u0112\7G\2\2\u0112\62\3\2\2\2\u0113\u0114")
-        buf.write("\7U\2\2\u0114\u0115\7G\2\2\u0115\u0116\7V\2\2\u0116\64")
-        buf.write("\3\2\2\2\u0117\u0118\7U\2\2\u0118\u0119\7G\2\2\u0119\u011a")
-        buf.write("\7N\2\2\u011a\u011b\7G\2\2\u011b\u011c\7E\2\2\u011c\u011d")
-        buf.write("\7V\2\2\u011d\66\3\2\2\2\u011e\u011f\7I\2\2\u011f\u0120")
-        buf.write("\7T\2\2\u0120\u0121\7Q\2\2\u0121\u0122\7W\2\2\u0122\u0123")
-        buf.write("\7R\2\2\u01238\3\2\2\2\u0124\u0125\7D\2\2\u0125\u0126")
-        buf.write("\7[\2\2\u0126:\3\2\2\2\u0127\u0128\7N\2\2\u0128\u0129")
-        buf.write("\7K\2\2\u0129\u012a\7O\2\2\u012a\u012b\7K\2\2\u012b\u012c")
-        buf.write("\7V\2\2\u012c<\3\2\2\2\u012d\u012e\7Q\2\2\u012e\u012f")
-        buf.write("\7H\2\2\u012f\u0130\7H\2\2\u0130\u0131\7U\2\2\u0131\u0132")
-        buf.write("\7G\2\2\u0132\u0133\7V\2\2\u0133>\3\2\2\2\u0134\u0135")
-        buf.write("\7C\2\2\u0135\u0136\7N\2\2\u0136\u0137\7V\2\2\u0137\u0138")
-        buf.write("\7G\2\2\u0138\u0139\7T\2\2\u0139@\3\2\2\2\u013a\u013b")
-        buf.write("\7C\2\2\u013b\u013c\7F\2\2\u013c\u013d\7F\2\2\u013dB\3")
-        buf.write("\2\2\2\u013e\u013f\7K\2\2\u013f\u0140\7P\2\2\u0140\u0141")
-        buf.write("\7F\2\2\u0141\u0142\7G\2\2\u0142\u0143\7Z\2\2\u0143D\3")
-        buf.write("\2\2\2\u0144\u0145\7R\2\2\u0145\u0146\7T\2\2\u0146\u0147")
-        buf.write("\7K\2\2\u0147\u0148\7O\2\2\u0148\u0149\7C\2\2\u0149\u014a")
-        buf.write("\7T\2\2\u014a\u014b\7[\2\2\u014bF\3\2\2\2\u014c\u014d")
-        buf.write("\7M\2\2\u014d\u014e\7G\2\2\u014e\u014f\7[\2\2\u014fH\3")
-        buf.write("\2\2\2\u0150\u0151\7H\2\2\u0151\u0152\7Q\2\2\u0152\u0153")
-        buf.write("\7T\2\2\u0153\u0154\7G\2\2\u0154\u0155\7K\2\2\u0155\u0156")
-        buf.write("\7I\2\2\u0156\u0157\7P\2\2\u0157J\3\2\2\2\u0158\u0159")
-        buf.write("\7E\2\2\u0159\u015a\7Q\2\2\u015a\u015b\7P\2\2\u015b\u015c")
-        buf.write("\7U\2\2\u015c\u015d\7V\2\2\u015d\u015e\7T\2\2\u015e\u015f")
-        buf.write("\7C\2\2\u015f\u0160\7K\2\2\u0160\u0161\7P\2\2\u0161\u0162")
-        buf.write("\7V\2\2\u0162L\3\2\2\2\u0163\u0164\7T\2\2\u0164\u0165")
-        buf.write("\7G\2\2\u0165\u0166\7H\2\2\u0166\u0167\7G\2\2\u0167\u0168")
-        buf.write("\7T\2\2\u0168\u0169\7G\2\2\u0169\u016a\7P\2\2\u016a\u016b")
-        buf.write("\7E\2\2\u016b\u016c\7G\2\2\u016c\u016d\7U\2\2\u016dN\3")
-        buf.write("\2\2\2\u016e\u016f\7W\2\2\u016f\u0170\7P\2\2\u0170\u0171")
-        buf.write("\7K\2\2\u0171\u0172\7S\2\2\u0172\u0173\7W\2\2\u0173\u0174")
-        buf.write("\7G\2\2\u0174P\3\2\2\2\u0175\u0176\7.\2\2\u0176R\3\2\2")
-        buf.write("\2\u0177\u0178\7P\2\2\u0178\u0179\7Q\2\2\u0179\u017a\7")
-        buf.write("V\2\2\u017aT\3\2\2\2\u017b\u017c\7F\2\2\u017c\u017d\7")
-        buf.write("G\2\2\u017d\u017e\7H\2\2\u017e\u017f\7C\2\2\u017f\u0180")
-        buf.write("\7W\2\2\u0180\u0181\7N\2\2\u0181\u0182\7V\2\2\u0182V\3")
-        buf.write("\2\2\2\u0183\u0184\7K\2\2\u0184\u0185\7P\2\2\u0185\u0186")
-        buf.write("\7V\2\2\u0186X\3\2\2\2\u0187\u0188\7X\2\2\u0188\u0189")
-        buf.write("\7C\2\2\u0189\u018a\7T\2\2\u018a\u018b\7E\2\2\u018b\u018c")
-        buf.write("\7J\2\2\u018c\u018d\7C\2\2\u018d\u018e\7T\2\2\u018eZ\3")
-        buf.write("\2\2\2\u018f\u0190\7H\2\2\u0190\u0191\7N\2\2\u0191\u0192")
-        buf.write("\7Q\2\2\u0192\u0193\7C\2\2\u0193\u0194\7V\2\2\u0194\\")
-        buf.write("\3\2\2\2\u0195\u0196\7C\2\2\u0196\u0197\7P\2\2\u0197\u0198")
-        buf.write("\7F\2\2\u0198^\3\2\2\2\u0199\u019a\7K\2\2\u019a\u019b")
-        buf.write("\7U\2\2\u019b`\3\2\2\2\u019c\u019d\7K\2\2\u019d\u019e")
-        buf.write("\7P\2\2\u019eb\3\2\2\2\u019f\u01a0\7N\2\2\u01a0\u01a1")
-        buf.write("\7K\2\2\u01a1\u01a2\7M\2\2\u01a2\u01a3\7G\2\2\u01a3d\3")
-        buf.write("\2\2\2\u01a4\u01a5\7\60\2\2\u01a5f\3\2\2\2\u01a6\u01a7")
-        buf.write("\7,\2\2\u01a7h\3\2\2\2\u01a8\u01a9\7?\2\2\u01a9j\3\2\2")
-        buf.write("\2\u01aa\u01ab\7>\2\2\u01abl\3\2\2\2\u01ac\u01ad\7>\2")
-        buf.write("\2\u01ad\u01ae\7?\2\2\u01aen\3\2\2\2\u01af\u01b0\7@\2")
-        buf.write("\2\u01b0p\3\2\2\2\u01b1\u01b2\7@\2\2\u01b2\u01b3\7?\2")
-        buf.write("\2\u01b3r\3\2\2\2\u01b4\u01b5\7>\2\2\u01b5\u01b6\7@\2")
-        buf.write("\2\u01b6t\3\2\2\2\u01b7\u01b8\7E\2\2\u01b8\u01b9\7Q\2")
-        buf.write("\2\u01b9\u01ba\7W\2\2\u01ba\u01bb\7P\2\2\u01bb\u01bc\7")
-        buf.write("V\2\2\u01bcv\3\2\2\2\u01bd\u01be\7C\2\2\u01be\u01bf\7")
-        buf.write("X\2\2\u01bf\u01c0\7I\2\2\u01c0x\3\2\2\2\u01c1\u01c2\7")
-        buf.write("O\2\2\u01c2\u01c3\7C\2\2\u01c3\u01c4\7Z\2\2\u01c4z\3\2")
-        buf.write("\2\2\u01c5\u01c6\7O\2\2\u01c6\u01c7\7K\2\2\u01c7\u01c8")
-        buf.write("\7P\2\2\u01c8|\3\2\2\2\u01c9\u01ca\7U\2\2\u01ca\u01cb")
-        buf.write("\7W\2\2\u01cb\u01cc\7O\2\2\u01cc~\3\2\2\2\u01cd\u01ce")
-        buf.write("\7P\2\2\u01ce\u01cf\7W\2\2\u01cf\u01d0\7N\2\2\u01d0\u01d1")
-        buf.write("\7N\2\2\u01d1\u0080\3\2\2\2\u01d2\u01d6\t\2\2\2\u01d3")
-        buf.write("\u01d5\t\3\2\2\u01d4\u01d3\3\2\2\2\u01d5\u01d8\3\2\2\2")
-        buf.write("\u01d6\u01d4\3\2\2\2\u01d6\u01d7\3\2\2\2\u01d7\u0082\3")
-        buf.write("\2\2\2\u01d8\u01d6\3\2\2\2\u01d9\u01db\t\4\2\2\u01da\u01d9")
-        buf.write("\3\2\2\2\u01db\u01dc\3\2\2\2\u01dc\u01da\3\2\2\2\u01dc")
-        buf.write("\u01dd\3\2\2\2\u01dd\u0084\3\2\2\2\u01de\u01e2\7)\2\2")
-        buf.write("\u01df\u01e1\n\5\2\2\u01e0\u01df\3\2\2\2\u01e1\u01e4\3")
-        buf.write("\2\2\2\u01e2\u01e0\3\2\2\2\u01e2\u01e3\3\2\2\2\u01e3\u01e5")
-        buf.write("\3\2\2\2\u01e4\u01e2\3\2\2\2\u01e5\u01e6\7)\2\2\u01e6")
-        buf.write("\u0086\3\2\2\2\u01e7\u01e9\7/\2\2\u01e8\u01e7\3\2\2\2")
-        buf.write("\u01e8\u01e9\3\2\2\2\u01e9\u01eb\3\2\2\2\u01ea\u01ec\t")
-        buf.write("\4\2\2\u01eb\u01ea\3\2\2\2\u01ec\u01ed\3\2\2\2\u01ed\u01eb")
-        buf.write("\3\2\2\2\u01ed\u01ee\3\2\2\2\u01ee\u01ef\3\2\2\2\u01ef")
-        buf.write("\u01f3\7\60\2\2\u01f0\u01f2\t\4\2\2\u01f1\u01f0\3\2\2")
-        buf.write("\2\u01f2\u01f5\3\2\2\2\u01f3\u01f1\3\2\2\2\u01f3\u01f4")
-        buf.write("\3\2\2\2\u01f4\u0088\3\2\2\2\u01f5\u01f3\3\2\2\2\u01f6")
-        buf.write("\u01f8\t\6\2\2\u01f7\u01f6\3\2\2\2\u01f8\u01f9\3\2\2\2")
-        buf.write("\u01f9\u01f7\3\2\2\2\u01f9\u01fa\3\2\2\2\u01fa\u01fb\3")
-        buf.write("\2\2\2\u01fb\u01fc\bE\2\2\u01fc\u008a\3\2\2\2\u01fd\u01fe")
-        buf.write("\7/\2\2\u01fe\u0200\7/\2\2\u01ff\u0201\n\7\2\2\u0200\u01ff")
-        buf.write("\3\2\2\2\u0201\u0202\3\2\2\2\u0202\u0200\3\2\2\2\u0202")
-        buf.write("\u0203\3\2\2\2\u0203\u008c\3\2\2\2\13\2\u01d6\u01dc\u01e2")
-        buf.write("\u01e8\u01ed\u01f3\u01f9\u0202\3\b\2\2")
+        buf.write("C\4D\tD\4E\tE\4F\tF\4G\tG\4H\tH\4I\tI\4J\tJ\4K\tK\4L\t")
+        buf.write("L\4M\tM\4N\tN\4O\tO\4P\tP\4Q\tQ\3\2\3\2\3\3\3\3\3\3\3")
+        buf.write("\3\3\3\3\3\3\3\3\4\3\4\3\4\3\4\3\4\3\4\3\4\3\4\3\4\3\5")
+        buf.write("\3\5\3\5\3\5\3\5\3\6\3\6\3\6\3\6\3\6\3\7\3\7\3\7\3\7\3")
+        buf.write("\7\3\7\3\7\3\7\3\7\3\7\3\b\3\b\3\b\3\b\3\t\3\t\3\t\3\t")
+        buf.write("\3\t\3\t\3\t\3\n\3\n\3\n\3\n\3\n\3\n\3\n\3\n\3\13\3\13")
+        buf.write("\3\13\3\13\3\13\3\f\3\f\3\f\3\f\3\f\3\r\3\r\3\r\3\r\3")
+        buf.write("\r\3\16\3\16\3\16\3\17\3\17\3\17\3\17\3\17\3\17\3\20\3")
+        buf.write("\20\3\20\3\20\3\20\3\21\3\21\3\22\3\22\3\23\3\23\3\23")
+        buf.write("\3\23\3\23\3\24\3\24\3\24\3\24\3\24\3\24\3\24\3\25\3\25")
+        buf.write("\3\25\3\25\3\25\3\26\3\26\3\26\3\26\3\26\3\26\3\26\3\27")
+        buf.write("\3\27\3\27\3\27\3\27\3\27\3\27\3\30\3\30\3\30\3\30\3\30")
+        buf.write("\3\30\3\31\3\31\3\31\3\31\3\31\3\31\3\31\3\32\3\32\3\32")
+        buf.write("\3\32\3\33\3\33\3\33\3\33\3\33\3\33\3\33\3\34\3\34\3\34")
+        buf.write("\3\34\3\34\3\34\3\35\3\35\3\35\3\36\3\36\3\36\3\36\3\36")
+        buf.write("\3\36\3\37\3\37\3\37\3\37\3\37\3\37\3\37\3 \3 \3 \3 \3")
+        buf.write(" \3 \3!\3!\3!\3!\3\"\3\"\3\"\3\"\3\"\3\"\3#\3#\3#\3#\3")
+        buf.write("#\3#\3#\3#\3$\3$\3$\3$\3%\3%\3%\3%\3%\3%\3%\3%\3&\3&\3")
+        buf.write("&\3&\3&\3&\3&\3&\3&\3&\3&\3\'\3\'\3\'\3\'\3\'\3\'\3\'")
+        buf.write("\3\'\3\'\3\'\3\'\3(\3(\3(\3(\3(\3(\3(\3)\3)\3)\3)\3)\3")
+        buf.write(")\3)\3*\3*\3*\3*\3*\3*\3+\3+\3+\3+\3+\3+\3,\3,\3,\3,\3")
+        buf.write(",\3,\3-\3-\3-\3-\3-\3-\3-\3-\3.\3.\3.\3.\3.\3.\3.\3/\3")
+        buf.write("/\3/\3/\3/\3\60\3\60\3\60\3\60\3\60\3\61\3\61\3\61\3\61")
+        buf.write("\3\61\3\61\3\62\3\62\3\62\3\63\3\63\3\63\3\63\3\64\3\64")
+        buf.write("\3\65\3\65\3\65\3\65\3\66\3\66\3\66\3\66\3\66\3\66\3\66")
+        buf.write("\3\66\3\67\3\67\3\67\3\67\38\38\38\38\38\38\38\38\39\3")
+        buf.write("9\39\39\39\39\3:\3:\3:\3:\3;\3;\3;\3<\3<\3<\3=\3=\3=\3")
+        buf.write("=\3=\3>\3>\3?\3?\3@\3@\3A\3A\3B\3B\3B\3C\3C\3D\3D\3D\3")
+        buf.write("E\3E\3E\3F\3F\3F\3F\3F\3F\3G\3G\3G\3G\3H\3H\3H\3H\3I\3")
+        buf.write("I\3I\3I\3J\3J\3J\3J\3K\3K\3K\3K\3K\3L\3L\7L\u022a\nL\f")
+        buf.write("L\16L\u022d\13L\3M\6M\u0230\nM\rM\16M\u0231\3N\3N\7N\u0236")
+        buf.write("\nN\fN\16N\u0239\13N\3N\3N\3O\5O\u023e\nO\3O\6O\u0241")
+        buf.write("\nO\rO\16O\u0242\3O\3O\7O\u0247\nO\fO\16O\u024a\13O\3")
+        buf.write("P\6P\u024d\nP\rP\16P\u024e\3P\3P\3Q\3Q\3Q\6Q\u0256\nQ")
+        buf.write("\rQ\16Q\u0257\2\2R\3\3\5\4\7\5\t\6\13\7\r\b\17\t\21\n")
+        buf.write("\23\13\25\f\27\r\31\16\33\17\35\20\37\21!\22#\23%\24\'")
+        buf.write("\25)\26+\27-\30/\31\61\32\63\33\65\34\67\359\36;\37= ")
+        buf.write("?!A\"C#E$G%I&K\'M(O)Q*S+U,W-Y.[/]\60_\61a\62c\63e\64g")
+        buf.write("\65i\66k\67m8o9q:s;u<w=y>{?}@\177A\u0081B\u0083C\u0085")
+        buf.write("D\u0087E\u0089F\u008bG\u008dH\u008fI\u0091J\u0093K\u0095")
+        buf.write("L\u0097M\u0099N\u009bO\u009dP\u009fQ\u00a1R\3\2\b\5\2")
+        buf.write("C\\aac|\6\2\62;C\\aac|\3\2\62;\3\2))\5\2\13\f\17\17\"")
+        buf.write("\"\3\2==\2\u0260\2\3\3\2\2\2\2\5\3\2\2\2\2\7\3\2\2\2\2")
+        buf.write("\t\3\2\2\2\2\13\3\2\2\2\2\r\3\2\2\2\2\17\3\2\2\2\2\21")
+        buf.write("\3\2\2\2\2\23\3\2\2\2\2\25\3\2\2\2\2\27\3\2\2\2\2\31\3")
+        buf.write("\2\2\2\2\33\3\2\2\2\2\35\3\2\2\2\2\37\3\2\2\2\2!\3\2\2")
+        buf.write("\2\2#\3\2\2\2\2%\3\2\2\2\2\'\3\2\2\2\2)\3\2\2\2\2+\3\2")
+        buf.write("\2\2\2-\3\2\2\2\2/\3\2\2\2\2\61\3\2\2\2\2\63\3\2\2\2\2")
+        buf.write("\65\3\2\2\2\2\67\3\2\2\2\29\3\2\2\2\2;\3\2\2\2\2=\3\2")
+        buf.write("\2\2\2?\3\2\2\2\2A\3\2\2\2\2C\3\2\2\2\2E\3\2\2\2\2G\3")
+        buf.write("\2\2\2\2I\3\2\2\2\2K\3\2\2\2\2M\3\2\2\2\2O\3\2\2\2\2Q")
+        buf.write("\3\2\2\2\2S\3\2\2\2\2U\3\2\2\2\2W\3\2\2\2\2Y\3\2\2\2\2")
+        buf.write("[\3\2\2\2\2]\3\2\2\2\2_\3\2\2\2\2a\3\2\2\2\2c\3\2\2\2")
+        buf.write("\2e\3\2\2\2\2g\3\2\2\2\2i\3\2\2\2\2k\3\2\2\2\2m\3\2\2")
+        buf.write("\2\2o\3\2\2\2\2q\3\2\2\2\2s\3\2\2\2\2u\3\2\2\2\2w\3\2")
+        buf.write("\2\2\2y\3\2\2\2\2{\3\2\2\2\2}\3\2\2\2\2\177\3\2\2\2\2")
+        buf.write("\u0081\3\2\2\2\2\u0083\3\2\2\2\2\u0085\3\2\2\2\2\u0087")
+        buf.write("\3\2\2\2\2\u0089\3\2\2\2\2\u008b\3\2\2\2\2\u008d\3\2\2")
+        buf.write("\2\2\u008f\3\2\2\2\2\u0091\3\2\2\2\2\u0093\3\2\2\2\2\u0095")
+        buf.write("\3\2\2\2\2\u0097\3\2\2\2\2\u0099\3\2\2\2\2\u009b\3\2\2")
+        buf.write("\2\2\u009d\3\2\2\2\2\u009f\3\2\2\2\2\u00a1\3\2\2\2\3\u00a3")
+        buf.write("\3\2\2\2\5\u00a5\3\2\2\2\7\u00ac\3\2\2\2\t\u00b5\3\2\2")
+        buf.write("\2\13\u00ba\3\2\2\2\r\u00bf\3\2\2\2\17\u00c9\3\2\2\2\21")
+        buf.write("\u00cd\3\2\2\2\23\u00d4\3\2\2\2\25\u00dc\3\2\2\2\27\u00e1")
+        buf.write("\3\2\2\2\31\u00e6\3\2\2\2\33\u00eb\3\2\2\2\35\u00ee\3")
+        buf.write("\2\2\2\37\u00f4\3\2\2\2!\u00f9\3\2\2\2#\u00fb\3\2\2\2")
+        buf.write("%\u00fd\3\2\2\2\'\u0102\3\2\2\2)\u0109\3\2\2\2+\u010e")
+        buf.write("\3\2\2\2-\u0115\3\2\2\2/\u011c\3\2\2\2\61\u0122\3\2\2")
+        buf.write("\2\63\u0129\3\2\2\2\65\u012d\3\2\2\2\67\u0134\3\2\2\2")
+        buf.write("9\u013a\3\2\2\2;\u013d\3\2\2\2=\u0143\3\2\2\2?\u014a\3")
+        buf.write("\2\2\2A\u0150\3\2\2\2C\u0154\3\2\2\2E\u015a\3\2\2\2G\u0162")
+        buf.write("\3\2\2\2I\u0166\3\2\2\2K\u016e\3\2\2\2M\u0179\3\2\2\2")
+        buf.write("O\u0184\3\2\2\2Q\u018b\3\2\2\2S\u0192\3\2\2\2U\u0198\3")
+        buf.write("\2\2\2W\u019e\3\2\2\2Y\u01a4\3\2\2\2[\u01ac\3\2\2\2]\u01b3")
+        buf.write("\3\2\2\2_\u01b8\3\2\2\2a\u01bd\3\2\2\2c\u01c3\3\2\2\2")
+        buf.write("e\u01c6\3\2\2\2g\u01ca\3\2\2\2i\u01cc\3\2\2\2k\u01d0\3")
+        buf.write("\2\2\2m\u01d8\3\2\2\2o\u01dc\3\2\2\2q\u01e4\3\2\2\2s\u01ea")
+        buf.write("\3\2\2\2u\u01ee\3\2\2\2w\u01f1\3\2\2\2y\u01f4\3\2\2\2")
+        buf.write("{\u01f9\3\2\2\2}\u01fb\3\2\2\2\177\u01fd\3\2\2\2\u0081")
+        buf.write("\u01ff\3\2\2\2\u0083\u0201\3\2\2\2\u0085\u0204\3\2\2\2")
+        buf.write("\u0087\u0206\3\2\2\2\u0089\u0209\3\2\2\2\u008b\u020c\3")
+        buf.write("\2\2\2\u008d\u0212\3\2\2\2\u008f\u0216\3\2\2\2\u0091\u021a")
+        buf.write("\3\2\2\2\u0093\u021e\3\2\2\2\u0095\u0222\3\2\2\2\u0097")
+        buf.write("\u0227\3\2\2\2\u0099\u022f\3\2\2\2\u009b\u0233\3\2\2\2")
+        buf.write("\u009d\u023d\3\2\2\2\u009f\u024c\3\2\2\2\u00a1\u0252\3")
+        buf.write("\2\2\2\u00a3\u00a4\7=\2\2\u00a4\4\3\2\2\2\u00a5\u00a6")
+        buf.write("\7E\2\2\u00a6\u00a7\7T\2\2\u00a7\u00a8\7G\2\2\u00a8\u00a9")
+        buf.write("\7C\2\2\u00a9\u00aa\7V\2\2\u00aa\u00ab\7G\2\2\u00ab\6")
+        buf.write("\3\2\2\2\u00ac\u00ad\7F\2\2\u00ad\u00ae\7C\2\2\u00ae\u00af")
+        buf.write("\7V\2\2\u00af\u00b0\7C\2\2\u00b0\u00b1\7D\2\2\u00b1\u00b2")
+        buf.write("\7C\2\2\u00b2\u00b3\7U\2\2\u00b3\u00b4\7G\2\2\u00b4\b")
+        buf.write("\3\2\2\2\u00b5\u00b6\7F\2\2\u00b6\u00b7\7T\2\2\u00b7\u00b8")
+        buf.write("\7Q\2\2\u00b8\u00b9\7R\2\2\u00b9\n\3\2\2\2\u00ba\u00bb")
+        buf.write("\7U\2\2\u00bb\u00bc\7J\2\2\u00bc\u00bd\7Q\2\2\u00bd\u00be")
+        buf.write("\7Y\2\2\u00be\f\3\2\2\2\u00bf\u00c0\7F\2\2\u00c0\u00c1")
+        buf.write("\7C\2\2\u00c1\u00c2\7V\2\2\u00c2\u00c3\7C\2\2\u00c3\u00c4")
+        buf.write("\7D\2\2\u00c4\u00c5\7C\2\2\u00c5\u00c6\7U\2\2\u00c6\u00c7")
+        buf.write("\7G\2\2\u00c7\u00c8\7U\2\2\u00c8\16\3\2\2\2\u00c9\u00ca")
+        buf.write("\7W\2\2\u00ca\u00cb\7U\2\2\u00cb\u00cc\7G\2\2\u00cc\20")
+        buf.write("\3\2\2\2\u00cd\u00ce\7V\2\2\u00ce\u00cf\7C\2\2\u00cf\u00d0")
+        buf.write("\7D\2\2\u00d0\u00d1\7N\2\2\u00d1\u00d2\7G\2\2\u00d2\u00d3")
+        buf.write("\7U\2\2\u00d3\22\3\2\2\2\u00d4\u00d5\7K\2\2\u00d5\u00d6")
+        buf.write("\7P\2\2\u00d6\u00d7\7F\2\2\u00d7\u00d8\7G\2\2\u00d8\u00d9")
+        buf.write("\7Z\2\2\u00d9\u00da\7G\2\2\u00da\u00db\7U\2\2\u00db\24")
+        buf.write("\3\2\2\2\u00dc\u00dd\7N\2\2\u00dd\u00de\7Q\2\2\u00de\u00df")
+        buf.write("\7C\2\2\u00df\u00e0\7F\2\2\u00e0\26\3\2\2\2\u00e1\u00e2")
+        buf.write("\7H\2\2\u00e2\u00e3\7T\2\2\u00e3\u00e4\7Q\2\2\u00e4\u00e5")
+        buf.write("\7O\2\2\u00e5\30\3\2\2\2\u00e6\u00e7\7H\2\2\u00e7\u00e8")
+        buf.write("\7K\2\2\u00e8\u00e9\7N\2\2\u00e9\u00ea\7G\2\2\u00ea\32")
+        buf.write("\3\2\2\2\u00eb\u00ec\7V\2\2\u00ec\u00ed\7Q\2\2\u00ed\34")
+        buf.write("\3\2\2\2\u00ee\u00ef\7V\2\2\u00ef\u00f0\7C\2\2\u00f0\u00f1")
+        buf.write("\7D\2\2\u00f1\u00f2\7N\2\2\u00f2\u00f3\7G\2\2\u00f3\36")
+        buf.write("\3\2\2\2\u00f4\u00f5\7F\2\2\u00f5\u00f6\7W\2\2\u00f6\u00f7")
+        buf.write("\7O\2\2\u00f7\u00f8\7R\2\2\u00f8 \3\2\2\2\u00f9\u00fa")
+        buf.write("\7*\2\2\u00fa\"\3\2\2\2\u00fb\u00fc\7+\2\2\u00fc$\3\2")
+        buf.write("\2\2\u00fd\u00fe\7F\2\2\u00fe\u00ff\7G\2\2\u00ff\u0100")
+        buf.write("\7U\2\2\u0100\u0101\7E\2\2\u0101&\3\2\2\2\u0102\u0103")
+        buf.write("\7K\2\2\u0103\u0104\7P\2\2\u0104\u0105\7U\2\2\u0105\u0106")
+        buf.write("\7G\2\2\u0106\u0107\7T\2\2\u0107\u0108\7V\2\2\u0108(\3")
+        buf.write("\2\2\2\u0109\u010a\7K\2\2\u010a\u010b\7P\2\2\u010b\u010c")
+        buf.write("\7V\2\2\u010c\u010d\7Q\2\2\u010d*\3\2\2\2\u010e\u010f")
+        buf.write("\7X\2\2\u010f\u0110\7C\2\2\u0110\u0111\7N\2\2\u0111\u0112")
+        buf.write("\7W\2\2\u0112\u0113\7G\2\2\u0113\u0114\7U\2\2\u0114,\3")
+        buf.write("\2\2\2\u0115\u0116\7F\2\2\u0116\u0117\7G\2\2\u0117\u0118")
+        buf.write("\7N\2\2\u0118\u0119\7G\2\2\u0119\u011a\7V\2\2\u011a\u011b")
+        buf.write("\7G\2\2\u011b.\3\2\2\2\u011c\u011d\7Y\2\2\u011d\u011e")
+        buf.write("\7J\2\2\u011e\u011f\7G\2\2\u011f\u0120\7T\2\2\u0120\u0121")
+        buf.write("\7G\2\2\u0121\60\3\2\2\2\u0122\u0123\7W\2\2\u0123\u0124")
+        buf.write("\7R\2\2\u0124\u0125\7F\2\2\u0125\u0126\7C\2\2\u0126\u0127")
+        buf.write("\7V\2\2\u0127\u0128\7G\2\2\u0128\62\3\2\2\2\u0129\u012a")
+        buf.write("\7U\2\2\u012a\u012b\7G\2\2\u012b\u012c\7V\2\2\u012c\64")
+        buf.write("\3\2\2\2\u012d\u012e\7U\2\2\u012e\u012f\7G\2\2\u012f\u0130")
+        buf.write("\7N\2\2\u0130\u0131\7G\2\2\u0131\u0132\7E\2\2\u0132\u0133")
+        buf.write("\7V\2\2\u0133\66\3\2\2\2\u0134\u0135\7I\2\2\u0135\u0136")
+        buf.write("\7T\2\2\u0136\u0137\7Q\2\2\u0137\u0138\7W\2\2\u0138\u0139")
+        buf.write("\7R\2\2\u01398\3\2\2\2\u013a\u013b\7D\2\2\u013b\u013c")
+        buf.write("\7[\2\2\u013c:\3\2\2\2\u013d\u013e\7N\2\2\u013e\u013f")
+        buf.write("\7K\2\2\u013f\u0140\7O\2\2\u0140\u0141\7K\2\2\u0141\u0142")
+        buf.write("\7V\2\2\u0142<\3\2\2\2\u0143\u0144\7Q\2\2\u0144\u0145")
+        buf.write("\7H\2\2\u0145\u0146\7H\2\2\u0146\u0147\7U\2\2\u0147\u0148")
+        buf.write("\7G\2\2\u0148\u0149\7V\2\2\u0149>\3\2\2\2\u014a\u014b")
+        buf.write("\7C\2\2\u014b\u014c\7N\2\2\u014c\u014d\7V\2\2\u014d\u014e")
+        buf.write("\7G\2\2\u014e\u014f\7T\2\2\u014f@\3\2\2\2\u0150\u0151")
+        buf.write("\7C\2\2\u0151\u0152\7F\2\2\u0152\u0153\7F\2\2\u0153B\3")
+        buf.write("\2\2\2\u0154\u0155\7K\2\2\u0155\u0156\7P\2\2\u0156\u0157")
+        buf.write("\7F\2\2\u0157\u0158\7G\2\2\u0158\u0159\7Z\2\2\u0159D\3")
+        buf.write("\2\2\2\u015a\u015b\7R\2\2\u015b\u015c\7T\2\2\u015c\u015d")
+        buf.write("\7K\2\2\u015d\u015e\7O\2\2\u015e\u015f\7C\2\2\u015f\u0160")
+        buf.write("\7T\2\2\u0160\u0161\7[\2\2\u0161F\3\2\2\2\u0162\u0163")
+        buf.write("\7M\2\2\u0163\u0164\7G\2\2\u0164\u0165\7[\2\2\u0165H\3")
+        buf.write("\2\2\2\u0166\u0167\7H\2\2\u0167\u0168\7Q\2\2\u0168\u0169")
+        buf.write("\7T\2\2\u0169\u016a\7G\2\2\u016a\u016b\7K\2\2\u016b\u016c")
+        buf.write("\7I\2\2\u016c\u016d\7P\2\2\u016dJ\3\2\2\2\u016e\u016f")
+        buf.write("\7E\2\2\u016f\u0170\7Q\2\2\u0170\u0171\7P\2\2\u0171\u0172")
+        buf.write("\7U\2\2\u0172\u0173\7V\2\2\u0173\u0174\7T\2\2\u0174\u0175")
+        buf.write("\7C\2\2\u0175\u0176\7K\2\2\u0176\u0177\7P\2\2\u0177\u0178")
+        buf.write("\7V\2\2\u0178L\3\2\2\2\u0179\u017a\7T\2\2\u017a\u017b")
+        buf.write("\7G\2\2\u017b\u017c\7H\2\2\u017c\u017d\7G\2\2\u017d\u017e")
+        buf.write("\7T\2\2\u017e\u017f\7G\2\2\u017f\u0180\7P\2\2\u0180\u0181")
+        buf.write("\7E\2\2\u0181\u0182\7G\2\2\u0182\u0183\7U\2\2\u0183N\3")
+        buf.write("\2\2\2\u0184\u0185\7W\2\2\u0185\u0186\7P\2\2\u0186\u0187")
+        buf.write("\7K\2\2\u0187\u0188\7S\2\2\u0188\u0189\7W\2\2\u0189\u018a")
+        buf.write("\7G\2\2\u018aP\3\2\2\2\u018b\u018c\7D\2\2\u018c\u018d")
+        buf.write("\7W\2\2\u018d\u018e\7H\2\2\u018e\u018f\7H\2\2\u018f\u0190")
+        buf.write("\7G\2\2\u0190\u0191\7T\2\2\u0191R\3\2\2\2\u0192\u0193")
+        buf.write("\7U\2\2\u0193\u0194\7V\2\2\u0194\u0195\7C\2\2\u0195\u0196")
+        buf.write("\7V\2\2\u0196\u0197\7U\2\2\u0197T\3\2\2\2\u0198\u0199")
+        buf.write("\7T\2\2\u0199\u019a\7G\2\2\u019a\u019b\7U\2\2\u019b\u019c")
+        buf.write("\7G\2\2\u019c\u019d\7V\2\2\u019dV\3\2\2\2\u019e\u019f")
+        buf.write("\7S\2\2\u019f\u01a0\7W\2\2\u01a0\u01a1\7Q\2\2\u01a1\u01a2")
+        buf.write("\7V\2\2\u01a2\u01a3\7C\2\2\u01a3X\3\2\2\2\u01a4\u01a5")
+        buf.write("\7T\2\2\u01a5\u01a6\7G\2\2\u01a6\u01a7\7U\2\2\u01a7\u01a8")
+        buf.write("\7G\2\2\u01a8\u01a9\7T\2\2\u01a9\u01aa\7X\2\2\u01aa\u01ab")
+        buf.write("\7G\2\2\u01abZ\3\2\2\2\u01ac\u01ad\7S\2\2\u01ad\u01ae")
+        buf.write("\7W\2\2\u01ae\u01af\7Q\2\2\u01af\u01b0\7V\2\2\u01b0\u01b1")
+        buf.write("\7C\2\2\u01b1\u01b2\7U\2\2\u01b2\\\3\2\2\2\u01b3\u01b4")
+        buf.write("\7R\2\2\u01b4\u01b5\7C\2\2\u01b5\u01b6\7I\2\2\u01b6\u01b7")
+        buf.write("\7G\2\2\u01b7^\3\2\2\2\u01b8\u01b9\7U\2\2\u01b9\u01ba")
+        buf.write("\7K\2\2\u01ba\u01bb\7\\\2\2\u01bb\u01bc\7G\2\2\u01bc`")
+        buf.write("\3\2\2\2\u01bd\u01be\7V\2\2\u01be\u01bf\7T\2\2\u01bf\u01c0")
+        buf.write("\7C\2\2\u01c0\u01c1\7E\2\2\u01c1\u01c2\7G\2\2\u01c2b\3")
+        buf.write("\2\2\2\u01c3\u01c4\7Q\2\2\u01c4\u01c5\7P\2\2\u01c5d\3")
+        buf.write("\2\2\2\u01c6\u01c7\7Q\2\2\u01c7\u01c8\7H\2\2\u01c8\u01c9")
+        buf.write("\7H\2\2\u01c9f\3\2\2\2\u01ca\u01cb\7.\2\2\u01cbh\3\2\2")
+        buf.write("\2\u01cc\u01cd\7P\2\2\u01cd\u01ce\7Q\2\2\u01ce\u01cf\7")
+        buf.write("V\2\2\u01cfj\3\2\2\2\u01d0\u01d1\7F\2\2\u01d1\u01d2\7")
+        buf.write("G\2\2\u01d2\u01d3\7H\2\2\u01d3\u01d4\7C\2\2\u01d4\u01d5")
+        buf.write("\7W\2\2\u01d5\u01d6\7N\2\2\u01d6\u01d7\7V\2\2\u01d7l\3")
+        buf.write("\2\2\2\u01d8\u01d9\7K\2\2\u01d9\u01da\7P\2\2\u01da\u01db")
+        buf.write("\7V\2\2\u01dbn\3\2\2\2\u01dc\u01dd\7X\2\2\u01dd\u01de")
+        buf.write("\7C\2\2\u01de\u01df\7T\2\2\u01df\u01e0\7E\2\2\u01e0\u01e1")
+        buf.write("\7J\2\2\u01e1\u01e2\7C\2\2\u01e2\u01e3\7T\2\2\u01e3p\3")
+        buf.write("\2\2\2\u01e4\u01e5\7H\2\2\u01e5\u01e6\7N\2\2\u01e6\u01e7")
+        buf.write("\7Q\2\2\u01e7\u01e8\7C\2\2\u01e8\u01e9\7V\2\2\u01e9r\3")
+        buf.write("\2\2\2\u01ea\u01eb\7C\2\2\u01eb\u01ec\7P\2\2\u01ec\u01ed")
+        buf.write("\7F\2\2\u01edt\3\2\2\2\u01ee\u01ef\7K\2\2\u01ef\u01f0")
+        buf.write("\7U\2\2\u01f0v\3\2\2\2\u01f1\u01f2\7K\2\2\u01f2\u01f3")
+        buf.write("\7P\2\2\u01f3x\3\2\2\2\u01f4\u01f5\7N\2\2\u01f5\u01f6")
+        buf.write("\7K\2\2\u01f6\u01f7\7M\2\2\u01f7\u01f8\7G\2\2\u01f8z\3")
+        buf.write("\2\2\2\u01f9\u01fa\7\60\2\2\u01fa|\3\2\2\2\u01fb\u01fc")
+        buf.write("\7,\2\2\u01fc~\3\2\2\2\u01fd\u01fe\7?\2\2\u01fe\u0080")
+        buf.write("\3\2\2\2\u01ff\u0200\7>\2\2\u0200\u0082\3\2\2\2\u0201")
+        buf.write("\u0202\7>\2\2\u0202\u0203\7?\2\2\u0203\u0084\3\2\2\2\u0204")
+        buf.write("\u0205\7@\2\2\u0205\u0086\3\2\2\2\u0206\u0207\7@\2\2\u0207")
+        buf.write("\u0208\7?\2\2\u0208\u0088\3\2\2\2\u0209\u020a\7>\2\2\u020a")
+        buf.write("\u020b\7@\2\2\u020b\u008a\3\2\2\2\u020c\u020d\7E\2\2\u020d")
+        buf.write("\u020e\7Q\2\2\u020e\u020f\7W\2\2\u020f\u0210\7P\2\2\u0210")
+        buf.write("\u0211\7V\2\2\u0211\u008c\3\2\2\2\u0212\u0213\7C\2\2\u0213")
+        buf.write("\u0214\7X\2\2\u0214\u0215\7I\2\2\u0215\u008e\3\2\2\2\u0216")
+        buf.write("\u0217\7O\2\2\u0217\u0218\7C\2\2\u0218\u0219\7Z\2\2\u0219")
+        buf.write("\u0090\3\2\2\2\u021a\u021b\7O\2\2\u021b\u021c\7K\2\2\u021c")
+        buf.write("\u021d\7P\2\2\u021d\u0092\3\2\2\2\u021e\u021f\7U\2\2\u021f")
+        buf.write("\u0220\7W\2\2\u0220\u0221\7O\2\2\u0221\u0094\3\2\2\2\u0222")
+        buf.write("\u0223\7P\2\2\u0223\u0224\7W\2\2\u0224\u0225\7N\2\2\u0225")
+        buf.write("\u0226\7N\2\2\u0226\u0096\3\2\2\2\u0227\u022b\t\2\2\2")
+        buf.write("\u0228\u022a\t\3\2\2\u0229\u0228\3\2\2\2\u022a\u022d\3")
+        buf.write("\2\2\2\u022b\u0229\3\2\2\2\u022b\u022c\3\2\2\2\u022c\u0098")
+        buf.write("\3\2\2\2\u022d\u022b\3\2\2\2\u022e\u0230\t\4\2\2\u022f")
+        buf.write("\u022e\3\2\2\2\u0230\u0231\3\2\2\2\u0231\u022f\3\2\2\2")
+        buf.write("\u0231\u0232\3\2\2\2\u0232\u009a\3\2\2\2\u0233\u0237\7")
+        buf.write(")\2\2\u0234\u0236\n\5\2\2\u0235\u0234\3\2\2\2\u0236\u0239")
+        buf.write("\3\2\2\2\u0237\u0235\3\2\2\2\u0237\u0238\3\2\2\2\u0238")
+        buf.write("\u023a\3\2\2\2\u0239\u0237\3\2\2\2\u023a\u023b\7)\2\2")
+        buf.write("\u023b\u009c\3\2\2\2\u023c\u023e\7/\2\2\u023d\u023c\3")
+        buf.write("\2\2\2\u023d\u023e\3\2\2\2\u023e\u0240\3\2\2\2\u023f\u0241")
+        buf.write("\t\4\2\2\u0240\u023f\3\2\2\2\u0241\u0242\3\2\2\2\u0242")
+        buf.write("\u0240\3\2\2\2\u0242\u0243\3\2\2\2\u0243\u0244\3\2\2\2")
+        buf.write("\u0244\u0248\7\60\2\2\u0245\u0247\t\4\2\2\u0246\u0245")
+        buf.write("\3\2\2\2\u0247\u024a\3\2\2\2\u0248\u0246\3\2\2\2\u0248")
+        buf.write("\u0249\3\2\2\2\u0249\u009e\3\2\2\2\u024a\u0248\3\2\2\2")
+        buf.write("\u024b\u024d\t\6\2\2\u024c\u024b\3\2\2\2\u024d\u024e\3")
+        buf.write("\2\2\2\u024e\u024c\3\2\2\2\u024e\u024f\3\2\2\2\u024f\u0250")
+        buf.write("\3\2\2\2\u0250\u0251\bP\2\2\u0251\u00a0\3\2\2\2\u0252")
+        buf.write("\u0253\7/\2\2\u0253\u0255\7/\2\2\u0254\u0256\n\7\2\2\u0255")
+        buf.write("\u0254\3\2\2\2\u0256\u0257\3\2\2\2\u0257\u0255\3\2\2\2")
+        buf.write("\u0257\u0258\3\2\2\2\u0258\u00a2\3\2\2\2\13\2\u022b\u0231")
+        buf.write("\u0237\u023d\u0242\u0248\u024e\u0257\3\b\2\2")
         return buf.getvalue()
 
 
@@ -280,24 +315,35 @@ class SQLLexer(Lexer):
     T__48 = 49
     T__49 = 50
     T__50 = 51
-    EqualOrAssign = 52
-    Less = 53
-    LessEqual = 54
-    Greater = 55
-    GreaterEqual = 56
-    NotEqual = 57
-    Count = 58
-    Average = 59
-    Max = 60
-    Min = 61
-    Sum = 62
-    Null = 63
-    Identifier = 64
-    Integer = 65
-    String = 66
-    Float = 67
-    Whitespace = 68
-    Annotation = 69
+    T__51 = 52
+    T__52 = 53
+    T__53 = 54
+    T__54 = 55
+    T__55 = 56
+    T__56 = 57
+    T__57 = 58
+    T__58 = 59
+    T__59 = 60
+    T__60 = 61
+    T__61 = 62
+    EqualOrAssign = 63
+    Less = 64
+    LessEqual = 65
+    Greater = 66
+    GreaterEqual = 67
+    NotEqual = 68
+    Count = 69
+    Average = 70
+    Max = 71
+    Min = 72
+    Sum = 73
+    Null = 74
+    Identifier = 75
+    Integer = 76
+    String = 77
+    Float = 78
+    Whitespace = 79
+    Annotation = 80
 
     channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN" ]
 
@@ -310,10 +356,12 @@ class SQLLexer(Lexer):
             "'INTO'", "'VALUES'", "'DELETE'", "'WHERE'", "'UPDATE'", "'SET'", 
             "'SELECT'", "'GROUP'", "'BY'", "'LIMIT'", "'OFFSET'", "'ALTER'", 
             "'ADD'", "'INDEX'", "'PRIMARY'", "'KEY'", "'FOREIGN'", "'CONSTRAINT'", 
-            "'REFERENCES'", "'UNIQUE'", "','", "'NOT'", "'DEFAULT'", "'INT'", 
-            "'VARCHAR'", "'FLOAT'", "'AND'", "'IS'", "'IN'", "'LIKE'", "'.'", 
-            "'*'", "'='", "'<'", "'<='", "'>'", "'>='", "'<>'", "'COUNT'", 
-            "'AVG'", "'MAX'", "'MIN'", "'SUM'", "'NULL'" ]
+            "'REFERENCES'", "'UNIQUE'", "'BUFFER'", "'STATS'", "'RESET'", 
+            "'QUOTA'", "'RESERVE'", "'QUOTAS'", "'PAGE'", "'SIZE'", "'TRACE'", 
+            "'ON'", "'OFF'", "','", "'NOT'", "'DEFAULT'", "'INT'", "'VARCHAR'", 
+            "'FLOAT'", "'AND'", "'IS'", "'IN'", "'LIKE'", "'.'", "'*'", 
+            "'='", "'<'", "'<='", "'>'", "'>='", "'<>'", "'COUNT'", "'AVG'", 
+            "'MAX'", "'MIN'", "'SUM'", "'NULL'" ]
 
     symbolicNames = [ "<INVALID>",
             "EqualOrAssign", "Less", "LessEqual", "Greater", "GreaterEqual", 
@@ -328,10 +376,12 @@ class SQLLexer(Lexer):
                   "T__32", "T__33", "T__34", "T__35", "T__36", "T__37", 
                   "T__38", "T__39", "T__40", "T__41", "T__42", "T__43", 
                   "T__44", "T__45", "T__46", "T__47", "T__48", "T__49", 
-                  "T__50", "EqualOrAssign", "Less", "LessEqual", "Greater", 
-                  "GreaterEqual", "NotEqual", "Count", "Average", "Max", 
-                  "Min", "Sum", "Null", "Identifier", "Integer", "String", 
-                  "Float", "Whitespace", "Annotation" ]
+                  "T__50", "T__51", "T__52", "T__53", "T__54", "T__55", 
+                  "T__56", "T__57", "T__58", "T__59", "T__60", "T__61", 
+                  "EqualOrAssign", "Less", "LessEqual", "Greater", "GreaterEqual", 
+                  "NotEqual", "Count", "Average", "Max", "Min", "Sum", "Null", 
+                  "Identifier", "Integer", "String", "Float", "Whitespace", 
+                  "Annotation" ]
 
     grammarFileName = "SQL.g4"
 
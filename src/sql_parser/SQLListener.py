@@ -233,6 +233,87 @@ class SQLListener(ParseTreeListener):
         pass
 
 
+    # Enter a parse tree produced by SQLParser#show_buffer_stats.
+    def enterShow_buffer_stats(self, ctx:SQLParser.Show_buffer_statsContext):
+        pass
+
+    # Exit a parse tree produced by SQLParser#show_buffer_stats.
+    def exitShow_buffer_stats(self, ctx:SQLParser.Show_buffer_statsContext):
+        pass
+
+
+    # Enter a parse tree produced by SQLParser#reset_buffer_stats.
+    def enterReset_buffer_stats(self, ctx:SQLParser.Reset_buffer_statsContext):
+        pass
+
+    # Exit a parse tree produced by SQLParser#reset_buffer_stats.
+    def exitReset_buffer_stats(self, ctx:SQLParser.Reset_buffer_statsContext):
+        pass
+
+
+    # Enter a parse tree produced by SQLParser#set_buffer_quota.
+    def enterSet_buffer_quota(self, ctx:SQLParser.Set_buffer_quotaContext):
+        pass
+
+    # Exit a parse tree produced by SQLParser#set_buffer_quota.
+    def exitSet_buffer_quota(self, ctx:SQLParser.Set_buffer_quotaContext):
+        pass
+
+
+    # Enter a parse tree produced by SQLParser#drop_buffer_quota.
+    def enterDrop_buffer_quota(self, ctx:SQLParser.Drop_buffer_quotaContext):
+        pass
+
+    # Exit a parse tree produced by SQLParser#drop_buffer_quota.
+    def exitDrop_buffer_quota(self, ctx:SQLParser.Drop_buffer_quotaContext):
+        pass
+
+
+    # Enter a parse tree produced by SQLParser#show_buffer_quotas.
+    def enterShow_buffer_quotas(self, ctx:SQLParser.Show_buffer_quotasContext):
+        pass
+
+    # Exit a parse tree produced by SQLParser#show_buffer_quotas.
+    def exitShow_buffer_quotas(self, ctx:SQLParser.Show_buffer_quotasContext):
+        pass
+
+
+    # Enter a parse tree produced by SQLParser#set_page_size.
+    def enterSet_page_size(self, ctx:SQLParser.Set_page_sizeContext):
+        pass
+
+    # Exit a parse tree produced by SQLParser#set_page_size.
+    def exitSet_page_size(self, ctx:SQLParser.Set_page_sizeContext):
+        pass
+
+
+    # Enter a parse tree produced by SQLParser#set_trace.
+    def enterSet_trace(self, ctx:SQLParser.Set_traceContext):
+        pass
+
+    # Exit a parse tree produced by SQLParser#set_trace.
+    def exitSet_trace(self, ctx:SQLParser.Set_traceContext):
+        pass
+
+
+    # Enter a parse tree produced by SQLParser#show_trace_stats.
+    def enterShow_trace_stats(self, ctx:SQLParser.Show_trace_statsContext):
+        pass
+
+    # Exit a parse tree produced by SQLParser#show_trace_stats.
+    def exitShow_trace_stats(self, ctx:SQLParser.Show_trace_statsContext):
+        pass
+
+
+    # Enter a parse tree produced by SQLParser#reset_trace_stats.
+    def enterReset_trace_stats(self, ctx:SQLParser.Reset_trace_statsContext):
+        pass
+
+    # Exit a parse tree produced by SQLParser#reset_trace_stats.
+    def exitReset_trace_stats(self, ctx:SQLParser.Reset_trace_statsContext):
+        pass
+
+
     # Enter a parse tree produced by SQLParser#field_list.
     def enterField_list(self, ctx:SQLParser.Field_listContext):
         pass
@@ -422,6 +503,15 @@ class SQLListener(ParseTreeListener):
         pass
 
 
+    # Enter a parse tree produced by SQLParser#identifier.
+    def enterIdentifier(self, ctx:SQLParser.IdentifierContext):
+        pass
+
+    # Exit a parse tree produced by SQLParser#identifier.
+    def exitIdentifier(self, ctx:SQLParser.IdentifierContext):
+        pass
+
+
     # Enter a parse tree produced by SQLParser#operator_.
     def enterOperator_(self, ctx:SQLParser.Operator_Context):
         pass
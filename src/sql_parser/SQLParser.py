@@ -7,191 +7,228 @@ import sys
 
 def serializedATN():
     with StringIO() as buf:
-        buf.write("\3\u608b\ua72a\u8133\ub9ed\u417c\u3be7\u7786\u5964\3G")
-        buf.write("\u0198\4\2\t\2\4\3\t\3\4\4\t\4\4\5\t\5\4\6\t\6\4\7\t\7")
+        buf.write("\3\u608b\ua72a\u8133\ub9ed\u417c\u3be7\u7786\u5964\3R")
+        buf.write("\u01da\4\2\t\2\4\3\t\3\4\4\t\4\4\5\t\5\4\6\t\6\4\7\t\7")
         buf.write("\4\b\t\b\4\t\t\t\4\n\t\n\4\13\t\13\4\f\t\f\4\r\t\r\4\16")
         buf.write("\t\16\4\17\t\17\4\20\t\20\4\21\t\21\4\22\t\22\4\23\t\23")
-        buf.write("\4\24\t\24\4\25\t\25\4\26\t\26\4\27\t\27\4\30\t\30\3\2")
-        buf.write("\7\2\62\n\2\f\2\16\2\65\13\2\3\2\3\2\3\3\3\3\3\3\3\3\3")
-        buf.write("\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\5\3I\n")
-        buf.write("\3\3\4\3\4\3\4\3\4\3\4\3\4\3\4\3\4\3\4\3\4\3\4\3\4\3\4")
-        buf.write("\3\4\5\4Y\n\4\3\5\3\5\3\5\3\5\3\5\3\5\3\5\3\5\3\5\3\5")
-        buf.write("\3\5\3\5\3\5\3\5\5\5i\n\5\3\6\3\6\3\6\3\6\3\6\3\6\3\6")
+        buf.write("\4\24\t\24\4\25\t\25\4\26\t\26\4\27\t\27\4\30\t\30\4\31")
+        buf.write("\t\31\4\32\t\32\3\2\7\2\66\n\2\f\2\16\29\13\2\3\2\3\2")
+        buf.write("\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3")
+        buf.write("\3\3\3\3\3\3\3\3\3\3\3\5\3P\n\3\3\4\3\4\3\4\3\4\3\4\3")
+        buf.write("\4\3\4\3\4\3\4\3\4\3\4\3\4\3\4\3\4\5\4`\n\4\3\5\3\5\3")
+        buf.write("\5\3\5\3\5\3\5\3\5\3\5\3\5\3\5\3\5\3\5\3\5\3\5\5\5p\n")
+        buf.write("\5\3\6\3\6\3\6\3\6\3\6\3\6\3\6\3\6\3\6\3\6\3\6\3\6\3\6")
         buf.write("\3\6\3\6\3\6\3\6\3\6\3\6\3\6\3\6\3\6\3\6\3\6\3\6\3\6\3")
-        buf.write("\6\3\6\3\6\3\6\3\6\3\6\3\6\3\6\3\6\3\6\5\6\u0089\n\6\3")
-        buf.write("\7\3\7\3\7\3\7\3\7\3\7\5\7\u0091\n\7\3\7\3\7\3\7\5\7\u0096")
-        buf.write("\n\7\3\7\3\7\3\7\3\7\5\7\u009c\n\7\5\7\u009e\n\7\3\b\3")
+        buf.write("\6\3\6\3\6\3\6\3\6\3\6\5\6\u0092\n\6\3\7\3\7\3\7\3\7\3")
+        buf.write("\7\3\7\5\7\u009a\n\7\3\7\3\7\3\7\5\7\u009f\n\7\3\7\3\7")
+        buf.write("\3\7\3\7\5\7\u00a5\n\7\5\7\u00a7\n\7\3\b\3\b\3\b\3\b\3")
         buf.write("\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b")
-        buf.write("\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\5\b\u00b9\n\b")
-        buf.write("\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\5")
-        buf.write("\b\u00c8\n\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3")
-        buf.write("\b\3\b\5\b\u00d6\n\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3")
-        buf.write("\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\5\b\u00ec")
-        buf.write("\n\b\3\t\3\t\3\t\7\t\u00f1\n\t\f\t\16\t\u00f4\13\t\3\n")
-        buf.write("\3\n\3\n\3\n\5\n\u00fa\n\n\3\n\3\n\5\n\u00fe\n\n\3\n\3")
-        buf.write("\n\3\n\5\n\u0103\n\n\3\n\3\n\3\n\3\n\3\n\3\n\3\n\5\n\u010c")
-        buf.write("\n\n\3\n\3\n\3\n\3\n\3\n\3\n\3\n\3\n\3\n\5\n\u0117\n\n")
-        buf.write("\3\13\3\13\3\13\3\13\3\13\3\13\5\13\u011f\n\13\3\f\3\f")
-        buf.write("\3\f\7\f\u0124\n\f\f\f\16\f\u0127\13\f\3\r\3\r\3\r\3\r")
-        buf.write("\7\r\u012d\n\r\f\r\16\r\u0130\13\r\3\r\3\r\3\16\3\16\3")
-        buf.write("\17\3\17\3\17\7\17\u0139\n\17\f\17\16\17\u013c\13\17\3")
-        buf.write("\20\3\20\3\20\3\20\3\20\3\20\3\20\3\20\3\20\3\20\3\20")
-        buf.write("\3\20\3\20\5\20\u014b\n\20\3\20\3\20\3\20\3\20\3\20\3")
-        buf.write("\20\3\20\3\20\3\20\3\20\3\20\3\20\3\20\3\20\3\20\3\20")
-        buf.write("\5\20\u015d\n\20\3\21\3\21\5\21\u0161\n\21\3\21\3\21\3")
-        buf.write("\22\3\22\5\22\u0167\n\22\3\23\3\23\3\23\3\23\3\23\3\23")
-        buf.write("\3\23\7\23\u0170\n\23\f\23\16\23\u0173\13\23\3\24\3\24")
-        buf.write("\3\24\3\24\7\24\u0179\n\24\f\24\16\24\u017c\13\24\5\24")
-        buf.write("\u017e\n\24\3\25\3\25\3\25\3\25\3\25\3\25\3\25\3\25\3")
-        buf.write("\25\3\25\5\25\u018a\n\25\3\26\3\26\3\26\7\26\u018f\n\26")
-        buf.write("\f\26\16\26\u0192\13\26\3\27\3\27\3\30\3\30\3\30\2\2\31")
-        buf.write("\2\4\6\b\n\f\16\20\22\24\26\30\32\34\36 \"$&(*,.\2\5\4")
-        buf.write("\2AACE\3\2\66;\3\2<@\2\u01b9\2\63\3\2\2\2\4H\3\2\2\2\6")
-        buf.write("X\3\2\2\2\bh\3\2\2\2\n\u0088\3\2\2\2\f\u008a\3\2\2\2\16")
-        buf.write("\u00eb\3\2\2\2\20\u00ed\3\2\2\2\22\u0116\3\2\2\2\24\u011e")
-        buf.write("\3\2\2\2\26\u0120\3\2\2\2\30\u0128\3\2\2\2\32\u0133\3")
-        buf.write("\2\2\2\34\u0135\3\2\2\2\36\u015c\3\2\2\2 \u0160\3\2\2")
-        buf.write("\2\"\u0166\3\2\2\2$\u0168\3\2\2\2&\u017d\3\2\2\2(\u0189")
-        buf.write("\3\2\2\2*\u018b\3\2\2\2,\u0193\3\2\2\2.\u0195\3\2\2\2")
-        buf.write("\60\62\5\4\3\2\61\60\3\2\2\2\62\65\3\2\2\2\63\61\3\2\2")
-        buf.write("\2\63\64\3\2\2\2\64\66\3\2\2\2\65\63\3\2\2\2\66\67\7\2")
-        buf.write("\2\3\67\3\3\2\2\289\5\6\4\29:\7\3\2\2:I\3\2\2\2;<\5\b")
-        buf.write("\5\2<=\7\3\2\2=I\3\2\2\2>?\5\n\6\2?@\7\3\2\2@I\3\2\2\2")
-        buf.write("AB\5\16\b\2BC\7\3\2\2CI\3\2\2\2DE\7G\2\2EI\7\3\2\2FG\7")
-        buf.write("A\2\2GI\7\3\2\2H8\3\2\2\2H;\3\2\2\2H>\3\2\2\2HA\3\2\2")
-        buf.write("\2HD\3\2\2\2HF\3\2\2\2I\5\3\2\2\2JK\7\4\2\2KL\7\5\2\2")
-        buf.write("LY\7B\2\2MN\7\6\2\2NO\7\5\2\2OY\7B\2\2PQ\7\7\2\2QY\7\b")
-        buf.write("\2\2RS\7\t\2\2SY\7B\2\2TU\7\7\2\2UY\7\n\2\2VW\7\7\2\2")
-        buf.write("WY\7\13\2\2XJ\3\2\2\2XM\3\2\2\2XP\3\2\2\2XR\3\2\2\2XT")
-        buf.write("\3\2\2\2XV\3\2\2\2Y\7\3\2\2\2Z[\7\f\2\2[\\\7\r\2\2\\]")
-        buf.write("\7\16\2\2]^\7D\2\2^_\7\17\2\2_`\7\20\2\2`i\7B\2\2ab\7")
-        buf.write("\21\2\2bc\7\17\2\2cd\7\16\2\2de\7D\2\2ef\7\r\2\2fg\7\20")
-        buf.write("\2\2gi\7B\2\2hZ\3\2\2\2ha\3\2\2\2i\t\3\2\2\2jk\7\4\2\2")
-        buf.write("kl\7\20\2\2lm\7B\2\2mn\7\22\2\2no\5\20\t\2op\7\23\2\2")
-        buf.write("p\u0089\3\2\2\2qr\7\6\2\2rs\7\20\2\2s\u0089\7B\2\2tu\7")
-        buf.write("\24\2\2u\u0089\7B\2\2vw\7\25\2\2wx\7\26\2\2xy\7B\2\2y")
-        buf.write("z\7\27\2\2z\u0089\5\26\f\2{|\7\30\2\2|}\7\r\2\2}~\7B\2")
-        buf.write("\2~\177\7\31\2\2\177\u0089\5\34\17\2\u0080\u0081\7\32")
-        buf.write("\2\2\u0081\u0082\7B\2\2\u0082\u0083\7\33\2\2\u0083\u0084")
-        buf.write("\5$\23\2\u0084\u0085\7\31\2\2\u0085\u0086\5\34\17\2\u0086")
-        buf.write("\u0089\3\2\2\2\u0087\u0089\5\f\7\2\u0088j\3\2\2\2\u0088")
-        buf.write("q\3\2\2\2\u0088t\3\2\2\2\u0088v\3\2\2\2\u0088{\3\2\2\2")
-        buf.write("\u0088\u0080\3\2\2\2\u0088\u0087\3\2\2\2\u0089\13\3\2")
-        buf.write("\2\2\u008a\u008b\7\34\2\2\u008b\u008c\5&\24\2\u008c\u008d")
-        buf.write("\7\r\2\2\u008d\u0090\5*\26\2\u008e\u008f\7\31\2\2\u008f")
-        buf.write("\u0091\5\34\17\2\u0090\u008e\3\2\2\2\u0090\u0091\3\2\2")
-        buf.write("\2\u0091\u0095\3\2\2\2\u0092\u0093\7\35\2\2\u0093\u0094")
-        buf.write("\7\36\2\2\u0094\u0096\5 \21\2\u0095\u0092\3\2\2\2\u0095")
-        buf.write("\u0096\3\2\2\2\u0096\u009d\3\2\2\2\u0097\u0098\7\37\2")
-        buf.write("\2\u0098\u009b\7C\2\2\u0099\u009a\7 \2\2\u009a\u009c\7")
-        buf.write("C\2\2\u009b\u0099\3\2\2\2\u009b\u009c\3\2\2\2\u009c\u009e")
-        buf.write("\3\2\2\2\u009d\u0097\3\2\2\2\u009d\u009e\3\2\2\2\u009e")
-        buf.write("\r\3\2\2\2\u009f\u00a0\7!\2\2\u00a0\u00a1\7\20\2\2\u00a1")
-        buf.write("\u00a2\7B\2\2\u00a2\u00a3\7\"\2\2\u00a3\u00a4\7#\2\2\u00a4")
-        buf.write("\u00a5\7\22\2\2\u00a5\u00a6\5*\26\2\u00a6\u00a7\7\23\2")
-        buf.write("\2\u00a7\u00ec\3\2\2\2\u00a8\u00a9\7!\2\2\u00a9\u00aa")
-        buf.write("\7\20\2\2\u00aa\u00ab\7B\2\2\u00ab\u00ac\7\6\2\2\u00ac")
-        buf.write("\u00ad\7#\2\2\u00ad\u00ae\7\22\2\2\u00ae\u00af\5*\26\2")
-        buf.write("\u00af\u00b0\7\23\2\2\u00b0\u00ec\3\2\2\2\u00b1\u00b2")
-        buf.write("\7!\2\2\u00b2\u00b3\7\20\2\2\u00b3\u00b4\7B\2\2\u00b4")
-        buf.write("\u00b5\7\6\2\2\u00b5\u00b6\7$\2\2\u00b6\u00b8\7%\2\2\u00b7")
-        buf.write("\u00b9\7B\2\2\u00b8\u00b7\3\2\2\2\u00b8\u00b9\3\2\2\2")
-        buf.write("\u00b9\u00ec\3\2\2\2\u00ba\u00bb\7!\2\2\u00bb\u00bc\7")
-        buf.write("\20\2\2\u00bc\u00bd\7B\2\2\u00bd\u00be\7\6\2\2\u00be\u00bf")
-        buf.write("\7&\2\2\u00bf\u00c0\7%\2\2\u00c0\u00ec\7B\2\2\u00c1\u00c2")
-        buf.write("\7!\2\2\u00c2\u00c3\7\20\2\2\u00c3\u00c4\7B\2\2\u00c4")
-        buf.write("\u00c5\7\"\2\2\u00c5\u00c7\7\'\2\2\u00c6\u00c8\7B\2\2")
-        buf.write("\u00c7\u00c6\3\2\2\2\u00c7\u00c8\3\2\2\2\u00c8\u00c9\3")
-        buf.write("\2\2\2\u00c9\u00ca\7$\2\2\u00ca\u00cb\7%\2\2\u00cb\u00cc")
-        buf.write("\7\22\2\2\u00cc\u00cd\5*\26\2\u00cd\u00ce\7\23\2\2\u00ce")
-        buf.write("\u00ec\3\2\2\2\u00cf\u00d0\7!\2\2\u00d0\u00d1\7\20\2\2")
-        buf.write("\u00d1\u00d2\7B\2\2\u00d2\u00d3\7\"\2\2\u00d3\u00d5\7")
-        buf.write("\'\2\2\u00d4\u00d6\7B\2\2\u00d5\u00d4\3\2\2\2\u00d5\u00d6")
-        buf.write("\3\2\2\2\u00d6\u00d7\3\2\2\2\u00d7\u00d8\7&\2\2\u00d8")
-        buf.write("\u00d9\7%\2\2\u00d9\u00da\7\22\2\2\u00da\u00db\5*\26\2")
-        buf.write("\u00db\u00dc\7\23\2\2\u00dc\u00dd\7(\2\2\u00dd\u00de\7")
-        buf.write("B\2\2\u00de\u00df\7\22\2\2\u00df\u00e0\5*\26\2\u00e0\u00e1")
-        buf.write("\7\23\2\2\u00e1\u00ec\3\2\2\2\u00e2\u00e3\7!\2\2\u00e3")
-        buf.write("\u00e4\7\20\2\2\u00e4\u00e5\7B\2\2\u00e5\u00e6\7\"\2\2")
-        buf.write("\u00e6\u00e7\7)\2\2\u00e7\u00e8\7\22\2\2\u00e8\u00e9\5")
-        buf.write("*\26\2\u00e9\u00ea\7\23\2\2\u00ea\u00ec\3\2\2\2\u00eb")
-        buf.write("\u009f\3\2\2\2\u00eb\u00a8\3\2\2\2\u00eb\u00b1\3\2\2\2")
-        buf.write("\u00eb\u00ba\3\2\2\2\u00eb\u00c1\3\2\2\2\u00eb\u00cf\3")
-        buf.write("\2\2\2\u00eb\u00e2\3\2\2\2\u00ec\17\3\2\2\2\u00ed\u00f2")
-        buf.write("\5\22\n\2\u00ee\u00ef\7*\2\2\u00ef\u00f1\5\22\n\2\u00f0")
-        buf.write("\u00ee\3\2\2\2\u00f1\u00f4\3\2\2\2\u00f2\u00f0\3\2\2\2")
-        buf.write("\u00f2\u00f3\3\2\2\2\u00f3\21\3\2\2\2\u00f4\u00f2\3\2")
-        buf.write("\2\2\u00f5\u00f6\7B\2\2\u00f6\u00f9\5\24\13\2\u00f7\u00f8")
-        buf.write("\7+\2\2\u00f8\u00fa\7A\2\2\u00f9\u00f7\3\2\2\2\u00f9\u00fa")
-        buf.write("\3\2\2\2\u00fa\u00fd\3\2\2\2\u00fb\u00fc\7,\2\2\u00fc")
-        buf.write("\u00fe\5\32\16\2\u00fd\u00fb\3\2\2\2\u00fd\u00fe\3\2\2")
-        buf.write("\2\u00fe\u0117\3\2\2\2\u00ff\u0100\7$\2\2\u0100\u0102")
-        buf.write("\7%\2\2\u0101\u0103\7B\2\2\u0102\u0101\3\2\2\2\u0102\u0103")
-        buf.write("\3\2\2\2\u0103\u0104\3\2\2\2\u0104\u0105\7\22\2\2\u0105")
-        buf.write("\u0106\5*\26\2\u0106\u0107\7\23\2\2\u0107\u0117\3\2\2")
-        buf.write("\2\u0108\u0109\7&\2\2\u0109\u010b\7%\2\2\u010a\u010c\7")
-        buf.write("B\2\2\u010b\u010a\3\2\2\2\u010b\u010c\3\2\2\2\u010c\u010d")
-        buf.write("\3\2\2\2\u010d\u010e\7\22\2\2\u010e\u010f\5*\26\2\u010f")
-        buf.write("\u0110\7\23\2\2\u0110\u0111\7(\2\2\u0111\u0112\7B\2\2")
-        buf.write("\u0112\u0113\7\22\2\2\u0113\u0114\5*\26\2\u0114\u0115")
-        buf.write("\7\23\2\2\u0115\u0117\3\2\2\2\u0116\u00f5\3\2\2\2\u0116")
-        buf.write("\u00ff\3\2\2\2\u0116\u0108\3\2\2\2\u0117\23\3\2\2\2\u0118")
-        buf.write("\u011f\7-\2\2\u0119\u011a\7.\2\2\u011a\u011b\7\22\2\2")
-        buf.write("\u011b\u011c\7C\2\2\u011c\u011f\7\23\2\2\u011d\u011f\7")
-        buf.write("/\2\2\u011e\u0118\3\2\2\2\u011e\u0119\3\2\2\2\u011e\u011d")
-        buf.write("\3\2\2\2\u011f\25\3\2\2\2\u0120\u0125\5\30\r\2\u0121\u0122")
-        buf.write("\7*\2\2\u0122\u0124\5\30\r\2\u0123\u0121\3\2\2\2\u0124")
-        buf.write("\u0127\3\2\2\2\u0125\u0123\3\2\2\2\u0125\u0126\3\2\2\2")
-        buf.write("\u0126\27\3\2\2\2\u0127\u0125\3\2\2\2\u0128\u0129\7\22")
-        buf.write("\2\2\u0129\u012e\5\32\16\2\u012a\u012b\7*\2\2\u012b\u012d")
-        buf.write("\5\32\16\2\u012c\u012a\3\2\2\2\u012d\u0130\3\2\2\2\u012e")
-        buf.write("\u012c\3\2\2\2\u012e\u012f\3\2\2\2\u012f\u0131\3\2\2\2")
-        buf.write("\u0130\u012e\3\2\2\2\u0131\u0132\7\23\2\2\u0132\31\3\2")
-        buf.write("\2\2\u0133\u0134\t\2\2\2\u0134\33\3\2\2\2\u0135\u013a")
-        buf.write("\5\36\20\2\u0136\u0137\7\60\2\2\u0137\u0139\5\36\20\2")
-        buf.write("\u0138\u0136\3\2\2\2\u0139\u013c\3\2\2\2\u013a\u0138\3")
-        buf.write("\2\2\2\u013a\u013b\3\2\2\2\u013b\35\3\2\2\2\u013c\u013a")
-        buf.write("\3\2\2\2\u013d\u013e\5 \21\2\u013e\u013f\5,\27\2\u013f")
-        buf.write("\u0140\5\"\22\2\u0140\u015d\3\2\2\2\u0141\u0142\5 \21")
-        buf.write("\2\u0142\u0143\5,\27\2\u0143\u0144\7\22\2\2\u0144\u0145")
-        buf.write("\5\f\7\2\u0145\u0146\7\23\2\2\u0146\u015d\3\2\2\2\u0147")
-        buf.write("\u0148\5 \21\2\u0148\u014a\7\61\2\2\u0149\u014b\7+\2\2")
-        buf.write("\u014a\u0149\3\2\2\2\u014a\u014b\3\2\2\2\u014b\u014c\3")
-        buf.write("\2\2\2\u014c\u014d\7A\2\2\u014d\u015d\3\2\2\2\u014e\u014f")
-        buf.write("\5 \21\2\u014f\u0150\7\62\2\2\u0150\u0151\5\30\r\2\u0151")
-        buf.write("\u015d\3\2\2\2\u0152\u0153\5 \21\2\u0153\u0154\7\62\2")
-        buf.write("\2\u0154\u0155\7\22\2\2\u0155\u0156\5\f\7\2\u0156\u0157")
-        buf.write("\7\23\2\2\u0157\u015d\3\2\2\2\u0158\u0159\5 \21\2\u0159")
-        buf.write("\u015a\7\63\2\2\u015a\u015b\7D\2\2\u015b\u015d\3\2\2\2")
-        buf.write("\u015c\u013d\3\2\2\2\u015c\u0141\3\2\2\2\u015c\u0147\3")
-        buf.write("\2\2\2\u015c\u014e\3\2\2\2\u015c\u0152\3\2\2\2\u015c\u0158")
-        buf.write("\3\2\2\2\u015d\37\3\2\2\2\u015e\u015f\7B\2\2\u015f\u0161")
-        buf.write("\7\64\2\2\u0160\u015e\3\2\2\2\u0160\u0161\3\2\2\2\u0161")
-        buf.write("\u0162\3\2\2\2\u0162\u0163\7B\2\2\u0163!\3\2\2\2\u0164")
-        buf.write("\u0167\5\32\16\2\u0165\u0167\5 \21\2\u0166\u0164\3\2\2")
-        buf.write("\2\u0166\u0165\3\2\2\2\u0167#\3\2\2\2\u0168\u0169\7B\2")
-        buf.write("\2\u0169\u016a\7\66\2\2\u016a\u0171\5\32\16\2\u016b\u016c")
-        buf.write("\7*\2\2\u016c\u016d\7B\2\2\u016d\u016e\7\66\2\2\u016e")
-        buf.write("\u0170\5\32\16\2\u016f\u016b\3\2\2\2\u0170\u0173\3\2\2")
-        buf.write("\2\u0171\u016f\3\2\2\2\u0171\u0172\3\2\2\2\u0172%\3\2")
-        buf.write("\2\2\u0173\u0171\3\2\2\2\u0174\u017e\7\65\2\2\u0175\u017a")
-        buf.write("\5(\25\2\u0176\u0177\7*\2\2\u0177\u0179\5(\25\2\u0178")
-        buf.write("\u0176\3\2\2\2\u0179\u017c\3\2\2\2\u017a\u0178\3\2\2\2")
-        buf.write("\u017a\u017b\3\2\2\2\u017b\u017e\3\2\2\2\u017c\u017a\3")
-        buf.write("\2\2\2\u017d\u0174\3\2\2\2\u017d\u0175\3\2\2\2\u017e\'")
-        buf.write("\3\2\2\2\u017f\u018a\5 \21\2\u0180\u0181\5.\30\2\u0181")
-        buf.write("\u0182\7\22\2\2\u0182\u0183\5 \21\2\u0183\u0184\7\23\2")
-        buf.write("\2\u0184\u018a\3\2\2\2\u0185\u0186\7<\2\2\u0186\u0187")
-        buf.write("\7\22\2\2\u0187\u0188\7\65\2\2\u0188\u018a\7\23\2\2\u0189")
-        buf.write("\u017f\3\2\2\2\u0189\u0180\3\2\2\2\u0189\u0185\3\2\2\2")
-        buf.write("\u018a)\3\2\2\2\u018b\u0190\7B\2\2\u018c\u018d\7*\2\2")
-        buf.write("\u018d\u018f\7B\2\2\u018e\u018c\3\2\2\2\u018f\u0192\3")
-        buf.write("\2\2\2\u0190\u018e\3\2\2\2\u0190\u0191\3\2\2\2\u0191+")
-        buf.write("\3\2\2\2\u0192\u0190\3\2\2\2\u0193\u0194\t\3\2\2\u0194")
-        buf.write("-\3\2\2\2\u0195\u0196\t\4\2\2\u0196/\3\2\2\2\"\63HXh\u0088")
-        buf.write("\u0090\u0095\u009b\u009d\u00b8\u00c7\u00d5\u00eb\u00f2")
-        buf.write("\u00f9\u00fd\u0102\u010b\u0116\u011e\u0125\u012e\u013a")
-        buf.write("\u014a\u015c\u0160\u0166\u0171\u017a\u017d\u0189\u0190")
+        buf.write("\3\b\3\b\3\b\3\b\3\b\3\b\3\b\5\b\u00c2\n\b\3\b\3\b\3\b")
+        buf.write("\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\5\b\u00d2")
+        buf.write("\n\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\5")
+        buf.write("\b\u00e0\n\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3")
+        buf.write("\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\5\b\u00f6\n\b\3")
+        buf.write("\t\3\t\3\t\3\t\3\t\3\t\3\t\3\t\3\t\3\t\3\t\3\t\3\t\3\t")
+        buf.write("\5\t\u0106\n\t\3\t\3\t\5\t\u010a\n\t\3\t\3\t\5\t\u010e")
+        buf.write("\n\t\3\t\3\t\3\t\3\t\3\t\3\t\3\t\3\t\5\t\u0118\n\t\3\t")
+        buf.write("\3\t\3\t\3\t\3\t\3\t\3\t\3\t\3\t\3\t\3\t\3\t\3\t\3\t\3")
+        buf.write("\t\3\t\5\t\u012a\n\t\3\n\3\n\3\n\7\n\u012f\n\n\f\n\16")
+        buf.write("\n\u0132\13\n\3\13\3\13\3\13\3\13\5\13\u0138\n\13\3\13")
+        buf.write("\3\13\5\13\u013c\n\13\3\13\3\13\3\13\5\13\u0141\n\13\3")
+        buf.write("\13\3\13\3\13\3\13\3\13\3\13\3\13\5\13\u014a\n\13\3\13")
+        buf.write("\3\13\3\13\3\13\3\13\3\13\3\13\3\13\3\13\5\13\u0155\n")
+        buf.write("\13\3\f\3\f\3\f\3\f\3\f\3\f\5\f\u015d\n\f\3\r\3\r\3\r")
+        buf.write("\7\r\u0162\n\r\f\r\16\r\u0165\13\r\3\16\3\16\3\16\3\16")
+        buf.write("\7\16\u016b\n\16\f\16\16\16\u016e\13\16\3\16\3\16\3\17")
+        buf.write("\3\17\3\20\3\20\3\20\7\20\u0177\n\20\f\20\16\20\u017a")
+        buf.write("\13\20\3\21\3\21\3\21\3\21\3\21\3\21\3\21\3\21\3\21\3")
+        buf.write("\21\3\21\3\21\3\21\5\21\u0189\n\21\3\21\3\21\3\21\3\21")
+        buf.write("\3\21\3\21\3\21\3\21\3\21\3\21\3\21\3\21\3\21\3\21\3\21")
+        buf.write("\3\21\5\21\u019b\n\21\3\22\3\22\3\22\5\22\u01a0\n\22\3")
+        buf.write("\22\3\22\3\23\3\23\5\23\u01a6\n\23\3\24\3\24\3\24\3\24")
+        buf.write("\3\24\3\24\3\24\3\24\7\24\u01b0\n\24\f\24\16\24\u01b3")
+        buf.write("\13\24\3\25\3\25\3\25\3\25\7\25\u01b9\n\25\f\25\16\25")
+        buf.write("\u01bc\13\25\5\25\u01be\n\25\3\26\3\26\3\26\3\26\3\26")
+        buf.write("\3\26\3\26\3\26\3\26\3\26\5\26\u01ca\n\26\3\27\3\27\3")
+        buf.write("\27\7\27\u01cf\n\27\f\27\16\27\u01d2\13\27\3\30\3\30\3")
+        buf.write("\31\3\31\3\32\3\32\3\32\2\2\33\2\4\6\b\n\f\16\20\22\24")
+        buf.write("\26\30\32\34\36 \"$&(*,.\60\62\2\7\3\2\63\64\4\2LLNP\4")
+        buf.write("\2*\64MM\3\2AF\3\2GK\2\u0206\2\67\3\2\2\2\4O\3\2\2\2\6")
+        buf.write("_\3\2\2\2\bo\3\2\2\2\n\u0091\3\2\2\2\f\u0093\3\2\2\2\16")
+        buf.write("\u00f5\3\2\2\2\20\u0129\3\2\2\2\22\u012b\3\2\2\2\24\u0154")
+        buf.write("\3\2\2\2\26\u015c\3\2\2\2\30\u015e\3\2\2\2\32\u0166\3")
+        buf.write("\2\2\2\34\u0171\3\2\2\2\36\u0173\3\2\2\2 \u019a\3\2\2")
+        buf.write("\2\"\u019f\3\2\2\2$\u01a5\3\2\2\2&\u01a7\3\2\2\2(\u01bd")
+        buf.write("\3\2\2\2*\u01c9\3\2\2\2,\u01cb\3\2\2\2.\u01d3\3\2\2\2")
+        buf.write("\60\u01d5\3\2\2\2\62\u01d7\3\2\2\2\64\66\5\4\3\2\65\64")
+        buf.write("\3\2\2\2\669\3\2\2\2\67\65\3\2\2\2\678\3\2\2\28:\3\2\2")
+        buf.write("\29\67\3\2\2\2:;\7\2\2\3;\3\3\2\2\2<=\5\6\4\2=>\7\3\2")
+        buf.write("\2>P\3\2\2\2?@\5\b\5\2@A\7\3\2\2AP\3\2\2\2BC\5\n\6\2C")
+        buf.write("D\7\3\2\2DP\3\2\2\2EF\5\16\b\2FG\7\3\2\2GP\3\2\2\2HI\5")
+        buf.write("\20\t\2IJ\7\3\2\2JP\3\2\2\2KL\7R\2\2LP\7\3\2\2MN\7L\2")
+        buf.write("\2NP\7\3\2\2O<\3\2\2\2O?\3\2\2\2OB\3\2\2\2OE\3\2\2\2O")
+        buf.write("H\3\2\2\2OK\3\2\2\2OM\3\2\2\2P\5\3\2\2\2QR\7\4\2\2RS\7")
+        buf.write("\5\2\2S`\5.\30\2TU\7\6\2\2UV\7\5\2\2V`\5.\30\2WX\7\7\2")
+        buf.write("\2X`\7\b\2\2YZ\7\t\2\2Z`\5.\30\2[\\\7\7\2\2\\`\7\n\2\2")
+        buf.write("]^\7\7\2\2^`\7\13\2\2_Q\3\2\2\2_T\3\2\2\2_W\3\2\2\2_Y")
+        buf.write("\3\2\2\2_[\3\2\2\2_]\3\2\2\2`\7\3\2\2\2ab\7\f\2\2bc\7")
+        buf.write("\r\2\2cd\7\16\2\2de\7O\2\2ef\7\17\2\2fg\7\20\2\2gp\5.")
+        buf.write("\30\2hi\7\21\2\2ij\7\17\2\2jk\7\16\2\2kl\7O\2\2lm\7\r")
+        buf.write("\2\2mn\7\20\2\2np\5.\30\2oa\3\2\2\2oh\3\2\2\2p\t\3\2\2")
+        buf.write("\2qr\7\4\2\2rs\7\20\2\2st\5.\30\2tu\7\22\2\2uv\5\22\n")
+        buf.write("\2vw\7\23\2\2w\u0092\3\2\2\2xy\7\6\2\2yz\7\20\2\2z\u0092")
+        buf.write("\5.\30\2{|\7\24\2\2|\u0092\5.\30\2}~\7\25\2\2~\177\7\26")
+        buf.write("\2\2\177\u0080\5.\30\2\u0080\u0081\7\27\2\2\u0081\u0082")
+        buf.write("\5\30\r\2\u0082\u0092\3\2\2\2\u0083\u0084\7\30\2\2\u0084")
+        buf.write("\u0085\7\r\2\2\u0085\u0086\5.\30\2\u0086\u0087\7\31\2")
+        buf.write("\2\u0087\u0088\5\36\20\2\u0088\u0092\3\2\2\2\u0089\u008a")
+        buf.write("\7\32\2\2\u008a\u008b\5.\30\2\u008b\u008c\7\33\2\2\u008c")
+        buf.write("\u008d\5&\24\2\u008d\u008e\7\31\2\2\u008e\u008f\5\36\20")
+        buf.write("\2\u008f\u0092\3\2\2\2\u0090\u0092\5\f\7\2\u0091q\3\2")
+        buf.write("\2\2\u0091x\3\2\2\2\u0091{\3\2\2\2\u0091}\3\2\2\2\u0091")
+        buf.write("\u0083\3\2\2\2\u0091\u0089\3\2\2\2\u0091\u0090\3\2\2\2")
+        buf.write("\u0092\13\3\2\2\2\u0093\u0094\7\34\2\2\u0094\u0095\5(")
+        buf.write("\25\2\u0095\u0096\7\r\2\2\u0096\u0099\5,\27\2\u0097\u0098")
+        buf.write("\7\31\2\2\u0098\u009a\5\36\20\2\u0099\u0097\3\2\2\2\u0099")
+        buf.write("\u009a\3\2\2\2\u009a\u009e\3\2\2\2\u009b\u009c\7\35\2")
+        buf.write("\2\u009c\u009d\7\36\2\2\u009d\u009f\5\"\22\2\u009e\u009b")
+        buf.write("\3\2\2\2\u009e\u009f\3\2\2\2\u009f\u00a6\3\2\2\2\u00a0")
+        buf.write("\u00a1\7\37\2\2\u00a1\u00a4\7N\2\2\u00a2\u00a3\7 \2\2")
+        buf.write("\u00a3\u00a5\7N\2\2\u00a4\u00a2\3\2\2\2\u00a4\u00a5\3")
+        buf.write("\2\2\2\u00a5\u00a7\3\2\2\2\u00a6\u00a0\3\2\2\2\u00a6\u00a7")
+        buf.write("\3\2\2\2\u00a7\r\3\2\2\2\u00a8\u00a9\7!\2\2\u00a9\u00aa")
+        buf.write("\7\20\2\2\u00aa\u00ab\5.\30\2\u00ab\u00ac\7\"\2\2\u00ac")
+        buf.write("\u00ad\7#\2\2\u00ad\u00ae\7\22\2\2\u00ae\u00af\5,\27\2")
+        buf.write("\u00af\u00b0\7\23\2\2\u00b0\u00f6\3\2\2\2\u00b1\u00b2")
+        buf.write("\7!\2\2\u00b2\u00b3\7\20\2\2\u00b3\u00b4\5.\30\2\u00b4")
+        buf.write("\u00b5\7\6\2\2\u00b5\u00b6\7#\2\2\u00b6\u00b7\7\22\2\2")
+        buf.write("\u00b7\u00b8\5,\27\2\u00b8\u00b9\7\23\2\2\u00b9\u00f6")
+        buf.write("\3\2\2\2\u00ba\u00bb\7!\2\2\u00bb\u00bc\7\20\2\2\u00bc")
+        buf.write("\u00bd\5.\30\2\u00bd\u00be\7\6\2\2\u00be\u00bf\7$\2\2")
+        buf.write("\u00bf\u00c1\7%\2\2\u00c0\u00c2\5.\30\2\u00c1\u00c0\3")
+        buf.write("\2\2\2\u00c1\u00c2\3\2\2\2\u00c2\u00f6\3\2\2\2\u00c3\u00c4")
+        buf.write("\7!\2\2\u00c4\u00c5\7\20\2\2\u00c5\u00c6\5.\30\2\u00c6")
+        buf.write("\u00c7\7\6\2\2\u00c7\u00c8\7&\2\2\u00c8\u00c9\7%\2\2\u00c9")
+        buf.write("\u00ca\5.\30\2\u00ca\u00f6\3\2\2\2\u00cb\u00cc\7!\2\2")
+        buf.write("\u00cc\u00cd\7\20\2\2\u00cd\u00ce\5.\30\2\u00ce\u00cf")
+        buf.write("\7\"\2\2\u00cf\u00d1\7\'\2\2\u00d0\u00d2\5.\30\2\u00d1")
+        buf.write("\u00d0\3\2\2\2\u00d1\u00d2\3\2\2\2\u00d2\u00d3\3\2\2\2")
+        buf.write("\u00d3\u00d4\7$\2\2\u00d4\u00d5\7%\2\2\u00d5\u00d6\7\22")
+        buf.write("\2\2\u00d6\u00d7\5,\27\2\u00d7\u00d8\7\23\2\2\u00d8\u00f6")
+        buf.write("\3\2\2\2\u00d9\u00da\7!\2\2\u00da\u00db\7\20\2\2\u00db")
+        buf.write("\u00dc\5.\30\2\u00dc\u00dd\7\"\2\2\u00dd\u00df\7\'\2\2")
+        buf.write("\u00de\u00e0\5.\30\2\u00df\u00de\3\2\2\2\u00df\u00e0\3")
+        buf.write("\2\2\2\u00e0\u00e1\3\2\2\2\u00e1\u00e2\7&\2\2\u00e2\u00e3")
+        buf.write("\7%\2\2\u00e3\u00e4\7\22\2\2\u00e4\u00e5\5,\27\2\u00e5")
+        buf.write("\u00e6\7\23\2\2\u00e6\u00e7\7(\2\2\u00e7\u00e8\5.\30\2")
+        buf.write("\u00e8\u00e9\7\22\2\2\u00e9\u00ea\5,\27\2\u00ea\u00eb")
+        buf.write("\7\23\2\2\u00eb\u00f6\3\2\2\2\u00ec\u00ed\7!\2\2\u00ed")
+        buf.write("\u00ee\7\20\2\2\u00ee\u00ef\5.\30\2\u00ef\u00f0\7\"\2")
+        buf.write("\2\u00f0\u00f1\7)\2\2\u00f1\u00f2\7\22\2\2\u00f2\u00f3")
+        buf.write("\5,\27\2\u00f3\u00f4\7\23\2\2\u00f4\u00f6\3\2\2\2\u00f5")
+        buf.write("\u00a8\3\2\2\2\u00f5\u00b1\3\2\2\2\u00f5\u00ba\3\2\2\2")
+        buf.write("\u00f5\u00c3\3\2\2\2\u00f5\u00cb\3\2\2\2\u00f5\u00d9\3")
+        buf.write("\2\2\2\u00f5\u00ec\3\2\2\2\u00f6\17\3\2\2\2\u00f7\u00f8")
+        buf.write("\7\7\2\2\u00f8\u00f9\7*\2\2\u00f9\u012a\7+\2\2\u00fa\u00fb")
+        buf.write("\7,\2\2\u00fb\u00fc\7*\2\2\u00fc\u012a\7+\2\2\u00fd\u00fe")
+        buf.write("\7\33\2\2\u00fe\u00ff\7*\2\2\u00ff\u0100\7-\2\2\u0100")
+        buf.write("\u0105\5.\30\2\u0101\u0102\7\22\2\2\u0102\u0103\5,\27")
+        buf.write("\2\u0103\u0104\7\23\2\2\u0104\u0106\3\2\2\2\u0105\u0101")
+        buf.write("\3\2\2\2\u0105\u0106\3\2\2\2\u0106\u0109\3\2\2\2\u0107")
+        buf.write("\u0108\7.\2\2\u0108\u010a\7N\2\2\u0109\u0107\3\2\2\2\u0109")
+        buf.write("\u010a\3\2\2\2\u010a\u010d\3\2\2\2\u010b\u010c\7\37\2")
+        buf.write("\2\u010c\u010e\7N\2\2\u010d\u010b\3\2\2\2\u010d\u010e")
+        buf.write("\3\2\2\2\u010e\u012a\3\2\2\2\u010f\u0110\7\6\2\2\u0110")
+        buf.write("\u0111\7*\2\2\u0111\u0112\7-\2\2\u0112\u0117\5.\30\2\u0113")
+        buf.write("\u0114\7\22\2\2\u0114\u0115\5,\27\2\u0115\u0116\7\23\2")
+        buf.write("\2\u0116\u0118\3\2\2\2\u0117\u0113\3\2\2\2\u0117\u0118")
+        buf.write("\3\2\2\2\u0118\u012a\3\2\2\2\u0119\u011a\7\7\2\2\u011a")
+        buf.write("\u011b\7*\2\2\u011b\u012a\7/\2\2\u011c\u011d\7\33\2\2")
+        buf.write("\u011d\u011e\7\60\2\2\u011e\u011f\7\61\2\2\u011f\u012a")
+        buf.write("\7N\2\2\u0120\u0121\7\33\2\2\u0121\u0122\7\62\2\2\u0122")
+        buf.write("\u012a\t\2\2\2\u0123\u0124\7\7\2\2\u0124\u0125\7\62\2")
+        buf.write("\2\u0125\u012a\7+\2\2\u0126\u0127\7,\2\2\u0127\u0128\7")
+        buf.write("\62\2\2\u0128\u012a\7+\2\2\u0129\u00f7\3\2\2\2\u0129\u00fa")
+        buf.write("\3\2\2\2\u0129\u00fd\3\2\2\2\u0129\u010f\3\2\2\2\u0129")
+        buf.write("\u0119\3\2\2\2\u0129\u011c\3\2\2\2\u0129\u0120\3\2\2\2")
+        buf.write("\u0129\u0123\3\2\2\2\u0129\u0126\3\2\2\2\u012a\21\3\2")
+        buf.write("\2\2\u012b\u0130\5\24\13\2\u012c\u012d\7\65\2\2\u012d")
+        buf.write("\u012f\5\24\13\2\u012e\u012c\3\2\2\2\u012f\u0132\3\2\2")
+        buf.write("\2\u0130\u012e\3\2\2\2\u0130\u0131\3\2\2\2\u0131\23\3")
+        buf.write("\2\2\2\u0132\u0130\3\2\2\2\u0133\u0134\5.\30\2\u0134\u0137")
+        buf.write("\5\26\f\2\u0135\u0136\7\66\2\2\u0136\u0138\7L\2\2\u0137")
+        buf.write("\u0135\3\2\2\2\u0137\u0138\3\2\2\2\u0138\u013b\3\2\2\2")
+        buf.write("\u0139\u013a\7\67\2\2\u013a\u013c\5\34\17\2\u013b\u0139")
+        buf.write("\3\2\2\2\u013b\u013c\3\2\2\2\u013c\u0155\3\2\2\2\u013d")
+        buf.write("\u013e\7$\2\2\u013e\u0140\7%\2\2\u013f\u0141\5.\30\2\u0140")
+        buf.write("\u013f\3\2\2\2\u0140\u0141\3\2\2\2\u0141\u0142\3\2\2\2")
+        buf.write("\u0142\u0143\7\22\2\2\u0143\u0144\5,\27\2\u0144\u0145")
+        buf.write("\7\23\2\2\u0145\u0155\3\2\2\2\u0146\u0147\7&\2\2\u0147")
+        buf.write("\u0149\7%\2\2\u0148\u014a\5.\30\2\u0149\u0148\3\2\2\2")
+        buf.write("\u0149\u014a\3\2\2\2\u014a\u014b\3\2\2\2\u014b\u014c\7")
+        buf.write("\22\2\2\u014c\u014d\5,\27\2\u014d\u014e\7\23\2\2\u014e")
+        buf.write("\u014f\7(\2\2\u014f\u0150\5.\30\2\u0150\u0151\7\22\2\2")
+        buf.write("\u0151\u0152\5,\27\2\u0152\u0153\7\23\2\2\u0153\u0155")
+        buf.write("\3\2\2\2\u0154\u0133\3\2\2\2\u0154\u013d\3\2\2\2\u0154")
+        buf.write("\u0146\3\2\2\2\u0155\25\3\2\2\2\u0156\u015d\78\2\2\u0157")
+        buf.write("\u0158\79\2\2\u0158\u0159\7\22\2\2\u0159\u015a\7N\2\2")
+        buf.write("\u015a\u015d\7\23\2\2\u015b\u015d\7:\2\2\u015c\u0156\3")
+        buf.write("\2\2\2\u015c\u0157\3\2\2\2\u015c\u015b\3\2\2\2\u015d\27")
+        buf.write("\3\2\2\2\u015e\u0163\5\32\16\2\u015f\u0160\7\65\2\2\u0160")
+        buf.write("\u0162\5\32\16\2\u0161\u015f\3\2\2\2\u0162\u0165\3\2\2")
+        buf.write("\2\u0163\u0161\3\2\2\2\u0163\u0164\3\2\2\2\u0164\31\3")
+        buf.write("\2\2\2\u0165\u0163\3\2\2\2\u0166\u0167\7\22\2\2\u0167")
+        buf.write("\u016c\5\34\17\2\u0168\u0169\7\65\2\2\u0169\u016b\5\34")
+        buf.write("\17\2\u016a\u0168\3\2\2\2\u016b\u016e\3\2\2\2\u016c\u016a")
+        buf.write("\3\2\2\2\u016c\u016d\3\2\2\2\u016d\u016f\3\2\2\2\u016e")
+        buf.write("\u016c\3\2\2\2\u016f\u0170\7\23\2\2\u0170\33\3\2\2\2\u0171")
+        buf.write("\u0172\t\3\2\2\u0172\35\3\2\2\2\u0173\u0178\5 \21\2\u0174")
+        buf.write("\u0175\7;\2\2\u0175\u0177\5 \21\2\u0176\u0174\3\2\2\2")
+        buf.write("\u0177\u017a\3\2\2\2\u0178\u0176\3\2\2\2\u0178\u0179\3")
+        buf.write("\2\2\2\u0179\37\3\2\2\2\u017a\u0178\3\2\2\2\u017b\u017c")
+        buf.write("\5\"\22\2\u017c\u017d\5\60\31\2\u017d\u017e\5$\23\2\u017e")
+        buf.write("\u019b\3\2\2\2\u017f\u0180\5\"\22\2\u0180\u0181\5\60\31")
+        buf.write("\2\u0181\u0182\7\22\2\2\u0182\u0183\5\f\7\2\u0183\u0184")
+        buf.write("\7\23\2\2\u0184\u019b\3\2\2\2\u0185\u0186\5\"\22\2\u0186")
+        buf.write("\u0188\7<\2\2\u0187\u0189\7\66\2\2\u0188\u0187\3\2\2\2")
+        buf.write("\u0188\u0189\3\2\2\2\u0189\u018a\3\2\2\2\u018a\u018b\7")
+        buf.write("L\2\2\u018b\u019b\3\2\2\2\u018c\u018d\5\"\22\2\u018d\u018e")
+        buf.write("\7=\2\2\u018e\u018f\5\32\16\2\u018f\u019b\3\2\2\2\u0190")
+        buf.write("\u0191\5\"\22\2\u0191\u0192\7=\2\2\u0192\u0193\7\22\2")
+        buf.write("\2\u0193\u0194\5\f\7\2\u0194\u0195\7\23\2\2\u0195\u019b")
+        buf.write("\3\2\2\2\u0196\u0197\5\"\22\2\u0197\u0198\7>\2\2\u0198")
+        buf.write("\u0199\7O\2\2\u0199\u019b\3\2\2\2\u019a\u017b\3\2\2\2")
+        buf.write("\u019a\u017f\3\2\2\2\u019a\u0185\3\2\2\2\u019a\u018c\3")
+        buf.write("\2\2\2\u019a\u0190\3\2\2\2\u019a\u0196\3\2\2\2\u019b!")
+        buf.write("\3\2\2\2\u019c\u019d\5.\30\2\u019d\u019e\7?\2\2\u019e")
+        buf.write("\u01a0\3\2\2\2\u019f\u019c\3\2\2\2\u019f\u01a0\3\2\2\2")
+        buf.write("\u01a0\u01a1\3\2\2\2\u01a1\u01a2\5.\30\2\u01a2#\3\2\2")
+        buf.write("\2\u01a3\u01a6\5\34\17\2\u01a4\u01a6\5\"\22\2\u01a5\u01a3")
+        buf.write("\3\2\2\2\u01a5\u01a4\3\2\2\2\u01a6%\3\2\2\2\u01a7\u01a8")
+        buf.write("\5.\30\2\u01a8\u01a9\7A\2\2\u01a9\u01b1\5\34\17\2\u01aa")
+        buf.write("\u01ab\7\65\2\2\u01ab\u01ac\5.\30\2\u01ac\u01ad\7A\2\2")
+        buf.write("\u01ad\u01ae\5\34\17\2\u01ae\u01b0\3\2\2\2\u01af\u01aa")
+        buf.write("\3\2\2\2\u01b0\u01b3\3\2\2\2\u01b1\u01af\3\2\2\2\u01b1")
+        buf.write("\u01b2\3\2\2\2\u01b2\'\3\2\2\2\u01b3\u01b1\3\2\2\2\u01b4")
+        buf.write("\u01be\7@\2\2\u01b5\u01ba\5*\26\2\u01b6\u01b7\7\65\2\2")
+        buf.write("\u01b7\u01b9\5*\26\2\u01b8\u01b6\3\2\2\2\u01b9\u01bc\3")
+        buf.write("\2\2\2\u01ba\u01b8\3\2\2\2\u01ba\u01bb\3\2\2\2\u01bb\u01be")
+        buf.write("\3\2\2\2\u01bc\u01ba\3\2\2\2\u01bd\u01b4\3\2\2\2\u01bd")
+        buf.write("\u01b5\3\2\2\2\u01be)\3\2\2\2\u01bf\u01ca\5\"\22\2\u01c0")
+        buf.write("\u01c1\5\62\32\2\u01c1\u01c2\7\22\2\2\u01c2\u01c3\5\"")
+        buf.write("\22\2\u01c3\u01c4\7\23\2\2\u01c4\u01ca\3\2\2\2\u01c5\u01c6")
+        buf.write("\7G\2\2\u01c6\u01c7\7\22\2\2\u01c7\u01c8\7@\2\2\u01c8")
+        buf.write("\u01ca\7\23\2\2\u01c9\u01bf\3\2\2\2\u01c9\u01c0\3\2\2")
+        buf.write("\2\u01c9\u01c5\3\2\2\2\u01ca+\3\2\2\2\u01cb\u01d0\5.\30")
+        buf.write("\2\u01cc\u01cd\7\65\2\2\u01cd\u01cf\5.\30\2\u01ce\u01cc")
+        buf.write("\3\2\2\2\u01cf\u01d2\3\2\2\2\u01d0\u01ce\3\2\2\2\u01d0")
+        buf.write("\u01d1\3\2\2\2\u01d1-\3\2\2\2\u01d2\u01d0\3\2\2\2\u01d3")
+        buf.write("\u01d4\t\4\2\2\u01d4/\3\2\2\2\u01d5\u01d6\t\5\2\2\u01d6")
+        buf.write("\61\3\2\2\2\u01d7\u01d8\t\6\2\2\u01d8\63\3\2\2\2\'\67")
+        buf.write("O_o\u0091\u0099\u009e\u00a4\u00a6\u00c1\u00d1\u00df\u00f5")
+        buf.write("\u0105\u0109\u010d\u0117\u0129\u0130\u0137\u013b\u0140")
+        buf.write("\u0149\u0154\u015c\u0163\u016c\u0178\u0188\u019a\u019f")
+        buf.write("\u01a5\u01b1\u01ba\u01bd\u01c9\u01d0")
         return buf.getvalue()
 
 
@@ -212,7 +249,9 @@ class SQLParser ( Parser ):
                      "'DELETE'", "'WHERE'", "'UPDATE'", "'SET'", "'SELECT'", 
                      "'GROUP'", "'BY'", "'LIMIT'", "'OFFSET'", "'ALTER'", 
                      "'ADD'", "'INDEX'", "'PRIMARY'", "'KEY'", "'FOREIGN'", 
-                     "'CONSTRAINT'", "'REFERENCES'", "'UNIQUE'", "','", 
+                     "'CONSTRAINT'", "'REFERENCES'", "'UNIQUE'", "'BUFFER'", 
+                     "'STATS'", "'RESET'", "'QUOTA'", "'RESERVE'", "'QUOTAS'", 
+                     "'PAGE'", "'SIZE'", "'TRACE'", "'ON'", "'OFF'", "','", 
                      "'NOT'", "'DEFAULT'", "'INT'", "'VARCHAR'", "'FLOAT'", 
                      "'AND'", "'IS'", "'IN'", "'LIKE'", "'.'", "'*'", "'='", 
                      "'<'", "'<='", "'>'", "'>='", "'<>'", "'COUNT'", "'AVG'", 
@@ -231,10 +270,12 @@ class SQLParser ( Parser ):
                       "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
                       "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
                       "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
-                      "EqualOrAssign", "Less", "LessEqual", "Greater", "GreaterEqual", 
-                      "NotEqual", "Count", "Average", "Max", "Min", "Sum", 
-                      "Null", "Identifier", "Integer", "String", "Float", 
-                      "Whitespace", "Annotation" ]
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "EqualOrAssign", 
+                      "Less", "LessEqual", "Greater", "GreaterEqual", "NotEqual", 
+                      "Count", "Average", "Max", "Min", "Sum", "Null", "Identifier", 
+                      "Integer", "String", "Float", "Whitespace", "Annotation" ]
 
     RULE_program = 0
     RULE_statement = 1
@@ -243,29 +284,31 @@ class SQLParser ( Parser ):
     RULE_table_statement = 4
     RULE_select_table = 5
     RULE_alter_statement = 6
-    RULE_field_list = 7
-    RULE_field = 8
-    RULE_type_ = 9
-    RULE_value_lists = 10
-    RULE_value_list = 11
-    RULE_value = 12
-    RULE_where_and_clause = 13
-    RULE_where_clause = 14
-    RULE_column = 15
-    RULE_expression = 16
-    RULE_set_clause = 17
-    RULE_selectors = 18
-    RULE_selector = 19
-    RULE_identifiers = 20
-    RULE_operator_ = 21
-    RULE_aggregator = 22
+    RULE_system_statement = 7
+    RULE_field_list = 8
+    RULE_field = 9
+    RULE_type_ = 10
+    RULE_value_lists = 11
+    RULE_value_list = 12
+    RULE_value = 13
+    RULE_where_and_clause = 14
+    RULE_where_clause = 15
+    RULE_column = 16
+    RULE_expression = 17
+    RULE_set_clause = 18
+    RULE_selectors = 19
+    RULE_selector = 20
+    RULE_identifiers = 21
+    RULE_identifier = 22
+    RULE_operator_ = 23
+    RULE_aggregator = 24
 
     ruleNames =  [ "program", "statement", "db_statement", "io_statement", 
                    "table_statement", "select_table", "alter_statement", 
-                   "field_list", "field", "type_", "value_lists", "value_list", 
-                   "value", "where_and_clause", "where_clause", "column", 
-                   "expression", "set_clause", "selectors", "selector", 
-                   "identifiers", "operator_", "aggregator" ]
+                   "system_statement", "field_list", "field", "type_", "value_lists", 
+                   "value_list", "value", "where_and_clause", "where_clause", 
+                   "column", "expression", "set_clause", "selectors", "selector", 
+                   "identifiers", "identifier", "operator_", "aggregator" ]
 
     EOF = Token.EOF
     T__0=1
@@ -319,24 +362,35 @@ class SQLParser ( Parser ):
     T__48=49
     T__49=50
     T__50=51
-    EqualOrAssign=52
-    Less=53
-    LessEqual=54
-    Greater=55
-    GreaterEqual=56
-    NotEqual=57
-    Count=58
-    Average=59
-    Max=60
-    Min=61
-    Sum=62
-    Null=63
-    Identifier=64
-    Integer=65
-    String=66
-    Float=67
-    Whitespace=68
-    Annotation=69
+    T__51=52
+    T__52=53
+    T__53=54
+    T__54=55
+    T__55=56
+    T__56=57
+    T__57=58
+    T__58=59
+    T__59=60
+    T__60=61
+    T__61=62
+    EqualOrAssign=63
+    Less=64
+    LessEqual=65
+    Greater=66
+    GreaterEqual=67
+    NotEqual=68
+    Count=69
+    Average=70
+    Max=71
+    Min=72
+    Sum=73
+    Null=74
+    Identifier=75
+    Integer=76
+    String=77
+    Float=78
+    Whitespace=79
+    Annotation=80
 
     def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
         super().__init__(input, output)
@@ -389,17 +443,17 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 49
+            self.state = 53
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << SQLParser.T__1) | (1 << SQLParser.T__3) | (1 << SQLParser.T__4) | (1 << SQLParser.T__6) | (1 << SQLParser.T__9) | (1 << SQLParser.T__14) | (1 << SQLParser.T__17) | (1 << SQLParser.T__18) | (1 << SQLParser.T__21) | (1 << SQLParser.T__23) | (1 << SQLParser.T__25) | (1 << SQLParser.T__30) | (1 << SQLParser.Null))) != 0) or _la==SQLParser.Annotation:
-                self.state = 46
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << SQLParser.T__1) | (1 << SQLParser.T__3) | (1 << SQLParser.T__4) | (1 << SQLParser.T__6) | (1 << SQLParser.T__9) | (1 << SQLParser.T__14) | (1 << SQLParser.T__17) | (1 << SQLParser.T__18) | (1 << SQLParser.T__21) | (1 << SQLParser.T__23) | (1 << SQLParser.T__24) | (1 << SQLParser.T__25) | (1 << SQLParser.T__30) | (1 << SQLParser.T__41))) != 0) or _la==SQLParser.Null or _la==SQLParser.Annotation:
+                self.state = 50
                 self.statement()
-                self.state = 51
+                self.state = 55
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 52
+            self.state = 56
             self.match(SQLParser.EOF)
         except RecognitionException as re:
             localctx.exception = re
@@ -431,6 +485,10 @@ class SQLParser ( Parser ):
             return self.getTypedRuleContext(SQLParser.Alter_statementContext,0)
 
 
+        def system_statement(self):
+            return self.getTypedRuleContext(SQLParser.System_statementContext,0)
+
+
         def Annotation(self):
             return self.getToken(SQLParser.Annotation, 0)
 
@@ -462,54 +520,62 @@ class SQLParser ( Parser ):
         localctx = SQLParser.StatementContext(self, self._ctx, self.state)
         self.enterRule(localctx, 2, self.RULE_statement)
         try:
-            self.state = 70
+            self.state = 77
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,1,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 54
+                self.state = 58
                 self.db_statement()
-                self.state = 55
+                self.state = 59
                 self.match(SQLParser.T__0)
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 57
+                self.state = 61
                 self.io_statement()
-                self.state = 58
+                self.state = 62
                 self.match(SQLParser.T__0)
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 60
+                self.state = 64
                 self.table_statement()
-                self.state = 61
+                self.state = 65
                 self.match(SQLParser.T__0)
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 63
+                self.state = 67
                 self.alter_statement()
-                self.state = 64
+                self.state = 68
                 self.match(SQLParser.T__0)
                 pass
 
             elif la_ == 5:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 66
-                self.match(SQLParser.Annotation)
-                self.state = 67
+                self.state = 70
+                self.system_statement()
+                self.state = 71
                 self.match(SQLParser.T__0)
                 pass
 
             elif la_ == 6:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 68
+                self.state = 73
+                self.match(SQLParser.Annotation)
+                self.state = 74
+                self.match(SQLParser.T__0)
+                pass
+
+            elif la_ == 7:
+                self.enterOuterAlt(localctx, 7)
+                self.state = 75
                 self.match(SQLParser.Null)
-                self.state = 69
+                self.state = 76
                 self.match(SQLParser.T__0)
                 pass
 
@@ -566,8 +632,9 @@ class SQLParser ( Parser ):
             super().__init__(parser)
             self.copyFrom(ctx)
 
-        def Identifier(self):
-            return self.getToken(SQLParser.Identifier, 0)
+        def identifier(self):
+            return self.getTypedRuleContext(SQLParser.IdentifierContext,0)
+
 
         def enterRule(self, listener:ParseTreeListener):
             if hasattr( listener, "enterDrop_db" ):
@@ -612,8 +679,9 @@ class SQLParser ( Parser ):
             super().__init__(parser)
             self.copyFrom(ctx)
 
-        def Identifier(self):
-            return self.getToken(SQLParser.Identifier, 0)
+        def identifier(self):
+            return self.getTypedRuleContext(SQLParser.IdentifierContext,0)
+
 
         def enterRule(self, listener:ParseTreeListener):
             if hasattr( listener, "enterCreate_db" ):
@@ -636,8 +704,9 @@ class SQLParser ( Parser ):
             super().__init__(parser)
             self.copyFrom(ctx)
 
-        def Identifier(self):
-            return self.getToken(SQLParser.Identifier, 0)
+        def identifier(self):
+            return self.getTypedRuleContext(SQLParser.IdentifierContext,0)
+
 
         def enterRule(self, listener:ParseTreeListener):
             if hasattr( listener, "enterUse_db" ):
@@ -682,64 +751,64 @@ class SQLParser ( Parser ):
         localctx = SQLParser.Db_statementContext(self, self._ctx, self.state)
         self.enterRule(localctx, 4, self.RULE_db_statement)
         try:
-            self.state = 86
+            self.state = 93
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,2,self._ctx)
             if la_ == 1:
                 localctx = SQLParser.Create_dbContext(self, localctx)
                 self.enterOuterAlt(localctx, 1)
-                self.state = 72
+                self.state = 79
                 self.match(SQLParser.T__1)
-                self.state = 73
+                self.state = 80
                 self.match(SQLParser.T__2)
-                self.state = 74
-                self.match(SQLParser.Identifier)
+                self.state = 81
+                self.identifier()
                 pass
 
             elif la_ == 2:
                 localctx = SQLParser.Drop_dbContext(self, localctx)
                 self.enterOuterAlt(localctx, 2)
-                self.state = 75
+                self.state = 82
                 self.match(SQLParser.T__3)
-                self.state = 76
+                self.state = 83
                 self.match(SQLParser.T__2)
-                self.state = 77
-                self.match(SQLParser.Identifier)
+                self.state = 84
+                self.identifier()
                 pass
 
             elif la_ == 3:
                 localctx = SQLParser.Show_dbsContext(self, localctx)
                 self.enterOuterAlt(localctx, 3)
-                self.state = 78
+                self.state = 85
                 self.match(SQLParser.T__4)
-                self.state = 79
+                self.state = 86
                 self.match(SQLParser.T__5)
                 pass
 
             elif la_ == 4:
                 localctx = SQLParser.Use_dbContext(self, localctx)
                 self.enterOuterAlt(localctx, 4)
-                self.state = 80
+                self.state = 87
                 self.match(SQLParser.T__6)
-                self.state = 81
-                self.match(SQLParser.Identifier)
+                self.state = 88
+                self.identifier()
                 pass
 
             elif la_ == 5:
                 localctx = SQLParser.Show_tablesContext(self, localctx)
                 self.enterOuterAlt(localctx, 5)
-                self.state = 82
+                self.state = 89
                 self.match(SQLParser.T__4)
-                self.state = 83
+                self.state = 90
                 self.match(SQLParser.T__7)
                 pass
 
             elif la_ == 6:
                 localctx = SQLParser.Show_indexesContext(self, localctx)
                 self.enterOuterAlt(localctx, 6)
-                self.state = 84
+                self.state = 91
                 self.match(SQLParser.T__4)
-                self.state = 85
+                self.state = 92
                 self.match(SQLParser.T__8)
                 pass
 
@@ -776,8 +845,9 @@ class SQLParser ( Parser ):
 
         def String(self):
             return self.getToken(SQLParser.String, 0)
-        def Identifier(self):
-            return self.getToken(SQLParser.Identifier, 0)
+        def identifier(self):
+            return self.getTypedRuleContext(SQLParser.IdentifierContext,0)
+
 
         def enterRule(self, listener:ParseTreeListener):
             if hasattr( listener, "enterDump_data" ):
@@ -802,8 +872,9 @@ class SQLParser ( Parser ):
 
         def String(self):
             return self.getToken(SQLParser.String, 0)
-        def Identifier(self):
-            return self.getToken(SQLParser.Identifier, 0)
+        def identifier(self):
+            return self.getTypedRuleContext(SQLParser.IdentifierContext,0)
+
 
         def enterRule(self, listener:ParseTreeListener):
             if hasattr( listener, "enterLoad_data" ):
@@ -826,44 +897,44 @@ class SQLParser ( Parser ):
         localctx = SQLParser.Io_statementContext(self, self._ctx, self.state)
         self.enterRule(localctx, 6, self.RULE_io_statement)
         try:
-            self.state = 102
+            self.state = 109
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [SQLParser.T__9]:
                 localctx = SQLParser.Load_dataContext(self, localctx)
                 self.enterOuterAlt(localctx, 1)
-                self.state = 88
+                self.state = 95
                 self.match(SQLParser.T__9)
-                self.state = 89
+                self.state = 96
                 self.match(SQLParser.T__10)
-                self.state = 90
+                self.state = 97
                 self.match(SQLParser.T__11)
-                self.state = 91
+                self.state = 98
                 self.match(SQLParser.String)
-                self.state = 92
+                self.state = 99
                 self.match(SQLParser.T__12)
-                self.state = 93
+                self.state = 100
                 self.match(SQLParser.T__13)
-                self.state = 94
-                self.match(SQLParser.Identifier)
+                self.state = 101
+                self.identifier()
                 pass
             elif token in [SQLParser.T__14]:
                 localctx = SQLParser.Dump_dataContext(self, localctx)
                 self.enterOuterAlt(localctx, 2)
-                self.state = 95
+                self.state = 102
                 self.match(SQLParser.T__14)
-                self.state = 96
+                self.state = 103
                 self.match(SQLParser.T__12)
-                self.state = 97
+                self.state = 104
                 self.match(SQLParser.T__11)
-                self.state = 98
+                self.state = 105
                 self.match(SQLParser.String)
-                self.state = 99
+                self.state = 106
                 self.match(SQLParser.T__10)
-                self.state = 100
+                self.state = 107
                 self.match(SQLParser.T__13)
-                self.state = 101
-                self.match(SQLParser.Identifier)
+                self.state = 108
+                self.identifier()
                 pass
             else:
                 raise NoViableAltException(self)
@@ -898,8 +969,9 @@ class SQLParser ( Parser ):
             super().__init__(parser)
             self.copyFrom(ctx)
 
-        def Identifier(self):
-            return self.getToken(SQLParser.Identifier, 0)
+        def identifier(self):
+            return self.getTypedRuleContext(SQLParser.IdentifierContext,0)
+
         def where_and_clause(self):
             return self.getTypedRuleContext(SQLParser.Where_and_clauseContext,0)
 
@@ -925,8 +997,9 @@ class SQLParser ( Parser ):
             super().__init__(parser)
             self.copyFrom(ctx)
 
-        def Identifier(self):
-            return self.getToken(SQLParser.Identifier, 0)
+        def identifier(self):
+            return self.getTypedRuleContext(SQLParser.IdentifierContext,0)
+
         def value_lists(self):
             return self.getTypedRuleContext(SQLParser.Value_listsContext,0)
 
@@ -952,8 +1025,9 @@ class SQLParser ( Parser ):
             super().__init__(parser)
             self.copyFrom(ctx)
 
-        def Identifier(self):
-            return self.getToken(SQLParser.Identifier, 0)
+        def identifier(self):
+            return self.getTypedRuleContext(SQLParser.IdentifierContext,0)
+
         def field_list(self):
             return self.getTypedRuleContext(SQLParser.Field_listContext,0)
 
@@ -979,8 +1053,9 @@ class SQLParser ( Parser ):
             super().__init__(parser)
             self.copyFrom(ctx)
 
-        def Identifier(self):
-            return self.getToken(SQLParser.Identifier, 0)
+        def identifier(self):
+            return self.getTypedRuleContext(SQLParser.IdentifierContext,0)
+
 
         def enterRule(self, listener:ParseTreeListener):
             if hasattr( listener, "enterDescribe_table" ):
@@ -1028,8 +1103,9 @@ class SQLParser ( Parser ):
             super().__init__(parser)
             self.copyFrom(ctx)
 
-        def Identifier(self):
-            return self.getToken(SQLParser.Identifier, 0)
+        def identifier(self):
+            return self.getTypedRuleContext(SQLParser.IdentifierContext,0)
+
 
         def enterRule(self, listener:ParseTreeListener):
             if hasattr( listener, "enterDrop_table" ):
@@ -1052,8 +1128,9 @@ class SQLParser ( Parser ):
             super().__init__(parser)
             self.copyFrom(ctx)
 
-        def Identifier(self):
-            return self.getToken(SQLParser.Identifier, 0)
+        def identifier(self):
+            return self.getTypedRuleContext(SQLParser.IdentifierContext,0)
+
         def set_clause(self):
             return self.getTypedRuleContext(SQLParser.Set_clauseContext,0)
 
@@ -1082,91 +1159,91 @@ class SQLParser ( Parser ):
         localctx = SQLParser.Table_statementContext(self, self._ctx, self.state)
         self.enterRule(localctx, 8, self.RULE_table_statement)
         try:
-            self.state = 134
+            self.state = 143
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [SQLParser.T__1]:
                 localctx = SQLParser.Create_tableContext(self, localctx)
                 self.enterOuterAlt(localctx, 1)
-                self.state = 104
+                self.state = 111
                 self.match(SQLParser.T__1)
-                self.state = 105
+                self.state = 112
                 self.match(SQLParser.T__13)
-                self.state = 106
-                self.match(SQLParser.Identifier)
-                self.state = 107
+                self.state = 113
+                self.identifier()
+                self.state = 114
                 self.match(SQLParser.T__15)
-                self.state = 108
+                self.state = 115
                 self.field_list()
-                self.state = 109
+                self.state = 116
                 self.match(SQLParser.T__16)
                 pass
             elif token in [SQLParser.T__3]:
                 localctx = SQLParser.Drop_tableContext(self, localctx)
                 self.enterOuterAlt(localctx, 2)
-                self.state = 111
+                self.state = 118
                 self.match(SQLParser.T__3)
-                self.state = 112
+                self.state = 119
                 self.match(SQLParser.T__13)
-                self.state = 113
-                self.match(SQLParser.Identifier)
+                self.state = 120
+                self.identifier()
                 pass
             elif token in [SQLParser.T__17]:
                 localctx = SQLParser.Describe_tableContext(self, localctx)
                 self.enterOuterAlt(localctx, 3)
-                self.state = 114
+                self.state = 121
                 self.match(SQLParser.T__17)
-                self.state = 115
-                self.match(SQLParser.Identifier)
+                self.state = 122
+                self.identifier()
                 pass
             elif token in [SQLParser.T__18]:
                 localctx = SQLParser.Insert_into_tableContext(self, localctx)
                 self.enterOuterAlt(localctx, 4)
-                self.state = 116
+                self.state = 123
                 self.match(SQLParser.T__18)
-                self.state = 117
+                self.state = 124
                 self.match(SQLParser.T__19)
-                self.state = 118
-                self.match(SQLParser.Identifier)
-                self.state = 119
+                self.state = 125
+                self.identifier()
+                self.state = 126
                 self.match(SQLParser.T__20)
-                self.state = 120
+                self.state = 127
                 self.value_lists()
                 pass
             elif token in [SQLParser.T__21]:
                 localctx = SQLParser.Delete_from_tableContext(self, localctx)
                 self.enterOuterAlt(localctx, 5)
-                self.state = 121
+                self.state = 129
                 self.match(SQLParser.T__21)
-                self.state = 122
+                self.state = 130
                 self.match(SQLParser.T__10)
-                self.state = 123
-                self.match(SQLParser.Identifier)
-                self.state = 124
+                self.state = 131
+                self.identifier()
+                self.state = 132
                 self.match(SQLParser.T__22)
-                self.state = 125
+                self.state = 133
                 self.where_and_clause()
                 pass
             elif token in [SQLParser.T__23]:
                 localctx = SQLParser.Update_tableContext(self, localctx)
                 self.enterOuterAlt(localctx, 6)
-                self.state = 126
+                self.state = 135
                 self.match(SQLParser.T__23)
-                self.state = 127
-                self.match(SQLParser.Identifier)
-                self.state = 128
+                self.state = 136
+                self.identifier()
+                self.state = 137
                 self.match(SQLParser.T__24)
-                self.state = 129
+                self.state = 138
                 self.set_clause()
-                self.state = 130
+                self.state = 139
                 self.match(SQLParser.T__22)
-                self.state = 131
+                self.state = 140
                 self.where_and_clause()
                 pass
             elif token in [SQLParser.T__25]:
                 localctx = SQLParser.Select_table_Context(self, localctx)
                 self.enterOuterAlt(localctx, 7)
-                self.state = 133
+                self.state = 142
                 self.select_table()
                 pass
             else:
@@ -1235,51 +1312,51 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 136
+            self.state = 145
             self.match(SQLParser.T__25)
-            self.state = 137
+            self.state = 146
             self.selectors()
-            self.state = 138
+            self.state = 147
             self.match(SQLParser.T__10)
-            self.state = 139
+            self.state = 148
             self.identifiers()
-            self.state = 142
+            self.state = 151
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==SQLParser.T__22:
-                self.state = 140
+                self.state = 149
                 self.match(SQLParser.T__22)
-                self.state = 141
+                self.state = 150
                 self.where_and_clause()
 
 
-            self.state = 147
+            self.state = 156
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==SQLParser.T__26:
-                self.state = 144
+                self.state = 153
                 self.match(SQLParser.T__26)
-                self.state = 145
+                self.state = 154
                 self.match(SQLParser.T__27)
-                self.state = 146
+                self.state = 155
                 self.column()
 
 
-            self.state = 155
+            self.state = 164
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==SQLParser.T__28:
-                self.state = 149
+                self.state = 158
                 self.match(SQLParser.T__28)
-                self.state = 150
+                self.state = 159
                 self.match(SQLParser.Integer)
-                self.state = 153
+                self.state = 162
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==SQLParser.T__29:
-                    self.state = 151
+                    self.state = 160
                     self.match(SQLParser.T__29)
-                    self.state = 152
+                    self.state = 161
                     self.match(SQLParser.Integer)
 
 
@@ -1315,11 +1392,12 @@ class SQLParser ( Parser ):
             super().__init__(parser)
             self.copyFrom(ctx)
 
-        def Identifier(self, i:int=None):
+        def identifier(self, i:int=None):
             if i is None:
-                return self.getTokens(SQLParser.Identifier)
+                return self.getTypedRuleContexts(SQLParser.IdentifierContext)
             else:
-                return self.getToken(SQLParser.Identifier, i)
+                return self.getTypedRuleContext(SQLParser.IdentifierContext,i)
+
 
         def enterRule(self, listener:ParseTreeListener):
             if hasattr( listener, "enterAlter_table_drop_pk" ):
@@ -1342,11 +1420,12 @@ class SQLParser ( Parser ):
             super().__init__(parser)
             self.copyFrom(ctx)
 
-        def Identifier(self, i:int=None):
+        def identifier(self, i:int=None):
             if i is None:
-                return self.getTokens(SQLParser.Identifier)
+                return self.getTypedRuleContexts(SQLParser.IdentifierContext)
             else:
-                return self.getToken(SQLParser.Identifier, i)
+                return self.getTypedRuleContext(SQLParser.IdentifierContext,i)
+
         def identifiers(self, i:int=None):
             if i is None:
                 return self.getTypedRuleContexts(SQLParser.IdentifiersContext)
@@ -1375,8 +1454,9 @@ class SQLParser ( Parser ):
             super().__init__(parser)
             self.copyFrom(ctx)
 
-        def Identifier(self):
-            return self.getToken(SQLParser.Identifier, 0)
+        def identifier(self):
+            return self.getTypedRuleContext(SQLParser.IdentifierContext,0)
+
         def identifiers(self):
             return self.getTypedRuleContext(SQLParser.IdentifiersContext,0)
 
@@ -1402,8 +1482,9 @@ class SQLParser ( Parser ):
             super().__init__(parser)
             self.copyFrom(ctx)
 
-        def Identifier(self):
-            return self.getToken(SQLParser.Identifier, 0)
+        def identifier(self):
+            return self.getTypedRuleContext(SQLParser.IdentifierContext,0)
+
         def identifiers(self):
             return self.getTypedRuleContext(SQLParser.IdentifiersContext,0)
 
@@ -1429,8 +1510,9 @@ class SQLParser ( Parser ):
             super().__init__(parser)
             self.copyFrom(ctx)
 
-        def Identifier(self):
-            return self.getToken(SQLParser.Identifier, 0)
+        def identifier(self):
+            return self.getTypedRuleContext(SQLParser.IdentifierContext,0)
+
         def identifiers(self):
             return self.getTypedRuleContext(SQLParser.IdentifiersContext,0)
 
@@ -1456,11 +1538,12 @@ class SQLParser ( Parser ):
             super().__init__(parser)
             self.copyFrom(ctx)
 
-        def Identifier(self, i:int=None):
+        def identifier(self, i:int=None):
             if i is None:
-                return self.getTokens(SQLParser.Identifier)
+                return self.getTypedRuleContexts(SQLParser.IdentifierContext)
             else:
-                return self.getToken(SQLParser.Identifier, i)
+                return self.getTypedRuleContext(SQLParser.IdentifierContext,i)
+
 
         def enterRule(self, listener:ParseTreeListener):
             if hasattr( listener, "enterAlter_table_drop_foreign_key" ):
@@ -1483,11 +1566,12 @@ class SQLParser ( Parser ):
             super().__init__(parser)
             self.copyFrom(ctx)
 
-        def Identifier(self, i:int=None):
+        def identifier(self, i:int=None):
             if i is None:
-                return self.getTokens(SQLParser.Identifier)
+                return self.getTypedRuleContexts(SQLParser.IdentifierContext)
             else:
-                return self.getToken(SQLParser.Identifier, i)
+                return self.getTypedRuleContext(SQLParser.IdentifierContext,i)
+
         def identifiers(self):
             return self.getTypedRuleContext(SQLParser.IdentifiersContext,0)
 
@@ -1514,72 +1598,72 @@ class SQLParser ( Parser ):
         self.enterRule(localctx, 12, self.RULE_alter_statement)
         self._la = 0 # Token type
         try:
-            self.state = 233
+            self.state = 243
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,12,self._ctx)
             if la_ == 1:
                 localctx = SQLParser.Alter_add_indexContext(self, localctx)
                 self.enterOuterAlt(localctx, 1)
-                self.state = 157
+                self.state = 166
                 self.match(SQLParser.T__30)
-                self.state = 158
+                self.state = 167
                 self.match(SQLParser.T__13)
-                self.state = 159
-                self.match(SQLParser.Identifier)
-                self.state = 160
+                self.state = 168
+                self.identifier()
+                self.state = 169
                 self.match(SQLParser.T__31)
-                self.state = 161
+                self.state = 170
                 self.match(SQLParser.T__32)
-                self.state = 162
+                self.state = 171
                 self.match(SQLParser.T__15)
-                self.state = 163
+                self.state = 172
                 self.identifiers()
-                self.state = 164
+                self.state = 173
                 self.match(SQLParser.T__16)
                 pass
 
             elif la_ == 2:
                 localctx = SQLParser.Alter_drop_indexContext(self, localctx)
                 self.enterOuterAlt(localctx, 2)
-                self.state = 166
+                self.state = 175
                 self.match(SQLParser.T__30)
-                self.state = 167
+                self.state = 176
                 self.match(SQLParser.T__13)
-                self.state = 168
-                self.match(SQLParser.Identifier)
-                self.state = 169
+                self.state = 177
+                self.identifier()
+                self.state = 178
                 self.match(SQLParser.T__3)
-                self.state = 170
+                self.state = 179
                 self.match(SQLParser.T__32)
-                self.state = 171
+                self.state = 180
                 self.match(SQLParser.T__15)
-                self.state = 172
+                self.state = 181
                 self.identifiers()
-                self.state = 173
+                self.state = 182
                 self.match(SQLParser.T__16)
                 pass
 
             elif la_ == 3:
                 localctx = SQLParser.Alter_table_drop_pkContext(self, localctx)
                 self.enterOuterAlt(localctx, 3)
-                self.state = 175
+                self.state = 184
                 self.match(SQLParser.T__30)
-                self.state = 176
+                self.state = 185
                 self.match(SQLParser.T__13)
-                self.state = 177
-                self.match(SQLParser.Identifier)
-                self.state = 178
+                self.state = 186
+                self.identifier()
+                self.state = 187
                 self.match(SQLParser.T__3)
-                self.state = 179
+                self.state = 188
                 self.match(SQLParser.T__33)
-                self.state = 180
+                self.state = 189
                 self.match(SQLParser.T__34)
-                self.state = 182
+                self.state = 191
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==SQLParser.Identifier:
-                    self.state = 181
-                    self.match(SQLParser.Identifier)
+                if ((((_la - 40)) & ~0x3f) == 0 and ((1 << (_la - 40)) & ((1 << (SQLParser.T__39 - 40)) | (1 << (SQLParser.T__40 - 40)) | (1 << (SQLParser.T__41 - 40)) | (1 << (SQLParser.T__42 - 40)) | (1 << (SQLParser.T__43 - 40)) | (1 << (SQLParser.T__44 - 40)) | (1 << (SQLParser.T__45 - 40)) | (1 << (SQLParser.T__46 - 40)) | (1 << (SQLParser.T__47 - 40)) | (1 << (SQLParser.T__48 - 40)) | (1 << (SQLParser.T__49 - 40)) | (1 << (SQLParser.Identifier - 40)))) != 0):
+                    self.state = 190
+                    self.identifier()
 
 
                 pass
@@ -1587,116 +1671,116 @@ class SQLParser ( Parser ):
             elif la_ == 4:
                 localctx = SQLParser.Alter_table_drop_foreign_keyContext(self, localctx)
                 self.enterOuterAlt(localctx, 4)
-                self.state = 184
+                self.state = 193
                 self.match(SQLParser.T__30)
-                self.state = 185
+                self.state = 194
                 self.match(SQLParser.T__13)
-                self.state = 186
-                self.match(SQLParser.Identifier)
-                self.state = 187
+                self.state = 195
+                self.identifier()
+                self.state = 196
                 self.match(SQLParser.T__3)
-                self.state = 188
+                self.state = 197
                 self.match(SQLParser.T__35)
-                self.state = 189
+                self.state = 198
                 self.match(SQLParser.T__34)
-                self.state = 190
-                self.match(SQLParser.Identifier)
+                self.state = 199
+                self.identifier()
                 pass
 
             elif la_ == 5:
                 localctx = SQLParser.Alter_table_add_pkContext(self, localctx)
                 self.enterOuterAlt(localctx, 5)
-                self.state = 191
+                self.state = 201
                 self.match(SQLParser.T__30)
-                self.state = 192
+                self.state = 202
                 self.match(SQLParser.T__13)
-                self.state = 193
-                self.match(SQLParser.Identifier)
-                self.state = 194
+                self.state = 203
+                self.identifier()
+                self.state = 204
                 self.match(SQLParser.T__31)
-                self.state = 195
+                self.state = 205
                 self.match(SQLParser.T__36)
-                self.state = 197
+                self.state = 207
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==SQLParser.Identifier:
-                    self.state = 196
-                    self.match(SQLParser.Identifier)
+                if ((((_la - 40)) & ~0x3f) == 0 and ((1 << (_la - 40)) & ((1 << (SQLParser.T__39 - 40)) | (1 << (SQLParser.T__40 - 40)) | (1 << (SQLParser.T__41 - 40)) | (1 << (SQLParser.T__42 - 40)) | (1 << (SQLParser.T__43 - 40)) | (1 << (SQLParser.T__44 - 40)) | (1 << (SQLParser.T__45 - 40)) | (1 << (SQLParser.T__46 - 40)) | (1 << (SQLParser.T__47 - 40)) | (1 << (SQLParser.T__48 - 40)) | (1 << (SQLParser.T__49 - 40)) | (1 << (SQLParser.Identifier - 40)))) != 0):
+                    self.state = 206
+                    self.identifier()
 
 
-                self.state = 199
+                self.state = 209
                 self.match(SQLParser.T__33)
-                self.state = 200
+                self.state = 210
                 self.match(SQLParser.T__34)
-                self.state = 201
+                self.state = 211
                 self.match(SQLParser.T__15)
-                self.state = 202
+                self.state = 212
                 self.identifiers()
-                self.state = 203
+                self.state = 213
                 self.match(SQLParser.T__16)
                 pass
 
             elif la_ == 6:
                 localctx = SQLParser.Alter_table_add_foreign_keyContext(self, localctx)
                 self.enterOuterAlt(localctx, 6)
-                self.state = 205
+                self.state = 215
                 self.match(SQLParser.T__30)
-                self.state = 206
+                self.state = 216
                 self.match(SQLParser.T__13)
-                self.state = 207
-                self.match(SQLParser.Identifier)
-                self.state = 208
+                self.state = 217
+                self.identifier()
+                self.state = 218
                 self.match(SQLParser.T__31)
-                self.state = 209
+                self.state = 219
                 self.match(SQLParser.T__36)
-                self.state = 211
+                self.state = 221
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==SQLParser.Identifier:
-                    self.state = 210
-                    self.match(SQLParser.Identifier)
+                if ((((_la - 40)) & ~0x3f) == 0 and ((1 << (_la - 40)) & ((1 << (SQLParser.T__39 - 40)) | (1 << (SQLParser.T__40 - 40)) | (1 << (SQLParser.T__41 - 40)) | (1 << (SQLParser.T__42 - 40)) | (1 << (SQLParser.T__43 - 40)) | (1 << (SQLParser.T__44 - 40)) | (1 << (SQLParser.T__45 - 40)) | (1 << (SQLParser.T__46 - 40)) | (1 << (SQLParser.T__47 - 40)) | (1 << (SQLParser.T__48 - 40)) | (1 << (SQLParser.T__49 - 40)) | (1 << (SQLParser.Identifier - 40)))) != 0):
+                    self.state = 220
+                    self.identifier()
 
 
-                self.state = 213
+                self.state = 223
                 self.match(SQLParser.T__35)
-                self.state = 214
+                self.state = 224
                 self.match(SQLParser.T__34)
-                self.state = 215
+                self.state = 225
                 self.match(SQLParser.T__15)
-                self.state = 216
+                self.state = 226
                 self.identifiers()
-                self.state = 217
+                self.state = 227
                 self.match(SQLParser.T__16)
-                self.state = 218
+                self.state = 228
                 self.match(SQLParser.T__37)
-                self.state = 219
-                self.match(SQLParser.Identifier)
-                self.state = 220
+                self.state = 229
+                self.identifier()
+                self.state = 230
                 self.match(SQLParser.T__15)
-                self.state = 221
+                self.state = 231
                 self.identifiers()
-                self.state = 222
+                self.state = 232
                 self.match(SQLParser.T__16)
                 pass
 
             elif la_ == 7:
                 localctx = SQLParser.Alter_table_add_uniqueContext(self, localctx)
                 self.enterOuterAlt(localctx, 7)
-                self.state = 224
+                self.state = 234
                 self.match(SQLParser.T__30)
-                self.state = 225
+                self.state = 235
                 self.match(SQLParser.T__13)
-                self.state = 226
-                self.match(SQLParser.Identifier)
-                self.state = 227
+                self.state = 236
+                self.identifier()
+                self.state = 237
                 self.match(SQLParser.T__31)
-                self.state = 228
+                self.state = 238
                 self.match(SQLParser.T__38)
-                self.state = 229
+                self.state = 239
                 self.match(SQLParser.T__15)
-                self.state = 230
+                self.state = 240
                 self.identifiers()
-                self.state = 231
+                self.state = 241
                 self.match(SQLParser.T__16)
                 pass
 
@@ -1709,6 +1793,416 @@ class SQLParser ( Parser ):
             self.exitRule()
         return localctx
 
+    class System_statementContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return SQLParser.RULE_system_statement
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+
+    class Set_traceContext(System_statementContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a SQLParser.System_statementContext
+            super().__init__(parser)
+            self.on_off = None # Token
+            self.copyFrom(ctx)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterSet_trace" ):
+                listener.enterSet_trace(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitSet_trace" ):
+                listener.exitSet_trace(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitSet_trace" ):
+                return visitor.visitSet_trace(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class Reset_buffer_statsContext(System_statementContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a SQLParser.System_statementContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterReset_buffer_stats" ):
+                listener.enterReset_buffer_stats(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitReset_buffer_stats" ):
+                listener.exitReset_buffer_stats(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitReset_buffer_stats" ):
+                return visitor.visitReset_buffer_stats(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class Set_page_sizeContext(System_statementContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a SQLParser.System_statementContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def Integer(self):
+            return self.getToken(SQLParser.Integer, 0)
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterSet_page_size" ):
+                listener.enterSet_page_size(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitSet_page_size" ):
+                listener.exitSet_page_size(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitSet_page_size" ):
+                return visitor.visitSet_page_size(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class Show_buffer_quotasContext(System_statementContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a SQLParser.System_statementContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterShow_buffer_quotas" ):
+                listener.enterShow_buffer_quotas(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitShow_buffer_quotas" ):
+                listener.exitShow_buffer_quotas(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitShow_buffer_quotas" ):
+                return visitor.visitShow_buffer_quotas(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class Reset_trace_statsContext(System_statementContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a SQLParser.System_statementContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterReset_trace_stats" ):
+                listener.enterReset_trace_stats(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitReset_trace_stats" ):
+                listener.exitReset_trace_stats(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitReset_trace_stats" ):
+                return visitor.visitReset_trace_stats(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class Drop_buffer_quotaContext(System_statementContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a SQLParser.System_statementContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def identifier(self):
+            return self.getTypedRuleContext(SQLParser.IdentifierContext,0)
+
+        def identifiers(self):
+            return self.getTypedRuleContext(SQLParser.IdentifiersContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterDrop_buffer_quota" ):
+                listener.enterDrop_buffer_quota(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitDrop_buffer_quota" ):
+                listener.exitDrop_buffer_quota(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDrop_buffer_quota" ):
+                return visitor.visitDrop_buffer_quota(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class Set_buffer_quotaContext(System_statementContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a SQLParser.System_statementContext
+            super().__init__(parser)
+            self.reserve = None # Token
+            self.limit = None # Token
+            self.copyFrom(ctx)
+
+        def identifier(self):
+            return self.getTypedRuleContext(SQLParser.IdentifierContext,0)
+
+        def identifiers(self):
+            return self.getTypedRuleContext(SQLParser.IdentifiersContext,0)
+
+        def Integer(self, i:int=None):
+            if i is None:
+                return self.getTokens(SQLParser.Integer)
+            else:
+                return self.getToken(SQLParser.Integer, i)
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterSet_buffer_quota" ):
+                listener.enterSet_buffer_quota(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitSet_buffer_quota" ):
+                listener.exitSet_buffer_quota(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitSet_buffer_quota" ):
+                return visitor.visitSet_buffer_quota(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class Show_buffer_statsContext(System_statementContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a SQLParser.System_statementContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterShow_buffer_stats" ):
+                listener.enterShow_buffer_stats(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitShow_buffer_stats" ):
+                listener.exitShow_buffer_stats(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitShow_buffer_stats" ):
+                return visitor.visitShow_buffer_stats(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class Show_trace_statsContext(System_statementContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a SQLParser.System_statementContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterShow_trace_stats" ):
+                listener.enterShow_trace_stats(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitShow_trace_stats" ):
+                listener.exitShow_trace_stats(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitShow_trace_stats" ):
+                return visitor.visitShow_trace_stats(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def system_statement(self):
+
+        localctx = SQLParser.System_statementContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 14, self.RULE_system_statement)
+        self._la = 0 # Token type
+        try:
+            self.state = 295
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,17,self._ctx)
+            if la_ == 1:
+                localctx = SQLParser.Show_buffer_statsContext(self, localctx)
+                self.enterOuterAlt(localctx, 1)
+                self.state = 245
+                self.match(SQLParser.T__4)
+                self.state = 246
+                self.match(SQLParser.T__39)
+                self.state = 247
+                self.match(SQLParser.T__40)
+                pass
+
+            elif la_ == 2:
+                localctx = SQLParser.Reset_buffer_statsContext(self, localctx)
+                self.enterOuterAlt(localctx, 2)
+                self.state = 248
+                self.match(SQLParser.T__41)
+                self.state = 249
+                self.match(SQLParser.T__39)
+                self.state = 250
+                self.match(SQLParser.T__40)
+                pass
+
+            elif la_ == 3:
+                localctx = SQLParser.Set_buffer_quotaContext(self, localctx)
+                self.enterOuterAlt(localctx, 3)
+                self.state = 251
+                self.match(SQLParser.T__24)
+                self.state = 252
+                self.match(SQLParser.T__39)
+                self.state = 253
+                self.match(SQLParser.T__42)
+                self.state = 254
+                self.identifier()
+                self.state = 259
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==SQLParser.T__15:
+                    self.state = 255
+                    self.match(SQLParser.T__15)
+                    self.state = 256
+                    self.identifiers()
+                    self.state = 257
+                    self.match(SQLParser.T__16)
+
+
+                self.state = 263
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==SQLParser.T__43:
+                    self.state = 261
+                    self.match(SQLParser.T__43)
+                    self.state = 262
+                    localctx.reserve = self.match(SQLParser.Integer)
+
+
+                self.state = 267
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==SQLParser.T__28:
+                    self.state = 265
+                    self.match(SQLParser.T__28)
+                    self.state = 266
+                    localctx.limit = self.match(SQLParser.Integer)
+
+
+                pass
+
+            elif la_ == 4:
+                localctx = SQLParser.Drop_buffer_quotaContext(self, localctx)
+                self.enterOuterAlt(localctx, 4)
+                self.state = 269
+                self.match(SQLParser.T__3)
+                self.state = 270
+                self.match(SQLParser.T__39)
+                self.state = 271
+                self.match(SQLParser.T__42)
+                self.state = 272
+                self.identifier()
+                self.state = 277
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==SQLParser.T__15:
+                    self.state = 273
+                    self.match(SQLParser.T__15)
+                    self.state = 274
+                    self.identifiers()
+                    self.state = 275
+                    self.match(SQLParser.T__16)
+
+
+                pass
+
+            elif la_ == 5:
+                localctx = SQLParser.Show_buffer_quotasContext(self, localctx)
+                self.enterOuterAlt(localctx, 5)
+                self.state = 279
+                self.match(SQLParser.T__4)
+                self.state = 280
+                self.match(SQLParser.T__39)
+                self.state = 281
+                self.match(SQLParser.T__44)
+                pass
+
+            elif la_ == 6:
+                localctx = SQLParser.Set_page_sizeContext(self, localctx)
+                self.enterOuterAlt(localctx, 6)
+                self.state = 282
+                self.match(SQLParser.T__24)
+                self.state = 283
+                self.match(SQLParser.T__45)
+                self.state = 284
+                self.match(SQLParser.T__46)
+                self.state = 285
+                self.match(SQLParser.Integer)
+                pass
+
+            elif la_ == 7:
+                localctx = SQLParser.Set_traceContext(self, localctx)
+                self.enterOuterAlt(localctx, 7)
+                self.state = 286
+                self.match(SQLParser.T__24)
+                self.state = 287
+                self.match(SQLParser.T__47)
+                self.state = 288
+                localctx.on_off = self._input.LT(1)
+                _la = self._input.LA(1)
+                if not(_la==SQLParser.T__48 or _la==SQLParser.T__49):
+                    localctx.on_off = self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                pass
+
+            elif la_ == 8:
+                localctx = SQLParser.Show_trace_statsContext(self, localctx)
+                self.enterOuterAlt(localctx, 8)
+                self.state = 289
+                self.match(SQLParser.T__4)
+                self.state = 290
+                self.match(SQLParser.T__47)
+                self.state = 291
+                self.match(SQLParser.T__40)
+                pass
+
+            elif la_ == 9:
+                localctx = SQLParser.Reset_trace_statsContext(self, localctx)
+                self.enterOuterAlt(localctx, 9)
+                self.state = 292
+                self.match(SQLParser.T__41)
+                self.state = 293
+                self.match(SQLParser.T__47)
+                self.state = 294
+                self.match(SQLParser.T__40)
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
     class Field_listContext(ParserRuleContext):
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
@@ -1745,21 +2239,21 @@ class SQLParser ( Parser ):
     def field_list(self):
 
         localctx = SQLParser.Field_listContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 14, self.RULE_field_list)
+        self.enterRule(localctx, 16, self.RULE_field_list)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 235
+            self.state = 297
             self.field()
-            self.state = 240
+            self.state = 302
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==SQLParser.T__39:
-                self.state = 236
-                self.match(SQLParser.T__39)
-                self.state = 237
+            while _la==SQLParser.T__50:
+                self.state = 298
+                self.match(SQLParser.T__50)
+                self.state = 299
                 self.field()
-                self.state = 242
+                self.state = 304
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -1796,8 +2290,9 @@ class SQLParser ( Parser ):
         def identifiers(self):
             return self.getTypedRuleContext(SQLParser.IdentifiersContext,0)
 
-        def Identifier(self):
-            return self.getToken(SQLParser.Identifier, 0)
+        def identifier(self):
+            return self.getTypedRuleContext(SQLParser.IdentifierContext,0)
+
 
         def enterRule(self, listener:ParseTreeListener):
             if hasattr( listener, "enterPrimary_key_field" ):
@@ -1826,11 +2321,12 @@ class SQLParser ( Parser ):
             else:
                 return self.getTypedRuleContext(SQLParser.IdentifiersContext,i)
 
-        def Identifier(self, i:int=None):
+        def identifier(self, i:int=None):
             if i is None:
-                return self.getTokens(SQLParser.Identifier)
+                return self.getTypedRuleContexts(SQLParser.IdentifierContext)
             else:
-                return self.getToken(SQLParser.Identifier, i)
+                return self.getTypedRuleContext(SQLParser.IdentifierContext,i)
+
 
         def enterRule(self, listener:ParseTreeListener):
             if hasattr( listener, "enterForeign_key_field" ):
@@ -1853,8 +2349,9 @@ class SQLParser ( Parser ):
             super().__init__(parser)
             self.copyFrom(ctx)
 
-        def Identifier(self):
-            return self.getToken(SQLParser.Identifier, 0)
+        def identifier(self):
+            return self.getTypedRuleContext(SQLParser.IdentifierContext,0)
+
         def type_(self):
             return self.getTypedRuleContext(SQLParser.Type_Context,0)
 
@@ -1883,36 +2380,36 @@ class SQLParser ( Parser ):
     def field(self):
 
         localctx = SQLParser.FieldContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 16, self.RULE_field)
+        self.enterRule(localctx, 18, self.RULE_field)
         self._la = 0 # Token type
         try:
-            self.state = 276
+            self.state = 338
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [SQLParser.Identifier]:
+            if token in [SQLParser.T__39, SQLParser.T__40, SQLParser.T__41, SQLParser.T__42, SQLParser.T__43, SQLParser.T__44, SQLParser.T__45, SQLParser.T__46, SQLParser.T__47, SQLParser.T__48, SQLParser.T__49, SQLParser.Identifier]:
                 localctx = SQLParser.Normal_fieldContext(self, localctx)
                 self.enterOuterAlt(localctx, 1)
-                self.state = 243
-                self.match(SQLParser.Identifier)
-                self.state = 244
+                self.state = 305
+                self.identifier()
+                self.state = 306
                 self.type_()
-                self.state = 247
+                self.state = 309
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==SQLParser.T__40:
-                    self.state = 245
-                    self.match(SQLParser.T__40)
-                    self.state = 246
+                if _la==SQLParser.T__51:
+                    self.state = 307
+                    self.match(SQLParser.T__51)
+                    self.state = 308
                     self.match(SQLParser.Null)
 
 
-                self.state = 251
+                self.state = 313
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==SQLParser.T__41:
-                    self.state = 249
-                    self.match(SQLParser.T__41)
-                    self.state = 250
+                if _la==SQLParser.T__52:
+                    self.state = 311
+                    self.match(SQLParser.T__52)
+                    self.state = 312
                     self.value()
 
 
@@ -1920,55 +2417,55 @@ class SQLParser ( Parser ):
             elif token in [SQLParser.T__33]:
                 localctx = SQLParser.Primary_key_fieldContext(self, localctx)
                 self.enterOuterAlt(localctx, 2)
-                self.state = 253
+                self.state = 315
                 self.match(SQLParser.T__33)
-                self.state = 254
+                self.state = 316
                 self.match(SQLParser.T__34)
-                self.state = 256
+                self.state = 318
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==SQLParser.Identifier:
-                    self.state = 255
-                    self.match(SQLParser.Identifier)
+                if ((((_la - 40)) & ~0x3f) == 0 and ((1 << (_la - 40)) & ((1 << (SQLParser.T__39 - 40)) | (1 << (SQLParser.T__40 - 40)) | (1 << (SQLParser.T__41 - 40)) | (1 << (SQLParser.T__42 - 40)) | (1 << (SQLParser.T__43 - 40)) | (1 << (SQLParser.T__44 - 40)) | (1 << (SQLParser.T__45 - 40)) | (1 << (SQLParser.T__46 - 40)) | (1 << (SQLParser.T__47 - 40)) | (1 << (SQLParser.T__48 - 40)) | (1 << (SQLParser.T__49 - 40)) | (1 << (SQLParser.Identifier - 40)))) != 0):
+                    self.state = 317
+                    self.identifier()
 
 
-                self.state = 258
+                self.state = 320
                 self.match(SQLParser.T__15)
-                self.state = 259
+                self.state = 321
                 self.identifiers()
-                self.state = 260
+                self.state = 322
                 self.match(SQLParser.T__16)
                 pass
             elif token in [SQLParser.T__35]:
                 localctx = SQLParser.Foreign_key_fieldContext(self, localctx)
                 self.enterOuterAlt(localctx, 3)
-                self.state = 262
+                self.state = 324
                 self.match(SQLParser.T__35)
-                self.state = 263
+                self.state = 325
                 self.match(SQLParser.T__34)
-                self.state = 265
+                self.state = 327
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==SQLParser.Identifier:
-                    self.state = 264
-                    self.match(SQLParser.Identifier)
+                if ((((_la - 40)) & ~0x3f) == 0 and ((1 << (_la - 40)) & ((1 << (SQLParser.T__39 - 40)) | (1 << (SQLParser.T__40 - 40)) | (1 << (SQLParser.T__41 - 40)) | (1 << (SQLParser.T__42 - 40)) | (1 << (SQLParser.T__43 - 40)) | (1 << (SQLParser.T__44 - 40)) | (1 << (SQLParser.T__45 - 40)) | (1 << (SQLParser.T__46 - 40)) | (1 << (SQLParser.T__47 - 40)) | (1 << (SQLParser.T__48 - 40)) | (1 << (SQLParser.T__49 - 40)) | (1 << (SQLParser.Identifier - 40)))) != 0):
+                    self.state = 326
+                    self.identifier()
 
 
-                self.state = 267
+                self.state = 329
                 self.match(SQLParser.T__15)
-                self.state = 268
+                self.state = 330
                 self.identifiers()
-                self.state = 269
+                self.state = 331
                 self.match(SQLParser.T__16)
-                self.state = 270
+                self.state = 332
                 self.match(SQLParser.T__37)
-                self.state = 271
-                self.match(SQLParser.Identifier)
-                self.state = 272
+                self.state = 333
+                self.identifier()
+                self.state = 334
                 self.match(SQLParser.T__15)
-                self.state = 273
+                self.state = 335
                 self.identifiers()
-                self.state = 274
+                self.state = 336
                 self.match(SQLParser.T__16)
                 pass
             else:
@@ -2014,31 +2511,31 @@ class SQLParser ( Parser ):
     def type_(self):
 
         localctx = SQLParser.Type_Context(self, self._ctx, self.state)
-        self.enterRule(localctx, 18, self.RULE_type_)
+        self.enterRule(localctx, 20, self.RULE_type_)
         try:
-            self.state = 284
+            self.state = 346
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [SQLParser.T__42]:
+            if token in [SQLParser.T__53]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 278
-                self.match(SQLParser.T__42)
+                self.state = 340
+                self.match(SQLParser.T__53)
                 pass
-            elif token in [SQLParser.T__43]:
+            elif token in [SQLParser.T__54]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 279
-                self.match(SQLParser.T__43)
-                self.state = 280
+                self.state = 341
+                self.match(SQLParser.T__54)
+                self.state = 342
                 self.match(SQLParser.T__15)
-                self.state = 281
+                self.state = 343
                 self.match(SQLParser.Integer)
-                self.state = 282
+                self.state = 344
                 self.match(SQLParser.T__16)
                 pass
-            elif token in [SQLParser.T__44]:
+            elif token in [SQLParser.T__55]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 283
-                self.match(SQLParser.T__44)
+                self.state = 345
+                self.match(SQLParser.T__55)
                 pass
             else:
                 raise NoViableAltException(self)
@@ -2087,21 +2584,21 @@ class SQLParser ( Parser ):
     def value_lists(self):
 
         localctx = SQLParser.Value_listsContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 20, self.RULE_value_lists)
+        self.enterRule(localctx, 22, self.RULE_value_lists)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 286
+            self.state = 348
             self.value_list()
-            self.state = 291
+            self.state = 353
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==SQLParser.T__39:
-                self.state = 287
-                self.match(SQLParser.T__39)
-                self.state = 288
+            while _la==SQLParser.T__50:
+                self.state = 349
+                self.match(SQLParser.T__50)
+                self.state = 350
                 self.value_list()
-                self.state = 293
+                self.state = 355
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -2149,27 +2646,27 @@ class SQLParser ( Parser ):
     def value_list(self):
 
         localctx = SQLParser.Value_listContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 22, self.RULE_value_list)
+        self.enterRule(localctx, 24, self.RULE_value_list)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 294
+            self.state = 356
             self.match(SQLParser.T__15)
-            self.state = 295
+            self.state = 357
             self.value()
-            self.state = 300
+            self.state = 362
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==SQLParser.T__39:
-                self.state = 296
-                self.match(SQLParser.T__39)
-                self.state = 297
+            while _la==SQLParser.T__50:
+                self.state = 358
+                self.match(SQLParser.T__50)
+                self.state = 359
                 self.value()
-                self.state = 302
+                self.state = 364
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 303
+            self.state = 365
             self.match(SQLParser.T__16)
         except RecognitionException as re:
             localctx.exception = re
@@ -2220,13 +2717,13 @@ class SQLParser ( Parser ):
     def value(self):
 
         localctx = SQLParser.ValueContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 24, self.RULE_value)
+        self.enterRule(localctx, 26, self.RULE_value)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 305
+            self.state = 367
             _la = self._input.LA(1)
-            if not(((((_la - 63)) & ~0x3f) == 0 and ((1 << (_la - 63)) & ((1 << (SQLParser.Null - 63)) | (1 << (SQLParser.Integer - 63)) | (1 << (SQLParser.String - 63)) | (1 << (SQLParser.Float - 63)))) != 0)):
+            if not(((((_la - 74)) & ~0x3f) == 0 and ((1 << (_la - 74)) & ((1 << (SQLParser.Null - 74)) | (1 << (SQLParser.Integer - 74)) | (1 << (SQLParser.String - 74)) | (1 << (SQLParser.Float - 74)))) != 0)):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
@@ -2275,21 +2772,21 @@ class SQLParser ( Parser ):
     def where_and_clause(self):
 
         localctx = SQLParser.Where_and_clauseContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 26, self.RULE_where_and_clause)
+        self.enterRule(localctx, 28, self.RULE_where_and_clause)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 307
+            self.state = 369
             self.where_clause()
-            self.state = 312
+            self.state = 374
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==SQLParser.T__45:
-                self.state = 308
-                self.match(SQLParser.T__45)
-                self.state = 309
+            while _la==SQLParser.T__56:
+                self.state = 370
+                self.match(SQLParser.T__56)
+                self.state = 371
                 self.where_clause()
-                self.state = 314
+                self.state = 376
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -2493,91 +2990,91 @@ class SQLParser ( Parser ):
     def where_clause(self):
 
         localctx = SQLParser.Where_clauseContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 28, self.RULE_where_clause)
+        self.enterRule(localctx, 30, self.RULE_where_clause)
         self._la = 0 # Token type
         try:
-            self.state = 346
+            self.state = 408
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,24,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,29,self._ctx)
             if la_ == 1:
                 localctx = SQLParser.Where_operator_expressionContext(self, localctx)
                 self.enterOuterAlt(localctx, 1)
-                self.state = 315
+                self.state = 377
                 self.column()
-                self.state = 316
+                self.state = 378
                 self.operator_()
-                self.state = 317
+                self.state = 379
                 self.expression()
                 pass
 
             elif la_ == 2:
                 localctx = SQLParser.Where_operator_selectContext(self, localctx)
                 self.enterOuterAlt(localctx, 2)
-                self.state = 319
+                self.state = 381
                 self.column()
-                self.state = 320
+                self.state = 382
                 self.operator_()
-                self.state = 321
+                self.state = 383
                 self.match(SQLParser.T__15)
-                self.state = 322
+                self.state = 384
                 self.select_table()
-                self.state = 323
+                self.state = 385
                 self.match(SQLParser.T__16)
                 pass
 
             elif la_ == 3:
                 localctx = SQLParser.Where_nullContext(self, localctx)
                 self.enterOuterAlt(localctx, 3)
-                self.state = 325
+                self.state = 387
                 self.column()
-                self.state = 326
-                self.match(SQLParser.T__46)
-                self.state = 328
+                self.state = 388
+                self.match(SQLParser.T__57)
+                self.state = 390
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==SQLParser.T__40:
-                    self.state = 327
-                    self.match(SQLParser.T__40)
+                if _la==SQLParser.T__51:
+                    self.state = 389
+                    self.match(SQLParser.T__51)
 
 
-                self.state = 330
+                self.state = 392
                 self.match(SQLParser.Null)
                 pass
 
             elif la_ == 4:
                 localctx = SQLParser.Where_in_listContext(self, localctx)
                 self.enterOuterAlt(localctx, 4)
-                self.state = 332
+                self.state = 394
                 self.column()
-                self.state = 333
-                self.match(SQLParser.T__47)
-                self.state = 334
+                self.state = 395
+                self.match(SQLParser.T__58)
+                self.state = 396
                 self.value_list()
                 pass
 
             elif la_ == 5:
                 localctx = SQLParser.Where_in_selectContext(self, localctx)
                 self.enterOuterAlt(localctx, 5)
-                self.state = 336
+                self.state = 398
                 self.column()
-                self.state = 337
-                self.match(SQLParser.T__47)
-                self.state = 338
+                self.state = 399
+                self.match(SQLParser.T__58)
+                self.state = 400
                 self.match(SQLParser.T__15)
-                self.state = 339
+                self.state = 401
                 self.select_table()
-                self.state = 340
+                self.state = 402
                 self.match(SQLParser.T__16)
                 pass
 
             elif la_ == 6:
                 localctx = SQLParser.Where_like_stringContext(self, localctx)
                 self.enterOuterAlt(localctx, 6)
-                self.state = 342
+                self.state = 404
                 self.column()
-                self.state = 343
-                self.match(SQLParser.T__48)
-                self.state = 344
+                self.state = 405
+                self.match(SQLParser.T__59)
+                self.state = 406
                 self.match(SQLParser.String)
                 pass
 
@@ -2596,11 +3093,12 @@ class SQLParser ( Parser ):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def Identifier(self, i:int=None):
+        def identifier(self, i:int=None):
             if i is None:
-                return self.getTokens(SQLParser.Identifier)
+                return self.getTypedRuleContexts(SQLParser.IdentifierContext)
             else:
-                return self.getToken(SQLParser.Identifier, i)
+                return self.getTypedRuleContext(SQLParser.IdentifierContext,i)
+
 
         def getRuleIndex(self):
             return SQLParser.RULE_column
@@ -2625,21 +3123,21 @@ class SQLParser ( Parser ):
     def column(self):
 
         localctx = SQLParser.ColumnContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 30, self.RULE_column)
+        self.enterRule(localctx, 32, self.RULE_column)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 350
+            self.state = 413
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,25,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,30,self._ctx)
             if la_ == 1:
-                self.state = 348
-                self.match(SQLParser.Identifier)
-                self.state = 349
-                self.match(SQLParser.T__49)
+                self.state = 410
+                self.identifier()
+                self.state = 411
+                self.match(SQLParser.T__60)
 
 
-            self.state = 352
-            self.match(SQLParser.Identifier)
+            self.state = 415
+            self.identifier()
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -2685,19 +3183,19 @@ class SQLParser ( Parser ):
     def expression(self):
 
         localctx = SQLParser.ExpressionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 32, self.RULE_expression)
+        self.enterRule(localctx, 34, self.RULE_expression)
         try:
-            self.state = 356
+            self.state = 419
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [SQLParser.Null, SQLParser.Integer, SQLParser.String, SQLParser.Float]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 354
+                self.state = 417
                 self.value()
                 pass
-            elif token in [SQLParser.Identifier]:
+            elif token in [SQLParser.T__39, SQLParser.T__40, SQLParser.T__41, SQLParser.T__42, SQLParser.T__43, SQLParser.T__44, SQLParser.T__45, SQLParser.T__46, SQLParser.T__47, SQLParser.T__48, SQLParser.T__49, SQLParser.Identifier]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 355
+                self.state = 418
                 self.column()
                 pass
             else:
@@ -2717,11 +3215,12 @@ class SQLParser ( Parser ):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def Identifier(self, i:int=None):
+        def identifier(self, i:int=None):
             if i is None:
-                return self.getTokens(SQLParser.Identifier)
+                return self.getTypedRuleContexts(SQLParser.IdentifierContext)
             else:
-                return self.getToken(SQLParser.Identifier, i)
+                return self.getTypedRuleContext(SQLParser.IdentifierContext,i)
+
 
         def EqualOrAssign(self, i:int=None):
             if i is None:
@@ -2759,29 +3258,29 @@ class SQLParser ( Parser ):
     def set_clause(self):
 
         localctx = SQLParser.Set_clauseContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 34, self.RULE_set_clause)
+        self.enterRule(localctx, 36, self.RULE_set_clause)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 358
-            self.match(SQLParser.Identifier)
-            self.state = 359
+            self.state = 421
+            self.identifier()
+            self.state = 422
             self.match(SQLParser.EqualOrAssign)
-            self.state = 360
+            self.state = 423
             self.value()
-            self.state = 367
+            self.state = 431
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==SQLParser.T__39:
-                self.state = 361
-                self.match(SQLParser.T__39)
-                self.state = 362
-                self.match(SQLParser.Identifier)
-                self.state = 363
+            while _la==SQLParser.T__50:
+                self.state = 424
+                self.match(SQLParser.T__50)
+                self.state = 425
+                self.identifier()
+                self.state = 426
                 self.match(SQLParser.EqualOrAssign)
-                self.state = 364
+                self.state = 427
                 self.value()
-                self.state = 369
+                self.state = 433
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -2829,30 +3328,30 @@ class SQLParser ( Parser ):
     def selectors(self):
 
         localctx = SQLParser.SelectorsContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 36, self.RULE_selectors)
+        self.enterRule(localctx, 38, self.RULE_selectors)
         self._la = 0 # Token type
         try:
-            self.state = 379
+            self.state = 443
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [SQLParser.T__50]:
+            if token in [SQLParser.T__61]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 370
-                self.match(SQLParser.T__50)
+                self.state = 434
+                self.match(SQLParser.T__61)
                 pass
-            elif token in [SQLParser.Count, SQLParser.Average, SQLParser.Max, SQLParser.Min, SQLParser.Sum, SQLParser.Identifier]:
+            elif token in [SQLParser.T__39, SQLParser.T__40, SQLParser.T__41, SQLParser.T__42, SQLParser.T__43, SQLParser.T__44, SQLParser.T__45, SQLParser.T__46, SQLParser.T__47, SQLParser.T__48, SQLParser.T__49, SQLParser.Count, SQLParser.Average, SQLParser.Max, SQLParser.Min, SQLParser.Sum, SQLParser.Identifier]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 371
+                self.state = 435
                 self.selector()
-                self.state = 376
+                self.state = 440
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                while _la==SQLParser.T__39:
-                    self.state = 372
-                    self.match(SQLParser.T__39)
-                    self.state = 373
+                while _la==SQLParser.T__50:
+                    self.state = 436
+                    self.match(SQLParser.T__50)
+                    self.state = 437
                     self.selector()
-                    self.state = 378
+                    self.state = 442
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
@@ -2908,38 +3407,38 @@ class SQLParser ( Parser ):
     def selector(self):
 
         localctx = SQLParser.SelectorContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 38, self.RULE_selector)
+        self.enterRule(localctx, 40, self.RULE_selector)
         try:
-            self.state = 391
+            self.state = 455
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,30,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,35,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 381
+                self.state = 445
                 self.column()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 382
+                self.state = 446
                 self.aggregator()
-                self.state = 383
+                self.state = 447
                 self.match(SQLParser.T__15)
-                self.state = 384
+                self.state = 448
                 self.column()
-                self.state = 385
+                self.state = 449
                 self.match(SQLParser.T__16)
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 387
+                self.state = 451
                 self.match(SQLParser.Count)
-                self.state = 388
+                self.state = 452
                 self.match(SQLParser.T__15)
-                self.state = 389
-                self.match(SQLParser.T__50)
-                self.state = 390
+                self.state = 453
+                self.match(SQLParser.T__61)
+                self.state = 454
                 self.match(SQLParser.T__16)
                 pass
 
@@ -2958,11 +3457,12 @@ class SQLParser ( Parser ):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def Identifier(self, i:int=None):
+        def identifier(self, i:int=None):
             if i is None:
-                return self.getTokens(SQLParser.Identifier)
+                return self.getTypedRuleContexts(SQLParser.IdentifierContext)
             else:
-                return self.getToken(SQLParser.Identifier, i)
+                return self.getTypedRuleContext(SQLParser.IdentifierContext,i)
+
 
         def getRuleIndex(self):
             return SQLParser.RULE_identifiers
@@ -2987,21 +3487,21 @@ class SQLParser ( Parser ):
     def identifiers(self):
 
         localctx = SQLParser.IdentifiersContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 40, self.RULE_identifiers)
+        self.enterRule(localctx, 42, self.RULE_identifiers)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 393
-            self.match(SQLParser.Identifier)
-            self.state = 398
+            self.state = 457
+            self.identifier()
+            self.state = 462
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==SQLParser.T__39:
-                self.state = 394
-                self.match(SQLParser.T__39)
-                self.state = 395
-                self.match(SQLParser.Identifier)
-                self.state = 400
+            while _la==SQLParser.T__50:
+                self.state = 458
+                self.match(SQLParser.T__50)
+                self.state = 459
+                self.identifier()
+                self.state = 464
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -3013,6 +3513,57 @@ class SQLParser ( Parser ):
             self.exitRule()
         return localctx
 
+    class IdentifierContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def Identifier(self):
+            return self.getToken(SQLParser.Identifier, 0)
+
+        def getRuleIndex(self):
+            return SQLParser.RULE_identifier
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterIdentifier" ):
+                listener.enterIdentifier(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitIdentifier" ):
+                listener.exitIdentifier(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIdentifier" ):
+                return visitor.visitIdentifier(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def identifier(self):
+
+        localctx = SQLParser.IdentifierContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 44, self.RULE_identifier)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 465
+            _la = self._input.LA(1)
+            if not(((((_la - 40)) & ~0x3f) == 0 and ((1 << (_la - 40)) & ((1 << (SQLParser.T__39 - 40)) | (1 << (SQLParser.T__40 - 40)) | (1 << (SQLParser.T__41 - 40)) | (1 << (SQLParser.T__42 - 40)) | (1 << (SQLParser.T__43 - 40)) | (1 << (SQLParser.T__44 - 40)) | (1 << (SQLParser.T__45 - 40)) | (1 << (SQLParser.T__46 - 40)) | (1 << (SQLParser.T__47 - 40)) | (1 << (SQLParser.T__48 - 40)) | (1 << (SQLParser.T__49 - 40)) | (1 << (SQLParser.Identifier - 40)))) != 0)):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
     class Operator_Context(ParserRuleContext):
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
@@ -3060,13 +3611,13 @@ class SQLParser ( Parser ):
     def operator_(self):
 
         localctx = SQLParser.Operator_Context(self, self._ctx, self.state)
-        self.enterRule(localctx, 42, self.RULE_operator_)
+        self.enterRule(localctx, 46, self.RULE_operator_)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 401
+            self.state = 467
             _la = self._input.LA(1)
-            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << SQLParser.EqualOrAssign) | (1 << SQLParser.Less) | (1 << SQLParser.LessEqual) | (1 << SQLParser.Greater) | (1 << SQLParser.GreaterEqual) | (1 << SQLParser.NotEqual))) != 0)):
+            if not(((((_la - 63)) & ~0x3f) == 0 and ((1 << (_la - 63)) & ((1 << (SQLParser.EqualOrAssign - 63)) | (1 << (SQLParser.Less - 63)) | (1 << (SQLParser.LessEqual - 63)) | (1 << (SQLParser.Greater - 63)) | (1 << (SQLParser.GreaterEqual - 63)) | (1 << (SQLParser.NotEqual - 63)))) != 0)):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
@@ -3123,13 +3674,13 @@ class SQLParser ( Parser ):
     def aggregator(self):
 
         localctx = SQLParser.AggregatorContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 44, self.RULE_aggregator)
+        self.enterRule(localctx, 48, self.RULE_aggregator)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 403
+            self.state = 469
             _la = self._input.LA(1)
-            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << SQLParser.Count) | (1 << SQLParser.Average) | (1 << SQLParser.Max) | (1 << SQLParser.Min) | (1 << SQLParser.Sum))) != 0)):
+            if not(((((_la - 69)) & ~0x3f) == 0 and ((1 << (_la - 69)) & ((1 << (SQLParser.Count - 69)) | (1 << (SQLParser.Average - 69)) | (1 << (SQLParser.Max - 69)) | (1 << (SQLParser.Min - 69)) | (1 << (SQLParser.Sum - 69)))) != 0)):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
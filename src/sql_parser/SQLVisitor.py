@@ -134,6 +134,51 @@ class SQLVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by SQLParser#show_buffer_stats.
+    def visitShow_buffer_stats(self, ctx:SQLParser.Show_buffer_statsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by SQLParser#reset_buffer_stats.
+    def visitReset_buffer_stats(self, ctx:SQLParser.Reset_buffer_statsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by SQLParser#set_buffer_quota.
+    def visitSet_buffer_quota(self, ctx:SQLParser.Set_buffer_quotaContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by SQLParser#drop_buffer_quota.
+    def visitDrop_buffer_quota(self, ctx:SQLParser.Drop_buffer_quotaContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by SQLParser#show_buffer_quotas.
+    def visitShow_buffer_quotas(self, ctx:SQLParser.Show_buffer_quotasContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by SQLParser#set_page_size.
+    def visitSet_page_size(self, ctx:SQLParser.Set_page_sizeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by SQLParser#set_trace.
+    def visitSet_trace(self, ctx:SQLParser.Set_traceContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by SQLParser#show_trace_stats.
+    def visitShow_trace_stats(self, ctx:SQLParser.Show_trace_statsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by SQLParser#reset_trace_stats.
+    def visitReset_trace_stats(self, ctx:SQLParser.Reset_trace_statsContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by SQLParser#field_list.
     def visitField_list(self, ctx:SQLParser.Field_listContext):
         return self.visitChildren(ctx)
@@ -239,6 +284,11 @@ class SQLVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by SQLParser#identifier.
+    def visitIdentifier(self, ctx:SQLParser.IdentifierContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by SQLParser#operator_.
     def visitOperator_(self, ctx:SQLParser.Operator_Context):
         return self.visitChildren(ctx)
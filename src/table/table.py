@@ -9,7 +9,7 @@ from common.common import *
 import struct
 from index_management.ix_manager import ix_manager
 from index_management.ix_index_scan import IX_IndexScan
-from operators.conditions import Condition, AlgebraCondition
+from operators.conditions import Condition, AlgebraCondition, InListCondition
 from utils.bitwise import *
 import time
 from sm_manager import sm_manager
@@ -159,7 +159,7 @@ class Table():
         return self._name
 
     @staticmethod
-    def create_table(name: str, columns: List[Column], pk: List[int], fk: List[Dict]):
+    def create_table(name: str, columns: List[Column], pk: List[int], fk: List[Dict], page_size: int = TABLE_PAGE_SIZE):
         rm_manager.create_file(name)
 
         file_handle: RM_FileHandle = rm_manager.open_file(name)
@@ -201,6 +201,7 @@ class Table():
         meta['primary_keys'] = pk
         meta['foreign_key_number'] = len(fk)
         meta['foreign_keys'] = fk
+        meta['page_size'] = page_size
 
         file_handle.init_meta(meta)
 
@@ -215,6 +216,7 @@ class Table():
             idx_meta['field_number'] = len(pk)
             idx_meta['fields'] = [
                 (columns[each].type, columns[each].size) for each in pk]
+            idx_meta['page_size'] = page_size
             idx_handle.init_meta(idx_meta)
             idx_handle.sync_meta()
             ix_manager.close_index(name, index_no)
@@ -229,6 +231,7 @@ class Table():
         idx_meta['field_number'] = len(column_idx)
         idx_meta['fields'] = [
             (self._columns[each].type, self._columns[each].size) for each in column_idx]
+        idx_meta['page_size'] = self._file_handle.meta['page_size']
         idx_handle.init_meta(idx_meta)
         idx_handle.sync_meta()
         self._index_handles[index_no] = idx_handle
@@ -263,6 +266,11 @@ class Table():
         for each in self._index_handles.values():
             each.read_meta()
 
+    def sync_meta(self):
+        for each in self._index_handles.values():
+            each.sync_meta()
+        self._file_handle.sync_meta()
+
     def __del__(self) -> None:
         for each in self._index_handles:
             ix_manager.close_index(self._name, each)
@@ -289,11 +297,8 @@ class Table():
 
     def insert_records(self, fields_list: np.ndarray):
         # For locality, insert all records first, then insert all indexes
-        rids = []
-        for each in fields_list:
-            data: np.ndarray = self._file_handle.pack_record(each)
-            rid = self._file_handle.insert_record(data)
-            rids.append(rid)
+        datas: np.ndarray = self._file_handle.pack_records(fields_list)
+        rids = self._file_handle.insert_records(datas)
         for index_no in self._index_handles:
             column_idx = int_to_list_int(index_no)
             handle = self._index_handles[index_no]
@@ -323,16 +328,63 @@ class Table():
             vals = record.data[column_idx]
             handle.insert_entry(vals, rid)
 
-    def load_all_records(self) -> List[Record]:
+    def load_all_records(self, conds: List[Condition] = ()) -> List[Record]:
+        records: List[Record] = list()
+        for rids, columns in self.scan_columns(conds=conds):
+            fields_list = self._file_handle.columns_to_rows(columns)
+            records.extend(Record(fields, RM_Rid(page_no, slot_no))
+                           for fields, (page_no, slot_no) in zip(fields_list, rids.tolist()))
+        return records
+
+    def scan_columns(self, batch_pages: int = SCAN_BATCH_PAGES, conds: List[Condition] = ()):
+        """ Yield (rids, columns) of the records satisfying conds, batch_pages data pages at a time.
+            rids is an int32 array of (page_no, slot_no) rows, columns one numpy array per column.
+            conds must be accepted by can_push_down().
+        """
         scaner: RM_FileScan = RM_FileScan()
         scaner.open_scan(self._file_handle)
-        records: List = list()
-        raw_record = scaner.next()
-        for each in raw_record:
-            rec = self._file_handle.unpack_record(each.data)
-            records.append(Record(rec, each.rid))
+        for each in conds:
+            scaner.add_condition(*self._scan_condition(each))
+        yield from scaner.next_batch(batch_pages)
         scaner.close_scan()
-        return records
+
+    def can_push_down(self, cond: Condition) -> bool:
+        # only the conditions compared as python would compare them are evaluated by the file scan
+        if isinstance(cond, AlgebraCondition):
+            values = [cond._value]
+        elif isinstance(cond, InListCondition):
+            values = list(cond._values)
+        else:
+            return False
+        if not 0 <= cond._col_idx < len(self._columns):
+            return False
+        if self._columns[cond._col_idx].type == TYPE_STR:
+            return all(type(each) is str for each in values)
+        return all(type(each) in (int, float) for each in values)
+
+    def _scan_condition(self, cond: Condition) -> Tuple[CompOp, Union[int, float, str, list], int, int, int]:
+        col_idx = cond._col_idx
+        column = self._columns[col_idx]
+        field_off = sum(each.size for each in self._columns[:col_idx])
+        if isinstance(cond, InListCondition):
+            return CompOp.IN, list(cond._values), column.type, column.size, field_off
+        return cond._operator, cond._value, column.type, column.size, field_off
+
+    def load_all_columns(self) -> List[np.ndarray]:
+        empty = np.zeros((0, self._file_handle.meta['record_size']), dtype=np.uint8)
+        batches = [columns for rids, columns in self.scan_columns()]
+        if len(batches) == 0:
+            return self._file_handle.unpack_columns(empty)
+        return [np.concatenate(each) for each in zip(*batches)]
+
+    def _stack_records(self, raw_records: List) -> np.ndarray:
+        if len(raw_records) == 0:
+            return np.zeros((0, self._file_handle.meta['record_size']), dtype=np.uint8)
+        return np.stack([each.data for each in raw_records])
+
+    def _unpack_records(self, raw_records: List) -> List[Record]:
+        fields_list = self._file_handle.unpack_records(self._stack_records(raw_records))
+        return [Record(fields, each.rid) for fields, each in zip(fields_list, raw_records)]
 
     def load_records_with_cond(self, conds: List[AlgebraCondition]) -> List[Record]:
         scanner = IX_IndexScan()
@@ -352,10 +404,8 @@ class Table():
         for each in rid_sets[1:]:
             res = res.intersection(each)
 
-        rm_records = [self._file_handle.get_record(each[0]) for each in res]
-        records = [Record(self._file_handle.unpack_record(
-            each.data), each.rid) for each in rm_records]
-        return records
+        rm_records = self._file_handle.get_records([each[0] for each in res])
+        return self._unpack_records(rm_records)
 
     def get_column_names(self) -> List[str]:
         return [i.name for i in self._columns]
@@ -7,6 +7,8 @@ import config as cf
 import test.test_paged_file as test_pf
 import test.test_record_management as test_rm
 import test.test_index_management as test_ix
+import test.test_log_management as test_lm
+import test.test_system_management as test_sm
 
 if __name__ == '__main__':
     np.random.seed(0)
@@ -17,6 +19,8 @@ if __name__ == '__main__':
         test_pf.test()
         test_rm.test()
         test_ix.test()
+        test_lm.test()
+        test_sm.test()
     except Exception as e:
         traceback.print_exc()
     shutil.rmtree(cf.TEST_ROOT)
@@ -127,9 +127,107 @@ def test_modify_verbose():
     print(f'Modify verbose passed!')
 
 
+def test_index_page_reuse():
+    file_name = os.path.join(cf.TEST_ROOT, 'test_index_page_reuse')
+    index_no = 0
+    ix_manager.create_index(file_name, index_no)
+    index_handle: IX_IndexHandle = ix_manager.open_index(file_name, index_no)
+    meta = {'field_number': 1, 'fields': [(cf.TYPE_INT, 4)]}
+    index_handle.init_meta(meta)
+    N, M = 10, 10
+    for round in range(3):
+        for i in range(N * M):
+            index_handle.insert_entry([i % N], RM_Rid(round, i), i)
+        if round == 0: page_cnt = pf_manager.get_page_cnt(index_handle.data_file_id)
+        # rid buckets emptied by removing entries are released and reused by the next round
+        assert pf_manager.get_page_cnt(index_handle.data_file_id) == page_cnt
+        for i in range(N * M):
+            index_handle.remove_entry([i % N], RM_Rid(round, i))
+        index_scan = IX_IndexScan()
+        index_scan.open_scan(index_handle, CompOp.NO)
+        assert len(list(index_scan.next())) == 0
+    free_pages = pf_manager.get_free_pages(index_handle.data_file_id)
+    assert free_pages[0] > 0
+    ix_manager.close_index(file_name, index_no)
+    index_handle = ix_manager.open_index(file_name, index_no)
+    index_handle.read_meta()
+    assert pf_manager.get_free_pages(index_handle.data_file_id) == free_pages
+    ix_manager.close_index(file_name, index_no)
+    ix_manager.remove_index(file_name, index_no)
+    print(f'Index page reuse passed!')
+
+
+def test_index_page_size():
+    file_name = os.path.join(cf.TEST_ROOT, 'test_index_page_size')
+    N = 500
+    node_capacities = []
+    for index_no, page_size in enumerate((cf.PAGE_SIZE, 4 * cf.PAGE_SIZE)):
+        ix_manager.create_index(file_name, index_no)
+        index_handle: IX_IndexHandle = ix_manager.open_index(file_name, index_no)
+        index_handle.init_meta({'field_number': 1, 'fields': [(cf.TYPE_INT, 4)], 'page_size': page_size})
+        node_capacities.append(index_handle.meta['node_capacity'])
+        for i in np.random.permutation(N):
+            index_handle.insert_entry([int(i) % (N // 2)], RM_Rid(int(i), 0), 0)
+        ix_manager.close_index(file_name, index_no)
+        # the page size, and so the fan-out, is read from the meta after reopening the index
+        index_handle = ix_manager.open_index(file_name, index_no)
+        assert index_handle.read_meta()['page_size'] == page_size
+        assert pf_manager.get_page_size(index_handle.data_file_id) == page_size
+        index_scan = IX_IndexScan()
+        index_scan.open_scan(index_handle, CompOp.EQ, [7])
+        assert sorted(rid.page_no for rid, _ in index_scan.next()) == [7, 7 + N // 2]
+        index_scan.open_scan(index_handle, CompOp.NO)
+        assert len(list(index_scan.next())) == N
+        ix_manager.close_index(file_name, index_no)
+        ix_manager.remove_index(file_name, index_no)
+    assert node_capacities[1] > 4 * node_capacities[0]
+    print(f'Index page size passed!')
+
+
+def test_scan_read_leaves():
+    ''' Test the index scan reads the following leaves together instead of pinning them one by one.
+    '''
+    file_name = os.path.join(cf.TEST_ROOT, 'test_scan_read_leaves')
+    index_no = 0
+    ix_manager.create_index(file_name, index_no)
+    index_handle: IX_IndexHandle = ix_manager.open_index(file_name, index_no)
+    index_handle.init_meta({'field_number': 1, 'fields': [(cf.TYPE_INT, 4)]})
+    N = 400
+    values = np.random.permutation(N)
+    for i, value in enumerate(values):
+        index_handle.insert_entry([int(value)], RM_Rid(int(value), 0), 0)
+    ix_manager.close_index(file_name, index_no)
+    pin_page = pf_manager.pin_page
+    for comp_op, value, expected in [(CompOp.NO, None, list(range(N))),
+        (CompOp.GE, N // 3, list(range(N // 3, N))), (CompOp.LT, N // 2, list(range(N // 2)))]:
+        index_handle = ix_manager.open_index(file_name, index_no)
+        index_handle.read_meta()
+        data_file_id, pinned = index_handle.data_file_id, []
+        def counted_pin_page(file_id, page_id, *args, **kwargs):
+            if file_id == data_file_id: pinned.append(page_id)
+            return pin_page(file_id, page_id, *args, **kwargs)
+        pf_manager.pin_page = counted_pin_page
+        try:
+            index_scan = IX_IndexScan()
+            index_scan.open_scan(index_handle, comp_op, [value])
+            scanned = [rid.page_no for rid, verbose in index_scan.next()]
+            index_scan.close_scan()
+        finally: pf_manager.pin_page = pin_page
+        assert scanned == expected, 'test_scan_read_leaves failed!'
+        leaves = [page_id for page_id in pinned
+            if node_cache[data_file_id][page_id].header.node_type == cf.NODE_TYPE_LEAF]
+        assert len(leaves) <= 1, 'test_scan_read_leaves failed!'   # only the first one
+        ix_manager.close_index(file_name, index_no)
+    ix_manager.remove_index(file_name, index_no)
+    print(f'test_scan_read_leaves passed!')
+
+
 def test():
     print(f'-------- Test index management --------')
     test_index_init()
     test_index_insert()
     test_index_remove()
     test_modify_verbose()
+    test_index_page_reuse()
+    test_index_page_size()
+    test_scan_read_leaves()
\ No newline at end of file
@@ -0,0 +1,349 @@
+import os
+import sys
+import glob
+import struct
+import threading
+import subprocess
+import numpy as np
+from typing import Dict, List
+
+import config as cf
+from paged_file.pf_manager import pf_manager
+from record_management.rm_manager import rm_manager
+from record_management.rm_file_handle import RM_FileHandle
+from record_management.rm_file_scan import RM_FileScan
+from index_management.ix_manager import ix_manager
+from index_management.ix_index_scan import IX_IndexScan
+from log_management.lm_manager import LM_Manager, lm_manager
+from log_management.lm_log_record import LM_LogRecord, LOG_UPDATE, LOG_FORMAT, LOG_COMMIT
+from errors.err_log_management import ReadLogError
+from utils.enums import CompOp
+
+
+def replay(manager:LM_Manager, file_names:List[str]) -> Dict[str, Dict[int, np.ndarray]]:
+    ''' Redo the log from its start on empty pages.
+    return: Dict[str, Dict[int, np.ndarray]], file_name -> page_id -> page.
+    '''
+    pages = {file_name: {} for file_name in file_names}
+    for _, record in manager.read_records():
+        if record.file_name not in pages: continue
+        page = pages[record.file_name].setdefault(record.page_id, np.zeros(cf.PAGE_SIZE, dtype=np.uint8))
+        record.apply(page)
+    return pages
+
+
+def check_replay(manager:LM_Manager, file_names:List[str], message:str):
+    ''' Check the pages of some closed files are the same as the log redone.
+    '''
+    for file_name, pages in replay(manager, file_names).items():
+        file_id = pf_manager.open_file(file_name)
+        assert pf_manager.get_page_cnt(file_id) == len(pages), message
+        for page_id, page in pages.items():
+            data = pf_manager.read_page(file_id, page_id)
+            assert np.array_equal(data, page), message
+        pf_manager.close_file(file_id)
+
+
+def read_files(file_names:List[str]) -> Dict[str, List[np.ndarray]]:
+    ''' Read all pages of some closed files.
+    '''
+    files = {}
+    for file_name in file_names:
+        file_id = pf_manager.open_file(file_name)
+        files[file_name] = [pf_manager.read_page(file_id, i) for i in range(pf_manager.get_page_cnt(file_id))]
+        pf_manager.close_file(file_id)
+    return files
+
+
+def create_table(file_name:str, page_size:int=cf.PAGE_SIZE) -> RM_FileHandle:
+    ''' Create and open a table of two int columns, with an index on the second one.
+    '''
+    meta = {
+        'record_size': 2 * cf.SIZE_INT,
+        'column_number': 2,
+        'columns': [ {
+                'column_type': cf.TYPE_INT,
+                'column_size': cf.SIZE_INT,
+                'column_name_length': len(name),
+                'column_name': name,
+                'column_default_en': False,
+                'column_default': np.zeros(cf.SIZE_INT, dtype=np.uint8),
+            } for name in ('id', 'val')
+        ],
+        'primary_key_size': 0, 'primary_keys': [],
+        'foreign_key_number': 0, 'foreign_keys': [],
+        'page_size': page_size,
+    }
+    rm_manager.create_file(file_name)
+    handle:RM_FileHandle = rm_manager.open_file(file_name)
+    handle.init_meta(meta)
+    ix_manager.create_index(file_name, 1)
+    index_handle = ix_manager.open_index(file_name, 1)
+    index_handle.init_meta({'field_number': 1, 'fields': [(cf.TYPE_INT, cf.SIZE_INT)], 'page_size': page_size})
+    return handle
+
+
+def test_log_record():
+    ''' Test serializing log records, and finding the changed byte ranges.
+    '''
+    record = LM_LogRecord(LOG_UPDATE, 'a.data', 3, [(0, b'\x01\x02'), (17, b'\xff' * 9)])
+    data = record.serialize()
+    other, size = LM_LogRecord.deserialize(data + b'\x00' * 5)
+    assert size == len(data), 'test_log_record failed!'
+    assert (other.record_type, other.file_name, other.page_id, other.segments) == \
+        (LOG_UPDATE, 'a.data', 3, record.segments), 'test_log_record failed!'
+    for torn in (data[:-1], data[:3], data[:5] + b'\x00' + data[6:]):
+        try:
+            LM_LogRecord.deserialize(torn)
+            assert False, 'test_log_record failed!'
+        except ReadLogError as exception: pass
+    page = np.zeros(64, dtype=np.uint8)
+    LM_LogRecord(LOG_FORMAT, 'a.data', 0, [(4, b'\x07')]).apply(page)
+    assert page[4] == 7 and np.count_nonzero(page) == 1, 'test_log_record failed!'
+    old = np.zeros(256, dtype=np.uint8)
+    new = old.copy()
+    new[[1, 3, 100, 255]] = 1
+    assert LM_Manager.diff_ranges(old, new) == [(1, 3), (100, 1), (255, 1)], 'test_log_record failed!'
+    assert LM_Manager.diff_ranges(old, old) == [], 'test_log_record failed!'
+    print(f'test_log_record passed!')
+
+
+def test_log_file():
+    ''' Test appending, syncing and reading records, a torn tail is truncated when reopening.
+    '''
+    log_name = os.path.join(cf.TEST_ROOT, 'test_log_file.log')
+    manager = LM_Manager()
+    manager.open(log_name)
+    lsns = [manager.commit() for _ in range(5)]
+    assert lsns == sorted(lsns) and lsns[0] > 0, 'test_log_file failed!'
+    assert [lsn for lsn, _ in manager.read_records()] == lsns, 'test_log_file failed!'
+    manager.close()
+    with open(log_name, 'ab') as file:
+        file.write(b'\x40\x00\x00\x00torn')
+    manager = LM_Manager()
+    manager.open(log_name)
+    assert manager.get_stats()['next_lsn'] == lsns[-1], 'test_log_file failed!'
+    assert all(record.record_type == LOG_COMMIT for _, record in manager.read_records()), 'test_log_file failed!'
+    assert manager.commit() > lsns[-1], 'test_log_file failed!'
+    manager.close()
+    os.remove(log_name)
+    print(f'test_log_file passed!')
+
+
+def test_wal_rule():
+    ''' Test the log is synced before a dirty page is written back, and redoing the
+        log of a table and its index gives the pages on disk.
+    '''
+    log_name = os.path.join(cf.TEST_ROOT, 'test_wal_rule.log')
+    file_name = os.path.join(cf.TEST_ROOT, 'test_wal_rule')
+    lm_manager.open(log_name)
+    handle = create_table(file_name)
+    index_handle = ix_manager.opened_indicies[f'{file_name}.1']
+    N = 4 * handle.meta['record_per_page']
+    rids = [handle.insert_record(np.frombuffer(struct.pack('<ii', i, -i), dtype=np.uint8)) for i in range(N)]
+    # nothing is synced before a commit, but writing back the pages syncs the log first
+    stats = lm_manager.get_stats()
+    assert stats['flushed_lsn'] < stats['next_lsn'], 'test_wal_rule failed!'
+    pf_manager.sync_file(handle.data_file_id)
+    if handle.data_file_id not in pf_manager.mmap_files:    # written back by the OS
+        assert lm_manager.get_stats()['flushed_lsn'] == stats['next_lsn'], 'test_wal_rule failed!'
+    for i, rid in enumerate(rids):
+        index_handle.insert_entry([i % 7], rid)
+    for i, rid in enumerate(rids):
+        if i % 3 == 0: handle.update_record(rid, np.frombuffer(struct.pack('<ii', i, i), dtype=np.uint8))
+        elif i % 3 == 1 or i > N // 2:
+            handle.remove_record(rid)
+            index_handle.remove_entry([i % 7], rid)
+    handle.sync_meta()
+    index_handle.sync_meta()
+    lsn = lm_manager.commit()
+    assert lm_manager.get_stats()['flushed_lsn'] >= lsn, 'test_wal_rule failed!'
+    file_names = [file_name + suffix for suffix in (cf.TABLE_META_SUFFIX, cf.TABLE_DATA_SUFFIX)] + \
+        [f'{file_name}.1{suffix}' for suffix in (cf.INDEX_META_SUFFIX, cf.INDEX_DATA_SUFFIX)]
+    ix_manager.close_index(file_name, 1)
+    rm_manager.close_file(file_name)
+    check_replay(lm_manager, file_names, 'test_wal_rule failed!')
+    lm_manager.close()
+    assert os.path.getsize(log_name) < 100, 'test_wal_rule failed!'     # emptied, no file logged is opened
+    ix_manager.remove_index(file_name, 1)
+    rm_manager.remove_file(file_name)
+    os.remove(log_name)
+    print(f'test_wal_rule passed!')
+
+
+def test_group_commit():
+    ''' Test the concurrent commits are synced by fewer fsync calls.
+    '''
+    log_name = os.path.join(cf.TEST_ROOT, 'test_group_commit.log')
+    manager = LM_Manager()
+    manager.open(log_name)
+    commit_delay, cf.WAL_COMMIT_DELAY = cf.WAL_COMMIT_DELAY, 0.001
+    threads_cnt, commits_cnt = 8, 20
+    lsns = [[] for _ in range(threads_cnt)]
+    def run(i:int):
+        for _ in range(commits_cnt):
+            lsn = manager.commit()
+            assert manager.get_stats()['flushed_lsn'] >= lsn, 'test_group_commit failed!'
+            lsns[i].append(lsn)
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(threads_cnt)]
+    for thread in threads: thread.start()
+    for thread in threads: thread.join()
+    cf.WAL_COMMIT_DELAY = commit_delay
+    stats = manager.get_stats()
+    assert stats['commits'] == threads_cnt * commits_cnt, 'test_group_commit failed!'
+    assert sum(len(each) for each in lsns) == stats['commits'], 'test_group_commit failed!'
+    assert stats['flushes'] < stats['commits'], 'test_group_commit failed!'
+    assert len(list(manager.read_records())) == stats['commits'], 'test_group_commit failed!'
+    manager.close()
+    os.remove(log_name)
+    print(f'test_group_commit passed!')
+
+
+def test_checkpoint():
+    ''' Test a checkpoint writes back the dirty pages and the index caches while the table is
+        changed by another thread, and a crash after it is recovered by redoing the records after it.
+    '''
+    root = os.path.join(cf.TEST_ROOT, 'test_checkpoint')
+    os.makedirs(root, exist_ok=True)
+    log_name = os.path.join(root, 'wal.log')
+    file_name = os.path.join(root, 'test_checkpoint')
+    lm_manager.open(log_name)
+    handle = create_table(file_name)
+    index_handle = ix_manager.opened_indicies[f'{file_name}.1']
+    def insert(start:int, end:int):
+        for i in range(start, end):
+            rid = handle.insert_record(np.frombuffer(struct.pack('<ii', i, i % 13), dtype=np.uint8))
+            index_handle.insert_entry([i % 13], rid)
+        handle.sync_meta()
+        index_handle.sync_meta()
+        lm_manager.commit()
+    N = 3 * handle.meta['record_per_page']
+    insert(0, N)
+    # a fuzzy checkpoint, the table is changed meanwhile
+    batch_delay, cf.CHECKPOINT_BATCH_DELAY = cf.CHECKPOINT_BATCH_DELAY, 0.001
+    thread = threading.Thread(target=lm_manager.checkpoint)
+    thread.start()
+    insert(N, 2 * N)
+    thread.join()
+    cf.CHECKPOINT_BATCH_DELAY = batch_delay
+    start_lsn = lm_manager.checkpoint_lsn
+    assert start_lsn > 0 and lm_manager.get_stats()['checkpoints'] == 1, 'test_checkpoint failed!'
+    assert all(lsn > start_lsn for lsn, _ in lm_manager.read_records()), 'test_checkpoint failed!'
+    insert(2 * N, 3 * N)
+    redo_cnt = sum(record.record_type != LOG_COMMIT for _, record in lm_manager.read_records())
+    assert redo_cnt > 0, 'test_checkpoint failed!'
+    # crash: keep the files on disk now, then close to get the pages expected
+    crashed = {}
+    for path in glob.glob(os.path.join(root, '*')):
+        with open(path, 'rb') as file: crashed[path] = file.read()
+    ix_manager.close_index(file_name, 1)
+    rm_manager.close_file(file_name)
+    lm_manager.close()
+    file_names = [file_name + suffix for suffix in (cf.TABLE_META_SUFFIX, cf.TABLE_DATA_SUFFIX)] + \
+        [f'{file_name}.1{suffix}' for suffix in (cf.INDEX_META_SUFFIX, cf.INDEX_DATA_SUFFIX)]
+    expected = read_files(file_names)
+    for path in glob.glob(os.path.join(root, '*')):
+        if path not in crashed: os.remove(path)
+    for path, data in crashed.items():
+        with open(path, 'wb') as file: file.write(data)
+    lm_manager.open(log_name)
+    assert lm_manager.recover() == redo_cnt, 'test_checkpoint failed!'
+    assert len(list(lm_manager.read_records())) == 0, 'test_checkpoint failed!'
+    files = read_files(file_names)
+    for name in file_names:
+        assert len(files[name]) >= len(expected[name]), 'test_checkpoint failed!'
+        for page, other in zip(files[name], expected[name]):
+            assert np.array_equal(page, other), 'test_checkpoint failed!'
+        # a memory-mapped file crashed with the empty pages of its last segment
+        assert not any(page.any() for page in files[name][len(expected[name]):]), 'test_checkpoint failed!'
+    lm_manager.close()
+    ix_manager.remove_index(file_name, 1)
+    rm_manager.remove_file(file_name)
+    os.remove(log_name)
+    os.rmdir(root)
+    print(f'test_checkpoint passed!')
+
+
+def crash_after_checkpoint(root:str, backend:str):
+    ''' Run in a child process by test_crash_recovery. A statement inserts rows into a table and its index,
+        a checkpoint writes back its pages in the middle, then the statement removes the even rows committed
+        before and inserts more, and the process is killed before the commit.
+    '''
+    pf_manager.set_file_backend(backend)
+    lm_manager.open(os.path.join(root, 'wal.log'))
+    # larger pages, compressed to lengths changing with the records
+    handle = create_table(os.path.join(root, 'test_crash_recovery'), 8 * cf.PAGE_SIZE)
+    index_handle = ix_manager.opened_indicies[f'{os.path.join(root, "test_crash_recovery")}.1']
+    rids = {}
+    def insert(start:int, end:int):
+        for i in range(start, end):
+            rids[i] = handle.insert_record(np.frombuffer(struct.pack('<ii', i, i % 13), dtype=np.uint8))
+            index_handle.insert_entry([i % 13], rids[i])
+        handle.sync_meta()
+        index_handle.sync_meta()
+    N = 3 * handle.meta['record_per_page']
+    insert(0, N)
+    lm_manager.commit()
+    insert(N, 2 * N)
+    lm_manager.checkpoint()
+    # the pages synced by the checkpoint are changed and written back again
+    for i in range(0, N, 2):
+        handle.remove_record(rids[i])
+        index_handle.remove_entry([i % 13], rids[i])
+    insert(2 * N, 3 * N)
+    lm_manager.flush()
+    pf_manager.clean_pages(cf.BUFFER_CAPACITY)     # written back by the background writer, without syncing the files
+    os._exit(0)
+
+
+def test_crash_recovery(backend:str=None):
+    ''' Test the recovery redoes the records of a statement not committed, whose pages before a
+        checkpoint are on disk, after the process is killed.
+    args:
+        backend: str, the file backend of the tables, the current one if None.
+    '''
+    file_backend = pf_manager.file_backend
+    if backend is not None: pf_manager.set_file_backend(backend)
+    root = os.path.join(cf.TEST_ROOT, f'test_crash_recovery_{pf_manager.file_backend.lower()}')
+    os.makedirs(root, exist_ok=True)
+    log_name = os.path.join(root, 'wal.log')
+    file_name = os.path.join(root, 'test_crash_recovery')
+    subprocess.run([sys.executable, '-c', 'import test.test_log_management as test_lm; '
+        f'test_lm.crash_after_checkpoint({root!r}, {pf_manager.file_backend!r})'], check=True)
+    lm_manager.open(log_name)
+    records = [record for _, record in lm_manager.read_records()]
+    assert records and all(record.record_type != LOG_COMMIT for record in records), 'test_crash_recovery failed!'
+    assert lm_manager.recover() == len(records), 'test_crash_recovery failed!'
+    lm_manager.close()
+    handle = rm_manager.open_file(file_name)
+    handle.read_meta()
+    index_handle = ix_manager.open_index(file_name, 1)
+    index_handle.read_meta()
+    N = 3 * handle.meta['record_per_page']
+    file_scan = RM_FileScan()
+    file_scan.open_scan(handle)
+    rows = {record.rid: struct.unpack('<ii', record.data.tobytes()) for record in file_scan.next()}
+    assert sorted(rows.values()) == [(i, i % 13) for i in range(3 * N) if i >= N or i % 2], 'test_crash_recovery failed!'
+    index_scan = IX_IndexScan()
+    index_scan.open_scan(index_handle, CompOp.NO)
+    entries = [rid for rid, _ in index_scan.next()]
+    assert len(entries) == len(rows) and set(entries) == set(rows), 'test_crash_recovery failed!'
+    ix_manager.close_index(file_name, 1)
+    rm_manager.close_file(file_name)
+    ix_manager.remove_index(file_name, 1)
+    rm_manager.remove_file(file_name)
+    os.remove(log_name)
+    os.rmdir(root)
+    pf_manager.set_file_backend(file_backend)
+    print(f'test_crash_recovery passed!')
+
+
+def test():
+    print(f'-------- Test log management --------')
+    test_log_record()
+    test_log_file()
+    test_wal_rule()
+    test_group_commit()
+    test_checkpoint()
+    test_crash_recovery()
+    test_crash_recovery('COMPRESSED')
\ No newline at end of file
@@ -1,9 +1,19 @@
 import os
+import time
+import random
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from matplotlib.offsetbox import PaddedBox
 import numpy as np
 
 import config as cf
 from paged_file.pf_manager import PF_Manager
+from paged_file.pf_async import PF_AsyncManager
+from paged_file.pf_buffer_ring import PF_BufferRing
+from paged_file.pf_bg_writer import PF_BackgroundWriter
+from paged_file.pf_warm_start import PF_WarmStarter
+from utils.replacer import create_replacer
+from errors.err_paged_file import ResizeBufferError, BufferQuotaError
 
 
 def test_alloc_buffer():
@@ -93,9 +103,536 @@ def test_data_structures():
     print(f'test_data_structures passed!')
 
 
+def test_pin_page():
+    # BUFFER_CAPACITY = 4, PAGE_SIZE = 16
+    manager = PF_Manager()
+    name = os.path.join(cf.TEST_ROOT, 'test_pin_page.data')
+    manager.create_file(name)
+    file_id = manager.open_file(name)
+    manager.allocate_pages(file_id, cf.BUFFER_CAPACITY + 1)
+    page = manager.pin_page(file_id, 0)
+    page[:] = 7
+    manager.mark_dirty(file_id, 0)
+    assert np.min(manager.read_page(file_id, 0) == 7) == True
+    # the pinned page must survive evictions
+    for page_id in range(1, cf.BUFFER_CAPACITY + 1):
+        _ = manager.read_page(file_id, page_id)
+    assert (file_id, 0) in manager.pair_to_buffer_id, 'test_pin_page failed!'
+    manager.unpin_page(file_id, 0)
+    manager.close_file(file_id)
+    file_id = os.open(name, os.O_RDWR)
+    data = os.read(file_id, cf.PAGE_SIZE)
+    os.close(file_id)
+    manager.remove_file(name)
+    assert data == bytes([7]) * cf.PAGE_SIZE, 'test_pin_page failed!'
+    print(f'test_pin_page passed!')
+
+
+def test_replacement_policies():
+    capacity = 8
+    for policy in ('LRU', 'CLOCK', '2Q', 'LRU-K'):
+        replacer = create_replacer(policy, capacity)
+        # free pages are used first
+        for i in range(capacity):
+            idx = replacer.find()
+            assert idx == i, f'test_replacement_policies failed on {policy}!'
+            replacer.access(idx)
+        # a freed page is reused immediately
+        replacer.free(5)
+        assert replacer.find() == 5, f'test_replacement_policies failed on {policy}!'
+        replacer.access(5)
+        # pages accessed twice survive a scan under scan resistant policies
+        for i in range(capacity // 2):
+            replacer.access(i)
+        victims = set()
+        for _ in range(capacity):
+            idx = replacer.find()
+            replacer.free(idx)
+            replacer.access(idx)
+            victims.add(idx)
+        if policy in ('2Q', 'LRU-K'):
+            assert victims.isdisjoint(range(capacity // 2)), f'test_replacement_policies failed on {policy}!'
+    print(f'test_replacement_policies passed!')
+
+
+def test_buffer_ring():
+    # BUFFER_CAPACITY = 4, PAGE_SIZE = 16
+    manager = PF_Manager()
+    name = os.path.join(cf.TEST_ROOT, 'test_buffer_ring.data')
+    manager.create_file(name)
+    file_id = manager.open_file(name)
+    page_cnt = 2 * cf.BUFFER_CAPACITY
+    for i in range(page_cnt):
+        manager.append_page(file_id, np.zeros(cf.PAGE_SIZE, dtype=np.uint8) + i)
+    manager.flush_file(file_id)
+    _ = manager.read_page(file_id, 0)
+    ring = PF_BufferRing(size=2)
+    for i in range(page_cnt):
+        data = manager.read_page(file_id, i, ring)
+        assert np.min(data == i) == True, 'test_buffer_ring failed!'
+    # pages read through the ring do not enter the buffer
+    assert list(manager.pair_to_buffer_id.keys()) == [(file_id, 0)], 'test_buffer_ring failed!'
+    manager.close_file(file_id)
+    manager.remove_file(name)
+    print(f'test_buffer_ring passed!')
+
+
+def test_read_ahead():
+    # BUFFER_CAPACITY = 4, PAGE_SIZE = 16
+    name = os.path.join(cf.TEST_ROOT, 'test_read_ahead.data')
+    read_ahead_async = cf.READ_AHEAD_ASYNC
+    for cf.READ_AHEAD_ASYNC in (False, True):
+        manager = PF_Manager()
+        manager.create_file(name)
+        file_id = manager.open_file(name)
+        page_cnt = 4 * cf.BUFFER_CAPACITY
+        for i in range(page_cnt):
+            manager.append_page(file_id, np.zeros(cf.PAGE_SIZE, dtype=np.uint8) + i)
+        manager.flush_file(file_id)
+        for i in range(page_cnt):
+            data = manager.read_page(file_id, i)
+            assert np.min(data == i) == True, 'test_read_ahead failed!'
+        stats = manager.get_read_ahead_stats()
+        assert stats['issued'] > 0 and stats['hits'] == stats['issued'], 'test_read_ahead failed!'
+        manager.flush_file(file_id)
+        ring = PF_BufferRing(size=8)
+        for i in range(page_cnt):
+            data = manager.read_page(file_id, i, ring)
+            assert np.min(data == i) == True, 'test_read_ahead failed!'
+        # a page written back after being read ahead is not read from the ring
+        manager.flush_file(file_id)
+        _ = manager.read_page(file_id, 0, ring)
+        _ = manager.read_page(file_id, 1, ring)
+        manager.write_page(file_id, 2, np.zeros(cf.PAGE_SIZE, dtype=np.uint8) + 100)
+        manager.flush_file(file_id)
+        assert np.min(manager.read_page(file_id, 2, ring) == 100) == True, 'test_read_ahead failed!'
+        stats = manager.get_read_ahead_stats()
+        assert stats['hits'] + stats['wasted'] <= stats['issued'], 'test_read_ahead failed!'
+        manager.close_file(file_id)
+        manager.remove_file(name)
+    cf.READ_AHEAD_ASYNC = read_ahead_async
+    print(f'test_read_ahead passed!')
+
+
+def test_resize_buffer():
+    # BUFFER_CAPACITY = 4, PAGE_SIZE = 16
+    manager = PF_Manager(capacity=2)
+    assert all(frame is None for frame in manager.buffer), 'test_resize_buffer failed!'
+    name = os.path.join(cf.TEST_ROOT, 'test_resize_buffer.data')
+    manager.create_file(name)
+    file_id = manager.open_file(name)
+    page_cnt = 2 * cf.BUFFER_CAPACITY
+    for i in range(page_cnt):
+        manager.append_page(file_id, np.zeros(cf.PAGE_SIZE, dtype=np.uint8) + i)
+    assert len(manager.pair_to_buffer_id) == 2, 'test_resize_buffer failed!'
+    manager.resize(page_cnt)
+    for i in range(page_cnt):
+        assert np.min(manager.read_page(file_id, i) == i) == True, 'test_resize_buffer failed!'
+    assert len(manager.pair_to_buffer_id) == page_cnt, 'test_resize_buffer failed!'
+    _ = manager.pin_page(file_id, page_cnt - 1)
+    try:
+        manager.resize(1)
+        assert False, 'test_resize_buffer failed!'
+    except ResizeBufferError: pass
+    manager.unpin_page(file_id, page_cnt - 1)
+    manager.resize(1)
+    assert len(manager.buffer) == 1 and len(manager.pair_to_buffer_id) <= 1, 'test_resize_buffer failed!'
+    for i in range(page_cnt):
+        assert np.min(manager.read_page(file_id, i) == i) == True, 'test_resize_buffer failed!'
+    manager.close_file(file_id)
+    manager.remove_file(name)
+    print(f'test_resize_buffer passed!')
+
+
+def test_background_writer():
+    # BUFFER_CAPACITY = 4, PAGE_SIZE = 16
+    manager = PF_Manager()
+    name = os.path.join(cf.TEST_ROOT, 'test_background_writer.data')
+    manager.create_file(name)
+    file_id = manager.open_file(name)
+    for i in range(cf.BUFFER_CAPACITY):
+        manager.append_page(file_id, np.zeros(cf.PAGE_SIZE, dtype=np.uint8) + i)
+    _ = manager.pin_page(file_id, 0)
+    assert manager.clean_pages(cf.BUFFER_CAPACITY) == cf.BUFFER_CAPACITY - 1, 'test_background_writer failed!'
+    assert list(np.flatnonzero(manager.dirty)) == [manager.pair_to_buffer_id[(file_id, 0)]], 'test_background_writer failed!'
+    manager.unpin_page(file_id, 0)
+    os.lseek(file_id, cf.PAGE_SIZE, os.SEEK_SET)
+    data = np.frombuffer(os.read(file_id, cf.PAGE_SIZE), dtype=np.uint8)
+    assert np.min(data == 1) == True, 'test_background_writer failed!'
+    # the writer thread cleans the pages, so replacing them does not write
+    for i in range(cf.BUFFER_CAPACITY):
+        manager.write_page(file_id, i, np.zeros(cf.PAGE_SIZE, dtype=np.uint8) + i + 1)
+    writer = PF_BackgroundWriter(manager, interval=0.001)
+    writer.start()
+    while np.any(manager.dirty): time.sleep(0.001)
+    writer.stop()
+    for i in range(cf.BUFFER_CAPACITY):
+        manager.append_page(file_id)
+    stats = manager.get_writer_stats()
+    assert stats['evictions'] == cf.BUFFER_CAPACITY and stats['dirty_evictions'] == 0, 'test_background_writer failed!'
+    for i in range(cf.BUFFER_CAPACITY):
+        assert np.min(manager.read_page(file_id, i) == i + 1) == True, 'test_background_writer failed!'
+    manager.close_file(file_id)
+    manager.remove_file(name)
+    print(f'test_background_writer passed!')
+
+
+def test_sorted_write_back():
+    # BUFFER_CAPACITY = 4, PAGE_SIZE = 16
+    manager = PF_Manager()
+    name = os.path.join(cf.TEST_ROOT, 'test_sorted_write_back.data')
+    manager.create_file(name)
+    file_id = manager.open_file(name)
+    manager.allocate_pages(file_id, cf.BUFFER_CAPACITY)
+    manager.sync_file(file_id)
+    # dirty pages with a gap, written in reverse order
+    for page_id in range(cf.BUFFER_CAPACITY - 1, -1, -1):
+        if page_id == 1: continue
+        manager.write_page(file_id, page_id, np.zeros(cf.PAGE_SIZE, dtype=np.uint8) + page_id + 1)
+    manager.sync_file(file_id)
+    assert not np.any(manager.dirty), 'test_sorted_write_back failed!'
+    os.lseek(file_id, 0, os.SEEK_SET)
+    data = np.frombuffer(os.read(file_id, cf.BUFFER_CAPACITY * cf.PAGE_SIZE), dtype=np.uint8)
+    expected = np.repeat([page_id + 1 if page_id != 1 else 0 for page_id in range(cf.BUFFER_CAPACITY)], cf.PAGE_SIZE)
+    assert np.array_equal(data, expected), 'test_sorted_write_back failed!'
+    manager.close_file(file_id)
+    manager.remove_file(name)
+    print(f'test_sorted_write_back passed!')
+
+
+def test_mmap_backend():
+    # BUFFER_CAPACITY = 4, PAGE_SIZE = 16
+    manager = PF_Manager()
+    manager.set_file_backend('MMAP')
+    name = os.path.join(cf.TEST_ROOT, 'test_mmap_backend' + cf.TABLE_DATA_SUFFIX)
+    manager.create_file(name)
+    file_id = manager.open_file(name)
+    assert file_id in manager.mmap_files, 'test_mmap_backend failed!'
+    segment_pages = manager.mmap_files[file_id].segment_pages
+    page_cnt = 2 * segment_pages + 1
+    first = manager.pin_page(file_id, manager.append_page(file_id))
+    for i in range(1, page_cnt):
+        manager.append_page(file_id, np.zeros(cf.PAGE_SIZE, dtype=np.uint8) + i % 256)
+    # the view of a pinned page stays valid while the file grows
+    first[:] = 255
+    manager.mark_dirty(file_id, 0)
+    manager.unpin_page(file_id, 0)
+    assert len(manager.pair_to_buffer_id) == 0, 'test_mmap_backend failed!'
+    manager.close_file(file_id)
+    assert os.path.getsize(name) == page_cnt * cf.PAGE_SIZE, 'test_mmap_backend failed!'
+    manager.set_file_backend('BUFFER')
+    file_id = manager.open_file(name)
+    assert np.min(manager.read_page(file_id, 0) == 255) == True, 'test_mmap_backend failed!'
+    for i in range(1, page_cnt):
+        assert np.min(manager.read_page(file_id, i) == i % 256) == True, 'test_mmap_backend failed!'
+    manager.close_file(file_id)
+    manager.remove_file(name)
+    print(f'test_mmap_backend passed!')
+
+
+def test_buffer_stats():
+    # BUFFER_CAPACITY = 4, PAGE_SIZE = 16
+    manager = PF_Manager()
+    name = os.path.join(cf.TEST_ROOT, 'test_buffer_stats.data')
+    manager.create_file(name)
+    file_id = manager.open_file(name)
+    for i in range(cf.BUFFER_CAPACITY + 1):
+        manager.append_page(file_id, np.zeros(cf.PAGE_SIZE, dtype=np.uint8) + i)
+    _ = manager.read_page(file_id, cf.BUFFER_CAPACITY)
+    _ = manager.read_page(file_id, 0)
+    stats = manager.get_buffer_stats()[name]
+    assert stats['hits'] == 1 and stats['misses'] == 1 and stats['reads'] >= 1, 'test_buffer_stats failed!'
+    assert stats['evictions'] == 2 and stats['dirty_evictions'] == 2 and stats['writes'] == 2, 'test_buffer_stats failed!'
+    # the counters of a closed file are kept by its name
+    manager.close_file(file_id)
+    file_id = manager.open_file(name)
+    _ = manager.read_page(file_id, 0)
+    stats = manager.get_buffer_stats()[name]
+    assert stats['misses'] == 2 and stats['writes'] == cf.BUFFER_CAPACITY + 1, 'test_buffer_stats failed!'
+    manager.reset_buffer_stats()
+    assert manager.get_buffer_stats() == {}, 'test_buffer_stats failed!'
+    manager.close_file(file_id)
+    manager.remove_file(name)
+    print(f'test_buffer_stats passed!')
+
+
+def test_concurrent_access():
+    # BUFFER_CAPACITY = 4, PAGE_SIZE = 16
+    manager = PF_Manager()
+    name = os.path.join(cf.TEST_ROOT, 'test_concurrent_access.data')
+    manager.create_file(name)
+    file_id = manager.open_file(name)
+    page_cnt = 8 * cf.BUFFER_CAPACITY
+    for i in range(page_cnt):
+        manager.append_page(file_id, np.zeros(cf.PAGE_SIZE, dtype=np.uint8) + i % 256)
+    manager.flush_file(file_id)
+    def read(seed):
+        rand = random.Random(seed)
+        for _ in range(500):
+            page_id = rand.randrange(page_cnt) if rand.random() < 0.5 else (seed * 7 + _) % page_cnt
+            if rand.random() < 0.8:
+                data = manager.read_page(file_id, page_id)
+            else:
+                data = manager.pin_page(file_id, page_id).copy()
+                manager.unpin_page(file_id, page_id)
+            assert np.min(data == page_id % 256) == True, 'test_concurrent_access failed!'
+        return 500
+    def write():
+        for i in range(200):
+            manager.write_page(file_id, i % page_cnt, np.zeros(cf.PAGE_SIZE, dtype=np.uint8) + i % page_cnt % 256)
+            manager.clean_pages(cf.BUFFER_CAPACITY)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        writer = executor.submit(write)
+        reads = sum(executor.map(read, range(8)))
+        writer.result()
+    stats = manager.get_buffer_stats()[name]
+    assert stats['hits'] + stats['misses'] == reads, 'test_concurrent_access failed!'
+    assert np.all(manager.pin_cnt == 0), 'test_concurrent_access failed!'
+    manager.close_file(file_id)
+    manager.remove_file(name)
+    print(f'test_concurrent_access passed!')
+
+
+def test_buffer_quotas():
+    # BUFFER_CAPACITY = 4, PAGE_SIZE = 16
+    manager = PF_Manager()
+    names = [os.path.join(cf.TEST_ROOT, f'test_quota_{i}.data') for i in range(2)]
+    file_ids = []
+    for name in names:
+        manager.create_file(name)
+        file_ids.append(manager.open_file(name))
+        for i in range(2 * cf.BUFFER_CAPACITY):
+            manager.append_page(file_ids[-1], np.zeros(cf.PAGE_SIZE, dtype=np.uint8) + i)
+    small, large = file_ids
+    try:
+        manager.set_buffer_quota('test_quota_0', cf.BUFFER_CAPACITY)
+        assert False, 'test_buffer_quotas failed!'
+    except BufferQuotaError as exception: pass
+    manager.set_buffer_quota('test_quota_0', 2)
+    manager.set_buffer_quota('test_quota_1', 0, 1)
+    assert manager.file_quota == {small: 'test_quota_0', large: 'test_quota_1'}, 'test_buffer_quotas failed!'
+    # the reserved pages of the small file are kept by a scan of the large file
+    _ = manager.read_page(small, 0), manager.read_page(small, 1)
+    for i in range(2 * cf.BUFFER_CAPACITY):
+        _ = manager.read_page(large, i)
+        assert len(manager.buffered_pages[large]) == 1, 'test_buffer_quotas failed!'
+    assert (small, 0) in manager.pair_to_buffer_id and (small, 1) in manager.pair_to_buffer_id, 'test_buffer_quotas failed!'
+    quotas = manager.get_buffer_quotas()
+    assert quotas['test_quota_0'][:2] == (2, cf.INVALID) and quotas['test_quota_1'] == (0, 1, 1), 'test_buffer_quotas failed!'
+    manager.remove_buffer_quota('test_quota_1')
+    for i in range(2 * cf.BUFFER_CAPACITY):
+        _ = manager.read_page(large, i)
+    assert len(manager.buffered_pages[large]) == cf.BUFFER_CAPACITY - 2, 'test_buffer_quotas failed!'
+    # a limit lower than the pages held evicts the pages beyond it, but not the pinned ones
+    _ = manager.pin_page(large, 2 * cf.BUFFER_CAPACITY - 1)
+    manager.set_buffer_quota('test_quota_1', 0, 1)
+    assert manager.buffered_pages[large] == {manager.pair_to_buffer_id[(large, 2 * cf.BUFFER_CAPACITY - 1)]}, \
+        'test_buffer_quotas failed!'
+    manager.unpin_page(large, 2 * cf.BUFFER_CAPACITY - 1)
+    manager.set_buffer_quota('test_quota_0', 1, 1)
+    assert len(manager.buffered_pages[small]) == 1, 'test_buffer_quotas failed!'
+    assert manager.get_buffer_quotas()['test_quota_0'] == (1, 1, 1), 'test_buffer_quotas failed!'
+    for file_id, name in zip(file_ids, names):
+        manager.close_file(file_id)
+        manager.remove_file(name)
+    print(f'test_buffer_quotas passed!')
+
+
+def test_compressed_backend():
+    # BUFFER_CAPACITY = 4, PAGE_SIZE = 16
+    manager = PF_Manager()
+    manager.set_file_backend('COMPRESSED')
+    name = os.path.join(cf.TEST_ROOT, 'test_compressed_backend' + cf.TABLE_DATA_SUFFIX)
+    manager.create_file(name)
+    file_id = manager.open_file(name)
+    assert file_id in manager.compressed_files, 'test_compressed_backend failed!'
+    page_cnt = 4 * cf.BUFFER_CAPACITY
+    pages = [np.zeros(cf.PAGE_SIZE, dtype=np.uint8) for _ in range(page_cnt)]
+    for i in range(page_cnt):
+        pages[i][:4] = i
+        manager.append_page(file_id, pages[i])
+    manager.close_file(file_id)
+    assert os.path.exists(name + cf.PAGE_MAP_SUFFIX), 'test_compressed_backend failed!'
+    assert os.path.getsize(name) < page_cnt * cf.PAGE_SIZE, 'test_compressed_backend failed!'
+    # a compressed file stays compressed under other backends
+    manager.set_file_backend('BUFFER')
+    file_id = manager.open_file(name)
+    assert manager.get_page_cnt(file_id) == page_cnt, 'test_compressed_backend failed!'
+    for i in range(page_cnt):
+        assert np.all(manager.read_page(file_id, i) == pages[i]), 'test_compressed_backend failed!'
+    # an incompressible page is moved to a larger slot
+    pages[1] = np.random.default_rng(0).integers(0, 256, cf.PAGE_SIZE, dtype=np.uint8)
+    manager.write_page(file_id, 1, pages[1])
+    manager.flush_file(file_id)
+    for i in range(page_cnt):
+        assert np.all(manager.read_page(file_id, i) == pages[i]), 'test_compressed_backend failed!'
+    stats = manager.get_compression_stats()[name]
+    assert stats['pages_written'] == 1 and stats['bytes_out'] == cf.PAGE_SIZE, 'test_compressed_backend failed!'
+    manager.close_file(file_id)
+    manager.remove_file(name)
+    assert not os.path.exists(name + cf.PAGE_MAP_SUFFIX), 'test_compressed_backend failed!'
+    print(f'test_compressed_backend passed!')
+
+
+def test_compressed_crash():
+    manager = PF_Manager()
+    manager.set_file_backend('COMPRESSED')
+    name = os.path.join(cf.TEST_ROOT, 'test_compressed_crash' + cf.TABLE_DATA_SUFFIX)
+    manager.create_file(name)
+    file_id = manager.open_file(name)
+    page_cnt = 8
+    pages = [np.zeros(cf.PAGE_SIZE, dtype=np.uint8) for _ in range(page_cnt)]
+    for i in range(page_cnt):
+        pages[i][:4] = i
+        manager.append_page(file_id, pages[i])
+    manager.checkpoint()
+    # pages written back in place of their old slots, with other lengths, and no map written
+    rng = np.random.default_rng(0)
+    new_pages = [page.copy() for page in pages]
+    for i in range(page_cnt):
+        new_pages[i][:i % 5] = rng.integers(0, 256, i % 5, dtype=np.uint8)
+        manager.compressed_files[file_id].write(i, new_pages[i].tobytes())
+    # crash: the map on disk still finds the pages synced
+    other = PF_Manager()
+    other_id = other.open_file(name)
+    for i in range(page_cnt):
+        assert np.all(other.read_page(other_id, i) == pages[i]), 'test_compressed_crash failed!'
+    other.close_file(other_id)
+    manager.close_file(file_id)
+    file_id = manager.open_file(name)
+    for i in range(page_cnt):
+        assert np.all(manager.read_page(file_id, i) == new_pages[i]), 'test_compressed_crash failed!'
+    manager.close_file(file_id)
+    manager.remove_file(name)
+    print(f'test_compressed_crash passed!')
+
+
+def test_async_manager():
+    # BUFFER_CAPACITY = 4, PAGE_SIZE = 16
+    manager = PF_Manager()
+    async_manager = PF_AsyncManager(manager, workers=4)
+    name = os.path.join(cf.TEST_ROOT, 'test_async_manager.data')
+    async def run():
+        await async_manager.create_file(name)
+        file_id = await async_manager.open_file(name)
+        page_cnt = 4 * cf.BUFFER_CAPACITY
+        for i in range(page_cnt):
+            await async_manager.append_page(file_id, np.zeros(cf.PAGE_SIZE, dtype=np.uint8) + i)
+        await async_manager.flush_file(file_id)
+        # concurrent tasks reading the same file, with buffer hits served in the event loop
+        async def read(seed):
+            rand = random.Random(seed)
+            for _ in range(50):
+                page_id = rand.randrange(page_cnt)
+                data = await async_manager.read_page(file_id, page_id)
+                assert np.min(data == page_id) == True, 'test_async_manager failed!'
+            return 50
+        reads = sum(await asyncio.gather(*(read(seed) for seed in range(8))))
+        pages = await async_manager.read_pages(file_id, list(range(page_cnt)))
+        assert [int(page[0]) for page in pages] == list(range(page_cnt)), 'test_async_manager failed!'
+        page = await async_manager.pin_page(file_id, 0)
+        page[:] = 255
+        async_manager.mark_dirty(file_id, 0)
+        async_manager.unpin_page(file_id, 0)
+        await async_manager.close_file(file_id)
+        return reads + page_cnt
+    reads = asyncio.run(run())
+    stats = manager.get_buffer_stats()[name]
+    assert stats['hits'] + stats['misses'] == reads + 1, 'test_async_manager failed!'
+    file_id = manager.open_file(name)
+    assert np.min(manager.read_page(file_id, 0) == 255) == True, 'test_async_manager failed!'
+    manager.close_file(file_id)
+    manager.remove_file(name)
+    async_manager.shutdown()
+    print(f'test_async_manager passed!')
+
+
+def test_read_pages():
+    # BUFFER_CAPACITY = 4, PAGE_SIZE = 16
+    for backend in ('BUFFER', 'COMPRESSED', 'MMAP'):
+        manager = PF_Manager()
+        manager.set_file_backend(backend)
+        name = os.path.join(cf.TEST_ROOT, 'test_read_pages' + cf.TABLE_DATA_SUFFIX)
+        manager.create_file(name)
+        file_id = manager.open_file(name)
+        page_cnt = 3 * cf.BUFFER_CAPACITY
+        for i in range(page_cnt):
+            manager.append_page(file_id, np.zeros(cf.PAGE_SIZE, dtype=np.uint8) + i)
+        manager.close_file(file_id)
+        file_id = manager.open_file(name)
+        _ = manager.read_page(file_id, 5)
+        page_ids = [9, 0, 1, 2, 9, 5, 3, 11, 10]
+        pages = manager.read_pages(file_id, page_ids)
+        for page_id, page in zip(page_ids, pages):
+            assert np.min(page == page_id) == True, 'test_read_pages failed!'
+        if backend != 'MMAP':
+            # the missed pages are read once each, page 5 is a hit
+            stats = manager.get_buffer_stats()[name]
+            assert stats['misses'] == 1 + len(set(page_ids)) - 1, 'test_read_pages failed!'
+            assert stats['hits'] >= 1 and len(manager.pair_to_buffer_id) <= cf.BUFFER_CAPACITY, 'test_read_pages failed!'
+        # buffered pages are read from the buffer, with changes not written back yet
+        manager.write_page(file_id, 10, np.zeros(cf.PAGE_SIZE, dtype=np.uint8) + 100)
+        assert np.min(manager.read_pages(file_id, [10])[0] == 100) == True, 'test_read_pages failed!'
+        manager.close_file(file_id)
+        manager.remove_file(name)
+    print(f'test_read_pages passed!')
+
+
+def test_warm_start():
+    # BUFFER_CAPACITY = 4, PAGE_SIZE = 16
+    manager = PF_Manager()
+    name = os.path.join(cf.TEST_ROOT, 'test_warm_start.data')
+    warm_name = os.path.join(cf.TEST_ROOT, 'test_warm_start.warm')
+    manager.create_file(name)
+    file_id = manager.open_file(name)
+    for i in range(4 * cf.BUFFER_CAPACITY):
+        manager.append_page(file_id, np.zeros(cf.PAGE_SIZE, dtype=np.uint8) + i)
+    manager.sync_file(file_id)
+    hot = [9, 2, 7]
+    for page_id in hot: _ = manager.read_page(file_id, page_id)
+    pages = manager.get_resident_pages()
+    assert set(hot) <= set(pages[name]), 'test_warm_start failed!'
+    PF_WarmStarter.save(warm_name, {name: hot})
+    manager.close_file(file_id)
+    assert PF_WarmStarter.load(warm_name) == {name: hot}, 'test_warm_start failed!'
+    # reloaded in the background, into the free buffer pages
+    file_id = manager.open_file(name)
+    warm_starter = PF_WarmStarter(manager, PF_WarmStarter.load(warm_name), batch_pages=2)
+    warm_starter.start()
+    warm_starter.thread.join()
+    assert warm_starter.pages_read == len(hot), 'test_warm_start failed!'
+    assert all((file_id, page_id) in manager.pair_to_buffer_id for page_id in hot), 'test_warm_start failed!'
+    for page_id in hot:
+        assert np.min(manager.read_page(file_id, page_id) == page_id) == True, 'test_warm_start failed!'
+    # no buffered page is evicted for warming up
+    for page_id in range(cf.BUFFER_CAPACITY): _ = manager.read_page(file_id, page_id)
+    assert manager.prefetch_pages(file_id, [10, 11]) == 0, 'test_warm_start failed!'
+    manager.close_file(file_id)
+    manager.remove_file(name)
+    os.remove(warm_name)
+    assert PF_WarmStarter.load(warm_name) == {}, 'test_warm_start failed!'
+    print(f'test_warm_start passed!')
+
+
 def test():
     print(f'-------- Test paged file --------')
     test_alloc_buffer()
     test_lru()
     test_write_page()
     test_data_structures()
+    test_pin_page()
+    test_replacement_policies()
+    test_buffer_ring()
+    test_read_ahead()
+    test_resize_buffer()
+    test_background_writer()
+    test_sorted_write_back()
+    test_mmap_backend()
+    test_buffer_stats()
+    test_concurrent_access()
+    test_buffer_quotas()
+    test_compressed_backend()
+    test_compressed_crash()
+    test_async_manager()
+    test_read_pages()
+    test_warm_start()
\ No newline at end of file
@@ -8,7 +8,12 @@ from record_management.rm_record import RM_Record
 from record_management.rm_file_handle import RM_FileHandle
 from record_management.rm_file_scan import RM_FileScan
 from record_management.rm_manager import rm_manager
+from paged_file.pf_manager import pf_manager
+from log_management.lm_manager import lm_manager
 from utils.enums import CompOp
+from utils.bitmap import Bitmap
+from utils.tracing import tracer
+from errors.err_record_management import PackRecordError, OpenScanError
 
 
 def test_meta():
@@ -132,6 +137,22 @@ def test_pack_unpack_record():
     assert fields[2] == '3.14'
     packed_data = handle.pack_record(fields)
     assert np.min(data == packed_data) == True
+    # the batch codec agrees with pack_record and unpack_record row by row
+    fields_list = np.array([[i - 5, i / 4, str(i) * (i % 4)] for i in range(10)] + [[-2**31, -0.0, 'é' * 5]], dtype=object)
+    datas = handle.pack_records(fields_list)
+    assert datas.shape == (len(fields_list), 22) and datas.dtype == np.uint8
+    for fields, data in zip(fields_list, datas):
+        assert np.array_equal(handle.pack_record(fields), data)
+        assert list(handle.unpack_record(data)) == list(fields)
+    unpacked = handle.unpack_records(datas)
+    assert unpacked.tolist() == fields_list.tolist() and type(unpacked[0, 0]) == int
+    columns = handle.unpack_columns(datas)
+    assert columns[0].dtype == np.int32 and columns[1].dtype == np.float64 and columns[2].tolist() == list(fields_list[:, 2])
+    assert handle.pack_records([]).shape == (0, 22) and handle.unpack_records(datas[:0]).shape == (0, 3)
+    try:
+        handle.pack_records([[2**31, 0.0, '']])
+        assert False, 'test_pack_unpack_record failed!'
+    except PackRecordError as exception: pass
     rm_manager.close_file(file_name)
     rm_manager.remove_file(file_name)
     print(f'test_pack_unpack_record passed!')
@@ -287,10 +308,430 @@ def test_file_scan_2():
     print(f'test_file_scan_2 passed!')
 
 
+def test_page_reuse():
+    ''' Test releasing empty pages and reusing them under insert/delete churn.
+    '''
+    file_name = os.path.join(cf.TEST_ROOT, 'test_page_reuse')
+    meta = {
+        'record_size': 2 * cf.SIZE_INT,
+        'column_number': 2,
+        'columns': [ {
+                'column_type': cf.TYPE_INT,
+                'column_size': cf.SIZE_INT,
+                'column_name_length': 2,
+                'column_name': 'id',
+                'column_default_en': False,
+                'column_default': np.zeros(cf.SIZE_INT, dtype=np.uint8),
+            }, {
+                'column_type': cf.TYPE_INT,
+                'column_size': cf.SIZE_INT,
+                'column_name_length': 3,
+                'column_name': 'val',
+                'column_default_en': False,
+                'column_default': np.zeros(cf.SIZE_INT, dtype=np.uint8),
+            },
+        ],
+        'primary_key_size': 0, 'primary_keys': [],
+        'foreign_key_number': 0, 'foreign_keys': [],
+    }
+    rm_manager.create_file(file_name)
+    handle:RM_FileHandle = rm_manager.open_file(file_name)
+    handle.init_meta(meta)
+    N = 4 * handle.meta['record_per_page']
+    for round in range(3):
+        rids = [handle.insert_record(np.frombuffer(struct.pack('<ii', i, round), dtype=np.uint8))
+            for i in range(N)]
+        if round == 0: page_number = handle.meta['page_number']
+        assert handle.meta['page_number'] == page_number, 'test_page_reuse failed!'
+        for rid in reversed(rids):
+            handle.remove_record(rid)
+        assert handle.meta['record_number'] == 0, 'test_page_reuse failed!'
+    # empty pages are released from the middle of the free slot list too
+    rids = [handle.insert_record(np.frombuffer(struct.pack('<ii', i, 3), dtype=np.uint8)) for i in range(N)]
+    first_slots = [rid for rid in rids if rid.slot_no == 0]
+    for rid in first_slots: handle.remove_record(rid)   # every page joins the free slot list
+    for rid in rids:
+        if rid.slot_no != 0: handle.remove_record(rid)  # page 0 empties first, at the tail of the list
+    assert handle.meta['next_free_page'] == cf.INVALID, 'test_page_reuse failed!'
+    assert pf_manager.get_free_pages(handle.data_file_id)[0] == page_number, 'test_page_reuse failed!'
+    # the free page list survives closing the file
+    free_pages = pf_manager.get_free_pages(handle.data_file_id)
+    assert free_pages[0] > 0, 'test_page_reuse failed!'
+    handle.sync_meta()
+    rm_manager.close_file(file_name)
+    handle = rm_manager.open_file(file_name)
+    handle.read_meta()
+    assert pf_manager.get_free_pages(handle.data_file_id) == free_pages, 'test_page_reuse failed!'
+    for i in range(N):
+        handle.insert_record(np.frombuffer(struct.pack('<ii', i, 3), dtype=np.uint8))
+    assert handle.meta['page_number'] == page_number, 'test_page_reuse failed!'
+    file_scan = RM_FileScan()
+    file_scan.open_scan(handle)
+    assert sorted(handle.unpack_record(r.data)[0] for r in file_scan.next()) == list(range(N)), 'test_page_reuse failed!'
+    # a failed change leaves its page unpinned, e.g. failing to log it
+    data = np.frombuffer(struct.pack('<ii', N, 3), dtype=np.uint8)
+    rid = handle.insert_record(data)
+    def fail(*args, **kwargs): raise OSError('log failed')
+    log_page, lm_manager.log_page = lm_manager.log_page, fail
+    try:
+        for change in (lambda: handle.update_record(rid, data), lambda: handle.remove_record(rid),
+                lambda: handle.insert_record(data)):
+            try:
+                change()
+                assert False, 'test_page_reuse failed!'
+            except OSError as exception: pass
+            assert pf_manager.pin_cnt.sum() == 0, 'test_page_reuse failed!'
+    finally:
+        lm_manager.log_page = log_page
+    rm_manager.close_file(file_name)
+    rm_manager.remove_file(file_name)
+    print(f'test_page_reuse passed!')
+
+
+def test_page_size():
+    ''' Test tables with a larger page size, record_per_page follows the page size recorded in the meta.
+    '''
+    meta = {
+        'record_size': 2 * cf.SIZE_INT,
+        'column_number': 2,
+        'columns': [ {
+                'column_type': cf.TYPE_INT,
+                'column_size': cf.SIZE_INT,
+                'column_name_length': 2,
+                'column_name': 'id',
+                'column_default_en': False,
+                'column_default': np.zeros(cf.SIZE_INT, dtype=np.uint8),
+            }, {
+                'column_type': cf.TYPE_INT,
+                'column_size': cf.SIZE_INT,
+                'column_name_length': 3,
+                'column_name': 'val',
+                'column_default_en': False,
+                'column_default': np.zeros(cf.SIZE_INT, dtype=np.uint8),
+            },
+        ],
+        'primary_key_size': 0, 'primary_keys': [],
+        'foreign_key_number': 0, 'foreign_keys': [],
+    }
+    N = 200
+    page_numbers = {}
+    for page_size in (cf.PAGE_SIZE, 4 * cf.PAGE_SIZE):
+        file_name = os.path.join(cf.TEST_ROOT, f'test_page_size_{page_size}')
+        rm_manager.create_file(file_name)
+        handle:RM_FileHandle = rm_manager.open_file(file_name)
+        handle.init_meta(dict(meta, page_size=page_size))
+        for i in range(N):
+            handle.insert_record(np.frombuffer(struct.pack('<ii', i, -i), dtype=np.uint8))
+        handle.sync_meta()
+        rm_manager.close_file(file_name)
+        page_numbers[page_size] = (handle.meta['record_per_page'], handle.meta['page_number'])
+        # the page size is read from the meta after reopening the file
+        handle = rm_manager.open_file(file_name)
+        assert handle.read_meta()['page_size'] == page_size, 'test_page_size failed!'
+        assert pf_manager.get_page_size(handle.data_file_id) == page_size, 'test_page_size failed!'
+        assert pf_manager.get_page_cnt(handle.data_file_id) == handle.meta['page_number'], 'test_page_size failed!'
+        file_scan = RM_FileScan()
+        file_scan.open_scan(handle)
+        records = sorted(tuple(handle.unpack_record(r.data)[:2]) for r in file_scan.next())
+        assert records == [(i, -i) for i in range(N)], 'test_page_size failed!'
+        rm_manager.close_file(file_name)
+        rm_manager.remove_file(file_name)
+    (small_per_page, small_pages), (large_per_page, large_pages) = page_numbers.values()
+    assert large_per_page > 4 * small_per_page and large_pages < small_pages, 'test_page_size failed!'
+    print(f'test_page_size passed!')
+
+
+def test_tracing():
+    ''' Test the call counts and latencies of the traced hot paths, and no wrapper when disabled.
+    '''
+    file_name = os.path.join(cf.TEST_ROOT, 'test_tracing')
+    meta = {
+        'record_size': cf.SIZE_INT,
+        'column_number': 1,
+        'columns': [ {
+                'column_type': cf.TYPE_INT,
+                'column_size': cf.SIZE_INT,
+                'column_name_length': 2,
+                'column_name': 'id',
+                'column_default_en': False,
+                'column_default': np.zeros(cf.SIZE_INT, dtype=np.uint8),
+            },
+        ],
+        'primary_key_size': 0, 'primary_keys': [],
+        'foreign_key_number': 0, 'foreign_keys': [],
+    }
+    insert_record = RM_FileHandle.insert_record
+    rm_manager.create_file(file_name)
+    handle:RM_FileHandle = rm_manager.open_file(file_name)
+    handle.init_meta(meta)
+    tracer.enable()
+    assert RM_FileHandle.insert_record is not insert_record, 'test_tracing failed!'
+    tracer.reset()
+    N = 3 * handle.meta['record_per_page']
+    rids = [handle.insert_record(np.frombuffer(struct.pack('<i', i), dtype=np.uint8)) for i in range(N)]
+    for i, rid in enumerate(rids):
+        assert struct.unpack('<i', handle.get_record(rid).data.tobytes())[0] == i, 'test_tracing failed!'
+    page_cnt = pf_manager.get_page_cnt(handle.data_file_id)
+    for page_id in range(page_cnt):
+        pf_manager.read_page(handle.data_file_id, page_id)
+    stats = tracer.get_stats()
+    assert stats['rm.insert_record']['count'] == N and stats['rm.get_record']['count'] == N, 'test_tracing failed!'
+    assert sum(stats['rm.get_record']['histogram']) == N, 'test_tracing failed!'
+    each = stats['rm.insert_record']
+    assert 0 < each['p50_us'] <= each['p99_us'] and each['mean_us'] <= each['max_us'], 'test_tracing failed!'
+    assert stats['pf.read_page']['count'] >= page_cnt, 'test_tracing failed!'
+    tracer.disable()
+    assert RM_FileHandle.insert_record is insert_record, 'test_tracing failed!'
+    handle.get_record(rids[0])
+    assert tracer.get_stats()['rm.get_record']['count'] == N, 'test_tracing failed!'
+    tracer.reset()
+    assert tracer.get_stats() == {}, 'test_tracing failed!'
+    rm_manager.close_file(file_name)
+    rm_manager.remove_file(file_name)
+    print(f'test_tracing passed!')
+
+
+def test_scan_pages():
+    ''' Test the file scan reads each page once and decodes its records as get_record() does.
+    '''
+    file_name = os.path.join(cf.TEST_ROOT, 'test_scan_pages')
+    str_size = 6
+    meta = {
+        'record_size': 12 + str_size,
+        'column_number': 3,
+        'columns': [ {
+                'column_type': column_type,
+                'column_size': column_size,
+                'column_name_length': len(column_name),
+                'column_name': column_name,
+                'column_default_en': False,
+                'column_default': np.zeros(column_size, dtype=np.uint8),
+            } for column_type, column_size, column_name in [(cf.TYPE_INT, cf.SIZE_INT, 'col_int'),
+                (cf.TYPE_FLOAT, cf.SIZE_FLOAT, 'col_float'), (cf.TYPE_STR, str_size, 'col_str')]
+        ],
+        'primary_key_size': 0, 'primary_keys': [],
+        'foreign_key_number': 0, 'foreign_keys': [],
+    }
+    rm_manager.create_file(file_name)
+    handle:RM_FileHandle = rm_manager.open_file(file_name)
+    handle.init_meta(meta)
+    N = 3 * handle.meta['record_per_page'] + 2   # the last page holds a live record
+    rids = [handle.insert_record(np.frombuffer(struct.pack(f'<id{str_size}s', i % 50 - 25, float(i % 7),
+        bytes(str(i % 11), encoding='utf-8')), dtype=np.uint8)) for i in range(N)]
+    for i, rid in enumerate(rids):
+        if i % 3 == 0: handle.remove_record(rid)
+    live = {(rid.page_no, rid.slot_no): tuple(handle.unpack_record(handle.get_record(rid).data))
+        for i, rid in enumerate(rids) if i % 3 != 0}
+    file_scan = RM_FileScan()
+    conditions = [(CompOp.NO, None, cf.TYPE_INT, 4, 0, lambda v: True),
+        (CompOp.GE, 0, cf.TYPE_INT, 4, 0, lambda v: v[0] >= 0),
+        (CompOp.NE, 3.0, cf.TYPE_FLOAT, 8, 4, lambda v: v[1] != 3.0),
+        (CompOp.LT, '5', cf.TYPE_STR, str_size, 12, lambda v: v[2] < '5'),
+        (CompOp.EQ, '10', cf.TYPE_STR, str_size, 12, lambda v: v[2] == '10')]
+    for comp_op, field_value, field_type, field_size, field_off, predicate in conditions:
+        file_scan.open_scan(handle, comp_op, field_value, field_type, field_size, field_off)
+        tracer.enable()
+        tracer.reset()
+        scanned = {(record.rid.page_no, record.rid.slot_no): tuple(handle.unpack_record(record.data))
+            for record in file_scan.next()}
+        tracer.disable()
+        assert tracer.get_stats()['pf.read_page']['count'] == handle.meta['page_number'], 'test_scan_pages failed!'
+        assert scanned == {pair: values for pair, values in live.items() if predicate(values)}, 'test_scan_pages failed!'
+        file_scan.close_scan()
+    tracer.reset()
+    rm_manager.close_file(file_name)
+    rm_manager.remove_file(file_name)
+    print(f'test_scan_pages passed!')
+
+
+def test_scan_batch():
+    ''' Test the columnar batch scan returns the records of the record scan, page batches at a time.
+    '''
+    file_name = os.path.join(cf.TEST_ROOT, 'test_scan_batch')
+    str_size = 6
+    meta = {
+        'record_size': 12 + str_size,
+        'column_number': 3,
+        'columns': [ {
+                'column_type': column_type,
+                'column_size': column_size,
+                'column_name_length': len(column_name),
+                'column_name': column_name,
+                'column_default_en': False,
+                'column_default': np.zeros(column_size, dtype=np.uint8),
+            } for column_type, column_size, column_name in [(cf.TYPE_INT, cf.SIZE_INT, 'col_int'),
+                (cf.TYPE_FLOAT, cf.SIZE_FLOAT, 'col_float'), (cf.TYPE_STR, str_size, 'col_str')]
+        ],
+        'primary_key_size': 0, 'primary_keys': [],
+        'foreign_key_number': 0, 'foreign_keys': [],
+    }
+    rm_manager.create_file(file_name)
+    handle:RM_FileHandle = rm_manager.open_file(file_name)
+    handle.init_meta(meta)
+    N = 5 * handle.meta['record_per_page'] + 1
+    rids = [handle.insert_record(data) for data in handle.pack_records(
+        [[i, i / 2, str(i % 13)] for i in range(N)])]
+    for i, rid in enumerate(rids):
+        if i % 4 == 1: handle.remove_record(rid)
+    file_scan = RM_FileScan()
+    for comp_op, field_value in [(CompOp.NO, None), (CompOp.LT, N // 2), (CompOp.GT, N)]:
+        file_scan.open_scan(handle, comp_op, field_value)
+        expected = [((record.rid.page_no, record.rid.slot_no), tuple(handle.unpack_record(record.data)))
+            for record in file_scan.next()]
+        for batch_pages in [1, 2, 100]:
+            batches = list(file_scan.next_batch(batch_pages))
+            assert all(len(rids) > 0 for rids, columns in batches) or len(expected) == 0, 'test_scan_batch failed!'
+            scanned = []
+            for rids, columns in batches:
+                assert rids.dtype == np.int32 and rids.shape == (len(columns[0]), 2), 'test_scan_batch failed!'
+                assert columns[0].dtype == np.int32 and columns[1].dtype == np.float64, 'test_scan_batch failed!'
+                scanned += [(tuple(rid), fields) for rid, fields in zip(rids.tolist(), zip(*[c.tolist() for c in columns]))]
+            assert scanned == expected, 'test_scan_batch failed!'
+        file_scan.close_scan()
+    rm_manager.close_file(file_name)
+    rm_manager.remove_file(file_name)
+    print(f'test_scan_batch passed!')
+
+
+def test_scan_conditions():
+    ''' Test the file scan restricted with a conjunction of conditions, including IN lists.
+    '''
+    file_name = os.path.join(cf.TEST_ROOT, 'test_scan_conditions')
+    str_size = 6
+    meta = {
+        'record_size': 12 + str_size,
+        'column_number': 3,
+        'columns': [ {
+                'column_type': column_type,
+                'column_size': column_size,
+                'column_name_length': len(column_name),
+                'column_name': column_name,
+                'column_default_en': False,
+                'column_default': np.zeros(column_size, dtype=np.uint8),
+            } for column_type, column_size, column_name in [(cf.TYPE_INT, cf.SIZE_INT, 'col_int'),
+                (cf.TYPE_FLOAT, cf.SIZE_FLOAT, 'col_float'), (cf.TYPE_STR, str_size, 'col_str')]
+        ],
+        'primary_key_size': 0, 'primary_keys': [],
+        'foreign_key_number': 0, 'foreign_keys': [],
+    }
+    rm_manager.create_file(file_name)
+    handle:RM_FileHandle = rm_manager.open_file(file_name)
+    handle.init_meta(meta)
+    N = 4 * handle.meta['record_per_page'] + 3
+    rows = [(i % 17 - 8, (i % 5) / 2, 'abcdef'[:i % 7]) for i in range(N)]
+    for data in handle.pack_records(rows): handle.insert_record(data)
+    fields = [(cf.TYPE_INT, 4, 0), (cf.TYPE_FLOAT, 8, 4), (cf.TYPE_STR, str_size, 12)]
+    cases = [
+        [(CompOp.GE, -2, 0), (CompOp.LT, 1.5, 1)],
+        [(CompOp.NE, 'abc', 2), (CompOp.LE, 2**40, 0), (CompOp.GT, -0.5, 1)],
+        [(CompOp.IN, [3, -8, 100, 2.0], 0), (CompOp.EQ, 1.0, 1)],
+        [(CompOp.IN, {'', 'ab', 'abcdef'}, 2)],
+        [(CompOp.IN, [], 0)],
+    ]
+    comparators = {CompOp.EQ: lambda a, b: a == b, CompOp.LT: lambda a, b: a < b, CompOp.GT: lambda a, b: a > b,
+        CompOp.LE: lambda a, b: a <= b, CompOp.GE: lambda a, b: a >= b, CompOp.NE: lambda a, b: a != b,
+        CompOp.IN: lambda a, b: a in b}
+    file_scan = RM_FileScan()
+    for conditions in cases:
+        file_scan.open_scan(handle)
+        for comp_op, field_value, col in conditions:
+            file_scan.add_condition(comp_op, field_value, *fields[col])
+        scanned = [tuple(handle.unpack_record(record.data)) for record in file_scan.next()]
+        expected = [row for row in rows
+            if all(comparators[comp_op](row[col], field_value) for comp_op, field_value, col in conditions)]
+        assert scanned == expected, 'test_scan_conditions failed!'
+        file_scan.close_scan()
+    file_scan.open_scan(handle)
+    try:
+        file_scan.add_condition(CompOp.NO, None)
+        assert False, 'test_scan_conditions failed!'
+    except OpenScanError as exception: pass
+    file_scan.close_scan()
+    rm_manager.close_file(file_name)
+    rm_manager.remove_file(file_name)
+    print(f'test_scan_conditions passed!')
+
+
+def test_bitmap():
+    ''' Test the bulk bitmap operations against the single bit ones.
+    '''
+    for capacity in [1, 7, 8, 20, 333]:
+        bitmap, bits = Bitmap(capacity), np.zeros(capacity, dtype=bool)
+        assert bitmap.first_free() == 0 and bitmap.count() == 0, 'test_bitmap failed!'
+        for _ in range(4):
+            idxs = np.random.choice(capacity, size=np.random.randint(0, capacity + 1), replace=False)
+            occupied = bool(np.random.randint(2))
+            bitmap.set_bits(idxs, occupied)
+            bits[idxs] = occupied
+            single = Bitmap(capacity)
+            for idx in np.flatnonzero(bits): single.set_bit(int(idx), True)
+            assert np.array_equal(bitmap.serialize(), single.serialize()), 'test_bitmap failed!'
+            assert bitmap.occupied_slots() == np.flatnonzero(bits).tolist(), 'test_bitmap failed!'
+            assert bitmap.count() == np.count_nonzero(bits), 'test_bitmap failed!'
+            free = np.flatnonzero(~bits)
+            assert bitmap.first_free() == (int(free[0]) if len(free) else cf.INVALID), 'test_bitmap failed!'
+            assert np.array_equal(bitmap.first_free_bits(3), free[:3]), 'test_bitmap failed!'
+        bitmap.set_bits(np.arange(capacity), True)
+        assert bitmap.first_free() == cf.INVALID and len(bitmap.first_free_bits(1)) == 0, 'test_bitmap failed!'
+    print(f'test_bitmap passed!')
+
+
+def test_insert_records():
+    ''' Test inserting records in bulk fills the free slots as insert_record() does one by one.
+    '''
+    file_name = os.path.join(cf.TEST_ROOT, 'test_insert_records')
+    meta = {
+        'record_size': cf.SIZE_INT,
+        'column_number': 1,
+        'columns': [ {
+                'column_type': cf.TYPE_INT,
+                'column_size': cf.SIZE_INT,
+                'column_name_length': 2,
+                'column_name': 'id',
+                'column_default_en': False,
+                'column_default': np.zeros(cf.SIZE_INT, dtype=np.uint8),
+            },
+        ],
+        'primary_key_size': 0, 'primary_keys': [],
+        'foreign_key_number': 0, 'foreign_keys': [],
+    }
+    rm_manager.create_file(file_name)
+    handle:RM_FileHandle = rm_manager.open_file(file_name)
+    handle.init_meta(meta)
+    record_per_page = handle.meta['record_per_page']
+    rids = handle.insert_records(handle.pack_records([[i] for i in range(2 * record_per_page + 1)]))
+    assert [(rid.page_no, rid.slot_no) for rid in rids[:record_per_page+1]] \
+        == [(0, i) for i in range(record_per_page)] + [(1, 0)], 'test_insert_records failed!'
+    removed = rids[1:2*record_per_page:3]
+    for rid in removed: handle.remove_record(rid)
+    more = handle.insert_records(handle.pack_records([[-i] for i in range(len(removed) + record_per_page)]))
+    assert set(more[:len(removed)]) == set(removed), 'test_insert_records failed!'
+    assert handle.meta['record_number'] == len(rids) + record_per_page, 'test_insert_records failed!'
+    expected = {rid: i for i, rid in enumerate(rids) if rid not in removed}
+    expected.update({rid: -i for i, rid in enumerate(more)})
+    for rid, value in expected.items():
+        assert handle.unpack_record(handle.get_record(rid).data)[0] == value, 'test_insert_records failed!'
+    file_scan = RM_FileScan()
+    file_scan.open_scan(handle)
+    assert len(list(file_scan.next())) == len(expected), 'test_insert_records failed!'
+    file_scan.close_scan()
+    rm_manager.close_file(file_name)
+    rm_manager.remove_file(file_name)
+    print(f'test_insert_records passed!')
+
+
 def test():
     print(f'-------- Test record management --------')
     test_meta()
     test_pack_unpack_record()
     test_record()
     test_file_scan()
-    test_file_scan_2()
\ No newline at end of file
+    test_file_scan_2()
+    test_page_reuse()
+    test_page_size()
+    test_tracing()
+    test_scan_pages()
+    test_scan_batch()
+    test_scan_conditions()
+    test_bitmap()
+    test_insert_records()
\ No newline at end of file
@@ -0,0 +1,156 @@
+import os
+import time
+import asyncio
+import threading
+import numpy as np
+
+import config as cf
+
+
+def test_concurrent_selects():
+    ''' Test SELECTs over an index issued together through parser_command_async, which run
+        concurrently, and a DELETE among them, which runs alone.
+    '''
+    cwd = os.getcwd()
+    # importing the system manager moves into its database directory, keep it under the test root
+    os.chdir(cf.TEST_ROOT)
+    import main
+    from sm_manager.sm_manager import sm_manager
+    def run(line:str):
+        res, _ = asyncio.run(main.parser_command_async(line))
+        return res
+    def rows(res) -> list:
+        return sorted(tuple(record.data.tolist()) for record in res.records)
+    try:
+        run('CREATE DATABASE test_concurrent_selects;')
+        run('USE test_concurrent_selects;')
+        run('CREATE TABLE t (id INT, v INT);')
+        run('ALTER TABLE t ADD INDEX (id);')
+        N = 200
+        keys = np.random.permutation(N)
+        run('INSERT INTO t VALUES ' + ','.join(f'({k}, {k * 7 % 31})' for k in keys) + ';')
+        lines = []
+        for k in np.random.randint(0, N, 16):
+            lines += [f'SELECT * FROM t WHERE id = {k};', f'SELECT * FROM t WHERE id < {k};',
+                f'SELECT * FROM t WHERE id >= {k};', f'SELECT * FROM t WHERE id <> {k};']
+        expected = [rows(run(line)) for line in lines]
+        # count the statements running at the same time
+        execute_command, lock, running, most = main.execute_command, threading.Lock(), [0], [0]
+        def counted(tree):
+            with lock:
+                running[0] += 1
+                most[0] = max(most[0], running[0])
+            try:
+                time.sleep(0.01)
+                return execute_command(tree)
+            finally:
+                with lock: running[0] -= 1
+        async def gather():
+            return await asyncio.gather(*(main.parser_command_async(line) for line in lines))
+        main.execute_command = counted
+        try: results = asyncio.run(gather())
+        finally: main.execute_command = execute_command
+        assert most[0] > 1, 'test_concurrent_selects failed: the SELECTs ran one at a time'
+        for line, (res, _), other in zip(lines, results, expected):
+            assert rows(res) == other, f'test_concurrent_selects failed: {line}'
+        # a modifying statement runs alone, after the SELECTs issued before it
+        async def mixed():
+            return await asyncio.gather(main.parser_command_async(f'SELECT * FROM t WHERE id < {N};'),
+                main.parser_command_async(f'DELETE FROM t WHERE id >= {N // 2};'),
+                main.parser_command_async(f'SELECT * FROM t WHERE id < {N};'))
+        (before, _), _, (after, _) = asyncio.run(mixed())
+        assert len(rows(before)) == N and len(rows(after)) == N // 2, 'test_concurrent_selects failed!'
+        for i in range(0, len(lines), 4):
+            k = expected[i][0][0]
+            assert expected[i] == [(k, k * 7 % 31)], 'test_concurrent_selects failed!'
+            assert len(expected[i + 1]) == k and len(expected[i + 2]) == N - k, 'test_concurrent_selects failed!'
+            assert len(expected[i + 3]) == N - 1, 'test_concurrent_selects failed!'
+        run('DROP DATABASE test_concurrent_selects;')
+    finally:
+        os.chdir(cwd)
+    print(f'test_concurrent_selects passed!')
+
+
+def test_commit_touched_tables():
+    ''' Test a modifying statement with the log enabled syncs the metas of the tables it changed only.
+    '''
+    cwd = os.getcwd()
+    os.chdir(cf.TEST_ROOT)
+    import main
+    import sm_manager.sm_manager as sm
+    from table.table import Table
+    from log_management.lm_manager import lm_manager
+    def run(line:str):
+        res, _ = asyncio.run(main.parser_command_async(line))
+        return res
+    wal_enabled, sync_meta, synced = sm.WAL_ENABLED, Table.sync_meta, []
+    def counted(table):
+        synced.append(table.get_name())
+        sync_meta(table)
+    sm.WAL_ENABLED = True
+    try:
+        run('CREATE DATABASE test_commit_touched_tables;')
+        run('USE test_commit_touched_tables;')
+        assert lm_manager.is_open, 'test_commit_touched_tables failed!'
+        run('CREATE TABLE a (id INT, PRIMARY KEY (id));')
+        run('CREATE TABLE b (id INT, a_id INT, FOREIGN KEY (a_id) REFERENCES a(id));')
+        run('CREATE TABLE c (id INT);')
+        run('INSERT INTO a VALUES (1), (2);')
+        Table.sync_meta = counted
+        try:
+            run('INSERT INTO c VALUES (1);')
+            assert synced == ['c'], 'test_commit_touched_tables failed!'
+            synced.clear()
+            run('INSERT INTO b VALUES (1, 2);')
+            assert sorted(synced) == ['a', 'b'], 'test_commit_touched_tables failed!'
+            synced.clear()
+            run('SELECT * FROM b;')
+            assert synced == [], 'test_commit_touched_tables failed!'
+        finally:
+            Table.sync_meta = sync_meta
+        assert len(run('SELECT * FROM b;').records) == 1, 'test_commit_touched_tables failed!'
+        run('DROP DATABASE test_commit_touched_tables;')
+    finally:
+        sm.WAL_ENABLED = wal_enabled
+        os.chdir(cwd)
+    print(f'test_commit_touched_tables passed!')
+
+
+def test_keyword_names():
+    ''' Test the keywords of the system statements are usable as the names of databases, tables and columns.
+    '''
+    cwd = os.getcwd()
+    os.chdir(cf.TEST_ROOT)
+    import main
+    from sql_parser.SQLParser import SQLParser
+    def run(line:str):
+        res, _ = asyncio.run(main.parser_command_async(line))
+        return res
+    tree = main.parse_command('SET TRACE OFF; SHOW BUFFER QUOTAS; SET BUFFER QUOTA TRACE (SIZE) RESERVE 2 LIMIT 4;')
+    assert tree is not None, 'test_keyword_names failed!'
+    kinds = [type(each.getChild(0)) for each in tree.statement()]
+    assert kinds == [SQLParser.Set_traceContext, SQLParser.Show_buffer_quotasContext,
+        SQLParser.Set_buffer_quotaContext], 'test_keyword_names failed!'
+    try:
+        run('CREATE DATABASE BUFFER;')
+        run('USE BUFFER;')
+        run('CREATE TABLE TRACE (SIZE INT, PAGE INT, ON INT, OFF VARCHAR(8), STATS FLOAT);')
+        run('ALTER TABLE TRACE ADD INDEX (SIZE);')
+        run("INSERT INTO TRACE VALUES (1, 10, 1, 'a', 0.5), (2, 20, 0, 'b', 1.5);")
+        run('UPDATE TRACE SET PAGE = 30 WHERE SIZE = 2;')
+        res = run('SELECT TRACE.PAGE, OFF FROM TRACE WHERE SIZE >= 1 AND ON = 0;')
+        assert [list(record.data) for record in res.records] == [[30, 'b']], 'test_keyword_names failed!'
+        run('SET BUFFER QUOTA TRACE (SIZE) RESERVE 2;')
+        run('DROP BUFFER QUOTA TRACE (SIZE);')
+        run('DROP TABLE TRACE;')
+        run('DROP DATABASE BUFFER;')
+    finally:
+        os.chdir(cwd)
+    print(f'test_keyword_names passed!')
+
+
+def test():
+    print(f'-------- Test system management --------')
+    test_concurrent_selects()
+    test_commit_touched_tables()
+    test_keyword_names()
\ No newline at end of file
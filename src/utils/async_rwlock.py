@@ -0,0 +1,45 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+
+class AsyncRWLock:
+    ''' A readers-writer lock of asyncio tasks. Readers share the lock and a writer holds it alone.
+        A waiting writer goes before the readers coming later, so readers can not starve it.
+    '''
+
+
+    def __init__(self):
+        self.readers = 0
+        self.writer = False
+        self.writers_waiting = 0
+        self.condition = asyncio.Condition()
+
+
+    @asynccontextmanager
+    async def shared(self):
+        ''' Hold the lock with other readers.
+        '''
+        async with self.condition:
+            await self.condition.wait_for(lambda: not self.writer and self.writers_waiting == 0)
+            self.readers += 1
+        try: yield
+        finally:
+            async with self.condition:
+                self.readers -= 1
+                self.condition.notify_all()
+
+
+    @asynccontextmanager
+    async def exclusive(self):
+        ''' Hold the lock alone.
+        '''
+        async with self.condition:
+            self.writers_waiting += 1
+            try: await self.condition.wait_for(lambda: not self.writer and self.readers == 0)
+            finally: self.writers_waiting -= 1
+            self.writer = True
+        try: yield
+        finally:
+            async with self.condition:
+                self.writer = False
+                self.condition.notify_all()
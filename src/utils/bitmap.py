@@ -22,17 +22,15 @@ class Bitmap:
     def __str__(self):
         ''' Print the bitmap for debug porposes.
         '''
-        res = []
-        data = self.data
-        for byte_no in range(self.size - 1):
-            byte = data[byte_no]
-            for bit_no in range(8):
-                res.append('1' if (byte & np.uint8(1<<bit_no)) > 0 else '0')
-        byte = data[self.size - 1]
-        length = self.capacity % 8
-        for bit_no in range(length if length > 0 else 8):
-            res.append('1' if (byte & np.uint8(1<<bit_no)) > 0 else '0')
-        return f'{{capacity: {self.capacity}, data: [{" ".join(res)}]}}'
+        res = ' '.join(str(bit) for bit in self.bits())
+        return f'{{capacity: {self.capacity}, data: [{res}]}}'
+    
+    
+    def bits(self) -> np.ndarray:
+        ''' Unpack the bitmap.
+        return: np.ndarray[(capacity,), uint8], 1 for an occupied bit, 0 for a free one.
+        '''
+        return np.unpackbits(self.data, count=self.capacity, bitorder='little')
     
     
     def set_bit(self, idx:int, occupied:bool):
@@ -60,37 +58,55 @@ class Bitmap:
         self.data[:] = 0
     
     
+    def set_bits(self, idxs:np.ndarray, occupied:bool):
+        ''' Set the occupation status of many bits at once.
+        args:
+            idxs: np.ndarray[(N,), int] or List[int], the indexes in bit, in [0, capacity).
+            occupied: bool, True for 1, False for 0.
+        '''
+        bits = self.bits()
+        bits[np.asarray(idxs, dtype=np.int64)] = 1 if occupied else 0
+        self.data[:] = np.packbits(bits, bitorder='little')
+    
+    
+    def count(self) -> int:
+        ''' Count the occupied bits.
+        '''
+        return int(np.count_nonzero(self.bits()))
+    
+    
     def first_free(self) -> int:
         ''' Search the not unoccupied bit, return its index.
         return:
             int, the first free index, if not found, return INVALID.
         '''
-        res = cf.INVALID
-        for byte_no, byte in enumerate(self.data):
-            if res >= 0 or byte == 255: continue
-            for bit_no in range(8):
-                if (byte & np.uint8(1<<bit_no)) == 0:
-                    res = byte_no * 8 + bit_no
-                    break
+        free_bytes = np.flatnonzero(self.data != 255)
+        if len(free_bytes) == 0: return cf.INVALID
+        byte_no = int(free_bytes[0])
+        byte = int(self.data[byte_no])
+        res = byte_no * 8 + ((~byte & (byte + 1)).bit_length() - 1)   # the lowest 0 bit
         if res >= self.capacity: return cf.INVALID
         return res
     
     
+    def first_free_bits(self, k:int) -> np.ndarray:
+        ''' Search the first k unoccupied bits.
+        return: np.ndarray[(<=k,), int64], their indexes in order, fewer if not enough bits are free.
+        '''
+        return np.flatnonzero(self.bits() == 0)[:max(k, 0)]
+    
+    
+    def occupied_array(self) -> np.ndarray:
+        ''' Return all occupied slots in the bitmap.
+        return: np.ndarray[(N,), int64], in order.
+        '''
+        return np.flatnonzero(self.bits())
+    
+    
     def occupied_slots(self) -> List[int]:
         ''' Return all occupied slots in the bitmap.
         '''
-        res = []
-        for i, bits in enumerate(self.data):
-            base = (i << 3)
-            if (bits & 1) > 0: res.append(base)
-            if (bits & 2) > 0: res.append(base + 1)
-            if (bits & 4) > 0: res.append(base + 2)
-            if (bits & 8) > 0: res.append(base + 3)
-            if (bits & 16) > 0: res.append(base + 4)
-            if (bits & 32) > 0: res.append(base + 5)
-            if (bits & 64) > 0: res.append(base + 6)
-            if (bits & 128) > 0: res.append(base + 7)
-        return res
+        return self.occupied_array().tolist()
         
     
     def serialize(self) -> np.ndarray:
@@ -0,0 +1,57 @@
+from collections import deque
+from typing import List
+
+from utils.replacer import Replacer
+
+
+class ClockList(Replacer):
+    ''' The CLOCK (second chance) replacement policy.
+        Each page has a reference bit, set by access() and cleared by the clock hand.
+        The hand stops at the first page whose reference bit is already cleared.
+    '''
+    
+    
+    def __init__(self, capacity:int):
+        self._capacity = capacity
+        self._referenced = [False] * capacity
+        self._hand = 0
+        self._free = deque(range(capacity))     # may contain stale indices
+        self._is_free = [True] * capacity
+        
+        
+    def find(self) -> int:
+        ''' Return a free page if any, otherwise sweep the clock hand.
+        '''
+        free, is_free = self._free, self._is_free
+        while free:
+            if is_free[free[0]]: return free[0]
+            free.popleft()
+        referenced, hand = self._referenced, self._hand
+        while referenced[hand]:
+            referenced[hand] = False
+            hand = (hand + 1) % self._capacity
+        self._hand = (hand + 1) % self._capacity
+        return hand
+    
+    
+    def free(self, idx:int):
+        if self._is_free[idx]: return
+        self._is_free[idx] = True
+        self._referenced[idx] = False
+        self._free.appendleft(idx)
+        
+        
+    def access(self, idx:int):
+        self._is_free[idx] = False
+        self._referenced[idx] = True
+        
+        
+    def victims(self, count:int) -> List[int]:
+        ''' The used pages in the order the hand reaches them, unreferenced ones first.
+        '''
+        order = [(self._hand + i) % self._capacity for i in range(self._capacity)]
+        order = [idx for idx in order if not self._is_free[idx]]
+        res = [idx for idx in order if not self._referenced[idx]][:count]
+        if len(res) < count:
+            res += [idx for idx in order if self._referenced[idx]][:count - len(res)]
+        return res
@@ -10,6 +10,7 @@ class CompOp(Enum):
     GE = 4  # greater than or equal
     NE = 5  # not equal
     NO = 6  # no comparison
+    IN = 7  # in a list
 
 @unique
 class Aggregator(Enum):
@@ -1,6 +1,3 @@
-import numpy as np
-
-
 class LinkedList:
     
     
@@ -8,10 +5,11 @@ class LinkedList:
         ''' Stores <capacity> nodes in a bilateral linked list.
             Use the node at index <capacity + 1> as the head and tail.
             Nodes with index == themselves are unlinked.
+            Plain python lists are used since numpy scalar indexing is much slower.
         '''
         self._capacity = capacity
-        self._next = np.arange(capacity + 1)
-        self._prev = np.arange(capacity + 1)
+        self._next = list(range(capacity + 1))
+        self._prev = list(range(capacity + 1))
         
         
     def _link(self, prev:int, next:int):
@@ -61,4 +59,10 @@ class LinkedList:
         ''' Get the first node, indicated by the head node at index <self._capacity>.
         '''
         return self._next[self._capacity]
-        
\ No newline at end of file
+    
+    
+    def get_next(self, idx:int):
+        ''' Get the node after <idx>, the head node at index <self._capacity> after the back.
+        '''
+        return self._next[idx]
+        
@@ -0,0 +1,70 @@
+import heapq
+from itertools import islice
+from collections import OrderedDict
+from typing import List
+
+import config as cf
+from utils.replacer import Replacer
+
+
+class LRUKList(Replacer):
+    ''' The LRU-K replacement policy, K = LRU_K.
+        Replace the page whose K-th most recent access is the oldest. Pages accessed
+        less than K times have an infinite backward K-distance and are replaced first,
+        in LRU order. The history of a page is dropped once it is freed.
+    '''
+    
+    
+    def __init__(self, capacity:int):
+        self._capacity = capacity
+        self._k = cf.LRU_K
+        self._time = 0
+        self._history = [[] for _ in range(capacity)]  # the last K access times of each page
+        self._free = OrderedDict.fromkeys(range(capacity))
+        self._cold = OrderedDict()      # pages accessed < K times, in LRU order
+        self._heap = []                 # (K-th most recent access time, idx), may be stale
+        
+        
+    def find(self) -> int:
+        if self._free: return next(iter(self._free))
+        if self._cold: return next(iter(self._cold))
+        heap, history = self._heap, self._history
+        while True:
+            time, idx = heap[0]
+            if len(history[idx]) == self._k and history[idx][0] == time: return idx
+            heapq.heappop(heap)
+            
+    
+    def free(self, idx:int):
+        self._history[idx] = []
+        self._cold.pop(idx, None)
+        self._free[idx] = None
+        self._free.move_to_end(idx, last=False)
+        
+        
+    def access(self, idx:int):
+        self._time += 1
+        self._free.pop(idx, None)
+        history = self._history[idx]
+        history.append(self._time)
+        if len(history) > self._k: history.pop(0)
+        if len(history) < self._k:
+            self._cold[idx] = None
+            self._cold.move_to_end(idx)
+            return
+        self._cold.pop(idx, None)
+        heapq.heappush(self._heap, (history[0], idx))
+        if len(self._heap) > 4 * self._capacity:    # drop stale entries
+            self._heap = [(h[0], i) for i, h in enumerate(self._history) if len(h) == self._k]
+            heapq.heapify(self._heap)
+            
+            
+    def victims(self, count:int) -> List[int]:
+        ''' The pages accessed less than K times in LRU order, then by the K-th most recent access.
+        '''
+        res = list(islice(self._cold, count))
+        if len(res) < count:
+            history = self._history
+            hot = [(h[0], i) for i, h in enumerate(history) if len(h) == self._k]
+            res += [i for _, i in heapq.nsmallest(count - len(res), hot)]
+        return res
@@ -1,9 +1,10 @@
-import numpy as np
+from typing import List
 
 from utils.linked_list import LinkedList
+from utils.replacer import Replacer
 
 
-class LRUList:
+class LRUList(Replacer):
     
     
     def __init__(self, capacity:int):
@@ -11,6 +12,7 @@ class LRUList:
         self.linked_list = LinkedList(capacity)
         for idx in range(capacity - 1, -1, -1):
             self.linked_list.insert_front(idx)
+        self._is_free = [True] * capacity
 
     
     def find(self) -> int:
@@ -25,12 +27,24 @@ class LRUList:
         ''' Free a node by moving it to the front.
         '''
         self.linked_list.insert_front(idx)
+        self._is_free[idx] = True
         
         
     def access(self, idx:int):
         ''' Access a node by moving it to the back.
         '''
         self.linked_list.insert_back(idx)
+        self._is_free[idx] = False
+        
+        
+    def victims(self, count:int) -> List[int]:
+        ''' The least recently used nodes from the front, skipping the free ones.
+        '''
+        res, idx = [], self.linked_list.get_front()
+        while idx != self._capacity and len(res) < count:
+            if not self._is_free[idx]: res.append(idx)
+            idx = self.linked_list.get_next(idx)
+        return res
         
         
 def display(lru_list):
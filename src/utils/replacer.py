@@ -0,0 +1,54 @@
+from abc import abstractmethod
+from typing import List
+
+
+class Replacer:
+    ''' The buffer replacement policy interface used by PF_Manager.
+        A replacer tracks <capacity> buffer pages by their indices in [0, capacity).
+        All pages are free initially, and free pages are always chosen before used ones.
+    '''
+    
+    
+    @abstractmethod
+    def find(self) -> int:
+        ''' Find the page to be replaced without changing its status.
+            Should call access() after the page is reused.
+        return: int, the index.
+        '''
+        
+    
+    @abstractmethod
+    def free(self, idx:int):
+        ''' Mark a page as free, i.e. it holds no data and should be reused first.
+        '''
+        
+        
+    @abstractmethod
+    def access(self, idx:int):
+        ''' Record an access to a page.
+        '''
+        
+        
+    def victims(self, count:int) -> List[int]:
+        ''' Predict the used pages to be replaced next without changing their status.
+            Used to write dirty pages back before they are replaced.
+        return: List[int], at most <count> indices, the earliest to be replaced first.
+        '''
+        return []
+        
+        
+def create_replacer(policy:str, capacity:int) -> Replacer:
+    ''' Create a replacer by its policy name.
+    args:
+        policy: str, in {'LRU', 'CLOCK', '2Q', 'LRU-K'}, case insensitive.
+        capacity: int, the number of buffer pages.
+    '''
+    from utils.lru_list import LRUList
+    from utils.clock_list import ClockList
+    from utils.two_queue_list import TwoQueueList
+    from utils.lru_k_list import LRUKList
+    policies = {'LRU': LRUList, 'CLOCK': ClockList, '2Q': TwoQueueList, 'LRU-K': LRUKList}
+    replacer_class = policies.get(policy.upper())
+    if replacer_class is None:
+        raise ValueError(f'Unknown replacement policy {policy}, must be in {set(policies)}.')
+    return replacer_class(capacity)
@@ -0,0 +1,144 @@
+import sys
+import time
+import threading
+from typing import Callable, Dict, List, Tuple
+
+
+HISTOGRAM_BUCKETS = 40  # bucket i counts the calls taking [2**(i-1), 2**i) ns, the last one is unbounded
+
+
+class Tracer:
+    ''' Call counts and latency histograms of the hot paths of the storage layers.
+        A method marked by @traced(name) is left as it is, and costs nothing while tracing is
+        disabled. enable() replaces it on its class by a timing wrapper, disable() restores it.
+        Each thread counts into its own table, merged by get_stats(), so the wrapper takes no lock.
+        The times of nested calls are inclusive, e.g. the pin_page() calls in insert_record().
+    '''
+
+
+    def __init__(self):
+        self.enabled = False
+        self.registry: List[Tuple[str, Callable]] = []  # (name, the function marked)
+        self.patched: List[Tuple[object, str, Callable]] = []   # (owner, attribute, the original)
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.tables: List[Dict[str, list]] = []     # per thread, name -> [count, total_ns, max_ns, histogram]
+
+
+    def register(self, name:str, func:Callable):
+        self.registry.append((name, func))
+
+
+    def _table(self) -> Dict[str, list]:
+        table = getattr(self.local, 'table', None)
+        if table is None:
+            table = self.local.table = {}
+            with self.lock:
+                self.tables.append(table)
+        return table
+
+
+    def _wrap(self, name:str, func:Callable) -> Callable:
+        perf_counter_ns, table = time.perf_counter_ns, self._table
+        def wrapper(*args, **kwargs):
+            start = perf_counter_ns()
+            try: return func(*args, **kwargs)
+            finally:
+                elapsed = perf_counter_ns() - start
+                stats = table()
+                entry = stats.get(name)
+                if entry is None: entry = stats[name] = [0, 0, 0, [0] * HISTOGRAM_BUCKETS]
+                entry[0] += 1
+                entry[1] += elapsed
+                if elapsed > entry[2]: entry[2] = elapsed
+                entry[3][min(elapsed.bit_length(), HISTOGRAM_BUCKETS - 1)] += 1
+        wrapper.__wrapped__ = func
+        wrapper.__name__, wrapper.__qualname__, wrapper.__doc__ = func.__name__, func.__qualname__, func.__doc__
+        return wrapper
+
+
+    def enable(self):
+        ''' Start tracing the methods marked by @traced, of the modules imported.
+        '''
+        with self.lock:
+            if self.enabled: return
+            for name, func in self.registry:
+                owner = sys.modules[func.__module__]
+                for part in func.__qualname__.split('.')[:-1]:
+                    owner = getattr(owner, part)
+                attr = func.__qualname__.split('.')[-1]
+                original = owner.__dict__[attr] if isinstance(owner, type) else getattr(owner, attr)
+                self.patched.append((owner, attr, original))
+                setattr(owner, attr, self._wrap(name, original))
+            self.enabled = True
+
+
+    def disable(self):
+        ''' Stop tracing, the statistics are kept.
+        '''
+        with self.lock:
+            for owner, attr, original in reversed(self.patched):
+                setattr(owner, attr, original)
+            self.patched.clear()
+            self.enabled = False
+
+
+    def reset(self):
+        ''' Clear the statistics, e.g. before a query.
+        '''
+        with self.lock:
+            for table in self.tables: table.clear()
+
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        ''' Get the statistics of the traced calls.
+        return: Dict[str, Dict[str, float]], name -> 'count', 'total_us', 'mean_us', 'p50_us',
+            'p99_us', 'max_us' and 'histogram', the call counts of the latency buckets.
+            The percentiles are the upper bounds of their histogram buckets.
+        '''
+        merged: Dict[str, list] = {}
+        with self.lock:
+            for table in self.tables:
+                for name, (count, total, max_ns, histogram) in list(table.items()):
+                    entry = merged.setdefault(name, [0, 0, 0, [0] * HISTOGRAM_BUCKETS])
+                    entry[0] += count
+                    entry[1] += total
+                    entry[2] = max(entry[2], max_ns)
+                    entry[3] = [a + b for a, b in zip(entry[3], histogram)]
+        stats = {}
+        for name, (count, total, max_ns, histogram) in merged.items():
+            if count == 0: continue
+            stats[name] = {
+                'count': count,
+                'total_us': total / 1000,
+                'mean_us': total / count / 1000,
+                'p50_us': self._percentile(histogram, count, 0.5, max_ns),
+                'p99_us': self._percentile(histogram, count, 0.99, max_ns),
+                'max_us': max_ns / 1000,
+                'histogram': histogram,
+            }
+        return stats
+
+
+    @staticmethod
+    def _percentile(histogram:List[int], count:int, ratio:float, max_ns:int) -> float:
+        seen = 0
+        for i, cnt in enumerate(histogram):
+            seen += cnt
+            if seen >= ratio * count:
+                return min(2 ** i, max_ns) / 1000
+        return max_ns / 1000
+
+
+tracer = Tracer()
+
+
+def traced(name:str):
+    ''' Mark a method of a hot path to be traced by the tracer, as the outermost decorator.
+    args:
+        name: str, the name of the statistics, e.g. 'pf.read_page'.
+    '''
+    def decorator(func):
+        tracer.register(name, func)
+        return func
+    return decorator
@@ -0,0 +1,60 @@
+from itertools import islice
+from collections import OrderedDict
+from typing import List
+
+import config as cf
+from utils.replacer import Replacer
+
+
+class TwoQueueList(Replacer):
+    ''' A simplified 2Q replacement policy without the ghost queue.
+        Pages accessed once stay in the FIFO queue A1, pages accessed again are promoted
+        to the LRU queue Am. Pages are replaced from A1 while it is longer than
+        TWO_QUEUE_IN_RATIO * capacity, so a sequential scan only cycles through A1.
+    '''
+    
+    
+    def __init__(self, capacity:int):
+        self._capacity = capacity
+        self._in_capacity = max(1, int(capacity * cf.TWO_QUEUE_IN_RATIO))
+        self._free = OrderedDict.fromkeys(range(capacity))
+        self._a1 = OrderedDict()
+        self._am = OrderedDict()
+        
+        
+    def find(self) -> int:
+        ''' Return a free page if any, then the oldest page in A1 if A1 is too long,
+            otherwise the least recently used page in Am.
+        '''
+        if self._free: return next(iter(self._free))
+        if self._a1 and (len(self._a1) > self._in_capacity or not self._am):
+            return next(iter(self._a1))
+        return next(iter(self._am))
+    
+    
+    def free(self, idx:int):
+        self._a1.pop(idx, None)
+        self._am.pop(idx, None)
+        self._free[idx] = None
+        self._free.move_to_end(idx, last=False)
+        
+        
+    def access(self, idx:int):
+        if idx in self._am:
+            self._am.move_to_end(idx)
+        elif idx in self._a1:
+            del self._a1[idx]
+            self._am[idx] = None
+        else:
+            self._free.pop(idx, None)
+            self._a1[idx] = None
+            
+            
+    def victims(self, count:int) -> List[int]:
+        ''' The pages in A1 beyond its limit first, then Am in LRU order, then the rest of A1.
+        '''
+        over = max(len(self._a1) - self._in_capacity, 0)
+        res = list(islice(self._a1, min(over, count)))
+        res += list(islice(self._am, count - len(res)))
+        res += list(islice(self._a1, over, over + count - len(res)))
+        return res